@@ -0,0 +1,79 @@
+"""
+Contrôle d'admission des requêtes HTTP (délestage).
+
+Chaque requête est admise ou refusée (503 + Retry-After) avant tout
+traitement, selon la limite adaptative de requêtes en cours et la file
+d'attente du pool MySQL (voir infrastructure/concurrency/admission_controller.py).
+
+La priorité d'une route se déclare sous le décorateur de route:
+
+    @listing_bp.route('/listings/<listing_id>', methods=['GET'])
+    @admission_priority(Priority.HIGH)
+    def get_listing(listing_id): ...
+
+Sans déclaration, une route est NORMAL; les préflights CORS (OPTIONS)
+sont CRITICAL.
+"""
+import os
+from typing import Callable, TypeVar
+
+from flask import current_app, g, request
+
+from infrastructure.concurrency.admission_controller import AdmissionController, Priority
+from api.unit_of_work import connection_pool
+
+F = TypeVar('F', bound=Callable)
+
+_PRIORITY_ATTRIBUTE = 'admission_priority'
+
+admission_controller = AdmissionController(
+    initial_limit=int(os.getenv('ADMISSION_INITIAL_LIMIT', str(2 * connection_pool.size))),
+    min_limit=int(os.getenv('ADMISSION_MIN_LIMIT', '4')),
+    max_limit=int(os.getenv('ADMISSION_MAX_LIMIT', '200')),
+    latency_target_seconds=float(os.getenv('ADMISSION_LATENCY_TARGET_MS', '500')) / 1000,
+    queue_depth=lambda: connection_pool.waiting,
+    max_queue_depth=connection_pool.size,
+    retry_after_seconds=int(os.getenv('ADMISSION_RETRY_AFTER', '1'))
+)
+
+
+def admission_priority(priority: Priority) -> Callable[[F], F]:
+    """Déclare la priorité d'admission d'une route"""
+    def decorator(view: F) -> F:
+        setattr(view, _PRIORITY_ATTRIBUTE, priority)
+        return view
+    return decorator
+
+
+def request_priority() -> Priority:
+    """Priorité de la requête courante"""
+    if request.method == 'OPTIONS':
+        return Priority.CRITICAL
+    view = current_app.view_functions.get(request.endpoint)
+    return getattr(view, _PRIORITY_ATTRIBUTE, Priority.NORMAL)
+
+
+def register_admission_control(app, controller: AdmissionController = admission_controller):
+    """
+    Enregistre l'admission des requêtes.
+    
+    À enregistrer avant l'unité de travail: une requête refusée n'emprunte
+    pas de connexion. Le refus (ServiceOverloadedException) est converti en
+    503 par register_service_exception_handlers.
+    
+    Args:
+        app: Instance Flask
+        controller: Contrôleur d'admission
+    """
+    
+    @app.before_request
+    def admit_request():
+        priority = request_priority()
+        g.admission = (priority, controller.admit(priority))
+    
+    @app.teardown_request
+    def complete_request(error):
+        admission = g.pop('admission', None)
+        if admission is not None:
+            priority, started = admission
+            controller.complete(priority, started, sample=error is None)
@@ -0,0 +1 @@
+"""Authentification côté API (gardes de routes)"""
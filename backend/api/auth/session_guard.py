@@ -0,0 +1,64 @@
+"""
+Garde de routes: exige une session valide (en-tête Authorization: Bearer).
+"""
+from functools import wraps
+from typing import Optional
+from flask import g, request
+from application.auth.session_validation_service import SessionValidationService
+
+
+def extract_bearer_token() -> Optional[str]:
+    """
+    Extrait le jeton de l'en-tête Authorization de la requête courante.
+    
+    Returns:
+        Le jeton, ou None si l'en-tête est absent ou mal formé
+    """
+    header = request.headers.get('Authorization', '')
+    scheme, _, token = header.partition(' ')
+    if scheme.lower() != 'bearer' or not token.strip():
+        return None
+    return token.strip()
+
+
+def extract_query_token() -> Optional[str]:
+    """
+    Extrait le jeton du paramètre `access_token` de l'URL.
+    
+    Réservé aux routes consommées par EventSource, qui ne permet pas
+    d'envoyer d'en-tête Authorization.
+    
+    Returns:
+        Le jeton, ou None s'il est absent
+    """
+    token = request.args.get('access_token', '').strip()
+    return token or None
+
+
+def require_session(validation_service: SessionValidationService, allow_query_token: bool = False):
+    """
+    Décorateur de route: valide la session avant d'appeler la vue.
+    
+    En cas de succès, l'utilisateur authentifié est disponible dans
+    `flask.g.user_id`. Sinon, InvalidSessionException est levée et
+    convertie en 401 par l'exception mapper d'authentification.
+    
+    Usage:
+        @listing_bp.route('/listings/mine')
+        @require_session(session_validation_service)
+        def get_my_listings(): ...
+    
+    Args:
+        validation_service: Service de validation des sessions
+        allow_query_token: Accepter aussi le jeton en paramètre `access_token`
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            token = extract_bearer_token()
+            if token is None and allow_query_token:
+                token = extract_query_token()
+            g.user_id = validation_service.validate_token(token)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,191 @@
+"""
+Resource: AuthResource
+Définit les endpoints REST liés aux sessions (Couche API).
+"""
+import os
+import logging
+from flask import Blueprint, g, jsonify, request
+from application.auth.authentication_service import AuthenticationService
+from application.auth.session_validation_service import SessionValidationService
+from infrastructure.auth.session_cache import SessionCache
+from infrastructure.auth.revocation_channel import LocalRevocationChannel, UnixSocketRevocationChannel
+from infrastructure.persistence.in_memory.in_memory_session_repository import InMemorySessionRepository
+from infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+from infrastructure.security.password_hasher import PasswordHasher
+from api.auth.session_guard import extract_bearer_token, require_session
+from api.validators.auth_dto_validator import AuthDtoValidator
+from api.exceptions.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+# Créer le Blueprint Flask
+auth_bp = Blueprint('auth', __name__)
+
+# ===== Initialisation des dépendances =====
+# SESSION_REVOCATION_DIR active la diffusion des révocations entre workers
+# (un répertoire partagé par tous les workers gunicorn de la machine).
+_revocation_dir = os.getenv('SESSION_REVOCATION_DIR')
+
+_user_repository = InMemoryUserRepository()
+_session_repository = InMemorySessionRepository()
+_session_cache = SessionCache(
+    max_size=int(os.getenv('SESSION_CACHE_SIZE', '10000')),
+    max_age_seconds=float(os.getenv('SESSION_CACHE_MAX_AGE', '60'))
+)
+_revocation_channel = (
+    UnixSocketRevocationChannel(_revocation_dir) if _revocation_dir
+    else LocalRevocationChannel()
+)
+# Public: partagé avec les autres resources qui exigent une session
+session_validation_service = SessionValidationService(
+    _session_repository,
+    _session_cache,
+    _revocation_channel
+)
+
+# Coût bcrypt commun à tous les workers: BCRYPT_ROUNDS, calibré une fois au
+# déploiement (python -m infrastructure.security.password_hasher)
+_password_hasher = PasswordHasher(
+    rounds=int(os.getenv('BCRYPT_ROUNDS', str(PasswordHasher.DEFAULT_ROUNDS))),
+    max_workers=int(os.getenv('BCRYPT_POOL_SIZE', '0')) or None,
+    max_pending=int(os.getenv('BCRYPT_MAX_PENDING', '0')) or None
+)
+_authentication_service = AuthenticationService(
+    _user_repository,
+    _session_repository,
+    _password_hasher
+)
+_auth_validator = AuthDtoValidator()
+
+
+def _read_credentials():
+    """
+    Extrait et valide les identifiants du corps JSON.
+    
+    Returns:
+        (idul, password), ou une réponse d'erreur Flask
+    """
+    data = request.get_json(silent=True)
+    
+    if not data:
+        error = ErrorResponse(
+            error='INVALID_REQUEST',
+            description='Le corps de la requête doit être au format JSON'
+        )
+        return None, (jsonify(error.to_dict()), 400)
+    
+    try:
+        _auth_validator.validate(data)
+    except ValueError as e:
+        logger.warning(f"Validation échouée: {str(e)}")
+        return None, (jsonify(e.args[0] if e.args else {'error': 'VALIDATION_ERROR'}), 400)
+    
+    return (str(data['idul']), str(data['password'])), None
+
+
+@auth_bp.route('/auth/register', methods=['POST'])
+def register():
+    """
+    Endpoint: POST /api/auth/register
+    Crée un compte.
+    
+    Request Body (JSON):
+    {
+        "idul": "abk1234",
+        "password": "********"
+    }
+    
+    Response (201):
+    {
+        "user_id": "...",
+        "idul": "abk1234",
+        "email": "abk1234@ulaval.ca"
+    }
+    
+    Errors:
+    - 400: Données invalides
+    - 409: IDUL déjà inscrit
+    - 503: Pool bcrypt saturé (Retry-After)
+    """
+    credentials, error_response = _read_credentials()
+    if error_response:
+        return error_response
+    
+    user = _authentication_service.register(*credentials)
+    
+    return jsonify({
+        'user_id': user.user_id,
+        'idul': user.idul,
+        'email': user.email
+    }), 201
+
+
+@auth_bp.route('/auth/login', methods=['POST'])
+def login():
+    """
+    Endpoint: POST /api/auth/login
+    Vérifie les identifiants et ouvre une session.
+    
+    Response (200):
+    {
+        "access_token": "...",
+        "token_type": "Bearer",
+        "expires_at": "2026-01-01T12:00:00"
+    }
+    
+    Errors:
+    - 400: Données invalides
+    - 401: Identifiants incorrects
+    - 503: Pool bcrypt saturé (Retry-After)
+    """
+    credentials, error_response = _read_credentials()
+    if error_response:
+        return error_response
+    
+    session = _authentication_service.login(*credentials)
+    
+    return jsonify({
+        'access_token': session.token,
+        'token_type': 'Bearer',
+        'expires_at': session.expires_at.isoformat()
+    }), 200
+
+
+@auth_bp.route('/auth/me', methods=['GET'])
+@require_session(session_validation_service)
+def get_current_user():
+    """
+    Endpoint: GET /api/auth/me
+    Retourne l'utilisateur associé au jeton.
+    
+    Headers:
+    - Authorization: Bearer <token>
+    
+    Response (200):
+    {
+        "user_id": "..."
+    }
+    
+    Errors:
+    - 401: Jeton absent, expiré ou révoqué
+    """
+    return jsonify({'user_id': g.user_id}), 200
+
+
+@auth_bp.route('/auth/logout', methods=['POST'])
+@require_session(session_validation_service)
+def logout():
+    """
+    Endpoint: POST /api/auth/logout
+    Révoque la session courante sur tous les workers.
+    
+    Response (204): Pas de contenu
+    
+    Errors:
+    - 401: Jeton absent, expiré ou révoqué
+    """
+    logger.info(f"Logout de l'utilisateur {g.user_id}")
+    
+    session_validation_service.revoke_session(extract_bearer_token())
+    
+    return '', 204
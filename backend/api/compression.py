@@ -0,0 +1,135 @@
+"""
+Compression des réponses HTTP (gzip, brotli selon Accept-Encoding).
+
+Sont compressés les corps textuels (JSON, texte) d'au moins
+COMPRESSION_MIN_BYTES; les images sont déjà compressées et le flux SSE doit
+partir événement par événement. Les corps volumineux et les réponses
+produites par un générateur sont compressés au fil de l'eau.
+
+Un corps mis en cache par l'application se sert déjà compressé:
+
+    payload = PrecompressedPayload(json.dumps(listings).encode(), levels=PRECOMPRESSION_LEVELS)
+    ...
+    return precompressed_response(payload)
+"""
+import os
+from typing import Iterable, Optional
+
+from flask import current_app, request
+
+from infrastructure.compression.response_compressor import (
+    BROTLI,
+    GZIP,
+    REBUILT_LEVELS,
+    PrecompressedPayload,
+    ResponseCompressor,
+    available_encodings,
+)
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+    'text/css',
+    'text/csv',
+    'text/html',
+    'text/plain',
+    'text/xml',
+})
+
+response_compressor = ResponseCompressor(
+    min_bytes=int(os.getenv('COMPRESSION_MIN_BYTES', '1024')),
+    stream_threshold_bytes=int(os.getenv('COMPRESSION_STREAM_THRESHOLD_BYTES', str(256 * 1024))),
+    gzip_level=int(os.getenv('COMPRESSION_GZIP_LEVEL', '6')),
+    brotli_quality=int(os.getenv('COMPRESSION_BROTLI_QUALITY', '5')),
+    cache_entries=int(os.getenv('COMPRESSION_CACHE_ENTRIES', '32'))
+)
+
+# Niveaux des corps précompressés reconstruits en service (instantanés du catalogue)
+PRECOMPRESSION_LEVELS = {
+    GZIP: int(os.getenv('COMPRESSION_SNAPSHOT_GZIP_LEVEL', str(REBUILT_LEVELS[GZIP]))),
+    BROTLI: int(os.getenv('COMPRESSION_SNAPSHOT_BROTLI_QUALITY', str(REBUILT_LEVELS[BROTLI])))
+}
+
+
+def negotiate_encoding(offered: Iterable[str] = None) -> Optional[str]:
+    """Encodage préféré par le client parmi ceux offerts (None: corps non compressé)"""
+    offered = list(offered if offered is not None else available_encodings())
+    return request.accept_encodings.best_match(offered) if offered else None
+
+
+def precompressed_response(
+    payload: PrecompressedPayload,
+    status: int = 200,
+    compressor: ResponseCompressor = response_compressor
+):
+    """
+    Réponse servant la variante précompressée négociée, sans passe de compression
+    (304 si le client a déjà cette variante).
+    
+    Args:
+        payload: Corps figé et ses variantes
+        status: Statut HTTP
+        compressor: Compresseur (pour les métriques)
+    """
+    encoding = negotiate_encoding(payload.encodings)
+    response = current_app.response_class(payload.variant(encoding), status=status, mimetype=payload.mimetype)
+    response.vary.add('Accept-Encoding')
+    # Un ETag par variante: le client qui l'a déjà reçoit un 304 sans corps
+    response.set_etag(payload.etag if encoding is None else f"{payload.etag}-{encoding}")
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+        compressor.served_precompressed(encoding, payload)
+    return response.make_conditional(request)
+
+
+def register_compression(app, compressor: ResponseCompressor = response_compressor):
+    """
+    Enregistre la compression des réponses.
+    
+    À enregistrer avant les autres hooks after_request (Flask les appelle
+    dans l'ordre inverse): la compression s'applique au corps final.
+    
+    Args:
+        app: Instance Flask
+        compressor: Compresseur des corps
+    """
+    
+    @app.after_request
+    def compress_response(response):
+        if (
+            request.method == 'HEAD'
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        if response.is_streamed:
+            encoding = negotiate_encoding()
+            if encoding is None:
+                return response
+            response.response = compressor.stream(response.iter_encoded(), encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < compressor.min_bytes:
+                return response
+            encoding = negotiate_encoding()
+            if encoding is None:
+                return response
+            if len(body) >= compressor.stream_threshold_bytes:
+                response.response = compressor.stream(compressor.chunks(body), encoding)
+                response.headers.pop('Content-Length', None)
+            else:
+                response.set_data(compressor.compress(body, encoding))
+        
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None:
+            response.set_etag(f"{etag}-{encoding}", weak)
+        return response
@@ -0,0 +1,69 @@
+"""
+Exception Mapper: Convertit les exceptions d'authentification en réponses HTTP
+"""
+from flask import jsonify
+from domain.auth.exceptions.invalid_session_exception import InvalidSessionException
+from domain.auth.exceptions.invalid_credentials_exception import InvalidCredentialsException
+from domain.user.exceptions.user_already_exists_exception import UserAlreadyExistsException
+from api.exceptions.error_response import ErrorResponse
+
+
+def register_auth_exception_handlers(app):
+    """
+    Enregistre les gestionnaires d'exceptions pour l'authentification.
+    
+    Args:
+        app: Instance Flask
+    """
+    
+    @app.errorhandler(InvalidSessionException)
+    def handle_invalid_session(error):
+        """
+        Convertit InvalidSessionException en réponse HTTP 401.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 401
+        """
+        response = ErrorResponse(
+            error='UNAUTHORIZED',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 401, {'WWW-Authenticate': 'Bearer'}
+    
+    @app.errorhandler(InvalidCredentialsException)
+    def handle_invalid_credentials(error):
+        """
+        Convertit InvalidCredentialsException en réponse HTTP 401.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 401
+        """
+        response = ErrorResponse(
+            error='INVALID_CREDENTIALS',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 401
+    
+    @app.errorhandler(UserAlreadyExistsException)
+    def handle_user_already_exists(error):
+        """
+        Convertit UserAlreadyExistsException en réponse HTTP 409.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 409
+        """
+        response = ErrorResponse(
+            error='USER_ALREADY_EXISTS',
+            description=str(error),
+            field='idul'
+        )
+        return jsonify(response.to_dict()), 409
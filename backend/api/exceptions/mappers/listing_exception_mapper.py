@@ -3,6 +3,9 @@ Exception Mapper: Convertit les exceptions métier en réponses HTTP
 """
 from flask import jsonify
 from domain.listing.exceptions.listing_not_found_exception import ListingNotFoundException
+from domain.listing.exceptions.invalid_picture_exception import InvalidPictureException
+from domain.listing.exceptions.picture_not_found_exception import PictureNotFoundException
+from domain.listing.exceptions.picture_too_large_exception import PictureTooLargeException
 from api.exceptions.error_response import ErrorResponse
 
 
@@ -34,6 +37,57 @@ def register_listing_exception_handlers(app):
         )
         return jsonify(response.to_dict()), 404
     
+    @app.errorhandler(PictureNotFoundException)
+    def handle_picture_not_found(error):
+        """
+        Convertit PictureNotFoundException en réponse HTTP 404.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 404
+        """
+        response = ErrorResponse(
+            error='PICTURE_NOT_FOUND',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 404
+    
+    @app.errorhandler(PictureTooLargeException)
+    def handle_picture_too_large(error):
+        """
+        Convertit PictureTooLargeException en réponse HTTP 413.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 413
+        """
+        response = ErrorResponse(
+            error='PICTURE_TOO_LARGE',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 413
+    
+    @app.errorhandler(InvalidPictureException)
+    def handle_invalid_picture(error):
+        """
+        Convertit InvalidPictureException en réponse HTTP 400.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 400
+        """
+        response = ErrorResponse(
+            error='INVALID_PICTURE',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 400
+    
     @app.errorhandler(PermissionError)
     def handle_permission_error(error):
         """
@@ -0,0 +1,32 @@
+"""
+Exception Mapper: Convertit les exceptions de messagerie en réponses HTTP
+"""
+from flask import jsonify
+from domain.message.exceptions.conversation_not_found_exception import ConversationNotFoundException
+from api.exceptions.error_response import ErrorResponse
+
+
+def register_message_exception_handlers(app):
+    """
+    Enregistre les gestionnaires d'exceptions pour la messagerie.
+    
+    Args:
+        app: Instance Flask
+    """
+    
+    @app.errorhandler(ConversationNotFoundException)
+    def handle_conversation_not_found(error):
+        """
+        Convertit ConversationNotFoundException en réponse HTTP 404.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 404
+        """
+        response = ErrorResponse(
+            error='CONVERSATION_NOT_FOUND',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 404
@@ -0,0 +1,50 @@
+"""
+Exception Mapper: Convertit les exceptions techniques transverses en réponses HTTP
+"""
+from flask import jsonify
+from domain.exceptions.rate_limit_exceeded_exception import RateLimitExceededException
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+from api.exceptions.error_response import ErrorResponse
+
+
+def register_service_exception_handlers(app):
+    """
+    Enregistre les gestionnaires d'exceptions techniques communes.
+    
+    Args:
+        app: Instance Flask
+    """
+    
+    @app.errorhandler(ServiceOverloadedException)
+    def handle_service_overloaded(error):
+        """
+        Convertit ServiceOverloadedException en réponse HTTP 503.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 503 et en-tête Retry-After
+        """
+        response = ErrorResponse(
+            error='SERVICE_OVERLOADED',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 503, {'Retry-After': str(error.retry_after)}
+    
+    @app.errorhandler(RateLimitExceededException)
+    def handle_rate_limit_exceeded(error):
+        """
+        Convertit RateLimitExceededException en réponse HTTP 429.
+        
+        Args:
+            error: L'exception levée
+            
+        Returns:
+            Réponse JSON avec status 429 et en-tête Retry-After
+        """
+        response = ErrorResponse(
+            error='RATE_LIMITED',
+            description=str(error)
+        )
+        return jsonify(response.to_dict()), 429, {'Retry-After': str(error.retry_after)}
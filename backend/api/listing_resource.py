@@ -2,14 +2,33 @@
 Resource: ListingResource
 Définit les endpoints REST pour les annonces (Couche API).
 """
+import json
+import os
+from typing import Any, Dict, List, Optional
 from flask import Blueprint, request, jsonify
+from werkzeug.formparser import FormDataParser
 import logging
+from application.category.category_service import CategoryService
 from application.listing.listing_service import ListingService
 from application.listing.listing_assembler import ListingAssembler
 from application.listing.dtos.listing_creation_dto import ListingCreationDto
+from domain.category.exceptions.category_not_found_exception import CategoryNotFoundException
+from domain.listing.exceptions.invalid_picture_exception import InvalidPictureException
+from infrastructure.cache.snapshot_cache import SnapshotCache
+from infrastructure.compression.response_compressor import PrecompressedPayload
+from infrastructure.concurrency.query_coalescer import QueryCoalescer
+from infrastructure.imaging.thumbnail_generator import ThumbnailGenerator
+from infrastructure.persistence.in_memory.in_memory_category_repository import InMemoryCategoryRepository
 from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.storage.blob_garbage_collector import BlobGarbageCollector
+from infrastructure.storage.upload_store import LocalUploadStore
 from api.validators.listing_dto_validator import ListingDtoValidator
 from api.exceptions.error_response import ErrorResponse
+from api.admission_control import Priority, admission_priority
+from api.compression import PRECOMPRESSION_LEVELS, precompressed_response
+from api.rate_limiting import CREATE_LISTING_POLICY, catalogue_policy, rate_limit
+from api.unit_of_work import reads_own_writes, unit_of_work_manager
 
 logger = logging.getLogger(__name__)
 
@@ -19,25 +38,168 @@ listing_bp = Blueprint('listings', __name__)
 # ===== Initialisation des dépendances =====
 # Pour cet exemple, on crée les instances directement
 # En production, utilisez l'injection de dépendances (voir configuration.py)
-_listing_repository = InMemoryListingRepository()
+# Photos: écrites sur disque en flux (UPLOAD_MAX_FILE_SIZE par fichier),
+# variantes générées dans un pool de THUMBNAIL_POOL_SIZE processus.
+UPLOAD_DIR = os.getenv(
+    'UPLOAD_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+)
+UPLOAD_MAX_FILE_SIZE = int(os.getenv('UPLOAD_MAX_FILE_SIZE', str(LocalUploadStore.DEFAULT_MAX_FILE_SIZE)))
+# Champs texte du formulaire multipart (titre, description...)
+UPLOAD_MAX_FORM_MEMORY = 64 * 1024
+
+listing_repository = InMemoryListingRepository()
+_picture_repository = InMemoryListingPictureRepository()
 _listing_assembler = ListingAssembler()
-_listing_service = ListingService(_listing_repository, _listing_assembler)
-_listing_validator = ListingDtoValidator()
+# Arbre des catégories en mémoire; version de la table relue au plus
+# toutes les CATEGORY_REFRESH_INTERVAL_SECONDS secondes
+category_service = CategoryService(
+    InMemoryCategoryRepository(),
+    refresh_interval_seconds=float(os.getenv(
+        'CATEGORY_REFRESH_INTERVAL_SECONDS',
+        str(CategoryService.DEFAULT_REFRESH_INTERVAL_SECONDS)
+    ))
+)
+upload_store = LocalUploadStore(UPLOAD_DIR, UPLOAD_MAX_FILE_SIZE)
+thumbnail_generator = ThumbnailGenerator(
+    upload_store.root_dir,
+    max_workers=int(os.getenv('THUMBNAIL_POOL_SIZE', '0')) or None
+)
+
+
+def _listings_payload(listings_data: List[Dict[str, Any]]) -> PrecompressedPayload:
+    """Annonces sérialisées en JSON et précompressées"""
+    body = json.dumps(listings_data, separators=(',', ':'), sort_keys=True).encode()
+    return PrecompressedPayload(body, levels=PRECOMPRESSION_LEVELS)
+
+
+def _render_catalogue(category_id: Optional[int]) -> PrecompressedPayload:
+    """Catalogue sans filtre (None) ou d'une catégorie, sérialisé et précompressé"""
+    # listing_service est créé plus bas: la construction n'a lieu qu'à la première lecture
+    category = str(category_id) if category_id is not None else None
+    # Reconstruit aussi par le thread des instantanés, hors de toute requête
+    with unit_of_work_manager.scope(join_current=True):
+        return listing_service.query_listings(category=category, coalesce=False, render=_listings_payload)
+
+
+# Catalogue sans filtre et par catégorie: servi depuis un instantané, reconstruit
+# en arrière-plan après les écritures (périmé au plus CATALOGUE_SNAPSHOT_MAX_STALENESS_SECONDS)
+catalogue_snapshots = SnapshotCache(
+    'catalogue',
+    build=_render_catalogue,
+    debounce_seconds=float(os.getenv('CATALOGUE_SNAPSHOT_DEBOUNCE_SECONDS', '0.5')),
+    max_staleness_seconds=float(os.getenv('CATALOGUE_SNAPSHOT_MAX_STALENESS_SECONDS', '5')),
+    max_age_seconds=float(os.getenv('CATALOGUE_SNAPSHOT_MAX_AGE_SECONDS', '60'))
+)
+
+listing_service = ListingService(
+    listing_repository,
+    _listing_assembler,
+    _picture_repository,
+    thumbnail_generator,
+    category_service,
+    QueryCoalescer('listings', wait_timeout_seconds=float(os.getenv('LISTING_COALESCE_TIMEOUT_SECONDS', '2'))),
+    catalogue_snapshots,
+    unit_of_work_manager
+)
+_listing_validator = ListingDtoValidator(category_service)
+
+# Photos non référencées: supprimées en arrière-plan (démarré par create_app)
+blob_collector = BlobGarbageCollector(
+    upload_store,
+    _picture_repository,
+    url_prefix=ListingService.PICTURES_URL_PREFIX,
+    grace_seconds=float(os.getenv('UPLOAD_GC_GRACE_SECONDS', '3600')),
+    interval_seconds=float(os.getenv('UPLOAD_GC_INTERVAL_SECONDS', '3600'))
+)
+
+
+def warm_catalogue_snapshots():
+    """Programme la construction des instantanés du catalogue (sans filtre et par catégorie)"""
+    tree = category_service.tree
+    category_ids = set()
+    for root in tree.roots:
+        category_ids.update(tree.descendants(root.category_id))
+    catalogue_snapshots.warm([None, *sorted(category_ids)])
+
+
+def _create_listing_with_pictures():
+    """
+    Crée une annonce depuis un formulaire multipart/form-data.
+    
+    Chaque fichier `pictures` est écrit sur disque pendant la lecture de la
+    requête, sans passer par la mémoire; un fichier trop gros interrompt
+    l'envoi (413). Les variantes sont générées après la réponse.
+    
+    Raises:
+        PictureTooLargeException: Si une photo dépasse UPLOAD_MAX_FILE_SIZE
+        InvalidPictureException: Si un fichier n'est pas une image acceptée
+        ValueError: Si les champs de l'annonce sont invalides
+    """
+    batch = upload_store.new_batch()
+    stored_paths = []
+    
+    try:
+        parser = FormDataParser(
+            stream_factory=batch.stream_factory,
+            max_form_memory_size=UPLOAD_MAX_FORM_MEMORY,
+            max_content_length=ListingService.MAX_PICTURES * UPLOAD_MAX_FILE_SIZE + UPLOAD_MAX_FORM_MEMORY,
+            silent=False
+        )
+        _, form, files = parser.parse(
+            request.stream,
+            request.mimetype,
+            request.content_length,
+            request.mimetype_params
+        )
+        
+        data = form.to_dict()
+        _listing_validator.validate(data)
+        data['price'] = float(data['price'])
+        
+        pictures = files.getlist('pictures')
+        if len(pictures) > ListingService.MAX_PICTURES:
+            raise InvalidPictureException(
+                pictures[ListingService.MAX_PICTURES].filename,
+                f"Maximum {ListingService.MAX_PICTURES} photos par annonce"
+            )
+        
+        for picture in pictures:
+            stored_paths.append(upload_store.commit(picture.stream, picture.filename))
+        
+        logger.info(f"Requête de création d'annonce reçue: {data.get('title', 'N/A')} ({len(stored_paths)} photo(s))")
+        
+        response_dto = listing_service.create_listing_with_pictures(
+            ListingCreationDto(**data),
+            stored_paths
+        )
+    except Exception:
+        # Les fichiers déjà rangés peuvent être partagés avec d'autres annonces:
+        # seuls les temporaires sont supprimés, le ramasse-miettes fait le reste
+        batch.discard()
+        raise
+    
+    return jsonify(response_dto.to_dict()), 201
 
 
 @listing_bp.route('/listings', methods=['POST'])
+@rate_limit(CREATE_LISTING_POLICY)
 def create_listing():
     """
     Endpoint: POST /api/listings
     Crée une nouvelle annonce.
     
+    Avec Content-Type multipart/form-data, les champs sont ceux du corps JSON
+    et les photos sont envoyées dans `pictures` (5 au maximum, la première
+    est la couverture). L'annonce est retournée dès les fichiers écrits.
+    
     Request Body (JSON):
     {
         "seller_id": "user-123",
         "title": "Calculatrice TI-84",
         "description": "En excellent état",
         "price": 85.00,
-        "category": "electronics",
+        "category": "6",  # ID ou nom (table categories)
         "condition": "Comme neuf",
         "location": "Pavillon Adrien-Pouliot",
         "course_code": "MAT-1900",  # Optionnel
@@ -54,8 +216,13 @@ def create_listing():
     
     Errors:
     - 400: Données invalides
+    - 413: Photo trop volumineuse
     - 500: Erreur serveur
     """
+    if request.mimetype == 'multipart/form-data':
+        # Erreurs converties par les exception mappers (413 pour une photo trop grosse)
+        return _create_listing_with_pictures()
+    
     try:
         # 1. Extraire les données JSON
         data = request.get_json()
@@ -76,7 +243,7 @@ def create_listing():
         listing_dto = ListingCreationDto(**data)
         
         # 4. Appeler le service
-        response_dto = _listing_service.create_listing(listing_dto)
+        response_dto = listing_service.create_listing(listing_dto)
         
         # 5. Retourner la réponse
         return jsonify(response_dto.to_dict()), 201
@@ -97,6 +264,7 @@ def create_listing():
 
 
 @listing_bp.route('/listings/<listing_id>', methods=['GET'])
+@admission_priority(Priority.HIGH)
 def get_listing(listing_id: str):
     """
     Endpoint: GET /api/listings/{id}
@@ -115,7 +283,7 @@ def get_listing(listing_id: str):
     try:
         logger.info(f"Requête GET pour annonce: {listing_id}")
         
-        response_dto = _listing_service.get_listing_by_id(listing_id)
+        response_dto = listing_service.get_listing_by_id(listing_id)
         
         return jsonify(response_dto.to_dict()), 200
         
@@ -125,6 +293,7 @@ def get_listing(listing_id: str):
 
 
 @listing_bp.route('/listings', methods=['GET'])
+@rate_limit(catalogue_policy)
 def get_all_listings():
     """
     Endpoint: GET /api/listings
@@ -132,34 +301,62 @@ def get_all_listings():
     
     Query Parameters:
     - seller_id: Filtrer par vendeur
+    - category: Filtrer par catégorie (ID ou nom), sous-catégories comprises
     - search: Recherche par mots-clés
     
+    Sans filtre ou avec le seul filtre category: instantané précompressé,
+    périmé de quelques secondes au plus après une écriture.
+    
     Response (200):
     [
         {"listing_id": "...", "title": "..."},
         ...
     ]
+    
+    Errors:
+    - 400: Catégorie inconnue
     """
     try:
         # Récupérer les query parameters
         seller_id = request.args.get('seller_id')
+        category = request.args.get('category')
         search_query = request.args.get('search')
         
-        # Appliquer les filtres
-        if seller_id:
-            logger.info(f"Filtrage par vendeur: {seller_id}")
-            listings = _listing_service.get_listings_by_seller(seller_id)
-        elif search_query:
-            logger.info(f"Recherche: {search_query}")
-            listings = _listing_service.search_listings(search_query)
-        else:
-            logger.info("Récupération de toutes les annonces")
-            listings = _listing_service.get_all_listings()
+        # Jeton de cohérence valide seulement: un en-tête quelconque ne contourne pas les caches
+        read_your_writes = reads_own_writes()
+        
+        # Catalogue sans filtre ou par catégorie: instantané précompressé,
+        # sauf pour qui doit lire ses propres écritures
+        if not seller_id and not search_query and not read_your_writes:
+            key = category_service.resolve(category).category_id if category else None
+            return precompressed_response(catalogue_snapshots.get(key))
         
-        # Convertir en liste de dicts
-        listings_data = [listing.to_dict() for listing in listings]
+        if read_your_writes:
+            # Lecture propre: une lecture commencée avant ses écritures ne les contient pas
+            listings_data = listing_service.query_listings(
+                seller_id=seller_id,
+                category=category,
+                search=search_query,
+                coalesce=False
+            )
+            return jsonify(listings_data), 200
+        
+        # Lectures identiques simultanées: une seule lecture, sérialisation et compression
+        payload = listing_service.query_listings(
+            seller_id=seller_id,
+            category=category,
+            search=search_query,
+            render=_listings_payload
+        )
+        return precompressed_response(payload)
         
-        return jsonify(listings_data), 200
+    except CategoryNotFoundException as e:
+        error = ErrorResponse(
+            error='INVALID_CATEGORY',
+            description=str(e),
+            field='category'
+        )
+        return jsonify(error.to_dict()), 400
         
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des annonces: {str(e)}", exc_info=True)
@@ -200,7 +397,7 @@ def delete_listing(listing_id: str):
         
         logger.info(f"Suppression annonce {listing_id} par user {user_id}")
         
-        _listing_service.delete_listing(listing_id, user_id)
+        listing_service.delete_listing(listing_id, user_id)
         
         return '', 204  # No Content
         
@@ -211,11 +408,12 @@ def delete_listing(listing_id: str):
 
 # Route de test pour vérifier que le module est chargé
 @listing_bp.route('/listings/health', methods=['GET'])
+@admission_priority(Priority.CRITICAL)
 def health():
     """Endpoint de santé pour vérifier que le module fonctionne"""
     return jsonify({
         'status': 'healthy',
         'module': 'listings',
-        'repository_type': type(_listing_repository).__name__,
-        'listings_count': _listing_repository.count()
+        'repository_type': type(listing_repository).__name__,
+        'listings_count': listing_repository.count()
     }), 200
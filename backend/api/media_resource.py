@@ -0,0 +1,207 @@
+"""
+Resource: MediaResource
+Sert les photos envoyées (originaux et variantes) depuis le dossier d'uploads.
+
+Les noms de fichiers sont des empreintes de contenu: un fichier ne change
+jamais sous un même nom. Il est donc servi avec un ETag fort (l'empreinte)
+et un Cache-Control immuable, le navigateur ne le redemande plus.
+
+Le transfert évite Python:
+- par défaut, sendfile (wsgi.file_wrapper du serveur WSGI, zéro copie);
+- MEDIA_OFFLOAD=x-accel-redirect: nginx sert le fichier depuis l'emplacement
+  interne MEDIA_ACCEL_PREFIX;
+- MEDIA_OFFLOAD=x-sendfile: Apache (mod_xsendfile) / lighttpd servent le
+  chemin absolu.
+Les requêtes Range (reprise, lecture partielle) sont honorées dans tous les cas.
+
+GET /media/<picture_id>?w=&h=&fmt= sert une version redimensionnée à la
+demande (cache disque LRU, voir infrastructure/imaging/image_resizer.py).
+"""
+import os
+import re
+import mimetypes
+import logging
+from typing import Optional
+from flask import Blueprint, Response, abort, request
+from werkzeug.utils import send_file
+from api.listing_resource import listing_service, thumbnail_generator, upload_store
+from api.admission_control import Priority, admission_priority
+from infrastructure.imaging.image_resizer import ImageResizer, ResizeRequest
+from infrastructure.imaging.resized_image_cache import ResizedImageCache
+
+logger = logging.getLogger(__name__)
+
+# Créer le Blueprint Flask (monté sans préfixe: les chemins en base commencent par /uploads/)
+media_bp = Blueprint('media', __name__)
+
+# ===== Configuration =====
+MEDIA_OFFLOAD = os.getenv('MEDIA_OFFLOAD', 'none').lower()
+MEDIA_ACCEL_PREFIX = os.getenv('MEDIA_ACCEL_PREFIX', '/protected-uploads/')
+
+# Un an: durée maximale recommandée pour un contenu immuable
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# Anciens fichiers nommés librement (données de démonstration): revalidés
+MUTABLE_MAX_AGE = 300
+
+# <empreinte SHA-256>[_<variante>].<extension>
+_CONTENT_HASHED_NAME = re.compile(r'^([0-9a-f]{64}(?:_[a-z]+)?)\.[a-z]+$')
+
+_OFFLOAD_MODES = ('none', 'x-accel-redirect', 'x-sendfile')
+if MEDIA_OFFLOAD not in _OFFLOAD_MODES:
+    raise ValueError(f"MEDIA_OFFLOAD doit valoir {', '.join(_OFFLOAD_MODES)}")
+
+# ===== Initialisation des dépendances =====
+# Cache des tailles à la demande: dans le dossier d'uploads (caché, ignoré
+# par le ramasse-miettes) pour rester servable par X-Accel-Redirect.
+_image_resizer = ImageResizer(
+    upload_store.root_dir,
+    thumbnail_generator,
+    ResizedImageCache(
+        os.getenv('MEDIA_CACHE_DIR', os.path.join(upload_store.root_dir, '.cache')),
+        max_bytes=int(os.getenv('MEDIA_CACHE_MAX_BYTES', str(ResizedImageCache.DEFAULT_MAX_BYTES)))
+    )
+)
+
+
+def content_etag(filename: str) -> Optional[str]:
+    """
+    Retourne l'ETag d'un fichier adressé par contenu (son empreinte, avec la
+    variante), ou None pour un nom libre.
+    """
+    match = _CONTENT_HASHED_NAME.match(os.path.basename(filename))
+    return match.group(1) if match else None
+
+
+def _set_cache_headers(response: Response, etag: Optional[str]) -> Response:
+    response.cache_control.public = True
+    if etag is not None:
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = MUTABLE_MAX_AGE
+    return response
+
+
+def _send(path: str, etag: Optional[str]) -> Response:
+    """Envoie un fichier du dossier d'uploads selon MEDIA_OFFLOAD"""
+    if MEDIA_OFFLOAD == 'x-accel-redirect':
+        return _accel_redirect(os.path.relpath(path, upload_store.root_dir), etag)
+    
+    response = send_file(
+        path,
+        request.environ,
+        etag=etag if etag is not None else True,
+        conditional=True,
+        use_x_sendfile=(MEDIA_OFFLOAD == 'x-sendfile')
+    )
+    return _set_cache_headers(response, etag)
+
+
+def _not_modified(etag: str) -> Optional[Response]:
+    """Réponse 304 si le client a déjà ce contenu immuable (sans accès disque)"""
+    if etag not in request.if_none_match:
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return _set_cache_headers(response, etag)
+
+
+def _accel_redirect(filename: str, etag: Optional[str]) -> Response:
+    """
+    Délègue le transfert à nginx; il gère lui-même Range et la validation
+    conditionnelle à partir du fichier interne.
+    """
+    response = Response(status=200)
+    response.headers['X-Accel-Redirect'] = MEDIA_ACCEL_PREFIX.rstrip('/') + '/' + filename
+    response.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if etag is not None:
+        response.set_etag(etag)
+    return _set_cache_headers(response, etag)
+
+
+@media_bp.route('/uploads/<path:filename>', methods=['GET', 'HEAD'])
+@admission_priority(Priority.HIGH)
+def get_upload(filename: str):
+    """
+    Endpoint: GET /uploads/{chemin}
+    Retourne un fichier du dossier d'uploads.
+    
+    Headers:
+    - Range: Partie du fichier (réponse 206)
+    - If-None-Match: ETag déjà en cache (réponse 304)
+    
+    Errors:
+    - 404: Fichier inexistant ou chemin hors du dossier
+    - 416: Plage demandée invalide
+    """
+    try:
+        path = upload_store.path_for(filename)
+    except ValueError:
+        abort(404)
+    
+    etag = content_etag(filename)
+    
+    # Contenu immuable: un ETag connu suffit, sans même toucher au disque
+    if etag is not None:
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+    
+    if not os.path.isfile(path):
+        abort(404)
+    
+    return _send(path, etag)
+
+
+@media_bp.route('/media/<int:picture_id>', methods=['GET', 'HEAD'])
+@admission_priority(Priority.HIGH)
+def get_resized_picture(picture_id: int):
+    """
+    Endpoint: GET /media/{picture_id}?w=&h=&fmt=
+    Retourne une photo redimensionnée (proportions conservées, jamais agrandie).
+    
+    Query Parameters:
+    - w: Largeur maximale (1-2048, arrondie au multiple de 16 supérieur)
+    - h: Hauteur maximale (idem; au moins un des deux est requis)
+    - fmt: jpeg (défaut), webp ou png
+    
+    La première requête d'une taille la produit dans le pool de processus;
+    les requêtes simultanées attendent ce même rendu.
+    
+    Errors:
+    - 400: Paramètres invalides
+    - 404: Photo inexistante
+    """
+    resize_request = ResizeRequest.parse(
+        request.args.get('w', type=int),
+        request.args.get('h', type=int),
+        request.args.get('fmt')
+    )
+    relative_path = listing_service.get_picture_path(picture_id)
+    
+    try:
+        original_path = upload_store.path_for(relative_path)
+    except ValueError:
+        abort(404)
+    
+    if not _image_resizer.is_available:
+        # Sans Pillow: l'original, plutôt qu'une erreur
+        if not os.path.isfile(original_path):
+            abort(404)
+        return _send(original_path, content_etag(relative_path))
+    
+    try:
+        etag = _image_resizer.cache_key(relative_path, resize_request)
+    except FileNotFoundError:
+        abort(404)
+    
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    
+    try:
+        path = _image_resizer.resized_path(relative_path, resize_request)
+    except FileNotFoundError:
+        abort(404)
+    
+    return _send(path, etag)
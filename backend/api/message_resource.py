@@ -0,0 +1,382 @@
+"""
+Resource: MessageResource
+Définit les endpoints REST et le flux temps réel de la messagerie (Couche API).
+"""
+import os
+import json
+import logging
+from typing import Iterator, List, Optional
+from flask import Blueprint, Response, g, jsonify, request
+from application.message.message_service import MessageService
+from application.message.message_assembler import MessageAssembler
+from application.message.dtos.message_response_dto import MessageResponseDto
+from infrastructure.messaging.message_broker import BrokerEvent, MessageBroker, Subscription
+from infrastructure.persistence.in_memory.in_memory_conversation_repository import InMemoryConversationRepository
+from infrastructure.persistence.in_memory.in_memory_message_repository import InMemoryMessageRepository
+from api.auth.session_guard import require_session
+from api.auth_resource import session_validation_service
+from api.listing_resource import listing_repository
+from api.admission_control import Priority, admission_priority
+from api.unit_of_work import unit_of_work_manager
+
+logger = logging.getLogger(__name__)
+
+# Créer le Blueprint Flask
+messages_bp = Blueprint('messages', __name__)
+
+# ===== Initialisation des dépendances =====
+# Chaque flux SSE garde un thread du worker occupé: SSE_MAX_CONNECTIONS
+# plafonne leur nombre par worker (503 + Retry-After au-delà).
+SSE_HEARTBEAT_SECONDS = float(os.getenv('SSE_HEARTBEAT_SECONDS', '15'))
+SSE_RETRY_MS = int(os.getenv('SSE_RETRY_MS', '3000'))
+
+_conversation_repository = InMemoryConversationRepository()
+_message_repository = InMemoryMessageRepository(_conversation_repository)
+_message_broker = MessageBroker(
+    max_connections=int(os.getenv('SSE_MAX_CONNECTIONS', '100')),
+    queue_size=int(os.getenv('SSE_QUEUE_SIZE', '100'))
+)
+_message_service = MessageService(
+    _conversation_repository,
+    _message_repository,
+    listing_repository,
+    MessageAssembler(),
+    _message_broker,
+    unit_of_work_manager
+)
+
+
+def _read_json_body() -> dict:
+    """
+    Retourne le corps JSON de la requête.
+    
+    Raises:
+        ValueError: Si le corps est absent ou n'est pas un objet JSON
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data:
+        raise ValueError("Le corps de la requête doit être au format JSON")
+    return data
+
+
+def _parse_last_event_id() -> Optional[int]:
+    """
+    Lit le dernier événement reçu par le client.
+    
+    EventSource renvoie l'en-tête Last-Event-ID à la reconnexion; le
+    paramètre `last_event_id` couvre la première connexion d'une page
+    rechargée (le navigateur ne conserve pas l'en-tête entre les pages).
+    """
+    raw_value = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        return int(raw_value) if raw_value else None
+    except ValueError:
+        return None
+
+
+def format_sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    """
+    Formate un événement selon le protocole text/event-stream.
+    
+    Args:
+        event: Type d'événement
+        data: Contenu sérialisé en JSON sur une seule ligne
+        event_id: Identifiant repris par Last-Event-ID (optionnel)
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def generate_event_stream(
+    user_id: str,
+    subscription: Subscription,
+    missed_messages: List[MessageResponseDto],
+    unread_count: int,
+    last_event_id: Optional[int],
+    heartbeat_seconds: float = SSE_HEARTBEAT_SECONDS
+) -> Iterator[str]:
+    """
+    Produit le flux SSE d'un utilisateur.
+    
+    Le corps est lu après la fin de la requête, donc hors de son unité de
+    travail: la relecture en base (messages manqués, compteur) est faite
+    par la vue et reçue ici. L'abonnement est ouvert AVANT cette relecture:
+    un message envoyé pendant la relecture arrive aussi dans la file, et
+    les doublons sont écartés par message_id.
+    
+    Args:
+        user_id: Utilisateur authentifié
+        subscription: Abonnement au broker (fermé à la fin du flux)
+        missed_messages: Messages reçus après last_event_id (reprise)
+        unread_count: Compteur de non-lus lu à l'ouverture
+        last_event_id: Dernier message reçu par le client (reprise)
+        heartbeat_seconds: Délai entre deux commentaires de maintien
+    """
+    last_sent_id = last_event_id or 0
+    
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        
+        for message in missed_messages:
+            last_sent_id = max(last_sent_id, message.message_id)
+            yield format_sse('message', message.to_dict(), message.message_id)
+        
+        yield format_sse('unread', {'unread_count': unread_count})
+        
+        while True:
+            event: Optional[BrokerEvent] = subscription.get(timeout=heartbeat_seconds)
+            
+            if event is None:
+                if subscription.overflowed:
+                    break
+                # Commentaire SSE: garde la connexion ouverte à travers les proxys
+                yield ": heartbeat\n\n"
+                continue
+            
+            if event.event_id is not None:
+                if event.event_id <= last_sent_id:
+                    continue
+                last_sent_id = event.event_id
+            
+            yield format_sse(event.event, event.data, event.event_id)
+            
+            if subscription.overflowed:
+                # Client trop lent: il se reconnecte et relit depuis last_sent_id
+                logger.warning(f"File SSE saturée pour l'utilisateur {user_id}: flux fermé")
+                break
+    finally:
+        subscription.close()
+
+
+@messages_bp.route('/conversations', methods=['POST'])
+@require_session(session_validation_service)
+def start_conversation():
+    """
+    Endpoint: POST /api/conversations
+    Ouvre (ou retrouve) la conversation de l'utilisateur avec le vendeur d'une annonce.
+    
+    Le vendeur est celui de l'annonce en base, jamais une valeur du client.
+    Avec `content`, le premier message est envoyé dans la même opération
+    atomique (un seul aller-retour en base) et la réponse est ce message.
+    
+    Request Body (JSON):
+    {
+        "listing_id": "...",
+        "content": "Bonjour!"  # Optionnel
+    }
+    
+    Response (201): La conversation, ou le message envoyé si `content` est fourni
+    
+    Errors:
+    - 400: Données invalides, ou annonce de l'utilisateur lui-même
+    - 401: Session invalide
+    - 404: Annonce non trouvée
+    """
+    data = _read_json_body()
+    
+    if not data.get('listing_id'):
+        raise ValueError("Le champ listing_id est requis")
+    
+    if 'content' in data:
+        response_dto = _message_service.start_conversation_with_message(
+            listing_id=str(data['listing_id']),
+            buyer_id=g.user_id,
+            content=str(data['content'])
+        )
+    else:
+        response_dto = _message_service.start_conversation(
+            listing_id=str(data['listing_id']),
+            buyer_id=g.user_id
+        )
+    
+    return jsonify(response_dto.to_dict()), 201
+
+
+@messages_bp.route('/conversations', methods=['GET'])
+@require_session(session_validation_service)
+def get_inbox():
+    """
+    Endpoint: GET /api/conversations
+    Boîte de réception: conversations de l'utilisateur, la plus récente en premier.
+    
+    Query Parameters:
+    - limit: Nombre de conversations (défaut 50, max 100)
+    
+    Response (200):
+    [
+        {
+            "conversation_id": 1,
+            "other_party_username": "...",
+            "cover_picture_path": "...",
+            "last_message": {"message_id": 9, "preview": "...", "sender_id": "...", "sent_at": "..."},
+            "unread_count": 2,
+            ...
+        }
+    ]
+    
+    Errors:
+    - 400: Limite invalide
+    - 401: Session invalide
+    """
+    limit = request.args.get('limit', default=50, type=int)
+    
+    entries = _message_service.get_inbox(g.user_id, limit)
+    
+    return jsonify([entry.to_dict() for entry in entries]), 200
+
+
+@messages_bp.route('/conversations/<int:conversation_id>/messages', methods=['GET'])
+@require_session(session_validation_service)
+def get_conversation_messages(conversation_id: int):
+    """
+    Endpoint: GET /api/conversations/{id}/messages
+    Récupère une page de l'historique d'une conversation (défilement infini).
+    
+    Query Parameters:
+    - limit: Taille de la page (défaut 50, max 100)
+    - before_message_id: Messages plus anciens que ce message
+    - after_message_id: Messages plus récents que ce message
+    
+    Response (200):
+    {
+        "messages": [...],              # Ordre chronologique
+        "has_more": true,               # D'autres messages dans le sens demandé
+        "before_message_id": 120,       # Curseur de la page plus ancienne
+        "after_message_id": 169         # Curseur de la page plus récente
+    }
+    
+    Errors:
+    - 400: Paramètres invalides
+    - 401: Session invalide
+    - 403: L'utilisateur ne participe pas à la conversation
+    - 404: Conversation non trouvée
+    """
+    page = _message_service.get_conversation_messages(
+        conversation_id,
+        g.user_id,
+        limit=request.args.get('limit', default=50, type=int),
+        before_message_id=request.args.get('before_message_id', type=int),
+        after_message_id=request.args.get('after_message_id', type=int)
+    )
+    
+    return jsonify(page.to_dict()), 200
+
+
+@messages_bp.route('/conversations/<int:conversation_id>/messages', methods=['POST'])
+@require_session(session_validation_service)
+def send_message(conversation_id: int):
+    """
+    Endpoint: POST /api/conversations/{id}/messages
+    Envoie un message; le destinataire le reçoit sur son flux SSE.
+    
+    Request Body (JSON):
+    {
+        "content": "Bonjour, est-ce toujours disponible?"
+    }
+    
+    Response (201): Le message enregistré
+    
+    Errors:
+    - 400: Contenu invalide
+    - 401: Session invalide
+    - 403: L'utilisateur ne participe pas à la conversation
+    - 404: Conversation non trouvée
+    """
+    data = _read_json_body()
+    
+    response_dto = _message_service.send_message(
+        conversation_id,
+        g.user_id,
+        str(data.get('content', ''))
+    )
+    
+    return jsonify(response_dto.to_dict()), 201
+
+
+@messages_bp.route('/conversations/<int:conversation_id>/read', methods=['POST'])
+@require_session(session_validation_service)
+def mark_conversation_read(conversation_id: int):
+    """
+    Endpoint: POST /api/conversations/{id}/read
+    Marque comme lus les messages reçus dans la conversation.
+    
+    Response (200):
+    {
+        "marked_count": 3
+    }
+    
+    Errors:
+    - 401: Session invalide
+    - 403: L'utilisateur ne participe pas à la conversation
+    - 404: Conversation non trouvée
+    """
+    marked_count = _message_service.mark_conversation_read(conversation_id, g.user_id)
+    
+    return jsonify({'marked_count': marked_count}), 200
+
+
+@messages_bp.route('/messages/stream', methods=['GET'])
+@admission_priority(Priority.CRITICAL)
+@require_session(session_validation_service, allow_query_token=True)
+def stream_messages():
+    """
+    Endpoint: GET /api/messages/stream
+    Flux Server-Sent Events des nouveaux messages et du compteur de non-lus.
+    
+    Remplace le sondage de GET /api/conversations/{id}/messages.
+    EventSource ne pouvant pas envoyer d'en-tête, le jeton est accepté
+    en paramètre `access_token`.
+    
+    Events:
+    - message: un message reçu (id = message_id, repris par Last-Event-ID)
+    - unread: {"unread_count": N}
+    
+    Errors:
+    - 401: Session invalide
+    - 503: Plafond de flux du worker atteint (Retry-After)
+    """
+    user_id = g.user_id
+    last_event_id = _parse_last_event_id()
+    subscription = _message_broker.subscribe(user_id)
+    
+    # Lectures dans l'unité de travail de la requête, avant de rendre la réponse
+    try:
+        missed_messages = (
+            _message_service.get_missed_messages(user_id, last_event_id) if last_event_id is not None else []
+        )
+        unread_count = _message_service.get_unread_count(user_id)
+    except Exception:
+        subscription.close()
+        raise
+    
+    logger.info(f"Flux SSE ouvert pour l'utilisateur {user_id}")
+    
+    response = Response(
+        generate_event_stream(user_id, subscription, missed_messages, unread_count, last_event_id),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            # Désactive la mise en tampon de nginx pour ce flux
+            'X-Accel-Buffering': 'no'
+        }
+    )
+    # Le finally du générateur ne s'exécute pas si le corps n'est jamais lu
+    # (HEAD, client parti avant le premier octet): la fermeture libère la place
+    response.call_on_close(subscription.close)
+    return response
+
+
+@messages_bp.route('/messages/health', methods=['GET'])
+@admission_priority(Priority.CRITICAL)
+def health():
+    """Endpoint de santé pour vérifier que le module fonctionne"""
+    return jsonify({
+        'status': 'healthy',
+        'module': 'messages',
+        'stream_connections': _message_broker.connection_count,
+        'stream_max_connections': _message_broker.max_connections
+    }), 200
@@ -0,0 +1,24 @@
+"""
+Resource: MetricsResource
+Expose les métriques du processus au format texte Prometheus.
+"""
+from flask import Blueprint, Response
+from infrastructure.metrics.metrics_registry import metrics_registry
+from api.admission_control import Priority, admission_priority
+
+# Créer le Blueprint Flask (monté sans préfixe: chemin attendu par Prometheus)
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+@admission_priority(Priority.CRITICAL)
+def get_metrics():
+    """
+    Endpoint: GET /metrics
+    Retourne les compteurs et jauges du worker qui répond (label `pid`).
+    """
+    return Response(
+        metrics_registry.render(),
+        headers={'Cache-Control': 'no-store'},
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -0,0 +1,130 @@
+"""
+Limitation de débit par client (seaux de jetons).
+
+Les routes que les robots et les clients défaillants martèlent (recherche
+et création d'annonces) déclarent une politique sous le décorateur de route:
+
+    @listing_bp.route('/listings', methods=['POST'])
+    @rate_limit(CREATE_LISTING_POLICY)
+    def create_listing(): ...
+
+La politique peut aussi dépendre de la requête: `rate_limit(catalogue_policy)`
+réserve le seau de la recherche aux requêtes avec `search`; la simple
+consultation du catalogue (servie depuis un instantané) a un seau plus large.
+
+Le client est identifié par l'en-tête X-User-Id (le sujet du JWT plus tard),
+sinon par son adresse IP: derrière nginx (TRUSTED_PROXY_HOPS=1 à déclarer
+dans l'environnement du déploiement), celle de X-Forwarded-For, posée par
+les mandataires de confiance (register_proxy_fix).
+Les seaux sont partagés par les workers de la machine (voir
+infrastructure/concurrency/rate_limiter.py). Un seau vide donne 429 +
+Retry-After.
+"""
+import math
+import os
+from typing import Callable, TypeVar, Union
+
+from flask import current_app, request
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from domain.exceptions.rate_limit_exceeded_exception import RateLimitExceededException
+from infrastructure.concurrency.rate_limiter import RateLimiter, RatePolicy, default_path
+
+F = TypeVar('F', bound=Callable)
+
+_POLICY_ATTRIBUTE = 'rate_limit_policy'
+
+SEARCH_POLICY = RatePolicy(
+    'listings_search',
+    capacity=float(os.getenv('RATE_LIMIT_SEARCH_BURST', '60')),
+    refill_per_second=float(os.getenv('RATE_LIMIT_SEARCH_PER_SECOND', '20'))
+)
+BROWSE_POLICY = RatePolicy(
+    'listings_browse',
+    capacity=float(os.getenv('RATE_LIMIT_BROWSE_BURST', '120')),
+    refill_per_second=float(os.getenv('RATE_LIMIT_BROWSE_PER_SECOND', '60'))
+)
+CREATE_LISTING_POLICY = RatePolicy(
+    'listings_create',
+    capacity=float(os.getenv('RATE_LIMIT_CREATE_BURST', '5')),
+    refill_per_second=float(os.getenv('RATE_LIMIT_CREATE_PER_MINUTE', '6')) / 60
+)
+
+# Mandataires (nginx, répartiteur) dont X-Forwarded-For est cru. 0 par défaut: exposée
+# directement, l'API ne doit pas croire un en-tête que le client peut forger
+TRUSTED_PROXY_HOPS = int(os.getenv('TRUSTED_PROXY_HOPS', '0'))
+
+# La table n'est projetée qu'au premier contrôle
+rate_limiter = RateLimiter(
+    path=os.getenv('RATE_LIMIT_SHM_PATH', default_path()),
+    slots=int(os.getenv('RATE_LIMIT_SLOTS', '65536'))
+)
+
+
+def rate_limit(policy: Union[RatePolicy, Callable[[], RatePolicy]]) -> Callable[[F], F]:
+    """Déclare la politique de débit d'une route (ou la fonction qui la choisit selon la requête)"""
+    def decorator(view: F) -> F:
+        setattr(view, _POLICY_ATTRIBUTE, policy)
+        return view
+    return decorator
+
+
+def catalogue_policy() -> RatePolicy:
+    """Recherche (paramètre search) ou simple consultation du catalogue"""
+    return SEARCH_POLICY if request.args.get('search', '').strip() else BROWSE_POLICY
+
+
+def client_identity() -> str:
+    """Clé du client de la requête courante: utilisateur déclaré, sinon adresse IP"""
+    user_id = request.headers.get('X-User-Id', '').strip()
+    if user_id:
+        return f"user:{user_id}"
+    return f"ip:{request.remote_addr}"
+
+
+def register_rate_limiting(app, limiter: RateLimiter = rate_limiter):
+    """
+    Enregistre la limitation de débit des routes qui déclarent une politique.
+    
+    À enregistrer avant le contrôle d'admission: un client limité ne prend
+    pas de place parmi les requêtes en cours. Le refus
+    (RateLimitExceededException) est converti en 429 par
+    register_service_exception_handlers.
+    
+    Args:
+        app: Instance Flask
+        limiter: Table des seaux de jetons
+    """
+    
+    @app.before_request
+    def limit_request():
+        if request.method == 'OPTIONS':
+            return
+        view = current_app.view_functions.get(request.endpoint)
+        policy = getattr(view, _POLICY_ATTRIBUTE, None)
+        if callable(policy):
+            policy = policy()
+        if policy is None:
+            return
+        decision = limiter.take(f"{policy.name}:{client_identity()}", policy)
+        if not decision.allowed:
+            raise RateLimitExceededException(
+                "Trop de requêtes, réessayez plus tard",
+                retry_after=max(1, math.ceil(decision.retry_after))
+            )
+
+
+def register_proxy_fix(app, hops: int = TRUSTED_PROXY_HOPS):
+    """
+    Fait confiance aux en-têtes X-Forwarded-* des `hops` derniers mandataires.
+    
+    Sans cela, derrière nginx, request.remote_addr est l'adresse du
+    mandataire: tous les clients anonymes partagent un seul seau. Au-delà
+    de `hops`, les adresses ajoutées par le client sont ignorées.
+    
+    Args:
+        app: Instance Flask
+        hops: Nombre de mandataires de confiance (0: aucun, l'API est exposée directement)
+    """
+    if hops > 0:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops, x_host=hops)
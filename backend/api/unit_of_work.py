@@ -0,0 +1,169 @@
+"""
+Unité de travail par requête HTTP.
+
+Chaque requête ouvre une unité de travail; la connexion MySQL n'est
+empruntée au pool qu'à la première requête SQL. En fin de requête:
+- réponse < 400: un seul commit;
+- réponse >= 400 ou exception non gérée: rollback.
+La connexion est ensuite rendue au pool.
+
+Avec des réplicas (DB_REPLICAS), les requêtes GET/HEAD lisent sur un
+réplica. Après une écriture, l'utilisateur est suivi pendant
+DB_READ_YOUR_WRITES_SECONDS: ses lectures attendent un réplica à jour
+(ou vont au primaire). Le jeton est aussi renvoyé dans l'en-tête
+X-Consistency-Token, que le client peut renvoyer tel quel.
+
+Sur conflit de verrous (deadlock 1213, attente de verrou 1205), toute la
+requête est rejouée dans une nouvelle unité de travail, avec une attente
+exponentielle aléatoire et un budget par requête (DB_CONFLICT_MAX_RETRIES,
+DB_CONFLICT_BUDGET_MS). Budget épuisé: 503 + Retry-After.
+
+Les repositories MySQL reçoivent `unit_of_work_manager.connection()`.
+"""
+import logging
+import os
+from typing import Optional
+
+from flask import g, jsonify, request
+
+from domain.exceptions.database_exception import DatabaseException
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+from infrastructure.database.config import DatabaseConfig
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.database.consistency_tokens import ConsistencyTokenStore
+from infrastructure.database.replica_router import ReplicaRouter
+from infrastructure.database.transaction_runner import TransactionRunner
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from api.exceptions.error_response import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_HEADER = 'X-Consistency-Token'
+READ_ONLY_METHODS = ('GET', 'HEAD')
+
+_database_config = DatabaseConfig()
+_pool_size = int(os.getenv('DB_POOL_SIZE', '10'))
+_pool_timeout = float(os.getenv('DB_POOL_TIMEOUT', '5'))
+
+# Aucune connexion n'est ouverte tant qu'aucun repository MySQL n'en demande
+connection_pool = ConnectionPool(_database_config, size=_pool_size, acquire_timeout_seconds=_pool_timeout)
+replica_router = ReplicaRouter(
+    connection_pool,
+    [(replica.address, ConnectionPool(replica, size=_pool_size, acquire_timeout_seconds=_pool_timeout))
+     for replica in _database_config.replicas]
+) if _database_config.has_replicas else None
+# Jetons client signés avec la clé de l'application (même défaut que main.py)
+consistency_tokens = ConsistencyTokenStore(
+    window_seconds=float(os.getenv('DB_READ_YOUR_WRITES_SECONDS', '5')),
+    secret_key=os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+)
+unit_of_work_manager = UnitOfWorkManager(connection_pool, router=replica_router)
+transaction_runner = TransactionRunner(
+    unit_of_work_manager,
+    max_retries=int(os.getenv('DB_CONFLICT_MAX_RETRIES', '3')),
+    base_delay_seconds=float(os.getenv('DB_CONFLICT_BASE_DELAY_MS', '10')) / 1000,
+    max_delay_seconds=float(os.getenv('DB_CONFLICT_MAX_DELAY_MS', '200')) / 1000,
+    budget_seconds=float(os.getenv('DB_CONFLICT_BUDGET_MS', '1000')) / 1000
+)
+
+
+def register_unit_of_work(
+    app,
+    manager: UnitOfWorkManager = unit_of_work_manager,
+    tokens: ConsistencyTokenStore = consistency_tokens,
+    runner: Optional[TransactionRunner] = transaction_runner
+):
+    """
+    Enregistre l'ouverture et la fermeture de l'unité de travail autour de chaque requête.
+    
+    La reprise sur conflit enveloppe app.dispatch_request: la vue est rejouée
+    entière, que le conflit ait été levé ou rattrapé par la ressource (la
+    connexion l'a signalé à l'unité, voir UnitOfWork.conflict).
+    
+    Args:
+        app: Instance Flask
+        manager: Gestionnaire des unités de travail
+        tokens: Jetons de cohérence des dernières écritures
+        runner: Reprise sur conflit de verrous (None pour la désactiver)
+    """
+    
+    def last_write() -> Optional[str]:
+        # Résolu au premier emprunt: g.user_id est alors fixé par require_session
+        gtid_set = tokens.decode(request.headers.get(CONSISTENCY_HEADER))
+        return gtid_set if gtid_set is not None else tokens.get(g.get('user_id'))
+    
+    @app.before_request
+    def begin_unit_of_work():
+        g.unit_of_work_token = manager.begin(read_only=request.method in READ_ONLY_METHODS, consistency_token=last_write)
+    
+    if runner is not None:
+        dispatch = app.dispatch_request
+        
+        def dispatch_with_retry():
+            started = runner.clock()
+            attempt = 0
+            while True:
+                try:
+                    result = dispatch()
+                except Exception as error:
+                    conflict = runner.conflict_of(manager.current, error)
+                    if conflict is None:
+                        raise
+                else:
+                    conflict = runner.conflict_of(manager.current)
+                    if conflict is None:
+                        return result
+                token = g.pop('unit_of_work_token', None)
+                if token is None:
+                    # Unité déjà fermée par la vue: rien à rejouer
+                    raise conflict
+                manager.end(token, conflict)
+                if not runner.backoff(conflict, attempt, started):
+                    raise ServiceOverloadedException("Conflit d'accès aux données, réessayez plus tard")
+                attempt += 1
+                _rewind_uploads()
+                begin_unit_of_work()
+        
+        app.dispatch_request = dispatch_with_retry
+    
+    @app.after_request
+    def end_unit_of_work(response):
+        token = g.pop('unit_of_work_token', None)
+        if token is None:
+            return response
+        failed = response.status_code >= 400
+        try:
+            unit = manager.end(token, error=DatabaseException(f"Réponse {response.status_code}") if failed else None)
+        except DatabaseException as error:
+            logger.error(f"Échec du commit de fin de requête: {error}")
+            body = ErrorResponse(error='DATABASE_ERROR', description="L'opération n'a pas pu être enregistrée")
+            failure = jsonify(body.to_dict())
+            failure.status_code = 500
+            return failure
+        if unit is not None and unit.written_token is not None:
+            response.headers[CONSISTENCY_HEADER] = tokens.remember(g.get('user_id'), unit.written_token)
+        return response
+    
+    @app.teardown_request
+    def abort_unit_of_work(error):
+        # after_request n'a pas été appelé (exception non gérée)
+        token = g.pop('unit_of_work_token', None)
+        if token is not None:
+            manager.end(token, error=error or DatabaseException("Requête interrompue"))
+
+
+def reads_own_writes(tokens: Optional[ConsistencyTokenStore] = None) -> bool:
+    """
+    Indique si la requête présente un jeton de cohérence valide.
+    
+    Seul un jeton signé et non expiré compte: un en-tête quelconque ne doit
+    pas faire contourner les caches (instantanés, coalescence) du catalogue.
+    """
+    tokens = tokens if tokens is not None else consistency_tokens
+    return tokens.decode(request.headers.get(CONSISTENCY_HEADER)) is not None
+
+
+def _rewind_uploads() -> None:
+    """Remet les fichiers reçus au début avant de rejouer la requête"""
+    for upload in request.files.values():
+        upload.stream.seek(0)
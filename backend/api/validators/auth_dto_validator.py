@@ -0,0 +1,70 @@
+"""
+Validator: AuthDtoValidator
+Valide les données entrantes d'inscription et de connexion.
+"""
+import re
+from api.exceptions.error_response import ErrorResponse
+
+
+class AuthDtoValidator:
+    """
+    Validateur pour les identifiants (IDUL + mot de passe).
+    """
+    
+    # IDUL: lettres suivies de chiffres, 7 caractères maximum (colonne users.idul)
+    IDUL_PATTERN = re.compile(r'^[a-z]{3,7}[0-9]{0,4}$')
+    IDUL_MAX_LENGTH = 7
+    
+    PASSWORD_MIN_LENGTH = 8
+    # bcrypt ignore (ou refuse) tout ce qui dépasse 72 octets
+    PASSWORD_MAX_BYTES = 72
+    
+    @classmethod
+    def validate(cls, data: dict) -> None:
+        """
+        Valide les identifiants.
+        
+        Args:
+            data: Dictionnaire des données à valider
+            
+        Raises:
+            ValueError: Si une donnée est invalide (avec ErrorResponse dans le message)
+        """
+        for field_name in ('idul', 'password'):
+            if field_name not in data or not data[field_name]:
+                raise ValueError(
+                    ErrorResponse(
+                        error='MISSING_PARAMETER',
+                        description=f'Le champ "{field_name}" est requis',
+                        field=field_name
+                    ).to_dict()
+                )
+        
+        idul = str(data['idul']).strip().lower()
+        if len(idul) > cls.IDUL_MAX_LENGTH or not cls.IDUL_PATTERN.match(idul):
+            raise ValueError(
+                ErrorResponse(
+                    error='INVALID_IDUL',
+                    description='Format invalide. Exemple: abk1234',
+                    field='idul'
+                ).to_dict()
+            )
+        
+        password = str(data['password'])
+        if len(password) < cls.PASSWORD_MIN_LENGTH:
+            raise ValueError(
+                ErrorResponse(
+                    error='INVALID_PASSWORD',
+                    description=f'Le mot de passe doit contenir au moins {cls.PASSWORD_MIN_LENGTH} caractères',
+                    field='password'
+                ).to_dict()
+            )
+        
+        if len(password.encode('utf-8')) > cls.PASSWORD_MAX_BYTES:
+            raise ValueError(
+                ErrorResponse(
+                    error='INVALID_PASSWORD',
+                    description=f'Le mot de passe ne peut pas dépasser {cls.PASSWORD_MAX_BYTES} octets',
+                    field='password'
+                ).to_dict()
+            )
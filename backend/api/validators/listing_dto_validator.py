@@ -3,6 +3,7 @@ Validator: ListingDtoValidator
 Valide les données entrantes pour la création d'une annonce.
 """
 import re
+from application.category.category_service import CategoryService
 from api.exceptions.error_response import ErrorResponse
 
 
@@ -12,13 +13,10 @@ class ListingDtoValidator:
     
     Valide les données côté serveur AVANT de les passer au service.
     Double protection avec la validation côté client JavaScript.
-    """
     
-    # Catégories valides (doit correspondre au frontend)
-    VALID_CATEGORIES = [
-        'books', 'electronics', 'housing', 'lab',
-        'sports', 'clothing', 'other'
-    ]
+    Les catégories sont celles de la table `categories` (ID ou nom),
+    vérifiées dans l'arbre en mémoire du CategoryService.
+    """
     
     # Conditions valides
     VALID_CONDITIONS = [
@@ -35,8 +33,16 @@ class ListingDtoValidator:
         'Pavillon Alexandre-Vachon'
     ]
     
-    @classmethod
-    def validate(cls, data: dict) -> None:
+    def __init__(self, category_service: CategoryService):
+        """
+        Initialise le validateur.
+        
+        Args:
+            category_service: Service des catégories (table `categories`)
+        """
+        self._category_service = category_service
+    
+    def validate(self, data: dict) -> None:
         """
         Valide les données de création d'annonce.
         
@@ -47,13 +53,13 @@ class ListingDtoValidator:
             ValueError: Si une donnée est invalide (avec ErrorResponse dans le message)
         """
         # Validation champs obligatoires
-        cls._validate_required_field(data, 'seller_id')
-        cls._validate_required_field(data, 'title')
-        cls._validate_required_field(data, 'description')
-        cls._validate_required_field(data, 'price')
-        cls._validate_required_field(data, 'category')
-        cls._validate_required_field(data, 'condition')
-        cls._validate_required_field(data, 'location')
+        self._validate_required_field(data, 'seller_id')
+        self._validate_required_field(data, 'title')
+        self._validate_required_field(data, 'description')
+        self._validate_required_field(data, 'price')
+        self._validate_required_field(data, 'category')
+        self._validate_required_field(data, 'condition')
+        self._validate_required_field(data, 'location')
         
         # Validation titre
         title = data.get('title', '')
@@ -102,33 +108,33 @@ class ListingDtoValidator:
         
         # Validation catégorie
         category = data.get('category', '')
-        if category not in cls.VALID_CATEGORIES:
+        if not self._category_service.is_valid(category):
             raise ValueError(
                 ErrorResponse(
                     error='INVALID_CATEGORY',
-                    description=f'Catégorie invalide. Valeurs acceptées: {", ".join(cls.VALID_CATEGORIES)}',
+                    description=f'Catégorie inconnue: {category}',
                     field='category'
                 ).to_dict()
             )
         
         # Validation condition
         condition = data.get('condition', '')
-        if condition not in cls.VALID_CONDITIONS:
+        if condition not in self.VALID_CONDITIONS:
             raise ValueError(
                 ErrorResponse(
                     error='INVALID_CONDITION',
-                    description=f'Condition invalide. Valeurs acceptées: {", ".join(cls.VALID_CONDITIONS)}',
+                    description=f'Condition invalide. Valeurs acceptées: {", ".join(self.VALID_CONDITIONS)}',
                     field='condition'
                 ).to_dict()
             )
         
         # Validation location
         location = data.get('location', '')
-        if location not in cls.VALID_LOCATIONS:
+        if location not in self.VALID_LOCATIONS:
             raise ValueError(
                 ErrorResponse(
                     error='INVALID_LOCATION',
-                    description=f'Lieu invalide. Valeurs acceptées: {", ".join(cls.VALID_LOCATIONS)}',
+                    description=f'Lieu invalide. Valeurs acceptées: {", ".join(self.VALID_LOCATIONS)}',
                     field='location'
                 ).to_dict()
             )
@@ -136,7 +142,7 @@ class ListingDtoValidator:
         # Validation course_code (optionnel mais format si présent)
         course_code = data.get('course_code')
         if course_code:
-            if not cls._is_valid_course_code(course_code):
+            if not self._is_valid_course_code(course_code):
                 raise ValueError(
                     ErrorResponse(
                         error='INVALID_COURSE_CODE',
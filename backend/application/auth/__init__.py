@@ -0,0 +1 @@
+"""Module Auth - Application Layer"""
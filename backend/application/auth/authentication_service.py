@@ -0,0 +1,117 @@
+"""
+Service: AuthenticationService
+Orchestre l'inscription et la connexion des utilisateurs.
+"""
+import logging
+import secrets
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from domain.auth.session import Session
+from domain.auth.session_repository import SessionRepository
+from domain.auth.exceptions.invalid_credentials_exception import InvalidCredentialsException
+from domain.user.user import User
+from domain.user.user_repository import UserRepository
+from domain.user.exceptions.user_already_exists_exception import UserAlreadyExistsException
+
+if TYPE_CHECKING:
+    from infrastructure.security.password_hasher import PasswordHasher
+
+logger = logging.getLogger(__name__)
+
+
+class AuthenticationService:
+    """
+    Service gérant l'inscription et la connexion.
+    
+    Le hachage bcrypt est délégué au PasswordHasher (pool de processus).
+    À la connexion, une empreinte créée avec un ancien coût bcrypt est
+    recalculée au coût courant et enregistrée, sans action de l'utilisateur.
+    """
+    
+    SESSION_DURATION = timedelta(hours=24)
+    
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        session_repository: SessionRepository,
+        password_hasher: 'PasswordHasher'
+    ):
+        """
+        Initialise le service avec ses dépendances.
+        
+        Args:
+            user_repository: Repository des comptes
+            session_repository: Repository des sessions
+            password_hasher: Hacheur bcrypt
+        """
+        self._user_repository = user_repository
+        self._session_repository = session_repository
+        self._password_hasher = password_hasher
+    
+    def register(self, idul: str, password: str) -> User:
+        """
+        Inscrit un nouvel utilisateur.
+        
+        Args:
+            idul: Identifiant ULaval
+            password: Mot de passe en clair
+            
+        Returns:
+            L'utilisateur créé
+            
+        Raises:
+            UserAlreadyExistsException: Si l'IDUL est déjà inscrit
+            ServiceOverloadedException: Si le pool bcrypt est saturé
+        """
+        logger.info(f"Inscription de l'utilisateur: {idul}")
+        
+        if self._user_repository.find_by_idul(idul) is not None:
+            raise UserAlreadyExistsException(idul)
+        
+        password_hash = self._password_hasher.hash_password(password)
+        
+        return self._user_repository.save(User(idul=idul, password_hash=password_hash))
+    
+    def login(self, idul: str, password: str) -> Session:
+        """
+        Vérifie les identifiants et ouvre une session.
+        
+        Args:
+            idul: Identifiant ULaval
+            password: Mot de passe en clair
+            
+        Returns:
+            La session créée (contient le jeton à remettre au client)
+            
+        Raises:
+            InvalidCredentialsException: Si les identifiants sont incorrects
+            ServiceOverloadedException: Si le pool bcrypt est saturé
+        """
+        user = self._user_repository.find_by_idul(idul)
+        
+        if user is None or not user.is_active:
+            # Même coût qu'un mot de passe faux: la durée ne révèle pas l'existence du compte
+            self._password_hasher.verify_dummy(password)
+            logger.warning(f"Connexion refusée pour: {idul}")
+            raise InvalidCredentialsException()
+        
+        is_valid, new_hash = self._password_hasher.verify_and_update(password, user.password_hash)
+        
+        if not is_valid:
+            logger.warning(f"Mot de passe incorrect pour: {idul}")
+            raise InvalidCredentialsException()
+        
+        if new_hash is not None:
+            # Le coût bcrypt a changé depuis le dernier hachage
+            self._user_repository.update_password_hash(user.user_id, new_hash)
+            logger.info(f"Empreinte du mot de passe recalculée pour l'utilisateur {user.user_id}")
+        
+        session = Session(
+            user_id=user.user_id,
+            token=secrets.token_urlsafe(32),
+            expires_at=datetime.now() + self.SESSION_DURATION
+        )
+        self._session_repository.save(session)
+        
+        logger.info(f"Session ouverte pour l'utilisateur {user.user_id}")
+        return session
@@ -0,0 +1,146 @@
+"""
+Service: SessionValidationService
+Valide les jetons de session des requêtes protégées et gère leur révocation.
+"""
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+from domain.auth.session import Session
+from domain.auth.session_repository import SessionRepository
+from domain.auth.exceptions.invalid_session_exception import InvalidSessionException
+
+if TYPE_CHECKING:
+    from infrastructure.auth.session_cache import SessionCache
+    from infrastructure.auth.revocation_channel import RevocationChannel
+
+logger = logging.getLogger(__name__)
+
+
+class SessionValidationService:
+    """
+    Service de validation des sessions.
+    
+    Sans cache, chaque requête protégée interroge la table `sessions`.
+    Avec un SessionCache, seule la première requête d'un jeton (ou celle qui
+    suit l'expiration de l'entrée) touche la base.
+    
+    Les révocations (logout, réinitialisation du mot de passe) sont écrites
+    en base puis diffusées sur le RevocationChannel, pour que le cache de
+    chaque worker retire l'entrée correspondante.
+    """
+    
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        session_cache: Optional['SessionCache'] = None,
+        revocation_channel: Optional['RevocationChannel'] = None
+    ):
+        """
+        Initialise le service avec ses dépendances.
+        
+        Args:
+            session_repository: Repository des sessions
+            session_cache: Cache des sessions validées (optionnel)
+            revocation_channel: Canal de diffusion des révocations (optionnel)
+        """
+        self._session_repository = session_repository
+        self._session_cache = session_cache
+        self._revocation_channel = revocation_channel
+        
+        if session_cache is not None and revocation_channel is not None:
+            revocation_channel.subscribe(self._on_revocation)
+    
+    def validate_token(self, token: Optional[str]) -> str:
+        """
+        Valide un jeton et retourne l'utilisateur authentifié.
+        
+        Args:
+            token: Jeton extrait de l'en-tête Authorization
+            
+        Returns:
+            ID de l'utilisateur propriétaire de la session
+            
+        Raises:
+            InvalidSessionException: Si le jeton est absent, expiré ou révoqué
+        """
+        if not token:
+            raise InvalidSessionException("jeton manquant")
+        
+        token_hash = Session.hash_token(token)
+        
+        generation = None
+        if self._session_cache is not None:
+            cached = self._session_cache.get(token_hash, datetime.now())
+            if cached is not None:
+                return cached.user_id
+            # Lue avant la base: une révocation concurrente empêche la mise en cache
+            generation = self._session_cache.generation()
+        
+        session = self._session_repository.find_active_by_token(token)
+        
+        if session is None:
+            raise InvalidSessionException("jeton expiré ou révoqué")
+        
+        if self._session_cache is not None:
+            self._session_cache.put(token_hash, session.user_id, session.expires_at, generation)
+        
+        return session.user_id
+    
+    def revoke_session(self, token: str) -> bool:
+        """
+        Révoque une session (logout).
+        
+        Args:
+            token: Jeton de la session
+            
+        Returns:
+            True si une session active a été révoquée
+        """
+        revoked = self._session_repository.revoke(token)
+        
+        self._broadcast('token', Session.hash_token(token))
+        
+        logger.info("Session révoquée" if revoked else "Révocation d'une session déjà inactive")
+        return revoked
+    
+    def revoke_user_sessions(self, user_id: str) -> int:
+        """
+        Révoque toutes les sessions d'un utilisateur (réinitialisation du mot de passe).
+        
+        Args:
+            user_id: ID de l'utilisateur
+            
+        Returns:
+            Nombre de sessions révoquées en base
+        """
+        revoked_count = self._session_repository.revoke_all_for_user(user_id)
+        
+        self._broadcast('user', str(user_id))
+        
+        logger.info(f"{revoked_count} session(s) révoquée(s) pour l'utilisateur {user_id}")
+        return revoked_count
+    
+    def _broadcast(self, kind: str, value: str) -> None:
+        """
+        Invalide le cache local puis prévient les autres workers.
+        
+        Les types 'token' et 'user' correspondent à KIND_TOKEN et KIND_USER
+        du module infrastructure.auth.revocation_channel.
+        """
+        if self._revocation_channel is not None:
+            # Le canal rappelle _on_revocation pour le worker courant
+            self._revocation_channel.publish(kind, value)
+        else:
+            self._on_revocation(kind, value)
+    
+    def _on_revocation(self, kind: str, value: str) -> None:
+        """Applique une révocation reçue au cache local"""
+        if self._session_cache is None:
+            return
+        
+        if kind == 'token':
+            self._session_cache.invalidate(value)
+        elif kind == 'user':
+            self._session_cache.invalidate_user(value)
+        else:
+            logger.warning(f"Type de révocation inconnu ignoré: {kind}")
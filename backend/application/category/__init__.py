@@ -0,0 +1 @@
+"""Module Category - Application Layer"""
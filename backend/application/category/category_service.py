@@ -0,0 +1,138 @@
+"""
+Service: CategoryService
+Garde l'arbre des catégories en mémoire et résout les filtres par catégorie.
+"""
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Union
+from domain.category.category import Category
+from domain.category.category_repository import CategoryRepository
+from domain.category.category_tree import CategoryTree
+from domain.category.exceptions.category_not_found_exception import CategoryNotFoundException
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryService:
+    """
+    Service de lecture des catégories.
+    
+    L'arbre complet est chargé au premier accès puis partagé par toutes les
+    requêtes. Au plus une fois par `refresh_interval_seconds`, la version de
+    la table est relue (une ligne); l'arbre n'est rechargé que si elle a
+    changé. Le remplacement est une simple affectation de référence: les
+    lecteurs ne prennent jamais de verrou.
+    """
+    
+    DEFAULT_REFRESH_INTERVAL_SECONDS = 30.0
+    
+    def __init__(
+        self,
+        category_repository: CategoryRepository,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise le service avec ses dépendances.
+        
+        Args:
+            category_repository: Repository des catégories
+            refresh_interval_seconds: Délai minimal entre deux lectures de la version
+            clock: Horloge monotone (injectable pour les tests)
+        """
+        self._category_repository = category_repository
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._clock = clock
+        self._tree: Optional[CategoryTree] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def tree(self) -> CategoryTree:
+        """Arbre courant, rafraîchi si l'intervalle est écoulé"""
+        tree = self._tree
+        if tree is None or self._clock() >= self._next_check:
+            tree = self._refresh_if_stale()
+        return tree
+    
+    def refresh(self) -> CategoryTree:
+        """
+        Recharge l'arbre immédiatement, quelle que soit la version.
+        
+        Returns:
+            Le nouvel arbre
+        """
+        with self._lock:
+            return self._load(self._category_repository.get_version())
+    
+    def resolve(self, identifier: Union[int, str]) -> Category:
+        """
+        Trouve une catégorie par ID ou par nom.
+        
+        Args:
+            identifier: ID (ou chaîne de chiffres) ou nom, sans égard à la casse
+        
+        Returns:
+            La catégorie
+        
+        Raises:
+            CategoryNotFoundException: Si la catégorie n'existe pas
+        """
+        category = self.tree.find(identifier)
+        if category is None:
+            raise CategoryNotFoundException(str(identifier))
+        return category
+    
+    def is_valid(self, identifier: Union[int, str]) -> bool:
+        """Vérifie qu'une catégorie existe (lecture de dictionnaire)"""
+        return self.tree.find(identifier) is not None
+    
+    def expand_filter(self, identifier: Union[int, str]) -> List[int]:
+        """
+        Convertit un filtre par catégorie en liste plate d'IDs: la catégorie
+        et toutes ses sous-catégories, pour un `category_id IN (...)`.
+        
+        Args:
+            identifier: ID ou nom de la catégorie filtrée
+        
+        Returns:
+            IDs triés
+        
+        Raises:
+            CategoryNotFoundException: Si la catégorie n'existe pas
+        """
+        tree = self.tree
+        category = tree.find(identifier)
+        if category is None:
+            raise CategoryNotFoundException(str(identifier))
+        return sorted(tree.descendants(category.category_id))
+    
+    def _refresh_if_stale(self) -> CategoryTree:
+        with self._lock:
+            tree = self._tree
+            now = self._clock()
+            if tree is not None and now < self._next_check:
+                # Un autre thread vient de vérifier
+                return tree
+            
+            try:
+                version = self._category_repository.get_version()
+                if tree is None or version != tree.version:
+                    tree = self._load(version)
+            except Exception:
+                if tree is None:
+                    raise
+                # Base indisponible: l'arbre connu reste valable jusqu'au prochain essai
+                logger.warning("Vérification de la version des catégories impossible", exc_info=True)
+            
+            self._next_check = now + self._refresh_interval_seconds
+            return tree
+    
+    def _load(self, version: int) -> CategoryTree:
+        """Charge l'arbre complet (appelé sous verrou)"""
+        tree = CategoryTree(self._category_repository.find_all(), version)
+        self._tree = tree
+        self._next_check = self._clock() + self._refresh_interval_seconds
+        logger.info(f"Arbre des catégories chargé: {len(tree)} catégorie(s), version {version}")
+        return tree
@@ -28,6 +28,7 @@ class ListingResponseDto:
     images: List[str]
     is_sold: bool
     created_at: str  # ISO format string
+    cover_image: Optional[str] = None  # Petite variante de la photo de couverture
     
     def to_dict(self) -> dict:
         """
@@ -48,5 +49,6 @@ class ListingResponseDto:
             'course_code': self.course_code,
             'images': self.images,
             'is_sold': self.is_sold,
-            'created_at': self.created_at
+            'created_at': self.created_at,
+            'cover_image': self.cover_image
         }
@@ -5,7 +5,9 @@ Responsable de la transformation des données entre les couches.
 """
 import uuid
 from datetime import datetime
+from typing import Dict, Optional
 from domain.listing.listing import Listing
+from domain.listing.listing_picture import ListingPicture
 from domain.listing.listing_price import ListingPrice
 from domain.listing.listing_condition import ListingCondition
 from application.listing.dtos.listing_creation_dto import ListingCreationDto
@@ -63,7 +65,7 @@ class ListingAssembler:
         return listing
     
     @staticmethod
-    def to_response_dto(listing: Listing) -> ListingResponseDto:
+    def to_response_dto(listing: Listing, cover: Optional[ListingPicture] = None) -> ListingResponseDto:
         """
         Convertit une entité Listing en ListingResponseDto.
         
@@ -72,6 +74,7 @@ class ListingAssembler:
         
         Args:
             listing: L'entité Listing
+            cover: Photo de couverture (sa petite variante est servie au catalogue)
             
         Returns:
             DTO pour la réponse API
@@ -88,21 +91,26 @@ class ListingAssembler:
             course_code=listing.course_code,
             images=listing.images,
             is_sold=listing.is_sold,
-            created_at=listing.created_at.isoformat()  # Format ISO 8601
+            created_at=listing.created_at.isoformat(),  # Format ISO 8601
+            cover_image=cover.small_path if cover else None
         )
     
     @staticmethod
-    def to_response_dto_list(listings: list[Listing]) -> list[ListingResponseDto]:
+    def to_response_dto_list(
+        listings: list[Listing],
+        covers: Optional[Dict[str, ListingPicture]] = None
+    ) -> list[ListingResponseDto]:
         """
         Convertit une liste d'entités Listing en liste de DTOs.
         
         Args:
             listings: Liste d'entités Listing
+            covers: Photos de couverture par listing_id (optionnel)
             
         Returns:
             Liste de DTOs pour la réponse API
         """
         return [
-            ListingAssembler.to_response_dto(listing)
+            ListingAssembler.to_response_dto(listing, (covers or {}).get(listing.listing_id))
             for listing in listings
         ]
@@ -4,13 +4,26 @@ Orchestre les opérations métier liées aux annonces.
 Coordonne le Domaine et l'Infrastructure.
 """
 import logging
-from typing import List
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional
+from domain.listing.listing import Listing
+from domain.listing.listing_picture import ListingPicture
+from domain.listing.listing_picture_repository import ListingPictureRepository
 from domain.listing.listing_repository import ListingRepository
+from domain.listing.exceptions.invalid_picture_exception import InvalidPictureException
 from domain.listing.exceptions.listing_not_found_exception import ListingNotFoundException
+from domain.listing.exceptions.picture_not_found_exception import PictureNotFoundException
 from application.listing.listing_assembler import ListingAssembler
 from application.listing.dtos.listing_creation_dto import ListingCreationDto
 from application.listing.dtos.listing_response_dto import ListingResponseDto
 
+if TYPE_CHECKING:
+    from application.category.category_service import CategoryService
+    from infrastructure.cache.snapshot_cache import SnapshotCache
+    from infrastructure.concurrency.query_coalescer import QueryCoalescer
+    from infrastructure.database.unit_of_work import UnitOfWorkManager
+    from infrastructure.imaging.thumbnail_generator import ThumbnailGenerator
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,10 +41,22 @@ class ListingService:
     - Logger les opérations importantes
     """
     
+    # Maximum de photos par annonce (même règle que Listing.add_image)
+    MAX_PICTURES = 5
+    
+    # Préfixe public des fichiers du dossier d'uploads (cf. listing_pictures.file_path)
+    PICTURES_URL_PREFIX = '/uploads/'
+    
     def __init__(
         self,
         listing_repository: ListingRepository,
-        listing_assembler: ListingAssembler
+        listing_assembler: ListingAssembler,
+        picture_repository: Optional[ListingPictureRepository] = None,
+        thumbnail_generator: Optional['ThumbnailGenerator'] = None,
+        category_service: Optional['CategoryService'] = None,
+        query_coalescer: Optional['QueryCoalescer'] = None,
+        catalogue_snapshots: Optional['SnapshotCache'] = None,
+        unit_of_work_manager: Optional['UnitOfWorkManager'] = None
     ):
         """
         Initialise le service avec ses dépendances.
@@ -39,11 +64,29 @@ class ListingService:
         Args:
             listing_repository: Repository pour la persistance
             listing_assembler: Assembler pour les conversions
+            picture_repository: Repository des photos (optionnel: sans lui,
+                les réponses n'ont pas de cover_image)
+            thumbnail_generator: Génération des variantes en arrière-plan (optionnel)
+            category_service: Arbre des catégories (optionnel: sans lui, la
+                catégorie est enregistrée telle quelle et le filtre n'inclut
+                pas les sous-catégories)
+            query_coalescer: Coalescence des lectures identiques du catalogue
+                (optionnel: sans lui, chaque appel de query_listings lit le repository)
+            catalogue_snapshots: Instantanés du catalogue, périmés à chaque
+                écriture (optionnel)
+            unit_of_work_manager: Unités de travail des traitements de fond
+                (variantes des photos); optionnel avec des repositories en mémoire
             
         Note: Les dépendances sont injectées (Dependency Injection)
         """
         self._listing_repository = listing_repository
         self._listing_assembler = listing_assembler
+        self._picture_repository = picture_repository
+        self._thumbnail_generator = thumbnail_generator
+        self._category_service = category_service
+        self._query_coalescer = query_coalescer
+        self._catalogue_snapshots = catalogue_snapshots
+        self._unit_of_work_manager = unit_of_work_manager
     
     def create_listing(self, dto: ListingCreationDto) -> ListingResponseDto:
         """
@@ -68,11 +111,16 @@ class ListingService:
         logger.info(f"Création d'une annonce: '{dto.title}' par vendeur {dto.seller_id}")
         
         try:
+            # La catégorie peut être donnée par nom: on enregistre son ID
+            if self._category_service is not None:
+                dto.category = str(self._category_service.resolve(dto.category).category_id)
+            
             # 1. Convertir DTO → Entité Domaine
             listing = self._listing_assembler.to_listing(dto)
             
             # 2. Sauvegarder (la validation est faite dans le constructeur de Listing)
             self._listing_repository.save(listing)
+            self._catalogue_changed()
             
             logger.info(f"Annonce créée avec succès: {listing.listing_id}")
             
@@ -88,6 +136,58 @@ class ListingService:
             logger.error(f"Erreur inattendue lors de la création: {str(e)}", exc_info=True)
             raise RuntimeError(f"Erreur lors de la création de l'annonce: {str(e)}")
     
+    def create_listing_with_pictures(
+        self,
+        dto: ListingCreationDto,
+        picture_paths: List[str]
+    ) -> ListingResponseDto:
+        """
+        Crée une annonce avec les photos déjà stockées sur disque.
+        
+        L'annonce est retournée sans attendre les variantes: elles sont
+        générées en arrière-plan et enregistrées quand elles sont prêtes.
+        D'ici là, l'original sert de couverture.
+        
+        Args:
+            dto: Données de création de l'annonce
+            picture_paths: Chemins des photos, relatifs au dossier d'uploads
+                (la première est la couverture)
+            
+        Returns:
+            DTO contenant l'annonce créée
+            
+        Raises:
+            InvalidPictureException: Si le nombre de photos dépasse MAX_PICTURES
+            ValueError: Si les données sont invalides
+        """
+        if len(picture_paths) > self.MAX_PICTURES:
+            raise InvalidPictureException(
+                picture_paths[self.MAX_PICTURES],
+                f"Maximum {self.MAX_PICTURES} photos par annonce"
+            )
+        if picture_paths and self._picture_repository is None:
+            raise RuntimeError("Aucun repository de photos configuré")
+        
+        dto.images = [self.PICTURES_URL_PREFIX + path for path in picture_paths]
+        response_dto = self.create_listing(dto)
+        
+        for index, relative_path in enumerate(picture_paths):
+            picture = self._picture_repository.save(ListingPicture(
+                listing_id=response_dto.listing_id,
+                file_path=self.PICTURES_URL_PREFIX + relative_path,
+                is_cover=(index == 0)
+            ))
+            if picture.is_cover:
+                response_dto.cover_image = picture.small_path
+            self._schedule_variants(picture, relative_path)
+        if picture_paths:
+            # Les couvertures sont servies dans le catalogue
+            self._catalogue_changed()
+        
+        logger.info(f"{len(picture_paths)} photo(s) ajoutée(s) à l'annonce {response_dto.listing_id}")
+        
+        return response_dto
+    
     def get_listing_by_id(self, listing_id: str) -> ListingResponseDto:
         """
         Récupère une annonce par son ID.
@@ -109,7 +209,30 @@ class ListingService:
             logger.warning(f"Annonce non trouvée: {listing_id}")
             raise ListingNotFoundException(listing_id)
         
-        return self._listing_assembler.to_response_dto(listing)
+        return self._listing_assembler.to_response_dto(
+            listing,
+            self._covers_for([listing]).get(listing.listing_id)
+        )
+    
+    def get_picture_path(self, picture_id: int) -> str:
+        """
+        Retourne le chemin de l'original d'une photo, relatif au dossier d'uploads.
+        
+        Args:
+            picture_id: ID de la photo
+            
+        Raises:
+            PictureNotFoundException: Si la photo n'existe pas
+        """
+        picture = self._picture_repository.find_by_id(picture_id) if self._picture_repository else None
+        
+        if picture is None:
+            raise PictureNotFoundException(picture_id)
+        
+        file_path = picture.file_path
+        if file_path.startswith(self.PICTURES_URL_PREFIX):
+            file_path = file_path[len(self.PICTURES_URL_PREFIX):]
+        return file_path
     
     def get_all_listings(self) -> List[ListingResponseDto]:
         """
@@ -122,7 +245,7 @@ class ListingService:
         
         listings = self._listing_repository.find_all()
         
-        return self._listing_assembler.to_response_dto_list(listings)
+        return self._listing_assembler.to_response_dto_list(listings, self._covers_for(listings))
     
     def get_listings_by_seller(self, seller_id: str) -> List[ListingResponseDto]:
         """
@@ -138,7 +261,25 @@ class ListingService:
         
         listings = self._listing_repository.find_by_seller_id(seller_id)
         
-        return self._listing_assembler.to_response_dto_list(listings)
+        return self._listing_assembler.to_response_dto_list(listings, self._covers_for(listings))
+    
+    def get_listings_by_category(self, category: str) -> List[ListingResponseDto]:
+        """
+        Récupère les annonces d'une catégorie et de ses sous-catégories.
+        
+        Args:
+            category: ID ou nom de la catégorie (ex: "Électronique" inclut
+                Calculatrices et Ordinateurs)
+            
+        Returns:
+            Liste de DTOs des annonces
+            
+        Raises:
+            CategoryNotFoundException: Si la catégorie n'existe pas
+        """
+        logger.info(f"Récupération des annonces de la catégorie: {category}")
+        
+        return self._listings_in_categories(self._category_ids(category))
     
     def search_listings(self, query: str) -> List[ListingResponseDto]:
         """
@@ -154,7 +295,61 @@ class ListingService:
         
         listings = self._listing_repository.search(query)
         
-        return self._listing_assembler.to_response_dto_list(listings)
+        return self._listing_assembler.to_response_dto_list(listings, self._covers_for(listings))
+    
+    def query_listings(
+        self,
+        seller_id: Optional[str] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        coalesce: bool = True,
+        render: Optional[Callable[[List[Dict[str, Any]]], Any]] = None
+    ) -> Any:
+        """
+        Lit le catalogue selon un filtre et retourne les annonces sérialisées.
+        
+        Un seul filtre s'applique, par priorité: vendeur, catégorie, recherche.
+        Les lectures identiques en cours (filtre normalisé: catégorie
+        développée en IDs, recherche en minuscules sans espaces superflus)
+        partagent une seule lecture du repository et une seule sérialisation.
+        Avec `render`, elles partagent aussi le rendu (corps JSON compressé):
+        c'est lui qui coûte le plus lors d'une rafale.
+        
+        Args:
+            seller_id: Filtrer par vendeur
+            category: Filtrer par catégorie (ID ou nom), sous-catégories comprises
+            search: Recherche par mots-clés (insensible à la casse)
+            coalesce: Partager les lectures en cours (False quand le client
+                doit lire ses propres écritures: une lecture commencée avant
+                elles ne les contient pas)
+            render: Rendu des dictionnaires, fait une seule fois pour les
+                lectures partagées (optionnel)
+            
+        Returns:
+            Liste de dictionnaires des annonces, ou son rendu; partagé: à ne pas modifier
+            
+        Raises:
+            CategoryNotFoundException: Si la catégorie n'existe pas
+        """
+        if seller_id:
+            key, read = ('seller', seller_id), lambda: self.get_listings_by_seller(seller_id)
+        elif category:
+            category_ids = self._category_ids(category)
+            key, read = ('category', tuple(sorted(category_ids))), lambda: self._listings_in_categories(category_ids)
+        elif search:
+            terms = ' '.join(search.lower().split())
+            key, read = ('search', terms), lambda: self.search_listings(terms)
+        else:
+            key, read = ('all',), self.get_all_listings
+        
+        def serialized() -> Any:
+            listings_data = [listing.to_dict() for listing in read()]
+            return render(listings_data) if render is not None else listings_data
+        
+        if self._query_coalescer is None or not coalesce:
+            return serialized()
+        # Deux rendus différents d'une même lecture ne se partagent pas
+        return self._query_coalescer.run(key if render is None else key + (render,), serialized)
     
     def delete_listing(self, listing_id: str, user_id: str) -> None:
         """
@@ -190,5 +385,70 @@ class ListingService:
         
         # Supprimer
         self._listing_repository.delete(listing)
+        self._catalogue_changed()
         
         logger.info(f"Annonce supprimée: {listing_id}")
+    
+    def _catalogue_changed(self) -> None:
+        """Signale une écriture aux instantanés du catalogue (reconstruits en arrière-plan)"""
+        if self._catalogue_snapshots is None:
+            return
+        
+        try:
+            self._catalogue_snapshots.invalidate()
+        except Exception as e:
+            # L'écriture est faite: l'instantané expirera après sa péremption maximale
+            logger.error(f"Échec de la péremption des instantanés du catalogue: {str(e)}", exc_info=True)
+    
+    def _category_ids(self, category: str) -> List[str]:
+        """IDs de la catégorie et de ses sous-catégories (CategoryNotFoundException si inconnue)"""
+        if self._category_service is None:
+            return [category]
+        return [str(category_id) for category_id in self._category_service.expand_filter(category)]
+    
+    def _listings_in_categories(self, category_ids: List[str]) -> List[ListingResponseDto]:
+        listings = self._listing_repository.find_by_categories(category_ids)
+        return self._listing_assembler.to_response_dto_list(listings, self._covers_for(listings))
+    
+    def _covers_for(self, listings: List[Listing]) -> Dict[str, ListingPicture]:
+        """
+        Récupère les couvertures d'une liste d'annonces en une seule requête.
+        
+        Returns:
+            Dictionnaire listing_id → photo de couverture
+        """
+        if self._picture_repository is None or not listings:
+            return {}
+        return self._picture_repository.find_covers(listing.listing_id for listing in listings)
+    
+    def _unit_of_work(self) -> ContextManager:
+        """Unité de travail d'un traitement de fond (celle de la requête si le rappel y est exécuté)"""
+        if self._unit_of_work_manager is None:
+            return nullcontext()
+        return self._unit_of_work_manager.scope(join_current=True)
+    
+    def _schedule_variants(self, picture: ListingPicture, relative_path: str) -> None:
+        """
+        Planifie la génération des variantes d'une photo; leurs chemins sont
+        écrits dans `listing_pictures` depuis le thread de fin du pool.
+        
+        Args:
+            picture: Photo enregistrée (avec picture_id)
+            relative_path: Chemin de l'original, relatif au dossier d'uploads
+        """
+        if self._thumbnail_generator is None:
+            return
+        
+        def on_done(variants: Dict[str, str]) -> None:
+            # Thread de fin du pool: hors de toute requête, donc de son unité de travail
+            with self._unit_of_work():
+                self._picture_repository.update_variants(
+                    picture.picture_id,
+                    self.PICTURES_URL_PREFIX + variants['thumbnail'],
+                    self.PICTURES_URL_PREFIX + variants['medium']
+                )
+            if picture.is_cover:
+                self._catalogue_changed()
+            logger.info(f"Variantes prêtes pour la photo {picture.picture_id}")
+        
+        self._thumbnail_generator.submit(relative_path, on_done)
@@ -0,0 +1,35 @@
+"""
+DTO: ConversationResponseDto
+Data Transfer Object pour retourner une conversation via l'API.
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class ConversationResponseDto:
+    """
+    DTO pour retourner une conversation au client.
+    """
+    
+    conversation_id: int
+    listing_id: str
+    buyer_id: str
+    seller_id: str
+    last_message_at: str  # ISO format string
+    created_at: str  # ISO format string
+    
+    def to_dict(self) -> dict:
+        """
+        Convertit le DTO en dictionnaire pour sérialisation JSON.
+        
+        Returns:
+            Dictionnaire représentant la conversation
+        """
+        return {
+            'conversation_id': self.conversation_id,
+            'listing_id': self.listing_id,
+            'buyer_id': self.buyer_id,
+            'seller_id': self.seller_id,
+            'last_message_at': self.last_message_at,
+            'created_at': self.created_at
+        }
@@ -0,0 +1,51 @@
+"""
+DTO: InboxEntryResponseDto
+Data Transfer Object pour une ligne de la boîte de réception.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class InboxEntryResponseDto:
+    """
+    DTO pour retourner une conversation de la boîte de réception.
+    """
+    
+    conversation_id: int
+    listing_id: str
+    other_party_id: str
+    other_party_username: Optional[str]
+    cover_picture_path: Optional[str]
+    last_message_id: Optional[int]
+    last_message_preview: Optional[str]
+    last_sender_id: Optional[str]
+    last_message_at: str  # ISO format string
+    unread_count: int
+    
+    def to_dict(self) -> dict:
+        """
+        Convertit le DTO en dictionnaire pour sérialisation JSON.
+        
+        Returns:
+            Dictionnaire représentant l'entrée (last_message à None si aucun message)
+        """
+        last_message = None
+        if self.last_message_id is not None:
+            last_message = {
+                'message_id': self.last_message_id,
+                'preview': self.last_message_preview,
+                'sender_id': self.last_sender_id,
+                'sent_at': self.last_message_at
+            }
+        
+        return {
+            'conversation_id': self.conversation_id,
+            'listing_id': self.listing_id,
+            'other_party_id': self.other_party_id,
+            'other_party_username': self.other_party_username,
+            'cover_picture_path': self.cover_picture_path,
+            'last_message': last_message,
+            'last_message_at': self.last_message_at,
+            'unread_count': self.unread_count
+        }
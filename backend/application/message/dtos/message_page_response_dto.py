@@ -0,0 +1,43 @@
+"""
+DTO: MessagePageResponseDto
+Data Transfer Object pour une page de l'historique d'une conversation.
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+from application.message.dtos.message_response_dto import MessageResponseDto
+
+
+@dataclass
+class MessagePageResponseDto:
+    """
+    DTO pour retourner une page de messages au client.
+    
+    Les curseurs renvoyés se passent tels quels à la requête suivante:
+    `before_message_id` pour remonter l'historique, `after_message_id`
+    pour charger les messages plus récents.
+    """
+    
+    messages: List[MessageResponseDto]
+    has_more: bool  # D'autres messages existent dans le sens demandé
+    
+    @property
+    def before_message_id(self) -> Optional[int]:
+        return self.messages[0].message_id if self.messages else None
+    
+    @property
+    def after_message_id(self) -> Optional[int]:
+        return self.messages[-1].message_id if self.messages else None
+    
+    def to_dict(self) -> dict:
+        """
+        Convertit le DTO en dictionnaire pour sérialisation JSON.
+        
+        Returns:
+            Dictionnaire représentant la page
+        """
+        return {
+            'messages': [message.to_dict() for message in self.messages],
+            'has_more': self.has_more,
+            'before_message_id': self.before_message_id,
+            'after_message_id': self.after_message_id
+        }
@@ -0,0 +1,35 @@
+"""
+DTO: MessageResponseDto
+Data Transfer Object pour retourner un message via l'API.
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class MessageResponseDto:
+    """
+    DTO pour retourner un message au client.
+    """
+    
+    message_id: int
+    conversation_id: int
+    sender_id: str
+    content: str
+    is_read: bool
+    created_at: str  # ISO format string
+    
+    def to_dict(self) -> dict:
+        """
+        Convertit le DTO en dictionnaire pour sérialisation JSON.
+        
+        Returns:
+            Dictionnaire représentant le message
+        """
+        return {
+            'message_id': self.message_id,
+            'conversation_id': self.conversation_id,
+            'sender_id': self.sender_id,
+            'content': self.content,
+            'is_read': self.is_read,
+            'created_at': self.created_at
+        }
@@ -0,0 +1,94 @@
+"""
+Assembler: MessageAssembler
+Convertit les entités Message et Conversation en DTOs de réponse.
+"""
+from domain.message.conversation import Conversation
+from domain.message.inbox_entry import InboxEntry
+from domain.message.message import Message
+from application.message.dtos.conversation_response_dto import ConversationResponseDto
+from application.message.dtos.inbox_entry_response_dto import InboxEntryResponseDto
+from application.message.dtos.message_response_dto import MessageResponseDto
+
+
+class MessageAssembler:
+    """
+    Assembler pour la messagerie (Entité Domaine → DTO → API → JSON).
+    """
+    
+    @staticmethod
+    def to_response_dto(message: Message) -> MessageResponseDto:
+        """
+        Convertit une entité Message en MessageResponseDto.
+        
+        Args:
+            message: L'entité Message
+            
+        Returns:
+            DTO pour la réponse API
+        """
+        return MessageResponseDto(
+            message_id=message.message_id,
+            conversation_id=message.conversation_id,
+            sender_id=message.sender_id,
+            content=message.content,
+            is_read=message.is_read,
+            created_at=message.created_at.isoformat()
+        )
+    
+    @staticmethod
+    def to_response_dto_list(messages: list[Message]) -> list[MessageResponseDto]:
+        """
+        Convertit une liste d'entités Message en liste de DTOs.
+        
+        Args:
+            messages: Liste d'entités Message
+            
+        Returns:
+            Liste de DTOs pour la réponse API
+        """
+        return [MessageAssembler.to_response_dto(message) for message in messages]
+    
+    @staticmethod
+    def to_conversation_dto(conversation: Conversation) -> ConversationResponseDto:
+        """
+        Convertit une entité Conversation en ConversationResponseDto.
+        
+        Args:
+            conversation: L'entité Conversation
+            
+        Returns:
+            DTO pour la réponse API
+        """
+        return ConversationResponseDto(
+            conversation_id=conversation.conversation_id,
+            listing_id=conversation.listing_id,
+            buyer_id=conversation.buyer_id,
+            seller_id=conversation.seller_id,
+            last_message_at=conversation.last_message_at.isoformat(),
+            created_at=conversation.created_at.isoformat()
+        )
+    
+    @staticmethod
+    def to_inbox_dto(entry: InboxEntry) -> InboxEntryResponseDto:
+        """
+        Convertit une entrée de boîte de réception en InboxEntryResponseDto.
+        
+        Args:
+            entry: L'entrée de boîte de réception
+            
+        Returns:
+            DTO pour la réponse API
+        """
+        conversation = entry.conversation
+        return InboxEntryResponseDto(
+            conversation_id=conversation.conversation_id,
+            listing_id=conversation.listing_id,
+            other_party_id=entry.other_party_id,
+            other_party_username=entry.other_party_username,
+            cover_picture_path=entry.cover_picture_path,
+            last_message_id=conversation.last_message_id,
+            last_message_preview=conversation.last_message_preview,
+            last_sender_id=conversation.last_sender_id,
+            last_message_at=conversation.last_message_at.isoformat(),
+            unread_count=entry.unread_count
+        )
@@ -0,0 +1,338 @@
+"""
+Service: MessageService
+Orchestre l'envoi et la lecture des messages entre acheteurs et vendeurs.
+"""
+import logging
+from typing import TYPE_CHECKING, List, Optional
+from domain.message.conversation import Conversation
+from domain.message.conversation_repository import ConversationRepository
+from domain.message.message import Message
+from domain.message.message_repository import MessageRepository
+from domain.message.exceptions.conversation_not_found_exception import ConversationNotFoundException
+from domain.listing.listing_repository import ListingRepository
+from domain.listing.exceptions.listing_not_found_exception import ListingNotFoundException
+from application.message.message_assembler import MessageAssembler
+from application.message.dtos.conversation_response_dto import ConversationResponseDto
+from application.message.dtos.inbox_entry_response_dto import InboxEntryResponseDto
+from application.message.dtos.message_page_response_dto import MessagePageResponseDto
+from application.message.dtos.message_response_dto import MessageResponseDto
+
+if TYPE_CHECKING:
+    from infrastructure.database.unit_of_work import UnitOfWorkManager
+    from infrastructure.messaging.message_broker import MessageBroker
+
+logger = logging.getLogger(__name__)
+
+
+class MessageService:
+    """
+    Service gérant les conversations et les messages.
+    
+    Après chaque envoi, le destinataire est notifié en temps réel via le
+    MessageBroker (nouveau message + compteur de non-lus), ce qui évite au
+    frontend de sonder GET /api/conversations/:id/messages. Les événements
+    ne partent qu'après le commit de l'unité de travail: une transaction
+    annulée ou rejouée ne publie rien.
+    """
+    
+    # Nombre maximal de messages rejoués à la reconnexion d'un flux
+    MAX_REPLAY = 500
+    
+    # Taille maximale d'une page de boîte de réception
+    MAX_INBOX_SIZE = 100
+    
+    # Taille maximale d'une page d'historique
+    MAX_PAGE_SIZE = 100
+    
+    def __init__(
+        self,
+        conversation_repository: ConversationRepository,
+        message_repository: MessageRepository,
+        listing_repository: ListingRepository,
+        message_assembler: MessageAssembler,
+        message_broker: Optional['MessageBroker'] = None,
+        unit_of_work_manager: Optional['UnitOfWorkManager'] = None
+    ):
+        """
+        Initialise le service avec ses dépendances.
+        
+        Args:
+            conversation_repository: Repository des conversations
+            message_repository: Repository des messages
+            listing_repository: Repository des annonces (vendeur de l'annonce)
+            message_assembler: Assembler pour les conversions
+            message_broker: Broker temps réel (optionnel)
+            unit_of_work_manager: Unités de travail dont le commit déclenche
+                les publications (sans lui, publication immédiate)
+        """
+        self._conversation_repository = conversation_repository
+        self._message_repository = message_repository
+        self._listing_repository = listing_repository
+        self._message_assembler = message_assembler
+        self._message_broker = message_broker
+        self._unit_of_work_manager = unit_of_work_manager
+    
+    def start_conversation(self, listing_id: str, buyer_id: str) -> ConversationResponseDto:
+        """
+        Ouvre une conversation, ou retourne celle qui existe déjà
+        pour ce couple (annonce, acheteur).
+        
+        Args:
+            listing_id: ID de l'annonce
+            buyer_id: ID de l'acheteur
+            
+        Returns:
+            DTO de la conversation
+            
+        Raises:
+            ListingNotFoundException: Si l'annonce n'existe pas
+            ValueError: Si l'acheteur est le vendeur, ou si les données sont invalides
+        """
+        seller_id = self._get_seller_id(listing_id, buyer_id)
+        conversation = self._conversation_repository.get_or_create(
+            Conversation(listing_id=listing_id, buyer_id=buyer_id, seller_id=seller_id)
+        )
+        
+        return self._message_assembler.to_conversation_dto(conversation)
+    
+    def start_conversation_with_message(
+        self,
+        listing_id: str,
+        buyer_id: str,
+        content: str
+    ) -> MessageResponseDto:
+        """
+        Envoie le premier message d'un acheteur au vendeur d'une annonce,
+        en créant la conversation si nécessaire (une seule opération atomique).
+        
+        Args:
+            listing_id: ID de l'annonce
+            buyer_id: ID de l'acheteur (expéditeur)
+            content: Contenu du message
+            
+        Returns:
+            DTO du message enregistré (avec son conversation_id)
+            
+        Raises:
+            ListingNotFoundException: Si l'annonce n'existe pas
+            ValueError: Si l'acheteur est le vendeur, ou si les données sont invalides
+        """
+        seller_id = self._get_seller_id(listing_id, buyer_id)
+        conversation = Conversation(listing_id=listing_id, buyer_id=buyer_id, seller_id=seller_id)
+        
+        message = self._message_repository.save_with_conversation(conversation, buyer_id, content)
+        
+        logger.info(
+            f"Message {message.message_id} envoyé dans la conversation {message.conversation_id} "
+            f"(annonce {listing_id})"
+        )
+        
+        response_dto = self._message_assembler.to_response_dto(message)
+        self._notify_recipient(seller_id, response_dto)
+        
+        return response_dto
+    
+    def send_message(self, conversation_id: int, sender_id: str, content: str) -> MessageResponseDto:
+        """
+        Envoie un message et notifie le destinataire.
+        
+        Args:
+            conversation_id: ID de la conversation
+            sender_id: ID de l'expéditeur
+            content: Contenu du message
+            
+        Returns:
+            DTO du message enregistré
+            
+        Raises:
+            ConversationNotFoundException: Si la conversation n'existe pas
+            PermissionError: Si l'expéditeur ne participe pas à la conversation
+            ValueError: Si le contenu est invalide
+        """
+        conversation = self._get_conversation(conversation_id)
+        recipient_id = conversation.recipient_of(sender_id)
+        
+        message = self._message_repository.save(
+            Message(conversation_id=conversation_id, sender_id=sender_id, content=content)
+        )
+        
+        logger.info(f"Message {message.message_id} envoyé dans la conversation {conversation_id}")
+        
+        response_dto = self._message_assembler.to_response_dto(message)
+        self._notify_recipient(recipient_id, response_dto)
+        
+        return response_dto
+    
+    def get_conversation_messages(
+        self,
+        conversation_id: int,
+        user_id: str,
+        limit: int = 50,
+        before_message_id: Optional[int] = None,
+        after_message_id: Optional[int] = None
+    ) -> MessagePageResponseDto:
+        """
+        Retourne une page de l'historique d'une conversation.
+        
+        Sans curseur, la page contient les messages les plus récents.
+        
+        Args:
+            conversation_id: ID de la conversation
+            user_id: ID de l'utilisateur qui consulte
+            limit: Taille de la page (plafonnée à MAX_PAGE_SIZE)
+            before_message_id: Charger les messages plus anciens que celui-ci
+            after_message_id: Charger les messages plus récents que celui-ci
+            
+        Raises:
+            ConversationNotFoundException: Si la conversation n'existe pas
+            PermissionError: Si l'utilisateur ne participe pas à la conversation
+            ValueError: Si la limite est invalide ou si les deux curseurs sont fournis
+        """
+        if limit < 1:
+            raise ValueError("La limite doit être supérieure à 0")
+        
+        if before_message_id is not None and after_message_id is not None:
+            raise ValueError("before_message_id et after_message_id sont mutuellement exclusifs")
+        
+        conversation = self._get_conversation(conversation_id)
+        
+        if not conversation.involves(user_id):
+            raise PermissionError("Vous ne participez pas à cette conversation")
+        
+        page_size = min(limit, self.MAX_PAGE_SIZE)
+        
+        # Un message de plus que demandé indique s'il reste une page
+        messages = self._message_repository.find_by_conversation(
+            conversation_id,
+            page_size + 1,
+            before_message_id=before_message_id,
+            after_message_id=after_message_id
+        )
+        
+        has_more = len(messages) > page_size
+        if has_more:
+            messages = messages[:page_size] if after_message_id is not None else messages[1:]
+        
+        return MessagePageResponseDto(
+            messages=self._message_assembler.to_response_dto_list(messages),
+            has_more=has_more
+        )
+    
+    def get_inbox(self, user_id: str, limit: int = 50) -> List[InboxEntryResponseDto]:
+        """
+        Retourne la boîte de réception d'un utilisateur, conversation la
+        plus récente en premier.
+        
+        Args:
+            user_id: ID de l'utilisateur
+            limit: Nombre de conversations (plafonné à MAX_INBOX_SIZE)
+            
+        Raises:
+            ValueError: Si la limite est invalide
+        """
+        if limit < 1:
+            raise ValueError("La limite doit être supérieure à 0")
+        
+        entries = self._conversation_repository.find_inbox(user_id, min(limit, self.MAX_INBOX_SIZE))
+        return [self._message_assembler.to_inbox_dto(entry) for entry in entries]
+    
+    def mark_conversation_read(self, conversation_id: int, user_id: str) -> int:
+        """
+        Marque comme lus les messages reçus dans une conversation.
+        
+        Les autres flux ouverts de l'utilisateur reçoivent son nouveau
+        compteur de non-lus.
+        
+        Args:
+            conversation_id: ID de la conversation
+            user_id: ID du participant qui lit
+            
+        Returns:
+            Nombre de messages passés à lus
+            
+        Raises:
+            ConversationNotFoundException: Si la conversation n'existe pas
+            PermissionError: Si l'utilisateur ne participe pas à la conversation
+        """
+        conversation = self._get_conversation(conversation_id)
+        
+        if not conversation.involves(user_id):
+            raise PermissionError("Vous ne participez pas à cette conversation")
+        
+        marked = self._message_repository.mark_conversation_read(conversation_id, user_id)
+        if marked:
+            self._publish_unread_count(user_id)
+        return marked
+    
+    def get_missed_messages(self, user_id: str, after_message_id: int) -> List[MessageResponseDto]:
+        """
+        Retourne les messages reçus après `after_message_id` (reprise d'un flux).
+        
+        Args:
+            user_id: ID du destinataire
+            after_message_id: Dernier message reçu par le client (Last-Event-ID)
+        """
+        messages = self._message_repository.find_received_after(user_id, after_message_id, self.MAX_REPLAY)
+        return self._message_assembler.to_response_dto_list(messages)
+    
+    def get_unread_count(self, user_id: str) -> int:
+        """
+        Retourne le nombre de messages non lus reçus par un utilisateur.
+        
+        Args:
+            user_id: ID du destinataire
+        """
+        return self._message_repository.count_unread_for_user(user_id)
+    
+    def _get_seller_id(self, listing_id: str, buyer_id: str) -> str:
+        """Vendeur de l'annonce, lu en base (jamais fourni par le client)"""
+        listing = self._listing_repository.find_by_id(listing_id)
+        if listing is None:
+            raise ListingNotFoundException(listing_id)
+        if listing.seller_id == buyer_id:
+            raise ValueError("Vous ne pouvez pas écrire au vendeur de votre propre annonce")
+        return listing.seller_id
+    
+    def _get_conversation(self, conversation_id: int) -> Conversation:
+        conversation = self._conversation_repository.find_by_id(conversation_id)
+        if conversation is None:
+            raise ConversationNotFoundException(conversation_id)
+        return conversation
+    
+    def _notify_recipient(self, recipient_id: str, message_dto: MessageResponseDto) -> None:
+        """Pousse le message et le compteur de non-lus vers les flux du destinataire"""
+        if self._message_broker is None:
+            return
+        
+        self._publish_after_commit(
+            recipient_id, 'message', message_dto.to_dict(), event_id=message_dto.message_id
+        )
+        self._publish_unread_count(recipient_id)
+    
+    def _publish_unread_count(self, user_id: str) -> None:
+        """Pousse le compteur de non-lus vers les flux d'un utilisateur"""
+        if self._message_broker is None:
+            return
+        
+        try:
+            # Lu dans la transaction (qui voit ses propres écritures), publié après le commit
+            unread_count = self.get_unread_count(user_id)
+        except Exception as e:
+            logger.error(f"Échec de la notification temps réel: {str(e)}", exc_info=True)
+            return
+        
+        self._publish_after_commit(user_id, 'unread', {'unread_count': unread_count})
+    
+    def _publish_after_commit(self, user_id: str, event: str, data: dict, event_id: Optional[int] = None) -> None:
+        """Publie un événement une fois la transaction validée"""
+        def publish() -> None:
+            try:
+                self._message_broker.publish(user_id, event, data, event_id=event_id)
+            except Exception as e:
+                # Le message est enregistré: le client le rattrapera via Last-Event-ID
+                logger.error(f"Échec de la notification temps réel: {str(e)}", exc_info=True)
+        
+        if self._unit_of_work_manager is None:
+            publish()
+        else:
+            self._unit_of_work_manager.after_commit(publish)
@@ -0,0 +1 @@
+"""Benchmarks de performance du backend (exécutés avec python -m benchmarks.<module>)"""
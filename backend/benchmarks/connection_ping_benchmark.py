@@ -0,0 +1,190 @@
+"""
+Benchmark: allers-retours MySQL par requête HTTP, avant et après la
+suppression du ping systématique de DatabaseConnection.
+
+Avant (--ping-idle 0): is_connected() pingue le serveur avant chaque
+curseur, chaque commit et chaque emprunt au pool. Après (défaut
+DB_PING_IDLE_SECONDS): un ping seulement après une période d'inactivité.
+
+Profils de requête, à travers l'unité de travail et MySQLMessageRepository:
+    lecture: GET d'un fil (messages + compteur de non-lus) puis COMMIT
+    envoi:   POST d'un message (CALL SendMessage) puis COMMIT
+
+Mode simulé (par défaut): chaque aller-retour attend `--db-latency-ms`.
+Mode --mysql: mêmes profils sur la base configurée par les variables DB_*
+(base de développement uniquement: l'envoi insère des messages).
+
+Usage (depuis backend/):
+    python -m benchmarks.connection_ping_benchmark --requests 2000 --db-latency-ms 0.5
+    python -m benchmarks.connection_ping_benchmark --mysql --requests 500
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+from domain.message.conversation import Conversation
+from infrastructure.database.config import DatabaseConfig
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.mysql.mysql_message_repository import MySQLMessageRepository
+
+
+class _SimulatedServer:
+    """Compte les allers-retours par type et attend la latence réseau simulée"""
+    
+    def __init__(self, latency_seconds: float):
+        self._latency = latency_seconds
+        self.round_trips: Dict[str, int] = {'ping': 0, 'requête': 0, 'commit': 0}
+    
+    def round_trip(self, kind: str) -> None:
+        self.round_trips[kind] += 1
+        if self._latency:
+            time.sleep(self._latency)
+
+
+class _SimulatedCursor:
+    description = [('value',)]
+    
+    def __init__(self, server: _SimulatedServer):
+        self._server = server
+        self._row = None
+    
+    def execute(self, query, params=None):
+        self._server.round_trip('requête')
+        self._row = (1, 1) if query.lstrip().upper().startswith('CALL') else None
+    
+    def fetchone(self):
+        return self._row
+    
+    def fetchall(self):
+        return []
+    
+    def nextset(self):
+        return None
+    
+    def close(self):
+        pass
+
+
+class _SimulatedMySQLConnection:
+    """Interface de mysql.connector utilisée par DatabaseConnection"""
+    
+    def __init__(self, server: _SimulatedServer):
+        self._server = server
+    
+    def is_connected(self):
+        self._server.round_trip('ping')
+        return True
+    
+    def cursor(self):
+        return _SimulatedCursor(self._server)
+    
+    def commit(self):
+        self._server.round_trip('commit')
+    
+    def rollback(self):
+        self._server.round_trip('commit')
+    
+    def close(self):
+        pass
+
+
+def _simulated_factory(server: _SimulatedServer, ping_idle_seconds: float) -> Callable[[DatabaseConfig], DatabaseConnection]:
+    class SimulatedDatabaseConnection(DatabaseConnection):
+        def connect(self) -> None:
+            self._connection = _SimulatedMySQLConnection(server)
+            self._last_used = self._clock()
+            self._lost = False
+    
+    return lambda config: SimulatedDatabaseConnection(config, ping_idle_seconds=ping_idle_seconds)
+
+
+def _profiles(repository: MySQLMessageRepository) -> Dict[str, Callable[[], None]]:
+    def read_thread() -> None:
+        repository.find_by_conversation(1, limit=50)
+        repository.count_unread_for_user('2')
+    
+    def send_message() -> None:
+        repository.save_with_conversation(Conversation(listing_id='1', buyer_id='2', seller_id='3'), '2', 'benchmark')
+    
+    return {'lecture': read_thread, 'envoi': send_message}
+
+
+def _measure(manager: UnitOfWorkManager, operation: Callable[[], None], requests: int) -> List[float]:
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        with manager.scope():
+            operation()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _run_simulated(args: argparse.Namespace) -> None:
+    print(f"{'Profil':<8} {'Mode':<6} {'A/R par requête':>16} {'dont pings':>11} {'moyenne':>9}")
+    for profile in ('lecture', 'envoi'):
+        for label, ping_idle in (('avant', 0.0), ('après', args.ping_idle)):
+            server = _SimulatedServer(args.db_latency_ms / 1000)
+            pool = ConnectionPool(size=1, connection_factory=_simulated_factory(server, ping_idle), registry=MetricsRegistry())
+            manager = UnitOfWorkManager(pool, MetricsRegistry())
+            operation = _profiles(MySQLMessageRepository(manager.connection()))[profile]
+            _measure(manager, operation, 10)  # ouverture de la connexion hors mesure
+            server.round_trips = dict.fromkeys(server.round_trips, 0)
+            
+            latencies = _measure(manager, operation, args.requests)
+            total = sum(server.round_trips.values())
+            print(
+                f"{profile:<8} {label:<6} {total / args.requests:>16.2f} "
+                f"{server.round_trips['ping'] / args.requests:>11.2f} {statistics.fmean(latencies):>7.3f}ms"
+            )
+
+
+def _run_mysql(args: argparse.Namespace) -> None:
+    print(f"{'Profil':<8} {'Mode':<6} {'pings par requête':>18} {'moyenne':>9} {'p50':>9}")
+    for profile in ('lecture', 'envoi'):
+        for label, ping_idle in (('avant', 0.0), ('après', args.ping_idle)):
+            connections: List[DatabaseConnection] = []
+            
+            def factory(config: DatabaseConfig) -> DatabaseConnection:
+                connection = DatabaseConnection(config, ping_idle_seconds=ping_idle)
+                connections.append(connection)
+                return connection
+            
+            pool = ConnectionPool(size=1, connection_factory=factory, registry=MetricsRegistry())
+            manager = UnitOfWorkManager(pool, MetricsRegistry())
+            operation = _profiles(MySQLMessageRepository(manager.connection()))[profile]
+            try:
+                _measure(manager, operation, 10)
+                pings_before = sum(connection.pings for connection in connections)
+                latencies = sorted(_measure(manager, operation, args.requests))
+                pings = sum(connection.pings for connection in connections) - pings_before
+            finally:
+                pool.close()
+            print(
+                f"{profile:<8} {label:<6} {pings / args.requests:>18.2f} "
+                f"{statistics.fmean(latencies):>7.3f}ms {latencies[len(latencies) // 2]:>7.3f}ms"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000, help='Requêtes par profil et par mode')
+    parser.add_argument('--db-latency-ms', type=float, default=0.5, help='Latence simulée par aller-retour')
+    parser.add_argument(
+        '--ping-idle', type=float, default=DatabaseConnection.DEFAULT_PING_IDLE_SECONDS,
+        help="Inactivité avant ping pour le mode « après »"
+    )
+    parser.add_argument('--mysql', action='store_true', help='Mesurer sur la base MySQL configurée (DB_*)')
+    args = parser.parse_args(argv)
+    
+    if args.mysql:
+        _run_mysql(args)
+    else:
+        _run_simulated(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+"""
+Jeu de données synthétique pour les benchmarks (10k → 10M annonces).
+
+Usage (depuis backend/):
+    python -m benchmarks.dataset --listings 100k --seed 42 --output-dir /tmp/ulaval_100k
+    python -m benchmarks.dataset --listings 1m --mysql --method infile --truncate
+"""
+from benchmarks.dataset.generator import DatasetConfig, SyntheticDataset, TABLES
+from benchmarks.dataset.in_memory_loader import populate_in_memory
+from benchmarks.dataset.vocabulary import SeedVocabulary
+
+__all__ = ['DatasetConfig', 'SyntheticDataset', 'TABLES', 'SeedVocabulary', 'populate_in_memory']
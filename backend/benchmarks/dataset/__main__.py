@@ -0,0 +1,71 @@
+"""
+Génère le jeu de données synthétique: fichiers TSV (--output-dir) ou
+chargement direct dans MySQL (--mysql, variables DB_*).
+
+Usage (depuis backend/):
+    python -m benchmarks.dataset --listings 100k --output-dir /tmp/ulaval_100k
+    python -m benchmarks.dataset --listings 1m --mysql --method infile --truncate
+    python -m benchmarks.dataset --listings 10k --stats
+"""
+import argparse
+import logging
+import os
+import time
+from collections import Counter
+from typing import List, Optional
+
+from benchmarks.dataset.generator import TABLES, DatasetConfig, SyntheticDataset, parse_scale
+from benchmarks.dataset.mysql_loader import METHODS, MySQLBulkLoader, write_tsv
+
+
+def _print_stats(dataset: SyntheticDataset) -> None:
+    """Affiche l'asymétrie obtenue (vendeurs et annonces les plus actifs)"""
+    sellers = Counter(row[1] for row in dataset.rows('listings'))
+    listings = dataset.config.listings
+    top = sellers.most_common(max(1, len(sellers) // 100))
+    print(f"Annonces: {listings}, vendeurs actifs: {len(sellers)}")
+    print(f"1 % des vendeurs les plus actifs: {100 * sum(count for _, count in top) / listings:.1f} % des annonces")
+    hot = dataset.hot_listing_ids(10)
+    print(f"10 annonces les plus chaudes: {100 * sum(dataset.popularity(listing_id) for listing_id in hot):.1f} % de l'attention")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--listings', default='10k', help="Nombre d'annonces (10k, 100k, 1m, 10m ou entier)")
+    parser.add_argument('--users', type=int, default=None, help="Nombre d'utilisateurs (annonces / 4 par défaut)")
+    parser.add_argument('--seed', type=int, default=42, help='Graine (même graine = mêmes données)')
+    parser.add_argument('--tables', nargs='*', choices=list(TABLES), help='Sous-ensemble de tables')
+    parser.add_argument('--output-dir', help='Écrire un fichier TSV par table (format LOAD DATA)')
+    parser.add_argument('--mysql', action='store_true', help='Charger dans la base configurée par DB_*')
+    parser.add_argument('--method', choices=METHODS, default='insert', help='INSERT multi-lignes ou LOAD DATA LOCAL INFILE')
+    parser.add_argument('--batch-rows', type=int, default=2000, help='Lignes par INSERT')
+    parser.add_argument('--truncate', action='store_true', help='Vider les tables avant le chargement')
+    parser.add_argument('--stats', action='store_true', help="Afficher l'asymétrie obtenue")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    dataset = SyntheticDataset(DatasetConfig(listings=parse_scale(args.listings), users=args.users, seed=args.seed))
+    tables = args.tables or list(TABLES)
+    
+    if args.stats:
+        _print_stats(dataset)
+    
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for table in tables:
+            started = time.perf_counter()
+            count = write_tsv(os.path.join(args.output_dir, f"{table}.tsv"), dataset.rows(table))
+            print(f"{table}: {count} ligne(s) en {time.perf_counter() - started:.1f} s")
+    
+    if args.mysql:
+        loader = MySQLBulkLoader(method=args.method, batch_rows=args.batch_rows)
+        counts = loader.load(dataset, truncate=args.truncate, tables=tables)
+        for table, count in counts.items():
+            print(f"{table}: {count} ligne(s) chargée(s)")
+    
+    if not (args.output_dir or args.mysql or args.stats):
+        parser.error('Indiquer --output-dir, --mysql ou --stats')
+
+
+if __name__ == '__main__':
+    main()
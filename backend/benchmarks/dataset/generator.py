@@ -0,0 +1,419 @@
+"""
+Générateur déterministe du jeu de données synthétique.
+
+Chaque table est produite en flux (aucune table n'est gardée en mémoire):
+10 millions d'annonces se génèrent en mémoire constante. Une même graine
+donne toujours les mêmes lignes, table par table: les tables dépendantes
+(photos, favoris, conversations) rejouent le flux des annonces plutôt que
+de le conserver.
+
+Asymétries reproduites:
+- activité des vendeurs selon une loi de Zipf (quelques vendeurs très actifs);
+- popularité des annonces selon une loi de Zipf (annonces « chaudes »):
+  vues, favoris et conversations s'y concentrent;
+- catégories et prix selon les proportions des données de démonstration.
+"""
+import hashlib
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.dataset.vocabulary import SeedVocabulary
+
+Row = Tuple[object, ...]
+
+# Ordre de chargement (clés étrangères) et colonnes de chaque table
+TABLES: Dict[str, Tuple[str, ...]] = {
+    'users': ('user_id', 'idul', 'email', 'password_hash', 'is_verified', 'is_active', 'created_at', 'updated_at', 'deleted_at'),
+    'users_profiles': ('profile_id', 'username', 'program', 'rating', 'created_at', 'updated_at'),
+    'categories': ('category_id', 'name', 'icon', 'parent_id', 'description'),
+    'listings': (
+        'listing_id', 'seller_id', 'title', 'description', 'Program', 'price', 'category_id',
+        'item_condition', 'location', 'is_sold', 'is_deleted', 'view_count', 'favorite_count',
+        'created_at', 'updated_at'
+    ),
+    'listing_pictures': ('picture_id', 'listing_id', 'file_path', 'is_cover', 'created_at'),
+    'favorites': ('favorite_id', 'user_id', 'listing_id', 'created_at'),
+    'conversations': ('conversation_id', 'listing_id', 'buyer_id', 'seller_id', 'last_message_at', 'created_at', 'updated_at'),
+    'messages': ('message_id', 'conversation_id', 'sender_id', 'content', 'is_read', 'created_at'),
+}
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+
+CONDITIONS = (('Neuf', 10), ('Comme neuf', 30), ('Bon état', 40), ('Usagé', 20))
+
+# Empreinte des comptes de démonstration (database/dml), commune à tous les comptes synthétiques
+PASSWORD_HASH = '$2y$10$92IXUNpkjO0rOQ5byMi.Ye4oKoEa3Ro9llC/.og/at2.uheWG/igi'
+
+_FIRST_NAMES = (
+    'alex', 'julie', 'marc', 'sophie', 'kevin', 'emma', 'olivier', 'lea', 'samuel', 'chloe',
+    'gabriel', 'camille', 'felix', 'rosalie', 'thomas', 'laurence', 'william', 'mia', 'nathan', 'florence'
+)
+_TITLE_SUFFIXES = ('(édition récente)', '- à saisir', '- prix négociable', '(lot)', '- comme sur la photo')
+
+
+def parse_scale(value: str) -> int:
+    """Convertit « 100k », « 1m » ou « 25000 » en nombre d'annonces"""
+    text = value.strip().lower().replace('_', '')
+    if text in SCALES:
+        return SCALES[text]
+    for suffix, factor in (('k', 1_000), ('m', 1_000_000)):
+        if text.endswith(suffix):
+            return int(float(text[:-1]) * factor)
+    return int(text)
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    """
+    Paramètres du jeu de données.
+    
+    Les volumes des tables dépendantes sont des moyennes par annonce;
+    `users` vaut listings / 4 par défaut (au moins 10).
+    """
+    
+    listings: int = 10_000
+    seed: int = 42
+    users: Optional[int] = None
+    seller_share: float = 0.4
+    seller_zipf_exponent: float = 1.1
+    popularity_zipf_exponent: float = 1.0
+    pictures_per_listing: float = 2.5
+    favorites_per_listing: float = 1.5
+    conversations_per_listing: float = 0.3
+    messages_per_conversation: float = 4.0
+    views_per_listing: float = 40.0
+    sold_ratio: float = 0.12
+    deleted_ratio: float = 0.02
+    start: datetime = datetime(2023, 9, 1)
+    days: int = 730
+    
+    def __post_init__(self):
+        if self.listings < 1:
+            raise ValueError("Le jeu de données doit contenir au moins une annonce")
+        if not 0 < self.seller_share <= 1:
+            raise ValueError("seller_share doit être dans ]0, 1]")
+    
+    @property
+    def user_count(self) -> int:
+        return self.users if self.users is not None else max(10, self.listings // 4)
+    
+    @property
+    def seller_count(self) -> int:
+        return max(1, int(self.user_count * self.seller_share))
+
+
+class ZipfSampler:
+    """
+    Tirage d'un rang 1..n selon une loi de Zipf bornée d'exposant s.
+    
+    Inversion de la loi continue correspondante: O(1) en temps et en
+    mémoire, quelle que soit la taille (les rangs de tête sont exacts à
+    quelques pour cent près, largement assez pour reproduire l'asymétrie).
+    """
+    
+    def __init__(self, n: int, exponent: float):
+        if n < 1:
+            raise ValueError("n doit être positif")
+        self._n = n
+        self._exponent = exponent
+        if abs(exponent - 1.0) < 1e-9:
+            self._log_span = math.log(n + 1)
+        else:
+            self._span = (n + 1) ** (1 - exponent) - 1
+    
+    def sample(self, rng: random.Random) -> int:
+        u = rng.random()
+        if abs(self._exponent - 1.0) < 1e-9:
+            x = math.exp(u * self._log_span)
+        else:
+            x = (1 + u * self._span) ** (1 / (1 - self._exponent))
+        return min(self._n, max(1, int(x)))
+
+
+def zipf_weight(rank: int, n: int, exponent: float, normalizer: float) -> float:
+    """Part de la masse totale portée par le rang `rank` (somme = 1)"""
+    return rank ** -exponent / normalizer
+
+
+def harmonic_number(n: int, exponent: float) -> float:
+    """
+    Nombre harmonique généralisé H(n, s) = Σ k^-s: exact sur les 10 000
+    premiers termes, approximation d'Euler-Maclaurin pour la queue.
+    """
+    head = min(n, 10_000)
+    total = math.fsum(k ** -exponent for k in range(1, head + 1))
+    if n > head:
+        a, b = head + 0.5, n + 0.5
+        if abs(exponent - 1.0) < 1e-9:
+            total += math.log(b / a)
+        else:
+            total += (b ** (1 - exponent) - a ** (1 - exponent)) / (1 - exponent)
+    return total
+
+
+class _Permutation:
+    """Bijection déterministe 1..n → 1..n: répartit les rangs « chauds » sur toute la table"""
+    
+    def __init__(self, n: int, rng: random.Random):
+        self._n = n
+        multiplier = max(1, int(n * 0.6180339887)) | 1
+        while math.gcd(multiplier, n) != 1:
+            multiplier += 2
+        self._multiplier = multiplier
+        self._offset = rng.randrange(n)
+        self._inverse = pow(multiplier, -1, n) if n > 1 else 0
+    
+    def __call__(self, rank: int) -> int:
+        return ((rank - 1) * self._multiplier + self._offset) % self._n + 1
+    
+    def inverse(self, value: int) -> int:
+        return ((value - 1 - self._offset) * self._inverse) % self._n + 1
+
+
+class SyntheticDataset:
+    """
+    Jeu de données synthétique, table par table.
+    
+    `rows(table)` retourne un itérateur de tuples dans l'ordre des colonnes
+    de TABLES[table]; les IDs commencent à 1 et sont contigus.
+    """
+    
+    def __init__(self, config: DatasetConfig, vocabulary: Optional[SeedVocabulary] = None):
+        self._config = config
+        self._vocabulary = vocabulary or SeedVocabulary.load()
+        self._sellers = ZipfSampler(config.seller_count, config.seller_zipf_exponent)
+        self._seller_ids = _Permutation(config.user_count, self._rng('sellers'))
+        self._popularity = _Permutation(config.listings, self._rng('popularity'))
+        self._popularity_normalizer = harmonic_number(config.listings, config.popularity_zipf_exponent)
+        
+        weights = self._vocabulary.category_weights
+        self._category_ids = sorted(weights)
+        self._category_cumulative = self._cumulative(weights[category_id] for category_id in self._category_ids)
+        self._condition_cumulative = self._cumulative(weight for _, weight in CONDITIONS)
+    
+    @property
+    def config(self) -> DatasetConfig:
+        return self._config
+    
+    @property
+    def vocabulary(self) -> SeedVocabulary:
+        return self._vocabulary
+    
+    def rows(self, table: str) -> Iterator[Row]:
+        """
+        Retourne les lignes d'une table.
+        
+        Raises:
+            ValueError: Si la table est inconnue
+        """
+        generators: Dict[str, Callable[[], Iterator[Row]]] = {
+            'users': self._users,
+            'users_profiles': self._profiles,
+            'categories': self._categories,
+            'listings': self._listings,
+            'listing_pictures': self._pictures,
+            'favorites': self._favorites,
+            'conversations': lambda: (conversation for conversation, _ in self._threads()),
+            'messages': lambda: (message for _, messages in self._threads() for message in messages),
+        }
+        if table not in generators:
+            raise ValueError(f"Table inconnue: {table}")
+        return generators[table]()
+    
+    def popularity(self, listing_id: int) -> float:
+        """Part de l'attention totale (vues, favoris, messages) reçue par une annonce"""
+        rank = self._popularity.inverse(listing_id)
+        return zipf_weight(rank, self._config.listings, self._config.popularity_zipf_exponent, self._popularity_normalizer)
+    
+    def hot_listing_ids(self, count: int) -> List[int]:
+        """IDs des `count` annonces les plus populaires, de la plus chaude à la moins chaude"""
+        return [self._popularity(rank) for rank in range(1, min(count, self._config.listings) + 1)]
+    
+    # ===== Tables =====
+    
+    def _users(self) -> Iterator[Row]:
+        rng = self._rng('users')
+        for user_id in range(1, self._config.user_count + 1):
+            idul = self._idul(user_id)
+            created_at = self._timestamp(rng, (user_id - 1) / self._config.user_count)
+            yield (
+                user_id, idul, f"{idul}@ulaval.ca", PASSWORD_HASH,
+                rng.random() < 0.9, rng.random() < 0.98, created_at, created_at, None
+            )
+    
+    def _profiles(self) -> Iterator[Row]:
+        rng = self._rng('users_profiles')
+        programs = self._vocabulary.programs or ['Non spécifié']
+        for user_id in range(1, self._config.user_count + 1):
+            created_at = self._timestamp(rng, (user_id - 1) / self._config.user_count)
+            username = f"{rng.choice(_FIRST_NAMES)}_{user_id}"
+            rating = round(min(5.0, max(0.0, rng.gauss(4.2, 0.6))), 2)
+            yield (user_id, username, rng.choice(programs), rating, created_at, created_at)
+    
+    def _categories(self) -> Iterator[Row]:
+        return iter(self._vocabulary.categories)
+    
+    def _listings(self) -> Iterator[Row]:
+        config = self._config
+        rng = self._rng('listings')
+        for listing_id in range(1, config.listings + 1):
+            seller_id = self._seller_ids(self._sellers.sample(rng))
+            category_id = self._category_ids[self._pick(rng, self._category_cumulative)]
+            condition = CONDITIONS[self._pick(rng, self._condition_cumulative)][0]
+            created_at = self._timestamp(rng, (listing_id - 1) / config.listings)
+            views = self._poisson(rng, config.views_per_listing * config.listings * self.popularity(listing_id))
+            yield (
+                listing_id,
+                seller_id,
+                self._title(rng, category_id),
+                self._description(rng, category_id),
+                rng.choice(self._vocabulary.program_codes) if self._vocabulary.program_codes else None,
+                self._price(rng, category_id, condition),
+                category_id,
+                condition,
+                rng.choice(self._vocabulary.locations),
+                rng.random() < config.sold_ratio,
+                rng.random() < config.deleted_ratio,
+                views,
+                0,  # tenu par les triggers de `favorites`
+                created_at,
+                created_at
+            )
+    
+    def _pictures(self) -> Iterator[Row]:
+        rng = self._rng('listing_pictures')
+        picture_id = 0
+        for listing in self._listings():
+            listing_id, created_at = listing[0], listing[13]
+            count = min(5, self._poisson(rng, self._config.pictures_per_listing))
+            for index in range(count):
+                picture_id += 1
+                digest = hashlib.sha256(f"{self._config.seed}:{listing_id}:{index}".encode('utf-8')).hexdigest()
+                yield (picture_id, listing_id, f"/uploads/{digest[:2]}/{digest}.jpg", index == 0, created_at)
+    
+    def _favorites(self) -> Iterator[Row]:
+        config = self._config
+        rng = self._rng('favorites')
+        total = config.favorites_per_listing * config.listings
+        favorite_id = 0
+        for listing in self._listings():
+            listing_id, seller_id, created_at = listing[0], listing[1], listing[13]
+            count = self._poisson(rng, total * self.popularity(listing_id))
+            for user_id in self._distinct_users(rng, count, exclude=seller_id):
+                favorite_id += 1
+                yield (favorite_id, user_id, listing_id, created_at + timedelta(minutes=rng.randrange(1, 20_000)))
+    
+    def _threads(self) -> Iterator[Tuple[Row, List[Row]]]:
+        """Conversations et leurs messages, produits ensemble (même graine pour les deux tables)"""
+        config = self._config
+        rng = self._rng('conversations')
+        messages_vocabulary = self._vocabulary.messages
+        total = config.conversations_per_listing * config.listings
+        conversation_id = 0
+        message_id = 0
+        for listing in self._listings():
+            listing_id, seller_id, created_at = listing[0], listing[1], listing[13]
+            count = self._poisson(rng, total * self.popularity(listing_id))
+            for buyer_id in self._distinct_users(rng, count, exclude=seller_id):
+                conversation_id += 1
+                started_at = created_at + timedelta(minutes=rng.randrange(1, 10_000))
+                sent_at = started_at
+                messages = []
+                for index in range(1 + self._poisson(rng, config.messages_per_conversation - 1)):
+                    message_id += 1
+                    sender_id = buyer_id if index % 2 == 0 else seller_id
+                    messages.append((message_id, conversation_id, sender_id, rng.choice(messages_vocabulary), True, sent_at))
+                    sent_at += timedelta(minutes=rng.randrange(1, 600))
+                last_message_at = messages[-1][5]
+                messages[-1] = messages[-1][:4] + (rng.random() < 0.5,) + messages[-1][5:]
+                yield (conversation_id, listing_id, buyer_id, seller_id, last_message_at, started_at, last_message_at), messages
+    
+    # ===== Textes et valeurs =====
+    
+    def _title(self, rng: random.Random, category_id: int) -> str:
+        titles = self._vocabulary.titles.get(category_id) or [t for values in self._vocabulary.titles.values() for t in values]
+        title = rng.choice(titles)
+        roll = rng.random()
+        if roll < 0.35:
+            # Début d'un titre, fin d'un autre de la même catégorie
+            other = rng.choice(titles).split()
+            head = title.split()
+            title = ' '.join(head[:max(1, len(head) // 2)] + other[len(other) // 2:])
+        elif roll < 0.55 and self._vocabulary.program_codes:
+            title = f"{title} {rng.choice(self._vocabulary.program_codes)}-{rng.randrange(1000, 5000)}"
+        elif roll < 0.7:
+            title = f"{title} {rng.choice(_TITLE_SUFFIXES)}"
+        if len(title) < 5:
+            title = f"{title} à vendre"
+        return title[:200]
+    
+    def _description(self, rng: random.Random, category_id: int) -> str:
+        sentences = self._vocabulary.descriptions.get(category_id) or ['Article en bon état, disponible sur le campus.']
+        return ' '.join(rng.choice(sentences) for _ in range(rng.randint(1, 3)))
+    
+    def _price(self, rng: random.Random, category_id: int, condition: str) -> float:
+        prices = self._vocabulary.prices.get(category_id) or [25.0]
+        base = rng.choice(prices) * math.exp(rng.gauss(0, 0.35))
+        discount = {'Neuf': 1.0, 'Comme neuf': 0.9, 'Bon état': 0.75, 'Usagé': 0.6}[condition]
+        return round(max(1.0, base * discount), 2)
+    
+    def _timestamp(self, rng: random.Random, progress: float) -> datetime:
+        """Date croissante avec l'ID (progress ∈ [0, 1[), avec un peu de bruit"""
+        seconds = (progress * self._config.days + rng.random() * 0.5) * 86_400
+        return (self._config.start + timedelta(seconds=seconds)).replace(microsecond=0)
+    
+    @staticmethod
+    def _idul(user_id: int) -> str:
+        """IDUL unique sur 7 caractères: 3 lettres (base 26) + 4 chiffres"""
+        number = user_id - 1
+        letters = number // 10_000
+        if letters >= 26 ** 3:
+            raise ValueError("Trop d'utilisateurs pour des IDUL de 7 caractères")
+        prefix = ''.join(chr(ord('a') + (letters // 26 ** power) % 26) for power in (2, 1, 0))
+        return f"{prefix}{number % 10_000:04d}"
+    
+    def _distinct_users(self, rng: random.Random, count: int, exclude: int) -> List[int]:
+        """`count` utilisateurs distincts (hors `exclude`), unicité (user, annonce) garantie"""
+        population = self._config.user_count
+        count = min(count, population - 1)
+        if count <= 0:
+            return []
+        chosen = rng.sample(range(1, population), count)
+        # Décale les tirages ≥ exclude: couvre 1..population sans `exclude`
+        return [user_id + 1 if user_id >= exclude else user_id for user_id in chosen]
+    
+    @staticmethod
+    def _poisson(rng: random.Random, mean: float) -> int:
+        if mean <= 0:
+            return 0
+        if mean > 30:
+            return max(0, int(round(rng.gauss(mean, math.sqrt(mean)))))
+        limit, k, product = math.exp(-mean), 0, rng.random()
+        while product > limit:
+            k += 1
+            product *= rng.random()
+        return k
+    
+    @staticmethod
+    def _cumulative(weights) -> List[float]:
+        total, cumulative = 0.0, []
+        for weight in weights:
+            total += weight
+            cumulative.append(total)
+        return [value / total for value in cumulative]
+    
+    @staticmethod
+    def _pick(rng: random.Random, cumulative: List[float]) -> int:
+        u = rng.random()
+        for index, bound in enumerate(cumulative):
+            if u < bound:
+                return index
+        return len(cumulative) - 1
+    
+    def _rng(self, stream: str) -> random.Random:
+        """Générateur propre à une table: chaque table est reproductible seule"""
+        digest = hashlib.sha256(f"{self._config.seed}:{stream}".encode('utf-8')).digest()
+        return random.Random(int.from_bytes(digest[:8], 'big'))
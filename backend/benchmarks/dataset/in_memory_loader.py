@@ -0,0 +1,136 @@
+"""
+Chargement du jeu de données synthétique dans les repositories en mémoire
+(benchmarks sans MySQL, tests de montée en charge des services).
+"""
+from typing import Dict, Optional
+
+from benchmarks.dataset.generator import SyntheticDataset
+from domain.category.category import Category
+from domain.listing.listing import Listing
+from domain.listing.listing_condition import ListingCondition
+from domain.listing.listing_picture import ListingPicture
+from domain.listing.listing_price import ListingPrice
+from domain.message.conversation import Conversation
+from domain.message.message import Message
+from domain.user.user import User
+from infrastructure.persistence.in_memory.in_memory_category_repository import InMemoryCategoryRepository
+from infrastructure.persistence.in_memory.in_memory_conversation_repository import InMemoryConversationRepository
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.persistence.in_memory.in_memory_message_repository import InMemoryMessageRepository
+from infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+
+
+def populate_in_memory(
+    dataset: SyntheticDataset,
+    listing_repository: InMemoryListingRepository,
+    picture_repository: Optional[InMemoryListingPictureRepository] = None,
+    category_repository: Optional[InMemoryCategoryRepository] = None,
+    user_repository: Optional[InMemoryUserRepository] = None,
+    conversation_repository: Optional[InMemoryConversationRepository] = None,
+    message_repository: Optional[InMemoryMessageRepository] = None
+) -> Dict[str, int]:
+    """
+    Remplit les repositories fournis (les autres tables sont ignorées).
+    
+    Les annonces supprimées (is_deleted) ne sont pas chargées: le catalogue
+    en mémoire n'a pas de suppression logique. Les repositories doivent être
+    vides pour que les IDs attribués correspondent à ceux du jeu de données.
+    
+    Args:
+        dataset: Jeu de données
+        listing_repository: Destination des annonces
+        picture_repository: Destination des photos (optionnel)
+        category_repository: Destination des catégories (optionnel)
+        user_repository: Destination des comptes (optionnel)
+        conversation_repository: Destination des conversations (optionnel)
+        message_repository: Destination des messages (optionnel, avec les conversations)
+    
+    Returns:
+        Nombre d'entités chargées par table
+    """
+    counts: Dict[str, int] = {}
+    
+    if category_repository is not None:
+        for category_id, name, icon, parent_id, description in dataset.rows('categories'):
+            category_repository.save(Category(category_id, name, parent_id, icon, description))
+        counts['categories'] = len(category_repository.find_all())
+    
+    if user_repository is not None:
+        counts['users'] = 0
+        for user_id, idul, email, password_hash, is_verified, is_active, created_at, _, _ in dataset.rows('users'):
+            user_repository.save(User(
+                idul=idul,
+                password_hash=password_hash,
+                email=email,
+                user_id=str(user_id),
+                is_verified=is_verified,
+                is_active=is_active,
+                created_at=created_at
+            ))
+            counts['users'] += 1
+    
+    deleted = set()
+    counts['listings'] = 0
+    for row in dataset.rows('listings'):
+        (listing_id, seller_id, title, description, program, price, category_id,
+         condition, location, is_sold, is_deleted, _, _, created_at, _) = row
+        if is_deleted:
+            deleted.add(listing_id)
+            continue
+        listing_repository.save(Listing(
+            listing_id=str(listing_id),
+            seller_id=str(seller_id),
+            title=title,
+            description=description,
+            price=ListingPrice(price),
+            category=str(category_id),
+            condition=ListingCondition.from_string(condition),
+            location=location,
+            is_sold=is_sold,
+            created_at=created_at
+        ))
+        counts['listings'] += 1
+    
+    if picture_repository is not None:
+        counts['listing_pictures'] = 0
+        for _, listing_id, file_path, is_cover, created_at in dataset.rows('listing_pictures'):
+            if listing_id in deleted:
+                continue
+            picture_repository.save(ListingPicture(
+                listing_id=str(listing_id),
+                file_path=file_path,
+                is_cover=is_cover,
+                created_at=created_at
+            ))
+            counts['listing_pictures'] += 1
+    
+    if conversation_repository is not None:
+        counts['conversations'] = 0
+        counts['messages'] = 0
+        # Conversations et messages dans un même passage (`_threads`)
+        conversations = dataset.rows('conversations')
+        messages = dataset.rows('messages')
+        pending = next(messages, None)
+        for conversation_id, listing_id, buyer_id, seller_id, _, created_at, _ in conversations:
+            saved = conversation_repository.save(Conversation(
+                listing_id=str(listing_id),
+                buyer_id=str(buyer_id),
+                seller_id=str(seller_id),
+                last_message_at=created_at,
+                created_at=created_at
+            ))
+            counts['conversations'] += 1
+            while pending is not None and pending[1] == conversation_id:
+                if message_repository is not None:
+                    message_repository.save(Message(
+                        conversation_id=saved.conversation_id,
+                        sender_id=str(pending[2]),
+                        content=pending[3],
+                        is_read=pending[4],
+                        created_at=pending[5]
+                    ))
+                    counts['messages'] += 1
+                pending = next(messages, None)
+    
+    return counts
@@ -0,0 +1,200 @@
+"""
+Chargement en masse du jeu de données synthétique dans MySQL.
+
+Deux méthodes:
+- insert: INSERT multi-lignes par lots de `batch_rows` (aucune option serveur);
+- infile: fichier TSV temporaire par table puis LOAD DATA LOCAL INFILE
+  (nettement plus rapide; requiert local_infile=ON côté serveur).
+
+Les contrôles de clés étrangères et d'unicité sont suspendus pendant le
+chargement (session seulement); un commit est fait tous les
+`commit_every` lots. À utiliser sur une base de développement vide
+(schéma de database/ddl et migrations appliqués).
+"""
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import mysql.connector
+
+from benchmarks.dataset.generator import TABLES, Row, SyntheticDataset
+from infrastructure.database.config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+METHODS = ('insert', 'infile')
+
+
+def format_tsv_value(value: object) -> str:
+    """Valeur au format par défaut de LOAD DATA (\\N pour NULL, échappements \\)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def write_tsv(path: str, rows: Iterable[Row]) -> int:
+    """Écrit des lignes au format TSV de LOAD DATA; retourne le nombre de lignes"""
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as file:
+        for row in rows:
+            file.write('\t'.join(format_tsv_value(value) for value in row))
+            file.write('\n')
+            count += 1
+    return count
+
+
+class MySQLBulkLoader:
+    """Charge les tables d'un SyntheticDataset, dans l'ordre des clés étrangères"""
+    
+    def __init__(
+        self,
+        config: Optional[DatabaseConfig] = None,
+        method: str = 'insert',
+        batch_rows: int = 2_000,
+        commit_every: int = 25,
+        progress: Optional[Callable[[str, int], None]] = None
+    ):
+        """
+        Initialise le chargeur.
+        
+        Args:
+            config: Connexion MySQL (variables DB_* par défaut)
+            method: 'insert' (INSERT multi-lignes) ou 'infile' (LOAD DATA LOCAL INFILE)
+            batch_rows: Lignes par INSERT
+            commit_every: Lots entre deux commits
+            progress: Rappel (table, lignes chargées) après chaque commit
+        """
+        if method not in METHODS:
+            raise ValueError(f"Méthode inconnue: {method} (valeurs acceptées: {', '.join(METHODS)})")
+        if batch_rows < 1:
+            raise ValueError("batch_rows doit être positif")
+        self._config = config or DatabaseConfig()
+        self._method = method
+        self._batch_rows = batch_rows
+        self._commit_every = commit_every
+        self._progress = progress
+    
+    def load(self, dataset: SyntheticDataset, truncate: bool = False, tables: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        Charge le jeu de données.
+        
+        Args:
+            dataset: Jeu de données
+            truncate: Vider d'abord les tables (sinon, elles doivent être vides)
+            tables: Sous-ensemble de tables (toutes par défaut)
+        
+        Returns:
+            Nombre de lignes chargées par table
+        
+        Raises:
+            RuntimeError: Si une table n'est pas vide et truncate est False
+        """
+        tables = list(tables or TABLES)
+        params = self._config.get_connection_params()
+        params['autocommit'] = False
+        if self._method == 'infile':
+            params['allow_local_infile'] = True
+        connection = mysql.connector.connect(**params)
+        
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SET SESSION foreign_key_checks = 0")
+            cursor.execute("SET SESSION unique_checks = 0")
+            
+            if truncate:
+                for table in reversed(tables):
+                    cursor.execute(f"TRUNCATE TABLE {table}")
+            else:
+                for table in tables:
+                    cursor.execute(f"SELECT 1 FROM {table} LIMIT 1")
+                    if cursor.fetchall():
+                        raise RuntimeError(f"La table {table} n'est pas vide (utiliser truncate)")
+            
+            counts = {}
+            for table in tables:
+                started = time.perf_counter()
+                if self._method == 'infile':
+                    counts[table] = self._load_infile(connection, cursor, table, dataset.rows(table))
+                else:
+                    counts[table] = self._load_inserts(connection, cursor, table, dataset.rows(table))
+                logger.info(f"{table}: {counts[table]} ligne(s) en {time.perf_counter() - started:.1f} s")
+            
+            cursor.execute("SET SESSION unique_checks = 1")
+            cursor.execute("SET SESSION foreign_key_checks = 1")
+            cursor.close()
+            return counts
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+    
+    def _load_inserts(self, connection, cursor, table: str, rows: Iterable[Row]) -> int:
+        columns = TABLES[table]
+        placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        statements: Dict[int, str] = {}
+        
+        batch: List[object] = []
+        batch_size = 0
+        batches = 0
+        total = 0
+        for row in rows:
+            batch.extend(row)
+            batch_size += 1
+            if batch_size == self._batch_rows:
+                total += self._flush(cursor, statements, prefix, placeholders, batch, batch_size)
+                batch, batch_size = [], 0
+                batches += 1
+                if batches % self._commit_every == 0:
+                    connection.commit()
+                    self._report(table, total)
+        if batch_size:
+            total += self._flush(cursor, statements, prefix, placeholders, batch, batch_size)
+        connection.commit()
+        self._report(table, total)
+        return total
+    
+    @staticmethod
+    def _flush(cursor, statements: Dict[int, str], prefix: str, placeholders: str, values: List[object], size: int) -> int:
+        statement = statements.get(size)
+        if statement is None:
+            statement = prefix + ', '.join([placeholders] * size)
+            statements[size] = statement
+        cursor.execute(statement, values)
+        return size
+    
+    def _load_infile(self, connection, cursor, table: str, rows: Iterable[Row]) -> int:
+        columns = TABLES[table]
+        handle, path = tempfile.mkstemp(prefix=f"{table}-", suffix='.tsv')
+        os.close(handle)
+        try:
+            total = write_tsv(path, rows)
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})",
+                (path,)
+            )
+            connection.commit()
+            self._report(table, total)
+            return total
+        finally:
+            os.unlink(path)
+    
+    def _report(self, table: str, total: int) -> None:
+        if self._progress is not None:
+            self._progress(table, total)
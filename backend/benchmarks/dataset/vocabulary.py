@@ -0,0 +1,199 @@
+"""
+Vocabulaire du jeu de données, extrait des données de démonstration
+(database/dml/0*.sql): titres et descriptions par catégorie, programmes,
+lieux, messages. Les annonces synthétiques recombinent ces textes, de sorte
+que la recherche plein texte travaille sur du vrai français du campus.
+"""
+import glob
+import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_SEED_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    'database', 'dml'
+)
+
+_INSERT = re.compile(r'INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES', re.IGNORECASE)
+_COURSE_CODE = re.compile(r'\b[A-Z]{3,4}-\d{4}\b')
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# (category_id, name, icon, parent_id, description)
+CategoryRow = Tuple[int, str, Optional[str], Optional[int], Optional[str]]
+
+
+def iter_insert_rows(sql: str) -> Iterator[Tuple[str, Dict[str, object]]]:
+    """
+    Parcourt les `INSERT INTO t (colonnes) VALUES (...), (...);` d'un script.
+    
+    Reconnaît les chaînes ('' et \\' échappés), nombres, NULL, TRUE/FALSE:
+    le sous-ensemble utilisé par les scripts de démonstration.
+    
+    Yields:
+        (table, {colonne: valeur})
+    """
+    for match in _INSERT.finditer(sql):
+        table = match.group(1).lower()
+        columns = [column.strip() for column in match.group(2).split(',')]
+        position = match.end()
+        while True:
+            position = _skip_blanks(sql, position)
+            if position >= len(sql) or sql[position] != '(':
+                break
+            values, position = _parse_tuple(sql, position + 1)
+            yield table, dict(zip(columns, values))
+            position = _skip_blanks(sql, position)
+            if position < len(sql) and sql[position] == ',':
+                position += 1
+                continue
+            break
+
+
+def _skip_blanks(sql: str, position: int) -> int:
+    while position < len(sql):
+        if sql[position].isspace():
+            position += 1
+        elif sql.startswith('--', position):
+            end = sql.find('\n', position)
+            position = len(sql) if end == -1 else end + 1
+        else:
+            break
+    return position
+
+
+def _parse_tuple(sql: str, position: int) -> Tuple[List[object], int]:
+    values: List[object] = []
+    while True:
+        position = _skip_blanks(sql, position)
+        if sql[position] == "'":
+            chars = []
+            position += 1
+            while True:
+                char = sql[position]
+                if char == '\\':
+                    chars.append(sql[position + 1])
+                    position += 2
+                elif char == "'" and sql.startswith("''", position):
+                    chars.append("'")
+                    position += 2
+                elif char == "'":
+                    position += 1
+                    break
+                else:
+                    chars.append(char)
+                    position += 1
+            values.append(''.join(chars))
+        else:
+            end = position
+            while sql[end] not in ',)':
+                end += 1
+            values.append(_literal(sql[position:end].strip()))
+            position = end
+        
+        position = _skip_blanks(sql, position)
+        if sql[position] == ')':
+            return values, position + 1
+        position += 1
+
+
+def _literal(token: str) -> object:
+    upper = token.upper()
+    if upper == 'NULL':
+        return None
+    if upper in ('TRUE', 'FALSE'):
+        return upper == 'TRUE'
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+@dataclass
+class SeedVocabulary:
+    """Textes et distributions observés dans les données de démonstration"""
+    
+    categories: List[CategoryRow]
+    titles: Dict[int, List[str]]
+    descriptions: Dict[int, List[str]]
+    prices: Dict[int, List[float]]
+    category_weights: Dict[int, int]
+    programs: List[str]
+    program_codes: List[str]
+    locations: List[str]
+    course_codes: List[str]
+    messages: List[str]
+    usernames: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def load(cls, seed_dir: str = DEFAULT_SEED_DIR) -> 'SeedVocabulary':
+        """
+        Lit les scripts database/dml/0*.sql (le fichier « full » les
+        concatène et est ignoré).
+        
+        Raises:
+            FileNotFoundError: Si aucun script n'est trouvé
+            ValueError: Si les scripts ne contiennent ni catégories ni annonces
+        """
+        paths = sorted(glob.glob(os.path.join(seed_dir, '0*.sql')))
+        if not paths:
+            raise FileNotFoundError(f"Aucun script de démonstration dans {seed_dir}")
+        
+        categories: Dict[int, CategoryRow] = {}
+        titles = defaultdict(list)
+        descriptions = defaultdict(list)
+        prices = defaultdict(list)
+        weights: Dict[int, int] = defaultdict(int)
+        programs, program_codes, locations, messages, usernames = set(), set(), set(), set(), set()
+        course_codes = set()
+        seen_titles = set()
+        
+        for path in paths:
+            with open(path, encoding='utf-8') as file:
+                sql = file.read()
+            for table, row in iter_insert_rows(sql):
+                if table == 'categories':
+                    categories[int(row['category_id'])] = (
+                        int(row['category_id']), row['name'], row.get('icon'),
+                        row.get('parent_id'), row.get('description')
+                    )
+                elif table == 'listings':
+                    category_id = int(row['category_id'])
+                    title = row['title']
+                    weights[category_id] += 1
+                    if title not in seen_titles:
+                        seen_titles.add(title)
+                        titles[category_id].append(title)
+                        descriptions[category_id].extend(
+                            sentence for sentence in _SENTENCE_END.split(row['description'] or '') if len(sentence) >= 10
+                        )
+                        prices[category_id].append(float(row['price']))
+                    course_codes.update(_COURSE_CODE.findall(title))
+                    if row.get('Program'):
+                        program_codes.add(row['Program'])
+                    if row.get('location'):
+                        locations.add(row['location'])
+                elif table == 'users_profiles':
+                    if row.get('program'):
+                        programs.add(row['program'])
+                    usernames.add(row['username'])
+                elif table == 'messages':
+                    messages.add(row['content'])
+        
+        if not categories or not titles:
+            raise ValueError(f"Scripts de démonstration incomplets dans {seed_dir}")
+        
+        return cls(
+            categories=[categories[category_id] for category_id in sorted(categories)],
+            titles={category_id: values for category_id, values in titles.items()},
+            descriptions={category_id: values for category_id, values in descriptions.items()},
+            prices={category_id: values for category_id, values in prices.items()},
+            category_weights=dict(weights),
+            programs=sorted(programs),
+            program_codes=sorted(program_codes),
+            locations=sorted(locations),
+            course_codes=sorted(course_codes),
+            messages=sorted(messages),
+            usernames=sorted(usernames)
+        )
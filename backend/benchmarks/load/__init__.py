@@ -0,0 +1,16 @@
+"""
+Générateur de charge scénarisé contre un serveur en marche.
+
+Usage (depuis backend/):
+    python -m benchmarks.load --url http://localhost:5000 --concurrency 32 --duration 60
+    python -m benchmarks.load --mode open --rate 200 --html /tmp/charge.html
+"""
+from benchmarks.load.engine import LoadResult, run_load
+from benchmarks.load.histogram import LatencyHistogram
+from benchmarks.load.report import build_report, render_html
+from benchmarks.load.scenarios import DEFAULT_MIX, SCENARIOS, LoadContext, LoadScenario, parse_mix, prepare_context
+
+__all__ = [
+    'LoadResult', 'run_load', 'LatencyHistogram', 'build_report', 'render_html',
+    'DEFAULT_MIX', 'SCENARIOS', 'LoadContext', 'LoadScenario', 'parse_mix', 'prepare_context'
+]
@@ -0,0 +1,92 @@
+"""
+Lance un test de charge pondéré contre un serveur en marche.
+
+Boucle fermée (par défaut): --concurrency clients virtuels enchaînent
+leurs requêtes. Boucle ouverte: --rate requêtes/s arrivent quoi qu'il
+arrive; la latence inclut l'attente (pas d'omission coordonnée).
+
+Usage (depuis backend/):
+    python -m benchmarks.load --url http://localhost:5000 --duration 60 --concurrency 32
+    python -m benchmarks.load --mode open --rate 200 --arrivals poisson --concurrency 64
+    python -m benchmarks.load --mix browse=60,open=40 --json /tmp/charge.json --html /tmp/charge.html
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.load.client import HttpClient
+from benchmarks.load.engine import run_load
+from benchmarks.load.report import build_report, write_html, write_json
+from benchmarks.load.scenarios import SCENARIOS, parse_mix, prepare_context
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:5000', help='URL du serveur')
+    parser.add_argument('--mode', choices=('closed', 'open'), default='closed', help='Boucle fermée ou ouverte')
+    parser.add_argument('--concurrency', type=int, default=16, help='Clients virtuels / requêtes simultanées max')
+    parser.add_argument('--rate', type=float, help='Requêtes par seconde (boucle ouverte)')
+    parser.add_argument('--arrivals', choices=('constant', 'poisson'), default='constant', help="Loi d'arrivée (boucle ouverte)")
+    parser.add_argument('--duration', type=float, default=30.0, help='Durée mesurée en secondes')
+    parser.add_argument('--warmup', type=float, default=5.0, help='Chauffe non mesurée en secondes')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Pause entre requêtes (boucle fermée)')
+    parser.add_argument('--mix', help=f"Pondérations, ex: browse=40,open=30 (scénarios: {', '.join(SCENARIOS)})")
+    parser.add_argument('--accounts', type=int, default=20, help='Comptes de test')
+    parser.add_argument('--seed', type=int, default=42, help='Graine des tirages')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Délai max par requête en secondes')
+    parser.add_argument('--json', help='Écrire le rapport JSON dans ce fichier')
+    parser.add_argument('--html', help='Écrire le rapport HTML dans ce fichier')
+    args = parser.parse_args(argv)
+    
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.mode == 'open' and not args.rate:
+        parser.error('--rate est requis en boucle ouverte')
+    
+    setup_client = HttpClient(args.url, args.timeout)
+    try:
+        context = prepare_context(setup_client, accounts=args.accounts, seed=args.seed)
+    finally:
+        setup_client.close()
+    print(f"{len(context.accounts)} sessions, {len(context.listings)} annonces; "
+          f"chauffe {args.warmup:g} s puis mesure {args.duration:g} s ({args.mode})", file=sys.stderr)
+    
+    result = run_load(
+        lambda: HttpClient(args.url, args.timeout),
+        context,
+        mix,
+        SCENARIOS,
+        mode=args.mode,
+        duration_seconds=args.duration,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        arrivals=args.arrivals,
+        warmup_seconds=args.warmup,
+        think_time_seconds=args.think_time,
+        seed=args.seed
+    )
+    config = {key: value for key, value in vars(args).items() if key not in ('json', 'html')}
+    config['mix'] = mix
+    report = build_report(result, config)
+    
+    summary = report['summary']
+    print(f"{summary['count']} requêtes, {summary['throughput_rps']} req/s, "
+          f"erreurs {summary['errors']} ({summary['error_rate']:.2%})")
+    print(f"latence ms: p50 {summary['p50_ms']}  p95 {summary['p95_ms']}  p99 {summary['p99_ms']}  max {summary['max_ms']}")
+    if args.mode == 'open':
+        print(f"démarrages en retard: {summary['late_starts']}, file max: {summary['max_backlog']}")
+    for endpoint, stats in report['endpoints'].items():
+        print(f"  {endpoint:<28} {stats['count']:>7}  p50 {stats['p50_ms']:>8}  p99 {stats['p99_ms']:>8}  "
+              f"erreurs {stats['error_rate']:.2%}")
+    
+    if args.json:
+        write_json(report, args.json)
+    if args.html:
+        write_html(report, args.html)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Client HTTP minimal (bibliothèque standard) pour le générateur de charge.
+
+Une connexion keep-alive par client virtuel, rouverte après une erreur:
+le coût mesuré est celui du serveur, pas de l'établissement TCP.
+"""
+import http.client
+import json
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class HttpClient:
+    """Client keep-alive vers une URL de base (http ou https)"""
+    
+    def __init__(self, base_url: str, timeout_seconds: float = 30.0):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"URL invalide: {base_url}")
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip('/')
+        self._timeout = timeout_seconds
+        self._connection: Optional[http.client.HTTPConnection] = None
+    
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Envoie une requête et lit toute la réponse.
+        
+        Returns:
+            (statut, corps)
+        
+        Raises:
+            OSError, http.client.HTTPException: Erreur réseau (connexion fermée)
+        """
+        payload = None
+        all_headers = {'Accept': 'application/json'}
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            all_headers['Content-Type'] = 'application/json'
+        if headers:
+            all_headers.update(headers)
+        
+        connection = self._connect()
+        try:
+            connection.request(method, self._prefix + path, body=payload, headers=all_headers)
+            response = connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        if response.getheader('Connection', '').lower() == 'close':
+            self.close()
+        return response.status, data
+    
+    def request_json(self, method: str, path: str, body: Optional[dict] = None, headers: Optional[Dict[str, str]] = None):
+        """Comme request(), avec le corps décodé en JSON (None si vide ou invalide)"""
+        status, data = self.request(method, path, body, headers)
+        try:
+            return status, json.loads(data) if data else None
+        except ValueError:
+            return status, None
+    
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._connection is None:
+            connection_class = http.client.HTTPSConnection if self._scheme == 'https' else http.client.HTTPConnection
+            self._connection = connection_class(self._host, self._port, timeout=self._timeout)
+        return self._connection
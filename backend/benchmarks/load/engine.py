@@ -0,0 +1,265 @@
+"""
+Moteur du générateur de charge: boucle fermée et boucle ouverte.
+
+Boucle fermée (`closed`): N clients virtuels enchaînent leurs requêtes.
+Quand le serveur ralentit, ils envoient moins: le débit s'adapte et les
+pires latences sont sous-représentées (omission coordonnée).
+
+Boucle ouverte (`open`): les requêtes arrivent à un débit fixé, qu'elles
+soient servies ou non. La latence est comptée depuis l'instant d'arrivée
+prévu: une requête retardée par la saturation (file d'attente côté client
+ou serveur) porte tout son retard, comme pour un vrai utilisateur.
+"""
+import bisect
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.load.histogram import LatencyHistogram
+from benchmarks.load.scenarios import LoadContext, LoadScenario
+
+ClientFactory = Callable[[], object]
+
+# Retard de démarrage au-delà duquel une requête en boucle ouverte est comptée comme tardive
+LATE_START_SECONDS = 0.010
+
+
+@dataclass
+class EndpointStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    statuses: Dict[str, int] = field(default_factory=dict)
+    
+    def merge(self, other: 'EndpointStats') -> None:
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+
+
+@dataclass
+class SecondStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    
+    def merge(self, other: 'SecondStats') -> None:
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+
+
+class Recorder:
+    """Mesures d'un client virtuel (fusionnées à la fin, sans verrou pendant le test)"""
+    
+    def __init__(self, measure_from: float):
+        self.measure_from = measure_from
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.timeline: Dict[int, SecondStats] = {}
+        self.late_starts = 0
+    
+    def record(self, endpoint: str, started_at: float, finished_at: float, status: str, ok: bool) -> None:
+        if started_at < self.measure_from:
+            return  # chauffe
+        latency_us = (finished_at - started_at) * 1e6
+        stats = self.endpoints.setdefault(endpoint, EndpointStats())
+        stats.latency.record(latency_us)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        second = self.timeline.setdefault(int(started_at - self.measure_from), SecondStats())
+        second.latency.record(latency_us)
+        if not ok:
+            stats.errors += 1
+            second.errors += 1
+    
+    def merge(self, other: 'Recorder') -> None:
+        for endpoint, stats in other.endpoints.items():
+            self.endpoints.setdefault(endpoint, EndpointStats()).merge(stats)
+        for second, stats in other.timeline.items():
+            self.timeline.setdefault(second, SecondStats()).merge(stats)
+        self.late_starts += other.late_starts
+
+
+@dataclass
+class LoadResult:
+    """Résultat d'un test de charge"""
+    
+    mode: str
+    duration_seconds: float
+    concurrency: int
+    target_rate: Optional[float]
+    recorder: Recorder
+    max_backlog: int = 0
+    
+    @property
+    def total(self) -> EndpointStats:
+        total = EndpointStats()
+        for stats in self.recorder.endpoints.values():
+            total.merge(stats)
+        return total
+
+
+class _Mix:
+    """Tirage pondéré d'un scénario"""
+    
+    def __init__(self, scenarios: Sequence[LoadScenario], weights: Sequence[float]):
+        self._scenarios = list(scenarios)
+        total = 0.0
+        self._cumulative = []
+        for weight in weights:
+            total += weight
+            self._cumulative.append(total)
+        self._total = total
+    
+    def pick(self, rng: random.Random) -> LoadScenario:
+        index = bisect.bisect_right(self._cumulative, rng.random() * self._total)
+        return self._scenarios[min(index, len(self._scenarios) - 1)]
+
+
+def _execute(
+    scenario: LoadScenario,
+    client,
+    context: LoadContext,
+    rng: random.Random,
+    recorder: Recorder,
+    started_at: float,
+    clock: Callable[[], float]
+) -> None:
+    try:
+        status = scenario.run(client, context, rng)
+        label, ok = str(status), status == scenario.expected_status
+    except Exception as error:
+        label, ok = f"error:{type(error).__name__}", False
+    recorder.record(scenario.endpoint, started_at, clock(), label, ok)
+
+
+def run_load(
+    client_factory: ClientFactory,
+    context: LoadContext,
+    mix: Dict[str, float],
+    scenarios: Dict[str, LoadScenario],
+    mode: str = 'closed',
+    duration_seconds: float = 30.0,
+    concurrency: int = 16,
+    rate: Optional[float] = None,
+    arrivals: str = 'constant',
+    warmup_seconds: float = 0.0,
+    think_time_seconds: float = 0.0,
+    seed: int = 42,
+    clock: Callable[[], float] = time.perf_counter
+) -> LoadResult:
+    """
+    Exécute un test de charge.
+    
+    Args:
+        client_factory: Fabrique d'un client HTTP (un par client virtuel)
+        context: Comptes et annonces préparés
+        mix: Pondération de chaque scénario
+        scenarios: Scénarios disponibles par nom
+        mode: 'closed' (N clients en boucle) ou 'open' (débit d'arrivée fixé)
+        duration_seconds: Durée mesurée
+        concurrency: Clients virtuels (boucle fermée) ou requêtes simultanées max (boucle ouverte)
+        rate: Requêtes par seconde (boucle ouverte)
+        arrivals: 'constant' (intervalle fixe) ou 'poisson' (intervalles exponentiels)
+        warmup_seconds: Chauffe non mesurée avant la durée
+        think_time_seconds: Pause entre deux requêtes d'un client (boucle fermée)
+        seed: Graine des tirages
+    
+    Raises:
+        ValueError: Si les paramètres sont incohérents
+    """
+    if mode not in ('closed', 'open'):
+        raise ValueError(f"Mode inconnu: {mode}")
+    if mode == 'open' and (rate is None or rate <= 0):
+        raise ValueError("La boucle ouverte requiert un débit positif (rate)")
+    if arrivals not in ('constant', 'poisson'):
+        raise ValueError(f"Loi d'arrivée inconnue: {arrivals}")
+    if concurrency < 1:
+        raise ValueError("concurrency doit être positif")
+    
+    names = [name for name, weight in mix.items() if weight > 0]
+    selector = _Mix([scenarios[name] for name in names], [mix[name] for name in names])
+    started = clock()
+    measure_from = started + warmup_seconds
+    stop_at = measure_from + duration_seconds
+    recorders = [Recorder(measure_from) for _ in range(concurrency)]
+    
+    if mode == 'closed':
+        max_backlog = _run_closed(client_factory, context, selector, recorders, stop_at, think_time_seconds, seed, clock)
+    else:
+        max_backlog = _run_open(client_factory, context, selector, recorders, started, stop_at, rate, arrivals, seed, clock)
+    
+    merged = Recorder(measure_from)
+    for recorder in recorders:
+        merged.merge(recorder)
+    return LoadResult(mode, duration_seconds, concurrency, rate if mode == 'open' else None, merged, max_backlog)
+
+
+def _run_closed(client_factory, context, selector, recorders, stop_at, think_time_seconds, seed, clock) -> int:
+    def worker(index: int) -> None:
+        rng = random.Random(seed * 1_000_003 + index)
+        client = client_factory()
+        recorder = recorders[index]
+        try:
+            while True:
+                started_at = clock()
+                if started_at >= stop_at:
+                    break
+                _execute(selector.pick(rng), client, context, rng, recorder, started_at, clock)
+                if think_time_seconds:
+                    time.sleep(think_time_seconds)
+        finally:
+            getattr(client, 'close', lambda: None)()
+    
+    _join_all([threading.Thread(target=worker, args=(index,), daemon=True) for index in range(len(recorders))])
+    return 0
+
+
+def _run_open(client_factory, context, selector, recorders, started, stop_at, rate, arrivals, seed, clock) -> int:
+    pending: 'queue.Queue[Optional[Tuple[float, LoadScenario]]]' = queue.Queue()
+    backlog = {'max': 0}
+    
+    def scheduler() -> None:
+        rng = random.Random(seed)
+        intended = started
+        while intended < stop_at:
+            delay = intended - clock()
+            if delay > 0:
+                time.sleep(delay)
+            pending.put((intended, selector.pick(rng)))
+            backlog['max'] = max(backlog['max'], pending.qsize())
+            intended += rng.expovariate(rate) if arrivals == 'poisson' else 1.0 / rate
+        for _ in recorders:
+            pending.put(None)
+    
+    def worker(index: int) -> None:
+        rng = random.Random(seed * 1_000_003 + index)
+        client = client_factory()
+        recorder = recorders[index]
+        try:
+            while True:
+                item = pending.get()
+                if item is None:
+                    break
+                intended, scenario = item
+                delay = intended - clock()
+                if delay > 0:
+                    time.sleep(delay)
+                elif -delay > LATE_START_SECONDS and intended >= recorder.measure_from:
+                    recorder.late_starts += 1
+                # Latence depuis l'arrivée prévue: le retard de démarrage est compté
+                _execute(scenario, client, context, rng, recorder, intended, clock)
+        finally:
+            getattr(client, 'close', lambda: None)()
+    
+    threads = [threading.Thread(target=scheduler, daemon=True)]
+    threads += [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(len(recorders))]
+    _join_all(threads)
+    return backlog['max']
+
+
+def _join_all(threads: List[threading.Thread]) -> None:
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
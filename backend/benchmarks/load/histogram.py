@@ -0,0 +1,78 @@
+"""
+Histogramme de latences à précision relative constante.
+
+Les latences (en microsecondes) sont rangées dans des classes
+logarithmiques de 1 %: la mémoire ne dépend pas du nombre de requêtes,
+les percentiles sont exacts à 1 % près et deux histogrammes (workers,
+secondes) se fusionnent par simple addition.
+"""
+import math
+from typing import Dict, Iterable, Optional
+
+_RATIO = 1.01
+_LOG_RATIO = math.log(_RATIO)
+
+
+class LatencyHistogram:
+    """Compte des latences par classe, avec minimum et maximum exacts"""
+    
+    def __init__(self):
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0.0
+        self.min_us: Optional[float] = None
+        self.max_us: Optional[float] = None
+    
+    def record(self, latency_us: float) -> None:
+        latency_us = max(latency_us, 1.0)
+        index = int(math.log(latency_us) / _LOG_RATIO)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_us += latency_us
+        if self.min_us is None or latency_us < self.min_us:
+            self.min_us = latency_us
+        if self.max_us is None or latency_us > self.max_us:
+            self.max_us = latency_us
+    
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        if other.max_us is not None and (self.max_us is None or other.max_us > self.max_us):
+            self.max_us = other.max_us
+    
+    @property
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Retourne le percentile demandé (0-100), en microsecondes.
+        
+        La valeur est le milieu de la classe (erreur relative ≤ 0,5 %),
+        bornée par le minimum et le maximum observés.
+        """
+        if not self.count:
+            return 0.0
+        if percent >= 100:
+            return self.max_us
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                value = _RATIO ** (index + 0.5)
+                return min(max(value, self.min_us), self.max_us)
+        return self.max_us
+    
+    def summary(self, percents: Iterable[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Statistiques en millisecondes (count, mean, min, pXX, max)"""
+        result = {'count': self.count, 'mean_ms': round(self.mean_us / 1000, 3)}
+        result['min_ms'] = round((self.min_us or 0.0) / 1000, 3)
+        for percent in percents:
+            result[f"p{percent:g}_ms"] = round(self.percentile(percent) / 1000, 3)
+        result['max_ms'] = round((self.max_us or 0.0) / 1000, 3)
+        return result
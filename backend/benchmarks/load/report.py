@@ -0,0 +1,153 @@
+"""
+Rapports du générateur de charge: JSON et page HTML autonome.
+
+La page HTML ne charge aucune ressource externe: les courbes (débit,
+p50/p95/p99 par seconde) sont dessinées en SVG en ligne.
+"""
+import html
+import json
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks.load.engine import LoadResult
+
+_SERIES_COLORS = {'p50': '#2b8a3e', 'p95': '#e67700', 'p99': '#c92a2a', 'rps': '#1c7ed6', 'erreurs': '#862e9c'}
+
+
+def build_report(result: LoadResult, config: Dict) -> Dict:
+    """
+    Construit le rapport JSON d'un test de charge.
+    
+    Args:
+        result: Résultat de run_load()
+        config: Paramètres du test (URL, mix, mode...)
+    
+    Returns:
+        dict: config, summary, endpoints, timeline
+    """
+    total = result.total
+    duration = result.duration_seconds or 1.0
+    summary = total.latency.summary()
+    summary.update({
+        'mode': result.mode,
+        'concurrency': result.concurrency,
+        'target_rate': result.target_rate,
+        'throughput_rps': round(total.latency.count / duration, 2),
+        'errors': total.errors,
+        'error_rate': round(total.errors / total.latency.count, 4) if total.latency.count else 0.0,
+        'late_starts': result.recorder.late_starts,
+        'max_backlog': result.max_backlog
+    })
+    
+    endpoints = {}
+    for endpoint, stats in sorted(result.recorder.endpoints.items()):
+        entry = stats.latency.summary()
+        entry['throughput_rps'] = round(stats.latency.count / duration, 2)
+        entry['errors'] = stats.errors
+        entry['error_rate'] = round(stats.errors / stats.latency.count, 4) if stats.latency.count else 0.0
+        entry['statuses'] = dict(sorted(stats.statuses.items()))
+        endpoints[endpoint] = entry
+    
+    timeline = []
+    for second in sorted(result.recorder.timeline):
+        if second >= result.duration_seconds:
+            continue  # requêtes planifiées avant la fin mais terminées après
+        stats = result.recorder.timeline[second]
+        entry = {'second': second, 'requests': stats.latency.count, 'errors': stats.errors}
+        entry.update({key: value for key, value in stats.latency.summary().items() if key.startswith('p')})
+        timeline.append(entry)
+    
+    return {'config': config, 'summary': summary, 'endpoints': endpoints, 'timeline': timeline}
+
+
+def write_json(report: Dict, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2, ensure_ascii=False)
+
+
+def _svg_chart(title: str, unit: str, series: Sequence[Tuple[str, List[float]]], width: int = 860, height: int = 240) -> str:
+    left, right, top, bottom = 56, 16, 28, 28
+    plot_width, plot_height = width - left - right, height - top - bottom
+    points_count = max((len(values) for _, values in series), default=0)
+    peak = max((value for _, values in series for value in values), default=0.0) or 1.0
+    
+    def x(index: int) -> float:
+        return left + (plot_width * index / (points_count - 1) if points_count > 1 else plot_width / 2)
+    
+    def y(value: float) -> float:
+        return top + plot_height - plot_height * value / peak
+    
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" role="img">',
+        f'<text x="{left}" y="18" font-weight="bold">{html.escape(title)}</text>',
+        f'<line x1="{left}" y1="{top + plot_height}" x2="{left + plot_width}" y2="{top + plot_height}" stroke="#999"/>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_height}" stroke="#999"/>',
+        f'<text x="{left - 6}" y="{top + 4}" text-anchor="end" font-size="11">{peak:.4g} {html.escape(unit)}</text>',
+        f'<text x="{left - 6}" y="{top + plot_height}" text-anchor="end" font-size="11">0</text>',
+        f'<text x="{left + plot_width}" y="{height - 8}" text-anchor="end" font-size="11">{max(points_count - 1, 0)} s</text>'
+    ]
+    legend_x = left + plot_width
+    for name, values in reversed(series):
+        color = _SERIES_COLORS.get(name, '#495057')
+        if values:
+            path = ' '.join(f"{x(index):.1f},{y(value):.1f}" for index, value in enumerate(values))
+            parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{path}"/>')
+        legend_x -= 70
+        parts.append(f'<text x="{legend_x}" y="18" font-size="12" fill="{color}">{html.escape(name)}</text>')
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+
+def render_html(report: Dict) -> str:
+    """Page HTML autonome: résumé, courbes dans le temps et tableau par endpoint"""
+    summary = report['summary']
+    timeline = report['timeline']
+    
+    throughput_chart = _svg_chart('Débit (requêtes/s)', 'req/s', [
+        ('rps', [entry['requests'] for entry in timeline]),
+        ('erreurs', [entry['errors'] for entry in timeline])
+    ])
+    latency_chart = _svg_chart('Latence par seconde', 'ms', [
+        (name, [entry.get(f'{name}_ms', 0.0) for entry in timeline]) for name in ('p50', 'p95', 'p99')
+    ])
+    
+    headers = ['Endpoint', 'Requêtes', 'req/s', 'Erreurs', 'Taux', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms', 'Statuts']
+    rows = []
+    for endpoint, stats in report['endpoints'].items():
+        statuses = ', '.join(f"{status}: {count}" for status, count in stats['statuses'].items())
+        cells = [
+            endpoint, stats['count'], stats['throughput_rps'], stats['errors'], f"{stats['error_rate']:.2%}",
+            stats['p50_ms'], stats['p95_ms'], stats['p99_ms'], stats['max_ms'], statuses
+        ]
+        rows.append('<tr>' + ''.join(f'<td>{html.escape(str(cell))}</td>' for cell in cells) + '</tr>')
+    
+    overview = [
+        ('Mode', summary['mode']),
+        ('Requêtes', summary['count']),
+        ('Débit', f"{summary['throughput_rps']} req/s"),
+        ('Erreurs', f"{summary['errors']} ({summary['error_rate']:.2%})"),
+        ('p50 / p95 / p99', f"{summary['p50_ms']} / {summary['p95_ms']} / {summary['p99_ms']} ms"),
+        ('max', f"{summary['max_ms']} ms")
+    ]
+    if summary['mode'] == 'open':
+        overview.append(('Débit visé', f"{summary['target_rate']} req/s"))
+        overview.append(('Démarrages en retard', summary['late_starts']))
+    
+    return '\n'.join([
+        '<!DOCTYPE html>',
+        '<html lang="fr"><head><meta charset="utf-8"><title>Test de charge</title>',
+        '<style>body{font-family:sans-serif;margin:24px}table{border-collapse:collapse}'
+        'td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}td:first-child{text-align:left}</style>',
+        '</head><body>',
+        f"<h1>Test de charge — {html.escape(str(report['config'].get('url', '')))}</h1>",
+        '<table>' + ''.join(f'<tr><th>{html.escape(k)}</th><td>{html.escape(str(v))}</td></tr>' for k, v in overview) + '</table>',
+        throughput_chart,
+        latency_chart,
+        '<h2>Par endpoint</h2>',
+        '<table><tr>' + ''.join(f'<th>{h}</th>' for h in headers) + '</tr>' + ''.join(rows) + '</table>',
+        '</body></html>'
+    ])
+
+
+def write_html(report: Dict, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(render_html(report))
@@ -0,0 +1,180 @@
+"""
+Scénarios pondérés du générateur de charge (une requête par scénario).
+
+- browse: catalogue filtré par catégorie (GET /api/listings?category=)
+- open: page d'une annonce (GET /api/listings/<id>)
+- search: recherche par mots-clés (GET /api/listings?search=)
+- create: publication d'une annonce (POST /api/listings)
+- message: premier message au vendeur (POST /api/conversations, authentifié)
+
+La préparation (comptes, sessions, liste des annonces) est faite avant la
+mesure par prepare_context().
+"""
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from api.validators.listing_dto_validator import ListingDtoValidator
+from benchmarks.dataset.vocabulary import SeedVocabulary
+from benchmarks.load.client import HttpClient
+
+DEFAULT_MIX = {'browse': 40, 'open': 30, 'search': 15, 'create': 10, 'message': 5}
+
+
+@dataclass
+class LoadContext:
+    """Données partagées par les clients virtuels"""
+    
+    listings: List[Tuple[str, str]]
+    accounts: List[Tuple[str, str]]
+    categories: List[str]
+    search_terms: List[str]
+    titles: List[str]
+    locations: List[str]
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    
+    def add_listing(self, listing_id: str, seller_id: str) -> None:
+        with self._lock:
+            self.listings.append((listing_id, seller_id))
+
+
+@dataclass(frozen=True)
+class LoadScenario:
+    """Un scénario: une requête, son libellé de rapport et le statut attendu"""
+    
+    name: str
+    endpoint: str
+    expected_status: int
+    run: Callable[[HttpClient, LoadContext, random.Random], int]
+
+
+def _browse(client: HttpClient, context: LoadContext, rng: random.Random) -> int:
+    category = quote(rng.choice(context.categories))
+    return client.request('GET', f"/api/listings?category={category}")[0]
+
+
+def _open(client: HttpClient, context: LoadContext, rng: random.Random) -> int:
+    listing_id, _ = rng.choice(context.listings)
+    return client.request('GET', f"/api/listings/{quote(listing_id)}")[0]
+
+
+def _search(client: HttpClient, context: LoadContext, rng: random.Random) -> int:
+    return client.request('GET', f"/api/listings?search={quote(rng.choice(context.search_terms))}")[0]
+
+
+def _listing_payload(context: LoadContext, rng: random.Random, seller_id: str) -> dict:
+    return {
+        'seller_id': seller_id,
+        'title': rng.choice(context.titles),
+        'description': 'Annonce de test de charge, disponible sur le campus.',
+        'price': round(rng.uniform(5, 500), 2),
+        'category': rng.choice(context.categories),
+        'condition': rng.choice(['Neuf', 'Comme neuf', 'Bon état', 'Usagé']),
+        'location': rng.choice(context.locations)
+    }
+
+
+def _create(client: HttpClient, context: LoadContext, rng: random.Random) -> int:
+    seller_id, _ = rng.choice(context.accounts)
+    status, body = client.request_json('POST', '/api/listings', _listing_payload(context, rng, seller_id))
+    if status == 201 and body:
+        context.add_listing(str(body['listing_id']), seller_id)
+    return status
+
+
+def _message(client: HttpClient, context: LoadContext, rng: random.Random) -> int:
+    listing_id, seller_id = rng.choice(context.listings)
+    buyers = [account for account in context.accounts if account[0] != seller_id] or context.accounts
+    buyer_id, token = rng.choice(buyers)
+    return client.request(
+        'POST',
+        '/api/conversations',
+        {'listing_id': listing_id, 'content': 'Bonjour, est-ce toujours disponible?'},
+        {'Authorization': f"Bearer {token}"}
+    )[0]
+
+
+SCENARIOS: Dict[str, LoadScenario] = {
+    'browse': LoadScenario('browse', 'GET /api/listings?category=', 200, _browse),
+    'open': LoadScenario('open', 'GET /api/listings/<id>', 200, _open),
+    'search': LoadScenario('search', 'GET /api/listings?search=', 200, _search),
+    'create': LoadScenario('create', 'POST /api/listings', 201, _create),
+    'message': LoadScenario('message', 'POST /api/conversations', 201, _message),
+}
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, float]:
+    """
+    Convertit « browse=50,open=30,message=20 » en pondérations.
+    
+    Raises:
+        ValueError: Si un scénario est inconnu ou si le total est nul
+    """
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Scénario inconnu: {name} (valeurs acceptées: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    if sum(mix.values()) <= 0:
+        raise ValueError("La somme des pondérations doit être positive")
+    return mix
+
+
+def prepare_context(
+    client: HttpClient,
+    accounts: int = 20,
+    password: str = 'ChargeTest-2024!',
+    seed: int = 42,
+    min_listings: int = 50
+) -> LoadContext:
+    """
+    Ouvre les sessions des comptes de test et relève le catalogue.
+    
+    Les comptes (IDUL « chg » + 4 chiffres) sont créés au besoin; un compte
+    existant dont le mot de passe diffère est ignoré. Si le catalogue compte
+    moins de `min_listings` annonces, il est complété.
+    
+    Raises:
+        RuntimeError: Si aucune session n'a pu être ouverte
+    """
+    vocabulary = SeedVocabulary.load()
+    rng = random.Random(seed)
+    sessions = []
+    for number in range(accounts):
+        idul = f"chg{(seed * 7919 + number) % 10_000:04d}"
+        credentials = {'idul': idul, 'password': password}
+        client.request('POST', '/api/auth/register', credentials)
+        status, body = client.request_json('POST', '/api/auth/login', credentials)
+        if status != 200 or not body:
+            continue
+        status, me = client.request_json('GET', '/api/auth/me', headers={'Authorization': f"Bearer {body['access_token']}"})
+        if status == 200 and me:
+            sessions.append((str(me['user_id']), body['access_token']))
+    if not sessions:
+        raise RuntimeError("Aucune session de test n'a pu être ouverte (voir /api/auth/login)")
+    
+    roots = [name for _, name, _, parent_id, _ in vocabulary.categories if parent_id is None]
+    context = LoadContext(
+        listings=[],
+        accounts=sessions,
+        categories=roots,
+        search_terms=sorted({word.lower() for titles in vocabulary.titles.values() for title in titles
+                             for word in title.split() if len(word) > 4 and word.isalpha()}),
+        titles=[title for titles in vocabulary.titles.values() for title in titles if len(title) >= 5],
+        locations=list(ListingDtoValidator.VALID_LOCATIONS)
+    )
+    
+    status, listings = client.request_json('GET', '/api/listings')
+    if status == 200 and listings:
+        for listing in listings:
+            context.listings.append((str(listing['listing_id']), str(listing['seller_id'])))
+    while len(context.listings) < min_listings:
+        if _create(client, context, rng) != 201:
+            raise RuntimeError("Impossible de compléter le catalogue (POST /api/listings)")
+    return context
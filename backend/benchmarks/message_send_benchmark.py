@@ -0,0 +1,257 @@
+"""
+Benchmark: débit d'envoi de messages par des expéditeurs concurrents,
+chemin naïf (plusieurs allers-retours) contre procédure SendMessage (un seul).
+
+Chemin naïf, par message:
+    SELECT conversation -> INSERT conversation (si absente) -> INSERT message
+    -> UPDATE conversations -> COMMIT
+Le verrou de ligne posé par l'UPDATE est tenu jusqu'au COMMIT, soit un
+aller-retour réseau complet: les expéditeurs d'un même fil se sérialisent.
+
+Mode simulé (par défaut): chaque aller-retour attend `--db-latency-ms`.
+Mode --mysql: exécute les deux chemins sur la base configurée par les
+variables DB_* (base de développement uniquement: des lignes sont insérées;
+migrations 001 et 002 appliquées).
+
+Usage (depuis backend/):
+    python -m benchmarks.message_send_benchmark --senders 32 --conversations 4 --db-latency-ms 1.0
+    python -m benchmarks.message_send_benchmark --mysql --senders 16 --messages 50
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from domain.message.conversation import Conversation
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.persistence.mysql.mysql_message_repository import MySQLMessageRepository
+
+# (listing_id, buyer_id, seller_id)
+Thread = Tuple[str, str, str]
+
+
+class _SimulatedDatabase:
+    """Base simulée: latence par aller-retour et verrous de ligne par conversation"""
+    
+    def __init__(self, latency_seconds: float):
+        self._latency = latency_seconds
+        self._state_lock = threading.Lock()
+        self._conversations: Dict[Tuple[str, str], int] = {}
+        self._row_locks: Dict[int, threading.Lock] = {}
+        self.round_trips = 0
+        self.duplicate_races = 0
+    
+    def round_trip(self) -> None:
+        with self._state_lock:
+            self.round_trips += 1
+        time.sleep(self._latency)
+    
+    def find(self, key: Tuple[str, str]) -> Optional[int]:
+        with self._state_lock:
+            return self._conversations.get(key)
+    
+    def insert(self, key: Tuple[str, str]) -> Optional[int]:
+        """INSERT conversation; None sur doublon (unique_conversation)"""
+        with self._state_lock:
+            if key in self._conversations:
+                self.duplicate_races += 1
+                return None
+            conversation_id = len(self._conversations) + 1
+            self._conversations[key] = conversation_id
+            self._row_locks[conversation_id] = threading.Lock()
+            return conversation_id
+    
+    def upsert(self, key: Tuple[str, str]) -> int:
+        with self._state_lock:
+            if key not in self._conversations:
+                conversation_id = len(self._conversations) + 1
+                self._conversations[key] = conversation_id
+                self._row_locks[conversation_id] = threading.Lock()
+            return self._conversations[key]
+    
+    def row_lock(self, conversation_id: int) -> threading.Lock:
+        with self._state_lock:
+            return self._row_locks[conversation_id]
+
+
+def _simulated_naive_send(db: _SimulatedDatabase, thread: Thread) -> None:
+    listing_id, buyer_id, _ = thread
+    key = (listing_id, buyer_id)
+    
+    db.round_trip()  # SELECT conversation
+    conversation_id = db.find(key)
+    if conversation_id is None:
+        db.round_trip()  # INSERT conversation
+        conversation_id = db.insert(key)
+        if conversation_id is None:
+            db.round_trip()  # doublon: relire la conversation créée par un autre
+            conversation_id = db.find(key)
+    
+    db.round_trip()  # INSERT message
+    with db.row_lock(conversation_id):
+        db.round_trip()  # UPDATE conversations (verrou de ligne acquis)
+        db.round_trip()  # COMMIT (verrou relâché)
+
+
+def _simulated_atomic_send(db: _SimulatedDatabase, thread: Thread) -> None:
+    listing_id, buyer_id, _ = thread
+    
+    db.round_trip()  # CALL SendMessage
+    conversation_id = db.upsert((listing_id, buyer_id))
+    with db.row_lock(conversation_id):
+        pass  # verrou tenu côté serveur seulement, sans latence réseau
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _run(
+    send: Callable[[int, Thread], None],
+    threads: List[Thread],
+    sender_count: int,
+    messages_per_sender: int
+) -> Dict[str, float]:
+    """Lance `sender_count` expéditeurs et mesure débit et latences"""
+    latencies: List[float] = []
+    latencies_lock = threading.Lock()
+    
+    def sender(sender_index: int) -> None:
+        thread = threads[sender_index % len(threads)]
+        local = []
+        for _ in range(messages_per_sender):
+            start = time.perf_counter()
+            send(sender_index, thread)
+            local.append((time.perf_counter() - start) * 1000)
+        with latencies_lock:
+            latencies.extend(local)
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sender_count) as executor:
+        list(executor.map(sender, range(sender_count)))
+    elapsed = time.perf_counter() - start
+    
+    latencies.sort()
+    return {
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': _percentile(latencies, 50),
+        'p95_ms': _percentile(latencies, 95),
+        'mean_ms': statistics.fmean(latencies)
+    }
+
+
+def _run_simulated(args: argparse.Namespace) -> None:
+    threads = [(f"listing-{i}", f"buyer-{i}", f"seller-{i}") for i in range(args.conversations)]
+    
+    print(f"{'Chemin':<10} {'msg/s':>9} {'moyenne':>9} {'p50':>9} {'p95':>9} {'A/R par msg':>12} {'courses':>8}")
+    for label, send in (('naïf', _simulated_naive_send), ('atomique', _simulated_atomic_send)):
+        db = _SimulatedDatabase(args.db_latency_ms / 1000)
+        result = _run(lambda _, thread: send(db, thread), threads, args.senders, args.messages)
+        total = args.senders * args.messages
+        print(
+            f"{label:<10} {result['throughput']:>9.0f} {result['mean_ms']:>7.2f}ms "
+            f"{result['p50_ms']:>7.2f}ms {result['p95_ms']:>7.2f}ms "
+            f"{db.round_trips / total:>12.2f} {db.duplicate_races:>8}"
+        )
+
+
+def _mysql_threads(conversation_count: int) -> List[Thread]:
+    """Choisit des couples (annonce, acheteur) réels dans la base configurée"""
+    with DatabaseConnection() as connection:
+        cursor = connection.get_cursor()
+        cursor.execute(
+            "SELECT l.listing_id, u.user_id, l.seller_id FROM listings l "
+            "JOIN users u ON u.user_id <> l.seller_id "
+            "ORDER BY l.listing_id, u.user_id LIMIT %s",
+            (conversation_count,)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+    
+    if not rows:
+        raise RuntimeError("Aucune annonce dans la base: chargez un jeu de données d'abord")
+    return [(str(listing_id), str(buyer_id), str(seller_id)) for listing_id, buyer_id, seller_id in rows]
+
+
+def _run_mysql(args: argparse.Namespace) -> None:
+    threads = _mysql_threads(args.conversations)
+    connections = [DatabaseConnection() for _ in range(args.senders)]
+    for connection in connections:
+        connection.connect()
+    
+    def naive_send(sender_index: int, thread: Thread) -> None:
+        listing_id, buyer_id, seller_id = thread
+        connection = connections[sender_index]
+        cursor = connection.get_cursor()
+        try:
+            cursor.execute(
+                "SELECT conversation_id FROM conversations WHERE listing_id = %s AND buyer_id = %s",
+                (listing_id, buyer_id)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                cursor.execute(
+                    "INSERT IGNORE INTO conversations (listing_id, buyer_id, seller_id) VALUES (%s, %s, %s)",
+                    (listing_id, buyer_id, seller_id)
+                )
+                cursor.execute(
+                    "SELECT conversation_id FROM conversations WHERE listing_id = %s AND buyer_id = %s",
+                    (listing_id, buyer_id)
+                )
+                row = cursor.fetchone()
+            cursor.execute(
+                "INSERT INTO messages (conversation_id, sender_id, content) VALUES (%s, %s, %s)",
+                (row[0], buyer_id, 'benchmark')
+            )
+            cursor.execute(
+                "UPDATE conversations SET last_message_at = NOW(), "
+                "seller_unread_count = seller_unread_count + 1 WHERE conversation_id = %s",
+                (row[0],)
+            )
+            connection.commit()
+        finally:
+            cursor.close()
+    
+    repositories = [MySQLMessageRepository(connection) for connection in connections]
+    
+    def atomic_send(sender_index: int, thread: Thread) -> None:
+        listing_id, buyer_id, seller_id = thread
+        repositories[sender_index].save_with_conversation(
+            Conversation(listing_id=listing_id, buyer_id=buyer_id, seller_id=seller_id),
+            buyer_id,
+            'benchmark'
+        )
+    
+    try:
+        print(f"{'Chemin':<10} {'msg/s':>9} {'moyenne':>9} {'p50':>9} {'p95':>9}")
+        for label, send in (('naïf', naive_send), ('atomique', atomic_send)):
+            result = _run(send, threads, args.senders, args.messages)
+            print(
+                f"{label:<10} {result['throughput']:>9.0f} {result['mean_ms']:>7.2f}ms "
+                f"{result['p50_ms']:>7.2f}ms {result['p95_ms']:>7.2f}ms"
+            )
+    finally:
+        for connection in connections:
+            connection.disconnect()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--senders', type=int, default=32, help='Expéditeurs concurrents')
+    parser.add_argument('--messages', type=int, default=50, help='Messages par expéditeur')
+    parser.add_argument('--conversations', type=int, default=4, help='Fils distincts (moins = plus de contention)')
+    parser.add_argument('--db-latency-ms', type=float, default=1.0, help='Latence simulée par aller-retour')
+    parser.add_argument('--mysql', action='store_true', help='Mesurer sur la base MySQL configurée (DB_*)')
+    args = parser.parse_args(argv)
+    
+    if args.mysql:
+        _run_mysql(args)
+    else:
+        _run_simulated(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark: lignes/seconde du mappage ligne → entité des repositories MySQL.
+
+Deux chemins sur le même résultat:
+    dictionnaires: _fetch_all (un dict par ligne via cursor.description)
+                   puis un constructeur qui relit chaque valeur par nom
+                   (mappage d'avant RowMapper)
+    compilé:       _fetch_all_as(RowMapper): le tuple va directement au
+                   constructeur par une fonction compilée par forme de résultat
+
+Mode simulé (par défaut): le curseur retourne des lignes du jeu de données
+synthétique (messages et photos d'annonces), sans réseau: seul le mappage
+est mesuré. Mode --mysql: mêmes lectures sur la base configurée par les
+variables DB_* (table `messages` remplie, p. ex. par benchmarks.dataset).
+
+Usage (depuis backend/):
+    python -m benchmarks.row_mapping_benchmark --rows 10000 --repeat 20
+    python -m benchmarks.row_mapping_benchmark --mysql --rows 10000 --repeat 5
+"""
+import argparse
+import itertools
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.dataset.generator import DatasetConfig, SyntheticDataset
+from domain.listing.listing_picture import ListingPicture
+from domain.message.message import Message
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.mysql_listing_picture_repository import MySQLListingPictureRepository
+from infrastructure.persistence.mysql.mysql_message_repository import MySQLMessageRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+def _legacy_message(data: Dict[str, Any]) -> Message:
+    return Message(
+        message_id=data['message_id'],
+        conversation_id=data['conversation_id'],
+        sender_id=str(data['sender_id']),
+        content=data['content'],
+        is_read=bool(data['is_read']),
+        created_at=data['created_at']
+    )
+
+
+def _legacy_picture(data: Dict[str, Any]) -> ListingPicture:
+    return ListingPicture(
+        listing_id=str(data['listing_id']),
+        file_path=data['file_path'],
+        is_cover=bool(data['is_cover']),
+        picture_id=data['picture_id'],
+        thumbnail_path=data.get('thumbnail_path'),
+        medium_path=data.get('medium_path'),
+        created_at=data.get('created_at')
+    )
+
+
+class _BenchmarkRepository(BaseMySQLRepository):
+    """Expose les deux chemins de lecture de BaseMySQLRepository"""
+    
+    def read_dicts(self, query: str, params: Tuple, legacy: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        return [legacy(row) for row in self._fetch_all(query, params)]
+    
+    def read_compiled(self, query: str, params: Tuple, mapper: RowMapper) -> List[Any]:
+        return self._fetch_all_as(mapper, query, params)
+    
+    def _get_table_name(self) -> str:
+        return "benchmark"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> Any:
+        return data
+
+
+class _RowsCursor:
+    """Curseur qui retourne des lignes préparées"""
+    
+    def __init__(self, columns: Tuple[str, ...], rows: List[tuple]):
+        self.description = [(column,) for column in columns]
+        self._rows = rows
+    
+    def execute(self, query, params=None):
+        pass
+    
+    def fetchall(self):
+        return self._rows
+    
+    def close(self):
+        pass
+
+
+class _RowsConnection:
+    def __init__(self, cursor: _RowsCursor):
+        self._cursor = cursor
+    
+    def get_cursor(self, statement=None):
+        return self._cursor
+
+
+# Table -> (colonnes sélectionnées, requête MySQL, mappage d'avant, RowMapper)
+_TABLES = {
+    'messages': (
+        ('message_id', 'conversation_id', 'sender_id', 'content', 'is_read', 'created_at'),
+        f"SELECT {MySQLMessageRepository._COLUMNS} FROM messages m ORDER BY m.message_id LIMIT %s",
+        _legacy_message,
+        MySQLMessageRepository._ROW_MAPPER
+    ),
+    'listing_pictures': (
+        ('picture_id', 'listing_id', 'file_path', 'is_cover', 'thumbnail_path', 'medium_path', 'created_at'),
+        f"SELECT {MySQLListingPictureRepository._COLUMNS} FROM listing_pictures ORDER BY picture_id LIMIT %s",
+        _legacy_picture,
+        MySQLListingPictureRepository._ROW_MAPPER
+    ),
+}
+
+
+def _synthetic_rows(table: str, count: int, seed: int) -> List[tuple]:
+    dataset = SyntheticDataset(DatasetConfig(listings=max(count // 2, 100), seed=seed))
+    rows = itertools.cycle(list(itertools.islice(dataset.rows(table), count)))
+    if table == 'listing_pictures':
+        # Variantes (migration 004) absentes du jeu de données
+        return [
+            (picture_id, listing_id, file_path, is_cover, None, None, created_at)
+            for picture_id, listing_id, file_path, is_cover, created_at in itertools.islice(rows, count)
+        ]
+    return list(itertools.islice(rows, count))
+
+
+def _rows_per_second(read: Callable[[], List[Any]], rows: int, repeat: int) -> Tuple[float, float]:
+    read()  # compilation du mappage et caches hors mesure
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        mapped = read()
+        durations.append(time.perf_counter() - start)
+    assert len(mapped) == rows, f"{len(mapped)} lignes lues, {rows} attendues"
+    return rows / statistics.median(durations), rows / min(durations)
+
+
+def _report(table: str, label: str, rates: Tuple[float, float], reference: Optional[float]) -> None:
+    median, best = rates
+    gain = f"{median / reference:>6.2f}x" if reference else f"{'':>7}"
+    print(f"{table:<17} {label:<14} {median:>14,.0f} {best:>14,.0f} {gain}")
+
+
+def _run(
+    repository_for: Callable[[str], _BenchmarkRepository],
+    tables: List[str],
+    rows: int,
+    repeat: int
+) -> None:
+    print(f"{'Table':<17} {'Chemin':<14} {'lignes/s (méd.)':>14} {'lignes/s (max)':>14} {'gain':>7}")
+    for table in tables:
+        _, query, legacy, mapper = _TABLES[table]
+        repository = repository_for(table)
+        before = _rows_per_second(lambda: repository.read_dicts(query, (rows,), legacy), rows, repeat)
+        after = _rows_per_second(lambda: repository.read_compiled(query, (rows,), mapper), rows, repeat)
+        _report(table, 'dictionnaires', before, None)
+        _report(table, 'compilé', after, before[0])
+
+
+def _run_simulated(args: argparse.Namespace) -> None:
+    def repository_for(table: str) -> _BenchmarkRepository:
+        cursor = _RowsCursor(_TABLES[table][0], _synthetic_rows(table, args.rows, args.seed))
+        return _BenchmarkRepository(_RowsConnection(cursor))
+    
+    _run(repository_for, args.tables, args.rows, args.repeat)
+
+
+def _run_mysql(args: argparse.Namespace) -> None:
+    with DatabaseConnection() as connection:
+        repository = _BenchmarkRepository(connection)
+        _run(lambda table: repository, args.tables, args.rows, args.repeat)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000, help='Lignes par lecture')
+    parser.add_argument('--repeat', type=int, default=20, help='Lectures mesurées par chemin')
+    parser.add_argument('--seed', type=int, default=42, help='Graine du jeu de données (mode simulé)')
+    parser.add_argument(
+        '--tables', nargs='+', choices=sorted(_TABLES), default=sorted(_TABLES),
+        help='Tables lues'
+    )
+    parser.add_argument('--mysql', action='store_true', help='Mesurer sur la base MySQL configurée (DB_*)')
+    args = parser.parse_args(argv)
+    
+    if args.mysql:
+        _run_mysql(args)
+    else:
+        _run_simulated(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: latence d'un endpoint protégé avec et sans cache de sessions.
+
+La base est simulée par un InMemorySessionRepository qui attend
+`--db-latency-ms` à chaque recherche de jeton (un aller-retour réseau MySQL).
+
+Usage (depuis backend/):
+    python -m benchmarks.session_validation_benchmark --requests 2000 --db-latency-ms 1.0
+"""
+import argparse
+import secrets
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from flask import Flask, g, jsonify
+
+from api.auth.session_guard import require_session
+from api.exceptions.mappers.auth_exception_mapper import register_auth_exception_handlers
+from application.auth.session_validation_service import SessionValidationService
+from domain.auth.session import Session
+from infrastructure.auth.revocation_channel import LocalRevocationChannel
+from infrastructure.auth.session_cache import SessionCache
+from infrastructure.persistence.in_memory.in_memory_session_repository import InMemorySessionRepository
+
+
+class _SlowSessionRepository(InMemorySessionRepository):
+    """Repository en mémoire qui simule la latence d'un aller-retour MySQL"""
+    
+    def __init__(self, latency_seconds: float):
+        super().__init__()
+        self._latency = latency_seconds
+        self.lookups = 0
+    
+    def find_active_by_token(self, token: str) -> Optional[Session]:
+        self.lookups += 1
+        time.sleep(self._latency)
+        return super().find_active_by_token(token)
+
+
+def _build_app(service: SessionValidationService) -> Flask:
+    """Crée une application minimale avec une route protégée"""
+    app = Flask(__name__)
+    register_auth_exception_handlers(app)
+    
+    @app.route('/protected', methods=['GET'])
+    @require_session(service)
+    def protected():
+        return jsonify({'user_id': g.user_id}), 200
+    
+    return app
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _run_scenario(
+    use_cache: bool,
+    request_count: int,
+    session_count: int,
+    latency_seconds: float
+) -> Dict[str, float]:
+    """Exécute `request_count` requêtes protégées et retourne les statistiques"""
+    repository = _SlowSessionRepository(latency_seconds)
+    tokens = [secrets.token_urlsafe(32) for _ in range(session_count)]
+    expires_at = datetime.now() + timedelta(hours=24)
+    for index, token in enumerate(tokens):
+        repository.save(Session(user_id=str(index + 1), token=token, expires_at=expires_at))
+    
+    cache = SessionCache(max_size=max(session_count, 1)) if use_cache else None
+    service = SessionValidationService(repository, cache, LocalRevocationChannel())
+    client = _build_app(service).test_client()
+    
+    latencies = []
+    for index in range(request_count):
+        headers = {'Authorization': f"Bearer {tokens[index % session_count]}"}
+        start = time.perf_counter()
+        response = client.get('/protected', headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f"Réponse inattendue: {response.status_code}")
+    
+    latencies.sort()
+    return {
+        'mean_ms': statistics.fmean(latencies),
+        'p50_ms': _percentile(latencies, 50),
+        'p95_ms': _percentile(latencies, 95),
+        'p99_ms': _percentile(latencies, 99),
+        'db_lookups': repository.lookups
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000, help='Nombre de requêtes par scénario')
+    parser.add_argument('--sessions', type=int, default=100, help='Nombre de jetons distincts')
+    parser.add_argument('--db-latency-ms', type=float, default=1.0, help='Latence simulée de la table sessions')
+    args = parser.parse_args(argv)
+    
+    print(f"{'Scénario':<12} {'moyenne':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'lectures BD':>12}")
+    for label, use_cache in (('sans cache', False), ('avec cache', True)):
+        result = _run_scenario(use_cache, args.requests, args.sessions, args.db_latency_ms / 1000)
+        print(
+            f"{label:<12} {result['mean_ms']:>7.3f}ms {result['p50_ms']:>7.3f}ms "
+            f"{result['p95_ms']:>7.3f}ms {result['p99_ms']:>7.3f}ms {result['db_lookups']:>12}"
+        )
+
+
+if __name__ == '__main__':
+    main()
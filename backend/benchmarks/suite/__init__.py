@@ -0,0 +1,14 @@
+"""
+Suite de benchmarks du backend, avec référence JSON et seuil de régression.
+
+Usage (depuis backend/):
+    python -m benchmarks.suite --save-baseline      # enregistre la référence
+    python -m benchmarks.suite --threshold 10       # compare; code 1 si régression
+"""
+from benchmarks.suite.baseline import Comparison, compare, load_baseline, save_baseline
+from benchmarks.suite.runner import BenchmarkRunner, Scenario, ScenarioResult
+
+__all__ = [
+    'BenchmarkRunner', 'Scenario', 'ScenarioResult',
+    'Comparison', 'compare', 'load_baseline', 'save_baseline'
+]
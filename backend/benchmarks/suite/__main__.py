@@ -0,0 +1,99 @@
+"""
+Exécute la suite de benchmarks et la compare à la référence JSON.
+
+Code de sortie 1 si un scénario régresse de plus de --threshold %.
+
+Usage (depuis backend/):
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite --threshold 10 --filter http.
+    python -m benchmarks.suite --quick --output /tmp/resultats.json
+"""
+import argparse
+import fnmatch
+import json
+import os
+import sys
+from typing import List, Optional
+
+from benchmarks.suite.baseline import IMPROVED, NEW, REGRESSED, compare, environment, load_baseline, save_baseline
+from benchmarks.suite.runner import BenchmarkRunner
+from benchmarks.suite.scenarios import build_scenarios
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+_MARKERS = {REGRESSED: 'RÉGRESSION', IMPROVED: 'amélioré', NEW: 'nouveau'}
+
+
+def _format_duration(nanoseconds: float) -> str:
+    for unit, factor in (('s', 1e9), ('ms', 1e6), ('µs', 1e3)):
+        if nanoseconds >= factor:
+            return f"{nanoseconds / factor:.2f} {unit}"
+    return f"{nanoseconds:.0f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Fichier de référence JSON')
+    parser.add_argument('--save-baseline', action='store_true', help='Enregistrer les résultats comme référence')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Seuil de régression en pourcentage')
+    parser.add_argument('--filter', default='*', help='Motif des scénarios (ex: http.*)')
+    parser.add_argument('--listings', type=int, default=2000, help='Taille du catalogue synthétique')
+    parser.add_argument('--samples', type=int, default=7, help='Échantillons par scénario')
+    parser.add_argument('--quick', action='store_true', help='Échantillons courts (vérification rapide, bruitée)')
+    parser.add_argument('--output', help='Écrire aussi les résultats et la comparaison en JSON')
+    args = parser.parse_args(argv)
+    
+    pattern = args.filter if any(char in args.filter for char in '*?[') else f"{args.filter}*"
+    scenarios = [scenario for scenario in build_scenarios(args.listings) if fnmatch.fnmatch(scenario.name, pattern)]
+    if not scenarios:
+        parser.error(f"Aucun scénario ne correspond à {args.filter}")
+    
+    runner = BenchmarkRunner(
+        min_sample_seconds=0.01 if args.quick else 0.05,
+        samples=3 if args.quick else args.samples
+    )
+    baseline = load_baseline(args.baseline)
+    
+    results = []
+    print(f"{'Scénario':<36} {'médiane':>11} {'min':>11} {'écart-type':>11} {'référence':>11} {'Δ':>8}")
+    for scenario in scenarios:
+        result = runner.run(scenario)
+        results.append(result)
+        comparison = compare([result], baseline, args.threshold)[0]
+        reference = _format_duration(comparison.baseline_ns) if comparison.baseline_ns else '-'
+        change = f"{comparison.change_percent:+.1f}%" if comparison.change_percent is not None else '-'
+        print(
+            f"{scenario.name:<36} {_format_duration(result.median_ns):>11} {_format_duration(result.min_ns):>11} "
+            f"{_format_duration(result.stdev_ns):>11} {reference:>11} {change:>8} {_MARKERS.get(comparison.status, '')}",
+            flush=True
+        )
+    
+    comparisons = compare(results, baseline, args.threshold)
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    
+    if baseline is not None and baseline.get('environment') != environment():
+        print("Attention: la référence a été mesurée dans un autre environnement", file=sys.stderr)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({
+                'environment': environment(),
+                'threshold_percent': args.threshold,
+                'scenarios': {result.name: result.to_dict() for result in results},
+                'comparisons': [comparison.__dict__ for comparison in comparisons]
+            }, file, indent=2, ensure_ascii=False)
+    
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Référence enregistrée: {args.baseline}")
+        return 0
+    
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {args.threshold:g} %: "
+              + ', '.join(comparison.name for comparison in regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Référence JSON des résultats et détection des régressions.
+
+Format:
+    {
+        "created_at": "...",
+        "environment": {"python": "3.11.7", "platform": "...", ...},
+        "scenarios": {"<nom>": {"median_ns": ..., "min_ns": ..., ...}}
+    }
+
+Une référence n'est comparable qu'à des mesures faites sur la même machine:
+l'environnement est enregistré pour le rappeler dans le rapport.
+"""
+import json
+import os
+import platform
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from benchmarks.suite.runner import ScenarioResult
+
+REGRESSED = 'regressed'
+IMPROVED = 'improved'
+UNCHANGED = 'unchanged'
+NEW = 'new'
+
+
+def environment() -> Dict[str, str]:
+    """Description de la machine de mesure"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': str(os.cpu_count()),
+        'executable': sys.executable
+    }
+
+
+def save_baseline(path: str, results: Iterable[ScenarioResult]) -> None:
+    """Enregistre des résultats comme référence (écriture atomique)"""
+    document = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'scenarios': {result.name: result.to_dict() for result in results}
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(document, file, indent=2, ensure_ascii=False, sort_keys=True)
+        file.write('\n')
+    os.replace(temp_path, path)
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    """
+    Lit une référence.
+    
+    Returns:
+        Le document, ou None si le fichier n'existe pas
+    
+    Raises:
+        ValueError: Si le fichier n'est pas une référence valide
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as file:
+        document = json.load(file)
+    if not isinstance(document, dict) or not isinstance(document.get('scenarios'), dict):
+        raise ValueError(f"Référence invalide: {path}")
+    return document
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Résultat d'un scénario par rapport à la référence"""
+    
+    name: str
+    current_ns: float
+    baseline_ns: Optional[float]
+    change_percent: Optional[float]
+    status: str
+    
+    @property
+    def regressed(self) -> bool:
+        return self.status == REGRESSED
+
+
+def compare(results: Iterable[ScenarioResult], baseline: Optional[dict], threshold_percent: float) -> List[Comparison]:
+    """
+    Compare des résultats à la référence.
+    
+    Un scénario régresse si sa médiane ET son minimum dépassent ceux de la
+    référence de plus de `threshold_percent`: un seul échantillon lent
+    (bruit de la machine) ne suffit pas à faire échouer la suite.
+    
+    Args:
+        results: Mesures courantes
+        baseline: Document de référence (None: tous les scénarios sont nouveaux)
+        threshold_percent: Seuil de régression (ex: 10 pour +10 %)
+    """
+    reference = (baseline or {}).get('scenarios', {})
+    factor = 1 + threshold_percent / 100
+    comparisons = []
+    for result in results:
+        previous = reference.get(result.name)
+        if previous is None:
+            comparisons.append(Comparison(result.name, result.median_ns, None, None, NEW))
+            continue
+        
+        baseline_median = float(previous['median_ns'])
+        baseline_min = float(previous.get('min_ns', baseline_median))
+        change = (result.median_ns / baseline_median - 1) * 100 if baseline_median else 0.0
+        if result.median_ns > baseline_median * factor and result.min_ns > baseline_min * factor:
+            status = REGRESSED
+        elif result.median_ns * factor < baseline_median:
+            status = IMPROVED
+        else:
+            status = UNCHANGED
+        comparisons.append(Comparison(result.name, result.median_ns, baseline_median, change, status))
+    return comparisons
@@ -0,0 +1,135 @@
+"""
+Exécution des scénarios: calibration, échantillons et statistiques.
+
+Chaque échantillon répète l'opération assez de fois pour durer au moins
+`min_sample_seconds` (la résolution de l'horloge devient négligeable);
+le ramasse-miettes est désactivé pendant la mesure pour que ses pauses ne
+tombent pas au hasard dans un échantillon. La médiane et le minimum par
+opération servent à la comparaison (robustes au bruit de la machine).
+"""
+import gc
+import statistics
+import time
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+Operation = Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Scénario de benchmark.
+    
+    `setup` est un gestionnaire de contexte (fabrique) qui prépare les
+    données, fournit l'opération à mesurer et nettoie à la sortie.
+    """
+    
+    name: str
+    description: str
+    setup: Callable[[], 'AbstractContextManager[Operation]']
+
+
+@dataclass
+class ScenarioResult:
+    """Durées par opération (ns) de chaque échantillon"""
+    
+    name: str
+    iterations: int
+    samples_ns: List[float] = field(default_factory=list)
+    
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns)
+    
+    @property
+    def min_ns(self) -> float:
+        return min(self.samples_ns)
+    
+    @property
+    def mean_ns(self) -> float:
+        return statistics.fmean(self.samples_ns)
+    
+    @property
+    def stdev_ns(self) -> float:
+        return statistics.stdev(self.samples_ns) if len(self.samples_ns) > 1 else 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'iterations': self.iterations,
+            'samples': len(self.samples_ns),
+            'median_ns': round(self.median_ns, 1),
+            'min_ns': round(self.min_ns, 1),
+            'mean_ns': round(self.mean_ns, 1),
+            'stdev_ns': round(self.stdev_ns, 1)
+        }
+
+
+class BenchmarkRunner:
+    """Mesure des scénarios avec calibration automatique du nombre d'itérations"""
+    
+    MAX_ITERATIONS = 1 << 20
+    
+    def __init__(
+        self,
+        min_sample_seconds: float = 0.05,
+        samples: int = 7,
+        warmup_samples: int = 1,
+        timer: Callable[[], int] = time.perf_counter_ns
+    ):
+        """
+        Initialise le runner.
+        
+        Args:
+            min_sample_seconds: Durée minimale d'un échantillon
+            samples: Échantillons mesurés par scénario
+            warmup_samples: Échantillons de chauffe (ignorés)
+            timer: Horloge en nanosecondes (injectable pour les tests)
+        """
+        if samples < 1:
+            raise ValueError("Au moins un échantillon est requis")
+        self._min_sample_ns = min_sample_seconds * 1e9
+        self._samples = samples
+        self._warmup_samples = warmup_samples
+        self._timer = timer
+    
+    def run(self, scenario: Scenario) -> ScenarioResult:
+        """Exécute un scénario et retourne ses statistiques"""
+        with scenario.setup() as operation:
+            iterations = self._calibrate(operation)
+            for _ in range(self._warmup_samples):
+                self._sample(operation, iterations)
+            result = ScenarioResult(scenario.name, iterations)
+            for _ in range(self._samples):
+                result.samples_ns.append(self._sample(operation, iterations) / iterations)
+        return result
+    
+    def _calibrate(self, operation: Operation) -> int:
+        """Double le nombre d'itérations jusqu'à atteindre la durée minimale"""
+        iterations = 1
+        while iterations < self.MAX_ITERATIONS:
+            elapsed = self._sample(operation, iterations)
+            if elapsed >= self._min_sample_ns:
+                break
+            if elapsed <= 0:
+                iterations *= 10
+            else:
+                # Viser directement la durée minimale (avec une marge), sans dépasser ×10
+                iterations = min(iterations * 10, max(iterations * 2, int(iterations * 1.2 * self._min_sample_ns / elapsed)))
+        return min(iterations, self.MAX_ITERATIONS)
+    
+    def _sample(self, operation: Operation, iterations: int) -> float:
+        gc.collect()
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            timer = self._timer
+            loop = range(iterations)
+            start = timer()
+            for _ in loop:
+                operation()
+            return timer() - start
+        finally:
+            if enabled:
+                gc.enable()
@@ -0,0 +1,248 @@
+"""
+Scénarios de la suite de benchmarks.
+
+Les données viennent du jeu synthétique (benchmarks/dataset): mêmes
+annonces à chaque exécution pour une même graine et une même taille.
+Les allers-retours HTTP passent par le client de test Flask (routage,
+validation, service, sérialisation JSON), sans réseau.
+"""
+import itertools
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from flask import Flask
+
+import api.listing_resource as listing_resource
+from api.exceptions.mappers.listing_exception_mapper import register_listing_exception_handlers
+from api.unit_of_work import CONSISTENCY_HEADER, consistency_tokens
+from api.validators.listing_dto_validator import ListingDtoValidator
+from application.category.category_service import CategoryService
+from application.listing.dtos.listing_creation_dto import ListingCreationDto
+from application.listing.listing_assembler import ListingAssembler
+from application.listing.listing_service import ListingService
+from benchmarks.dataset import DatasetConfig, SyntheticDataset, populate_in_memory
+from benchmarks.suite.runner import Operation, Scenario
+from domain.listing.listing import Listing
+from domain.listing.listing_condition import ListingCondition
+from domain.listing.listing_price import ListingPrice
+from infrastructure.cache.snapshot_cache import SnapshotCache
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.in_memory.in_memory_category_repository import InMemoryCategoryRepository
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.persistence.mysql.mysql_listing_picture_repository import MySQLListingPictureRepository
+
+# Taille d'une page du catalogue
+PAGE_SIZE = 24
+
+_PAYLOAD = {
+    'seller_id': '42',
+    'title': 'Calculatrice TI-84 Plus CE',
+    'description': 'Calculatrice graphique, utilisée un semestre. Câble inclus.',
+    'price': 85.0,
+    'category': 'Calculatrices',
+    'condition': 'Comme neuf',
+    'location': 'Pavillon Adrien-Pouliot',
+    'course_code': 'MAT-1900'
+}
+
+
+class _FakeCursor:
+    """Curseur qui retourne des lignes préparées (mesure du mappage seul)"""
+    
+    def __init__(self, columns, rows):
+        self.description = [(column,) for column in columns]
+        self._rows = rows
+    
+    def execute(self, query, params=None):
+        pass
+    
+    def fetchall(self):
+        return self._rows
+    
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, cursor: _FakeCursor):
+        self._cursor = cursor
+    
+    def get_cursor(self, statement=None):
+        return self._cursor
+
+
+def build_scenarios(listings: int = 2_000, seed: int = 42) -> List[Scenario]:
+    """
+    Retourne tous les scénarios.
+    
+    Args:
+        listings: Taille du catalogue chargé pour les allers-retours HTTP
+        seed: Graine du jeu de données
+    """
+    dataset = SyntheticDataset(DatasetConfig(listings=listings, seed=seed))
+    
+    def listing_rows() -> List[tuple]:
+        return [row for row in itertools.islice(dataset.rows('listings'), 1_000)]
+    
+    @contextmanager
+    def listing_construction() -> Iterator[Operation]:
+        rows = itertools.cycle(listing_rows())
+        
+        def operation():
+            (listing_id, seller_id, title, description, _, price, category_id,
+             condition, location, is_sold, _, _, _, created_at, _) = next(rows)
+            return Listing(
+                listing_id=str(listing_id),
+                seller_id=str(seller_id),
+                title=title,
+                description=description,
+                price=ListingPrice(price),
+                category=str(category_id),
+                condition=ListingCondition.from_string(condition),
+                location=location,
+                is_sold=is_sold,
+                created_at=created_at
+            )
+        yield operation
+    
+    @contextmanager
+    def assembler_page() -> Iterator[Operation]:
+        repository = InMemoryListingRepository()
+        pictures = InMemoryListingPictureRepository()
+        populate_in_memory(
+            SyntheticDataset(DatasetConfig(listings=PAGE_SIZE * 4, seed=seed)),
+            repository,
+            picture_repository=pictures
+        )
+        page = repository.find_all()[:PAGE_SIZE]
+        covers = pictures.find_covers(listing.listing_id for listing in page)
+        assembler = ListingAssembler()
+        yield lambda: assembler.to_response_dto_list(page, covers)
+    
+    @contextmanager
+    def validator() -> Iterator[Operation]:
+        validator = ListingDtoValidator(CategoryService(InMemoryCategoryRepository()))
+        yield lambda: validator.validate(_PAYLOAD)
+    
+    @contextmanager
+    def picture_repository() -> Iterator[MySQLListingPictureRepository]:
+        columns = [column.strip() for column in MySQLListingPictureRepository._COLUMNS.split(',')]
+        rows = [
+            (picture_id, str(listing_id), file_path, is_cover, None, None, created_at)
+            for picture_id, listing_id, file_path, is_cover, created_at
+            in itertools.islice(dataset.rows('listing_pictures'), 500)
+        ]
+        yield MySQLListingPictureRepository(_FakeConnection(_FakeCursor(columns, rows)))
+    
+    @contextmanager
+    def fetch_all_mapping() -> Iterator[Operation]:
+        with picture_repository() as repository:
+            query = repository._SELECT_BY_LISTING
+            yield lambda: [repository._map_to_entity(row) for row in repository._fetch_all(query, ('1',))]
+    
+    @contextmanager
+    def fetch_all_row_mapper() -> Iterator[Operation]:
+        with picture_repository() as repository:
+            yield lambda: repository.find_by_listing('1')
+    
+    @contextmanager
+    def listing_app() -> Iterator[tuple]:
+        """Application Flask avec le catalogue synthétique; état global restauré à la sortie"""
+        repository = InMemoryListingRepository()
+        pictures = InMemoryListingPictureRepository()
+        populate_in_memory(dataset, repository, picture_repository=pictures)
+        # Instantanés construits depuis le service du scénario (_render_catalogue lit
+        # listing_resource.listing_service), reconstruits à la lecture sans thread de fond
+        snapshots = SnapshotCache(
+            'catalogue', build=listing_resource._render_catalogue, background=False, registry=MetricsRegistry()
+        )
+        service = ListingService(
+            repository,
+            ListingAssembler(),
+            pictures,
+            category_service=CategoryService(InMemoryCategoryRepository()),
+            catalogue_snapshots=snapshots
+        )
+        
+        app = Flask(__name__)
+        app.register_blueprint(listing_resource.listing_bp, url_prefix='/api')
+        register_listing_exception_handlers(app)
+        
+        previous_service = listing_resource.listing_service
+        previous_snapshots = listing_resource.catalogue_snapshots
+        previous_level = logging.getLogger('api').level
+        listing_resource.listing_service = service
+        listing_resource.catalogue_snapshots = snapshots
+        # Les journaux par requête ne font pas partie de la mesure
+        logging.getLogger('api').setLevel(logging.WARNING)
+        try:
+            yield app.test_client(), service, repository
+        finally:
+            listing_resource.listing_service = previous_service
+            listing_resource.catalogue_snapshots = previous_snapshots
+            logging.getLogger('api').setLevel(previous_level)
+    
+    def _checked(response, status: int):
+        if response.status_code != status:
+            raise RuntimeError(f"Réponse inattendue: {response.status_code} {response.get_data(as_text=True)[:200]}")
+        return response
+    
+    @contextmanager
+    def http_create() -> Iterator[Operation]:
+        with listing_app() as (client, _, _):
+            yield lambda: _checked(client.post('/api/listings', json=_PAYLOAD), 201)
+    
+    @contextmanager
+    def http_get() -> Iterator[Operation]:
+        with listing_app() as (client, _, repository):
+            hot = itertools.cycle(str(listing_id) for listing_id in dataset.hot_listing_ids(100) if repository.exists(str(listing_id)))
+            yield lambda: _checked(client.get(f"/api/listings/{next(hot)}"), 200)
+    
+    @contextmanager
+    def http_list() -> Iterator[Operation]:
+        with listing_app() as (client, _, _):
+            yield lambda: _checked(client.get('/api/listings?category=%C3%89lectronique'), 200)
+    
+    @contextmanager
+    def http_list_uncached() -> Iterator[Operation]:
+        with listing_app() as (client, _, _):
+            def operation():
+                # Jeton de cohérence valide (fenêtre de quelques secondes): ni instantané ni coalescence
+                headers = {CONSISTENCY_HEADER: consistency_tokens.remember(None, '')}
+                return _checked(client.get('/api/listings?category=%C3%89lectronique', headers=headers), 200)
+            yield operation
+    
+    @contextmanager
+    def http_search() -> Iterator[Operation]:
+        with listing_app() as (client, _, _):
+            terms = itertools.cycle(['calculatrice', 'manuel', 'vélo', 'ordinateur portable', 'bureau'])
+            yield lambda: _checked(client.get('/api/listings', query_string={'search': next(terms)}), 200)
+    
+    @contextmanager
+    def http_delete() -> Iterator[Operation]:
+        with listing_app() as (client, service, _):
+            def operation():
+                # Création par le service (hors HTTP), suppression par l'API
+                created = service.create_listing(ListingCreationDto(**_PAYLOAD))
+                _checked(client.delete(f"/api/listings/{created.listing_id}", headers={'X-User-Id': '42'}), 204)
+            yield operation
+    
+    return [
+        Scenario('domain.listing_construction', 'Construction d\'une entité Listing', listing_construction),
+        Scenario('application.assembler_page', f"ListingAssembler.to_response_dto_list ({PAGE_SIZE} annonces)", assembler_page),
+        Scenario('api.validator', 'ListingDtoValidator.validate (annonce valide)', validator),
+        Scenario('infrastructure.fetch_all_mapping', '_fetch_all + _map_to_entity (500 photos)', fetch_all_mapping),
+        Scenario('infrastructure.fetch_all_row_mapper', '_fetch_all_as(RowMapper) (500 photos)', fetch_all_row_mapper),
+        Scenario('http.create_listing', 'POST /api/listings (JSON)', http_create),
+        Scenario('http.get_listing', 'GET /api/listings/<id> (annonces chaudes)', http_get),
+        Scenario('http.list_by_category', 'GET /api/listings?category=Électronique (instantané)', http_list),
+        Scenario(
+            'http.list_by_category_uncached',
+            'GET /api/listings?category=Électronique (lecture de ses écritures)',
+            http_list_uncached
+        ),
+        Scenario('http.search_listings', 'GET /api/listings?search=', http_search),
+        Scenario('http.delete_listing', 'DELETE /api/listings/<id> (création par le service incluse)', http_delete),
+    ]
@@ -0,0 +1 @@
+"""Module Auth - Domain Layer"""
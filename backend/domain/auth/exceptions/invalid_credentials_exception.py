@@ -0,0 +1,15 @@
+"""
+Exception métier: InvalidCredentialsException
+Levée quand l'IDUL ou le mot de passe est incorrect.
+"""
+
+
+class InvalidCredentialsException(RuntimeError):
+    """
+    Exception levée lors d'une connexion refusée.
+    
+    Le message ne précise volontairement pas si l'IDUL existe.
+    """
+    
+    def __init__(self):
+        super().__init__("IDUL ou mot de passe incorrect")
@@ -0,0 +1,28 @@
+"""
+Exception métier: InvalidSessionException
+Levée quand un jeton de session est absent, expiré ou révoqué.
+"""
+
+
+class InvalidSessionException(RuntimeError):
+    """
+    Exception levée quand une session ne peut pas être validée.
+    
+    Cette exception fait partie de la couche Domaine et représente
+    une règle métier: une requête protégée exige une session active.
+    """
+    
+    def __init__(self, reason: str = None):
+        """
+        Crée l'exception.
+        
+        Args:
+            reason: Raison de l'échec de validation (optionnel)
+        """
+        if reason:
+            message = f"Session invalide: {reason}"
+        else:
+            message = "Session invalide"
+        
+        super().__init__(message)
+        self.reason = reason
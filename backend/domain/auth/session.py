@@ -0,0 +1,143 @@
+"""
+Entité: Session
+Représente une session d'authentification (table `sessions`).
+"""
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+
+class Session:
+    """
+    Entité représentant une session utilisateur.
+    
+    Une session est identifiée par un jeton opaque remis au client.
+    Elle est active tant qu'elle n'est ni expirée ni révoquée (used_at).
+    """
+    
+    TOKEN_TYPE_AUTH = 'auth'
+    
+    def __init__(
+        self,
+        user_id: str,
+        token: str,
+        expires_at: datetime,
+        session_id: Optional[int] = None,
+        token_type: str = TOKEN_TYPE_AUTH,
+        used_at: Optional[datetime] = None,
+        created_at: Optional[datetime] = None
+    ):
+        """
+        Crée une session.
+        
+        Args:
+            user_id: ID de l'utilisateur propriétaire
+            token: Jeton opaque remis au client
+            expires_at: Date d'expiration
+            session_id: Identifiant en base (None avant insertion)
+            token_type: Type de jeton (auth, email_verification, password_reset)
+            used_at: Date de révocation/utilisation (None si encore valide)
+            created_at: Date de création
+        
+        Raises:
+            ValueError: Si les données sont invalides
+        """
+        if user_id is None or not str(user_id).strip():
+            raise ValueError("L'ID de l'utilisateur est requis")
+        
+        if not token or not token.strip():
+            raise ValueError("Le jeton de session est requis")
+        
+        if expires_at is None:
+            raise ValueError("La date d'expiration est requise")
+        
+        self._session_id = session_id
+        self._user_id = str(user_id)
+        self._token = token
+        self._token_type = token_type
+        self._expires_at = expires_at
+        self._used_at = used_at
+        self._created_at = created_at if created_at else datetime.now()
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def session_id(self) -> Optional[int]:
+        return self._session_id
+    
+    @property
+    def user_id(self) -> str:
+        return self._user_id
+    
+    @property
+    def token(self) -> str:
+        return self._token
+    
+    @property
+    def token_type(self) -> str:
+        return self._token_type
+    
+    @property
+    def expires_at(self) -> datetime:
+        return self._expires_at
+    
+    @property
+    def used_at(self) -> Optional[datetime]:
+        return self._used_at
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    # ===== Méthodes Métier =====
+    
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """
+        Calcule l'empreinte d'un jeton.
+        
+        L'empreinte sert de clé de cache et de message de révocation:
+        le jeton brut ne quitte jamais la requête qui l'a reçu.
+        
+        Args:
+            token: Jeton brut
+            
+        Returns:
+            Empreinte SHA-256 hexadécimale
+        """
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+    
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        """
+        Vérifie si la session permet encore d'accéder aux routes protégées.
+        
+        Args:
+            now: Instant de référence (datetime.now() par défaut)
+            
+        Returns:
+            True si la session est de type auth, non révoquée et non expirée
+        """
+        now = now or datetime.now()
+        return (
+            self._token_type == self.TOKEN_TYPE_AUTH
+            and self._used_at is None
+            and self._expires_at > now
+        )
+    
+    def revoke(self, when: Optional[datetime] = None) -> None:
+        """
+        Révoque la session (logout).
+        
+        Args:
+            when: Instant de révocation (datetime.now() par défaut)
+        """
+        if self._used_at is None:
+            self._used_at = when or datetime.now()
+    
+    def __repr__(self) -> str:
+        return (
+            f"Session(id={self._session_id}, "
+            f"user_id={self._user_id}, "
+            f"expires_at={self._expires_at.isoformat()}, "
+            f"revoked={self._used_at is not None})"
+        )
@@ -0,0 +1,66 @@
+"""
+Interface (Port) : SessionRepository
+Définit le contrat pour la persistance des sessions d'authentification.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from domain.auth.session import Session
+
+
+class SessionRepository(ABC):
+    """
+    Interface définissant les opérations de persistance pour les sessions.
+    
+    Cette interface est un PORT dans l'architecture hexagonale.
+    Elle est définie dans le Domaine mais implémentée dans l'Infrastructure.
+    """
+    
+    @abstractmethod
+    def find_active_by_token(self, token: str) -> Optional[Session]:
+        """
+        Trouve une session active (type auth, non révoquée, non expirée).
+        
+        Args:
+            token: Jeton de session
+            
+        Returns:
+            La session si elle est active, None sinon
+        """
+        pass
+    
+    @abstractmethod
+    def save(self, session: Session) -> None:
+        """
+        Sauvegarde une nouvelle session.
+        
+        Args:
+            session: La session à sauvegarder
+        """
+        pass
+    
+    @abstractmethod
+    def revoke(self, token: str) -> bool:
+        """
+        Révoque une session (logout).
+        
+        Args:
+            token: Jeton de la session à révoquer
+            
+        Returns:
+            True si une session active a été révoquée
+        """
+        pass
+    
+    @abstractmethod
+    def revoke_all_for_user(self, user_id: str) -> int:
+        """
+        Révoque toutes les sessions actives d'un utilisateur
+        (changement ou réinitialisation du mot de passe).
+        
+        Args:
+            user_id: ID de l'utilisateur
+            
+        Returns:
+            Nombre de sessions révoquées
+        """
+        pass
@@ -0,0 +1 @@
+"""Module Category - Domain Layer"""
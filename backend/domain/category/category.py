@@ -0,0 +1,98 @@
+"""
+Entité: Category
+Représente une catégorie du catalogue (table `categories`).
+"""
+from typing import Optional
+
+
+class Category:
+    """
+    Entité représentant une catégorie d'annonces.
+    
+    Les catégories forment un arbre par `parent_id` (ex: Électronique →
+    Calculatrices, Ordinateurs); une catégorie sans parent est une racine.
+    """
+    
+    def __init__(
+        self,
+        category_id: int,
+        name: str,
+        parent_id: Optional[int] = None,
+        icon: Optional[str] = None,
+        description: Optional[str] = None
+    ):
+        """
+        Crée une catégorie.
+        
+        Args:
+            category_id: Identifiant en base
+            name: Nom unique (ex: "Électronique")
+            parent_id: Catégorie parente (None pour une racine)
+            icon: Icône affichée dans le frontend
+            description: Description de la catégorie
+        
+        Raises:
+            ValueError: Si les données sont invalides
+        """
+        if category_id is None or int(category_id) < 1:
+            raise ValueError("L'ID de la catégorie doit être positif")
+        
+        if not name or not name.strip():
+            raise ValueError("Le nom de la catégorie est requis")
+        
+        if parent_id is not None and int(parent_id) == int(category_id):
+            raise ValueError("Une catégorie ne peut pas être son propre parent")
+        
+        self._category_id = int(category_id)
+        self._name = name.strip()
+        self._parent_id = int(parent_id) if parent_id is not None else None
+        self._icon = icon
+        self._description = description
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def category_id(self) -> int:
+        return self._category_id
+    
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @property
+    def parent_id(self) -> Optional[int]:
+        return self._parent_id
+    
+    @property
+    def icon(self) -> Optional[str]:
+        return self._icon
+    
+    @property
+    def description(self) -> Optional[str]:
+        return self._description
+    
+    # ===== Méthodes Métier =====
+    
+    def is_root(self) -> bool:
+        """Vérifie si la catégorie est une racine de l'arbre"""
+        return self._parent_id is None
+    
+    def to_dict(self) -> dict:
+        return {
+            'category_id': self._category_id,
+            'name': self._name,
+            'parent_id': self._parent_id,
+            'icon': self._icon,
+            'description': self._description
+        }
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Category):
+            return False
+        return self._category_id == other._category_id
+    
+    def __hash__(self) -> int:
+        return hash(self._category_id)
+    
+    def __repr__(self) -> str:
+        return f"Category(id={self._category_id}, name='{self._name}', parent_id={self._parent_id})"
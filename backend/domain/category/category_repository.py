@@ -0,0 +1,39 @@
+"""
+Interface (Port) : CategoryRepository
+Définit le contrat pour la lecture des catégories.
+"""
+from abc import ABC, abstractmethod
+from typing import List
+from domain.category.category import Category
+
+
+class CategoryRepository(ABC):
+    """
+    Interface définissant les opérations de persistance pour les catégories.
+    
+    Cette interface est un PORT dans l'architecture hexagonale.
+    La table est petite et change rarement: elle est lue en entier, et un
+    numéro de version permet de savoir à peu de frais si elle a changé.
+    """
+    
+    @abstractmethod
+    def find_all(self) -> List[Category]:
+        """
+        Retourne toutes les catégories.
+        
+        Returns:
+            Liste de toutes les catégories
+        """
+        pass
+    
+    @abstractmethod
+    def get_version(self) -> int:
+        """
+        Retourne la version courante de la table des catégories.
+        
+        La version augmente à chaque ajout, modification ou suppression.
+        
+        Returns:
+            Numéro de version
+        """
+        pass
@@ -0,0 +1,142 @@
+"""
+Objet valeur: CategoryTree
+Arbre complet des catégories, avec les descendants de chaque nœud précalculés.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from domain.category.category import Category
+
+
+class CategoryTree:
+    """
+    Arbre immuable des catégories.
+    
+    Construit une fois à partir de la table entière: chaque recherche
+    (par ID, par nom, descendants d'un nœud) est ensuite une lecture de
+    dictionnaire. Filtrer sur une catégorie revient à filtrer sur
+    `descendants(id)`, sans requête récursive.
+    """
+    
+    def __init__(self, categories: Iterable[Category], version: int = 0):
+        """
+        Construit l'arbre.
+        
+        Un parent absent de la table est ignoré (la catégorie devient une
+        racine), comme le ferait ON DELETE SET NULL.
+        
+        Args:
+            categories: Toutes les catégories
+            version: Version de la table lue
+        
+        Raises:
+            ValueError: Si les parents forment un cycle
+        """
+        self._version = version
+        self._by_id: Dict[int, Category] = {}
+        self._by_name: Dict[str, Category] = {}
+        
+        for category in categories:
+            self._by_id[category.category_id] = category
+            self._by_name[self.normalize_name(category.name)] = category
+        
+        self._parent: Dict[int, Optional[int]] = {}
+        children: Dict[int, List[int]] = {category_id: [] for category_id in self._by_id}
+        for category_id in sorted(self._by_id):
+            parent_id = self._by_id[category_id].parent_id
+            if parent_id not in self._by_id:
+                parent_id = None
+            self._parent[category_id] = parent_id
+            if parent_id is not None:
+                children[parent_id].append(category_id)
+        
+        self._children: Dict[int, Tuple[int, ...]] = {
+            category_id: tuple(child_ids) for category_id, child_ids in children.items()
+        }
+        self._roots: Tuple[int, ...] = tuple(
+            category_id for category_id in sorted(self._by_id) if self._parent[category_id] is None
+        )
+        self._descendants: Dict[int, FrozenSet[int]] = {}
+        for root_id in self._roots:
+            self._collect_descendants(root_id)
+        
+        if len(self._descendants) != len(self._by_id):
+            cyclic = sorted(set(self._by_id) - set(self._descendants))
+            raise ValueError(f"Cycle dans l'arbre des catégories: {cyclic}")
+    
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Forme de comparaison des noms (casse et espaces ignorés)"""
+        return ' '.join(name.split()).casefold()
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def version(self) -> int:
+        return self._version
+    
+    @property
+    def roots(self) -> List[Category]:
+        return [self._by_id[category_id] for category_id in self._roots]
+    
+    # ===== Méthodes Métier =====
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def __contains__(self, category_id: int) -> bool:
+        return category_id in self._by_id
+    
+    def get(self, category_id: int) -> Optional[Category]:
+        return self._by_id.get(category_id)
+    
+    def find(self, identifier: Union[int, str]) -> Optional[Category]:
+        """
+        Trouve une catégorie par ID ou par nom.
+        
+        Args:
+            identifier: ID (entier ou chaîne de chiffres) ou nom
+        
+        Returns:
+            La catégorie si trouvée, None sinon
+        """
+        if isinstance(identifier, bool):
+            return None
+        if isinstance(identifier, int):
+            return self._by_id.get(identifier)
+        if not isinstance(identifier, str):
+            return None
+        
+        text = identifier.strip()
+        # isdigit() seul accepte '²' ou '٣', que int() refuse ou convertit
+        if text.isascii() and text.isdigit():
+            return self._by_id.get(int(text))
+        return self._by_name.get(self.normalize_name(text))
+    
+    def parent_of(self, category_id: int) -> Optional[Category]:
+        parent_id = self._parent.get(category_id)
+        return self._by_id[parent_id] if parent_id is not None else None
+    
+    def children_of(self, category_id: int) -> List[Category]:
+        return [self._by_id[child_id] for child_id in self._children.get(category_id, ())]
+    
+    def descendants(self, category_id: int) -> FrozenSet[int]:
+        """
+        Retourne la catégorie et toutes ses sous-catégories.
+        
+        Returns:
+            Ensemble d'IDs (vide si la catégorie n'existe pas)
+        """
+        return self._descendants.get(category_id, frozenset())
+    
+    def _collect_descendants(self, root_id: int) -> None:
+        """Remplit les descendants d'un sous-arbre (itératif, en post-ordre)"""
+        stack = [(root_id, False)]
+        while stack:
+            category_id, expanded = stack.pop()
+            if expanded:
+                collected = {category_id}
+                for child_id in self._children[category_id]:
+                    collected |= self._descendants[child_id]
+                self._descendants[category_id] = frozenset(collected)
+            else:
+                stack.append((category_id, True))
+                stack.extend((child_id, False) for child_id in self._children[category_id])
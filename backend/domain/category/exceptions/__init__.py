@@ -0,0 +1 @@
+"""Exceptions métier Category"""
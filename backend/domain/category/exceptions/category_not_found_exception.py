@@ -0,0 +1,26 @@
+"""
+Exception métier: CategoryNotFoundException
+Levée quand une catégorie demandée n'existe pas.
+"""
+
+
+class CategoryNotFoundException(ValueError):
+    """
+    Exception levée quand un identifiant ou un nom ne correspond à aucune
+    catégorie de la table.
+    """
+    
+    def __init__(self, identifier: str = None):
+        """
+        Crée l'exception.
+        
+        Args:
+            identifier: ID ou nom de la catégorie non trouvée (optionnel)
+        """
+        if identifier is not None:
+            message = f"Catégorie inconnue: {identifier}"
+        else:
+            message = "Catégorie inconnue"
+        
+        super().__init__(message)
+        self.identifier = identifier
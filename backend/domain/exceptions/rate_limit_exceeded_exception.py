@@ -0,0 +1,28 @@
+"""
+Exception technique: RateLimitExceededException
+Levée quand un client dépasse le débit autorisé sur une route.
+"""
+
+
+class RateLimitExceededException(RuntimeError):
+    """
+    Exception levée quand le seau de jetons d'un client est vide.
+    
+    Contrairement à ServiceOverloadedException, le serveur n'est pas
+    saturé: c'est ce client qui envoie trop de requêtes. La couche API la
+    convertit en 429 avec un en-tête Retry-After.
+    """
+    
+    def __init__(self, message: str = None, retry_after: int = 1):
+        """
+        Crée l'exception.
+        
+        Args:
+            message: Message décrivant la limite atteinte
+            retry_after: Délai avant qu'un jeton soit disponible (secondes)
+        """
+        if message is None:
+            message = "Trop de requêtes"
+        
+        super().__init__(message)
+        self.retry_after = retry_after
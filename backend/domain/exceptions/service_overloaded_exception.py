@@ -0,0 +1,28 @@
+"""
+Exception technique: ServiceOverloadedException
+Levée quand une ressource bornée (pool, file d'attente) est saturée.
+"""
+
+
+class ServiceOverloadedException(RuntimeError):
+    """
+    Exception levée quand le serveur refuse du travail pour se protéger.
+    
+    Plutôt que de laisser les requêtes s'accumuler (et la latence exploser),
+    on échoue rapidement: la couche API la convertit en 503 avec un
+    en-tête Retry-After.
+    """
+    
+    def __init__(self, message: str = None, retry_after: int = 1):
+        """
+        Crée l'exception.
+        
+        Args:
+            message: Message décrivant la ressource saturée
+            retry_after: Délai suggéré au client avant de réessayer (secondes)
+        """
+        if message is None:
+            message = "Service temporairement surchargé"
+        
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,27 @@
+"""
+Exception métier: InvalidPictureException
+Levée quand un fichier envoyé n'est pas une image acceptée.
+"""
+
+
+class InvalidPictureException(ValueError):
+    """
+    Exception levée quand une photo d'annonce est refusée.
+    
+    Exemples:
+    - Extension non supportée
+    - Contenu qui n'est pas une image JPEG, PNG ou WebP
+    - Trop de photos pour une annonce
+    """
+    
+    def __init__(self, filename: str, reason: str = "Image invalide"):
+        """
+        Crée l'exception.
+        
+        Args:
+            filename: Nom du fichier envoyé
+            reason: Raison du refus
+        """
+        super().__init__(f"{reason}: {filename}")
+        self.filename = filename
+        self.reason = reason
@@ -0,0 +1,26 @@
+"""
+Exception métier: PictureNotFoundException
+Levée quand une photo d'annonce n'est pas trouvée.
+"""
+
+
+class PictureNotFoundException(RuntimeError):
+    """
+    Exception levée quand une photo demandée n'existe pas (ou que son
+    fichier a disparu du stockage).
+    """
+    
+    def __init__(self, picture_id: int = None):
+        """
+        Crée l'exception.
+        
+        Args:
+            picture_id: ID de la photo non trouvée (optionnel)
+        """
+        if picture_id is not None:
+            message = f"Photo non trouvée: {picture_id}"
+        else:
+            message = "Photo non trouvée"
+        
+        super().__init__(message)
+        self.picture_id = picture_id
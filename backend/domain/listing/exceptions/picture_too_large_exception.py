@@ -0,0 +1,21 @@
+"""
+Exception métier: PictureTooLargeException
+Levée quand une photo dépasse la taille maximale autorisée.
+"""
+
+
+class PictureTooLargeException(ValueError):
+    """
+    Exception levée dès que le flux d'upload dépasse la limite, sans
+    attendre la fin du transfert.
+    """
+    
+    def __init__(self, max_size: int):
+        """
+        Crée l'exception.
+        
+        Args:
+            max_size: Taille maximale autorisée en octets
+        """
+        super().__init__(f"La photo dépasse la taille maximale de {max_size // (1024 * 1024)} Mo")
+        self.max_size = max_size
@@ -44,7 +44,7 @@ class Listing:
             title: Titre de l'annonce
             description: Description détaillée
             price: Prix (Value Object)
-            category: Catégorie (books, electronics, etc.)
+            category: ID de la catégorie (table `categories`)
             condition: État du produit (Value Object)
             location: Lieu de remise sur le campus
             course_code: Code de cours (optionnel, ex: GLO-2005)
@@ -0,0 +1,131 @@
+"""
+Entité: ListingPicture
+Représente une photo d'annonce (table `listing_pictures`) et ses variantes
+redimensionnées.
+"""
+from datetime import datetime
+from typing import Optional
+
+
+class ListingPicture:
+    """
+    Entité représentant une photo d'annonce.
+    
+    Les variantes (miniature, moyenne) sont générées en arrière-plan après
+    l'upload: tant qu'elles ne sont pas prêtes, l'original les remplace.
+    """
+    
+    def __init__(
+        self,
+        listing_id: str,
+        file_path: str,
+        is_cover: bool = False,
+        picture_id: Optional[int] = None,
+        thumbnail_path: Optional[str] = None,
+        medium_path: Optional[str] = None,
+        created_at: Optional[datetime] = None
+    ):
+        """
+        Crée une photo d'annonce.
+        
+        Args:
+            listing_id: ID de l'annonce
+            file_path: Chemin de l'original, relatif au dossier d'uploads
+            is_cover: Photo de couverture (affichée dans le catalogue)
+            picture_id: Identifiant en base (None avant insertion)
+            thumbnail_path: Chemin de la miniature (None tant qu'elle n'est pas prête)
+            medium_path: Chemin de la variante moyenne (None tant qu'elle n'est pas prête)
+            created_at: Date d'upload
+        
+        Raises:
+            ValueError: Si les données sont invalides
+        """
+        if not listing_id or not str(listing_id).strip():
+            raise ValueError("L'ID de l'annonce est requis")
+        
+        if not file_path or not file_path.strip():
+            raise ValueError("Le chemin du fichier est requis")
+        
+        self._picture_id = picture_id
+        self._listing_id = str(listing_id)
+        self._file_path = file_path
+        self._is_cover = is_cover
+        self._thumbnail_path = thumbnail_path
+        self._medium_path = medium_path
+        self._created_at = created_at if created_at else datetime.now()
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def picture_id(self) -> Optional[int]:
+        return self._picture_id
+    
+    @property
+    def listing_id(self) -> str:
+        return self._listing_id
+    
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+    
+    @property
+    def is_cover(self) -> bool:
+        return self._is_cover
+    
+    @property
+    def thumbnail_path(self) -> Optional[str]:
+        return self._thumbnail_path
+    
+    @property
+    def medium_path(self) -> Optional[str]:
+        return self._medium_path
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    @property
+    def small_path(self) -> str:
+        """Variante servie dans le catalogue: la miniature, sinon l'original"""
+        return self._thumbnail_path or self._file_path
+    
+    @property
+    def has_variants(self) -> bool:
+        return self._thumbnail_path is not None and self._medium_path is not None
+    
+    # ===== Méthodes Métier =====
+    
+    def with_id(self, picture_id: int) -> 'ListingPicture':
+        """
+        Retourne une copie de la photo avec son identifiant en base.
+        
+        Args:
+            picture_id: Identifiant attribué à l'insertion
+        """
+        return ListingPicture(
+            listing_id=self._listing_id,
+            file_path=self._file_path,
+            is_cover=self._is_cover,
+            picture_id=picture_id,
+            thumbnail_path=self._thumbnail_path,
+            medium_path=self._medium_path,
+            created_at=self._created_at
+        )
+    
+    def attach_variants(self, thumbnail_path: str, medium_path: str) -> None:
+        """
+        Enregistre les chemins des variantes générées.
+        
+        Args:
+            thumbnail_path: Chemin de la miniature
+            medium_path: Chemin de la variante moyenne
+        """
+        self._thumbnail_path = thumbnail_path
+        self._medium_path = medium_path
+    
+    def __repr__(self) -> str:
+        return (
+            f"ListingPicture(id={self._picture_id}, "
+            f"listing_id={self._listing_id}, "
+            f"is_cover={self._is_cover})"
+        )
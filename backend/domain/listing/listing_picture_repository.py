@@ -0,0 +1,92 @@
+"""
+Interface (Port) : ListingPictureRepository
+Définit le contrat pour la persistance des photos d'annonces.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+from domain.listing.listing_picture import ListingPicture
+
+
+class ListingPictureRepository(ABC):
+    """
+    Interface définissant les opérations de persistance pour les photos.
+    
+    Cette interface est un PORT dans l'architecture hexagonale.
+    """
+    
+    @abstractmethod
+    def save(self, picture: ListingPicture) -> ListingPicture:
+        """
+        Enregistre une nouvelle photo.
+        
+        Args:
+            picture: La photo à enregistrer (sans picture_id)
+            
+        Returns:
+            La photo avec son picture_id attribué
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_id(self, picture_id: int) -> Optional[ListingPicture]:
+        """
+        Trouve une photo par son ID.
+        
+        Args:
+            picture_id: ID de la photo
+            
+        Returns:
+            La photo si trouvée, None sinon
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_listing(self, listing_id: str) -> List[ListingPicture]:
+        """
+        Retourne les photos d'une annonce, couverture en premier.
+        
+        Args:
+            listing_id: ID de l'annonce
+        """
+        pass
+    
+    @abstractmethod
+    def find_covers(self, listing_ids: Iterable[str]) -> Dict[str, ListingPicture]:
+        """
+        Retourne la photo de couverture de plusieurs annonces en une fois
+        (une page du catalogue = une requête).
+        
+        Args:
+            listing_ids: IDs des annonces
+            
+        Returns:
+            Dictionnaire listing_id → photo de couverture (annonces sans photo absentes)
+        """
+        pass
+    
+    @abstractmethod
+    def update_variants(self, picture_id: int, thumbnail_path: str, medium_path: str) -> None:
+        """
+        Enregistre les chemins des variantes générées pour une photo.
+        
+        Args:
+            picture_id: ID de la photo
+            thumbnail_path: Chemin de la miniature
+            medium_path: Chemin de la variante moyenne
+        """
+        pass
+    
+    @abstractmethod
+    def count_references(self, file_paths: Iterable[str]) -> Dict[str, int]:
+        """
+        Compte les photos qui référencent chaque fichier (stockage adressé
+        par contenu: une même photo peut servir à plusieurs annonces).
+        
+        Args:
+            file_paths: Chemins des fichiers (tels qu'enregistrés dans file_path)
+            
+        Returns:
+            Dictionnaire file_path → nombre de références (fichiers non
+            référencés absents)
+        """
+        pass
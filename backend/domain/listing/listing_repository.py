@@ -4,7 +4,7 @@ Définit le contrat pour la persistance des annonces.
 Le Domaine définit l'interface, l'Infrastructure l'implémente.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from domain.listing.listing import Listing
 
 
@@ -69,6 +69,23 @@ class ListingRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def find_by_categories(self, categories: Iterable[str]) -> List[Listing]:
+        """
+        Trouve toutes les annonces de plusieurs catégories.
+        
+        Un filtre par catégorie parente est d'abord développé en liste plate
+        (voir CategoryService.expand_filter): l'implémentation SQL est un
+        simple `category_id IN (...)`.
+        
+        Args:
+            categories: IDs des catégories recherchées
+            
+        Returns:
+            Liste des annonces de ces catégories
+        """
+        pass
+    
     @abstractmethod
     def search(self, query: str) -> List[Listing]:
         """
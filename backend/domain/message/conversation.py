@@ -0,0 +1,224 @@
+"""
+Entité: Conversation
+Représente un fil de discussion entre un acheteur et un vendeur au sujet
+d'une annonce (table `conversations`).
+"""
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from domain.message.message import Message
+
+
+class Conversation:
+    """
+    Entité représentant une conversation.
+    
+    Règle métier: une seule conversation par couple (annonce, acheteur),
+    garantie en base par la contrainte `unique_conversation`.
+    
+    La conversation porte un aperçu dénormalisé de son dernier message et
+    un compteur de non-lus par participant, tenus à jour dans la même
+    transaction que l'insertion du message: la boîte de réception se lit
+    sans jointure sur `messages`.
+    """
+    
+    # Longueur de l'aperçu du dernier message (colonne last_message_preview)
+    PREVIEW_LENGTH = 140
+    
+    def __init__(
+        self,
+        listing_id: str,
+        buyer_id: str,
+        seller_id: str,
+        conversation_id: Optional[int] = None,
+        last_message_at: Optional[datetime] = None,
+        created_at: Optional[datetime] = None,
+        last_message_id: Optional[int] = None,
+        last_message_preview: Optional[str] = None,
+        last_sender_id: Optional[str] = None,
+        buyer_unread_count: int = 0,
+        seller_unread_count: int = 0
+    ):
+        """
+        Crée une conversation.
+        
+        Args:
+            listing_id: ID de l'annonce concernée
+            buyer_id: ID de l'acheteur (initiateur)
+            seller_id: ID du vendeur
+            conversation_id: Identifiant en base (None avant insertion)
+            last_message_at: Date du dernier message
+            created_at: Date de création
+            last_message_id: ID du dernier message (None si aucun message)
+            last_message_preview: Début du dernier message
+            last_sender_id: Expéditeur du dernier message
+            buyer_unread_count: Messages non lus par l'acheteur
+            seller_unread_count: Messages non lus par le vendeur
+        
+        Raises:
+            ValueError: Si les données sont invalides
+        """
+        if listing_id is None or not str(listing_id).strip():
+            raise ValueError("L'ID de l'annonce est requis")
+        
+        if buyer_id is None or not str(buyer_id).strip():
+            raise ValueError("L'ID de l'acheteur est requis")
+        
+        if seller_id is None or not str(seller_id).strip():
+            raise ValueError("L'ID du vendeur est requis")
+        
+        if str(buyer_id) == str(seller_id):
+            raise ValueError("Un vendeur ne peut pas ouvrir une conversation sur sa propre annonce")
+        
+        if buyer_unread_count < 0 or seller_unread_count < 0:
+            raise ValueError("Les compteurs de messages non lus ne peuvent pas être négatifs")
+        
+        self._conversation_id = conversation_id
+        self._listing_id = str(listing_id)
+        self._buyer_id = str(buyer_id)
+        self._seller_id = str(seller_id)
+        self._created_at = created_at if created_at else datetime.now()
+        self._last_message_at = last_message_at if last_message_at else self._created_at
+        self._last_message_id = last_message_id
+        self._last_message_preview = last_message_preview
+        self._last_sender_id = str(last_sender_id) if last_sender_id is not None else None
+        self._buyer_unread_count = buyer_unread_count
+        self._seller_unread_count = seller_unread_count
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def conversation_id(self) -> Optional[int]:
+        return self._conversation_id
+    
+    @property
+    def listing_id(self) -> str:
+        return self._listing_id
+    
+    @property
+    def buyer_id(self) -> str:
+        return self._buyer_id
+    
+    @property
+    def seller_id(self) -> str:
+        return self._seller_id
+    
+    @property
+    def last_message_at(self) -> datetime:
+        return self._last_message_at
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    @property
+    def last_message_id(self) -> Optional[int]:
+        return self._last_message_id
+    
+    @property
+    def last_message_preview(self) -> Optional[str]:
+        return self._last_message_preview
+    
+    @property
+    def last_sender_id(self) -> Optional[str]:
+        return self._last_sender_id
+    
+    @property
+    def buyer_unread_count(self) -> int:
+        return self._buyer_unread_count
+    
+    @property
+    def seller_unread_count(self) -> int:
+        return self._seller_unread_count
+    
+    # ===== Méthodes Métier =====
+    
+    def involves(self, user_id: str) -> bool:
+        """
+        Vérifie si un utilisateur participe à la conversation.
+        
+        Args:
+            user_id: ID de l'utilisateur
+        """
+        return str(user_id) in (self._buyer_id, self._seller_id)
+    
+    def recipient_of(self, sender_id: str) -> str:
+        """
+        Retourne le destinataire d'un message envoyé par `sender_id`.
+        
+        Args:
+            sender_id: ID de l'expéditeur (doit participer à la conversation)
+            
+        Raises:
+            PermissionError: Si l'expéditeur ne participe pas à la conversation
+        """
+        if not self.involves(sender_id):
+            raise PermissionError("Vous ne participez pas à cette conversation")
+        return self._seller_id if str(sender_id) == self._buyer_id else self._buyer_id
+    
+    def record_message(self, message: 'Message') -> None:
+        """
+        Met à jour l'aperçu du dernier message et le compteur de non-lus
+        du destinataire.
+        
+        Args:
+            message: Le message enregistré (avec son message_id)
+            
+        Raises:
+            PermissionError: Si l'expéditeur ne participe pas à la conversation
+        """
+        recipient_id = self.recipient_of(message.sender_id)
+        
+        self._last_message_id = message.message_id
+        self._last_message_preview = self.preview_of(message.content)
+        self._last_sender_id = message.sender_id
+        if message.created_at > self._last_message_at:
+            self._last_message_at = message.created_at
+        
+        if recipient_id == self._buyer_id:
+            self._buyer_unread_count += 1
+        else:
+            self._seller_unread_count += 1
+    
+    def unread_count_for(self, user_id: str) -> int:
+        """
+        Retourne le nombre de messages non lus par un participant.
+        
+        Args:
+            user_id: ID du participant
+        """
+        if str(user_id) == self._buyer_id:
+            return self._buyer_unread_count
+        if str(user_id) == self._seller_id:
+            return self._seller_unread_count
+        return 0
+    
+    def mark_read_by(self, user_id: str) -> None:
+        """
+        Remet à zéro le compteur de non-lus d'un participant.
+        
+        Args:
+            user_id: ID du participant
+        """
+        if str(user_id) == self._buyer_id:
+            self._buyer_unread_count = 0
+        elif str(user_id) == self._seller_id:
+            self._seller_unread_count = 0
+    
+    @classmethod
+    def preview_of(cls, content: str) -> str:
+        """
+        Tronque un contenu à la longueur de l'aperçu.
+        
+        Args:
+            content: Contenu complet du message
+        """
+        return content[:cls.PREVIEW_LENGTH]
+    
+    def __repr__(self) -> str:
+        return (
+            f"Conversation(id={self._conversation_id}, "
+            f"listing_id={self._listing_id}, "
+            f"buyer_id={self._buyer_id}, seller_id={self._seller_id})"
+        )
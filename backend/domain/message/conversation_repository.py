@@ -0,0 +1,85 @@
+"""
+Interface (Port) : ConversationRepository
+Définit le contrat pour la persistance des conversations.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from domain.message.conversation import Conversation
+from domain.message.inbox_entry import InboxEntry
+
+
+class ConversationRepository(ABC):
+    """
+    Interface définissant les opérations de persistance pour les conversations.
+    
+    Cette interface est un PORT dans l'architecture hexagonale.
+    """
+    
+    @abstractmethod
+    def find_by_id(self, conversation_id: int) -> Optional[Conversation]:
+        """
+        Trouve une conversation par son ID.
+        
+        Args:
+            conversation_id: ID de la conversation
+            
+        Returns:
+            La conversation si trouvée, None sinon
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_listing_and_buyer(self, listing_id: str, buyer_id: str) -> Optional[Conversation]:
+        """
+        Trouve la conversation d'un acheteur au sujet d'une annonce.
+        
+        Args:
+            listing_id: ID de l'annonce
+            buyer_id: ID de l'acheteur
+            
+        Returns:
+            La conversation si elle existe, None sinon
+        """
+        pass
+    
+    @abstractmethod
+    def save(self, conversation: Conversation) -> Conversation:
+        """
+        Crée une conversation.
+        
+        Args:
+            conversation: La conversation à créer (sans conversation_id)
+            
+        Returns:
+            La conversation avec son conversation_id attribué
+        """
+        pass
+    
+    @abstractmethod
+    def get_or_create(self, conversation: Conversation) -> Conversation:
+        """
+        Crée la conversation, ou retourne celle qui existe déjà pour le
+        couple (annonce, acheteur), sans lecture préalable ni course
+        entre deux créations simultanées.
+        
+        Args:
+            conversation: La conversation à créer (sans conversation_id)
+            
+        Returns:
+            La conversation existante ou créée
+        """
+        pass
+    
+    @abstractmethod
+    def find_inbox(self, user_id: str, limit: int) -> List[InboxEntry]:
+        """
+        Retourne la boîte de réception d'un utilisateur (acheteur ou vendeur).
+        
+        Args:
+            user_id: ID de l'utilisateur
+            limit: Nombre maximal de conversations
+            
+        Returns:
+            Entrées triées par last_message_at décroissant
+        """
+        pass
@@ -0,0 +1,25 @@
+"""
+Exception métier: ConversationNotFoundException
+Levée quand une conversation n'est pas trouvée.
+"""
+
+
+class ConversationNotFoundException(RuntimeError):
+    """
+    Exception levée quand une conversation demandée n'existe pas.
+    """
+    
+    def __init__(self, conversation_id=None):
+        """
+        Crée l'exception.
+        
+        Args:
+            conversation_id: ID de la conversation non trouvée (optionnel)
+        """
+        if conversation_id is not None:
+            message = f"Conversation non trouvée: {conversation_id}"
+        else:
+            message = "Conversation non trouvée"
+        
+        super().__init__(message)
+        self.conversation_id = conversation_id
@@ -0,0 +1,76 @@
+"""
+Entité: InboxEntry
+Ligne de la boîte de réception d'un utilisateur: une conversation vue
+par l'un de ses participants.
+"""
+from typing import Optional
+from domain.message.conversation import Conversation
+
+
+class InboxEntry:
+    """
+    Vue en lecture seule d'une conversation pour un participant.
+    
+    Regroupe ce que la page /messages affiche pour chaque fil: la
+    conversation (avec son dernier message dénormalisé), le nom de
+    l'autre participant et la photo de couverture de l'annonce.
+    """
+    
+    def __init__(
+        self,
+        conversation: Conversation,
+        viewer_id: str,
+        other_party_username: Optional[str] = None,
+        cover_picture_path: Optional[str] = None
+    ):
+        """
+        Crée une entrée de boîte de réception.
+        
+        Args:
+            conversation: La conversation
+            viewer_id: ID de l'utilisateur qui consulte sa boîte
+            other_party_username: Nom d'utilisateur de l'autre participant
+            cover_picture_path: Chemin de la photo de couverture de l'annonce
+            
+        Raises:
+            ValueError: Si l'utilisateur ne participe pas à la conversation
+        """
+        if not conversation.involves(viewer_id):
+            raise ValueError("L'utilisateur ne participe pas à cette conversation")
+        
+        self._conversation = conversation
+        self._viewer_id = str(viewer_id)
+        self._other_party_username = other_party_username
+        self._cover_picture_path = cover_picture_path
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def conversation(self) -> Conversation:
+        return self._conversation
+    
+    @property
+    def viewer_id(self) -> str:
+        return self._viewer_id
+    
+    @property
+    def other_party_id(self) -> str:
+        return self._conversation.recipient_of(self._viewer_id)
+    
+    @property
+    def other_party_username(self) -> Optional[str]:
+        return self._other_party_username
+    
+    @property
+    def cover_picture_path(self) -> Optional[str]:
+        return self._cover_picture_path
+    
+    @property
+    def unread_count(self) -> int:
+        return self._conversation.unread_count_for(self._viewer_id)
+    
+    def __repr__(self) -> str:
+        return (
+            f"InboxEntry(conversation_id={self._conversation.conversation_id}, "
+            f"viewer_id={self._viewer_id}, unread={self.unread_count})"
+        )
@@ -0,0 +1,128 @@
+"""
+Entité: Message
+Représente un message envoyé dans une conversation (table `messages`).
+"""
+from datetime import datetime
+from typing import Optional
+
+
+class Message:
+    """
+    Entité représentant un message.
+    
+    L'identifiant (message_id) est attribué par la base à l'insertion et
+    croît avec l'ordre d'envoi: il sert aussi de curseur (Last-Event-ID,
+    pagination).
+    """
+    
+    MAX_CONTENT_LENGTH = 5000
+    
+    def __init__(
+        self,
+        conversation_id: int,
+        sender_id: str,
+        content: str,
+        message_id: Optional[int] = None,
+        is_read: bool = False,
+        created_at: Optional[datetime] = None
+    ):
+        """
+        Crée un message.
+        
+        Args:
+            conversation_id: ID de la conversation
+            sender_id: ID de l'expéditeur
+            content: Contenu du message
+            message_id: Identifiant en base (None avant insertion)
+            is_read: Lu par le destinataire
+            created_at: Date d'envoi
+        
+        Raises:
+            ValueError: Si les données sont invalides
+        """
+        if conversation_id is None:
+            raise ValueError("L'ID de la conversation est requis")
+        
+        if sender_id is None or not str(sender_id).strip():
+            raise ValueError("L'ID de l'expéditeur est requis")
+        
+        self.validate_content(content)
+        
+        self._message_id = message_id
+        self._conversation_id = conversation_id
+        self._sender_id = str(sender_id)
+        self._content = content.strip()
+        self._is_read = is_read
+        self._created_at = created_at if created_at else datetime.now()
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def message_id(self) -> Optional[int]:
+        return self._message_id
+    
+    @property
+    def conversation_id(self) -> int:
+        return self._conversation_id
+    
+    @property
+    def sender_id(self) -> str:
+        return self._sender_id
+    
+    @property
+    def content(self) -> str:
+        return self._content
+    
+    @property
+    def is_read(self) -> bool:
+        return self._is_read
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    # ===== Méthodes Métier =====
+    
+    def with_id(self, message_id: int) -> 'Message':
+        """
+        Retourne une copie du message avec l'identifiant attribué par la base.
+        
+        Args:
+            message_id: Identifiant attribué
+        """
+        return Message(
+            conversation_id=self._conversation_id,
+            sender_id=self._sender_id,
+            content=self._content,
+            message_id=message_id,
+            is_read=self._is_read,
+            created_at=self._created_at
+        )
+    
+    @classmethod
+    def validate_content(cls, content: str) -> None:
+        """
+        Valide le contenu d'un message avant son envoi.
+        
+        Args:
+            content: Contenu du message
+            
+        Raises:
+            ValueError: Si le contenu est vide ou trop long
+        """
+        if not content or not content.strip():
+            raise ValueError("Le message ne peut pas être vide")
+        
+        if len(content) > cls.MAX_CONTENT_LENGTH:
+            raise ValueError(f"Le message ne peut pas dépasser {cls.MAX_CONTENT_LENGTH} caractères")
+    
+    def mark_as_read(self) -> None:
+        """Marque le message comme lu"""
+        self._is_read = True
+    
+    def __repr__(self) -> str:
+        return (
+            f"Message(id={self._message_id}, "
+            f"conversation_id={self._conversation_id}, "
+            f"sender_id={self._sender_id})"
+        )
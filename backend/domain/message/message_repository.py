@@ -0,0 +1,119 @@
+"""
+Interface (Port) : MessageRepository
+Définit le contrat pour la persistance des messages.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from domain.message.conversation import Conversation
+from domain.message.message import Message
+
+
+class MessageRepository(ABC):
+    """
+    Interface définissant les opérations de persistance pour les messages.
+    
+    Cette interface est un PORT dans l'architecture hexagonale.
+    """
+    
+    @abstractmethod
+    def save(self, message: Message) -> Message:
+        """
+        Enregistre un nouveau message.
+        
+        Dans la même transaction, l'aperçu du dernier message et le
+        compteur de non-lus du destinataire sont mis à jour sur la
+        conversation.
+        
+        Args:
+            message: Le message à enregistrer (sans message_id)
+            
+        Returns:
+            Le message avec son message_id attribué
+        """
+        pass
+    
+    @abstractmethod
+    def save_with_conversation(self, conversation: Conversation, sender_id: str, content: str) -> Message:
+        """
+        Envoie le premier message d'un fil: crée la conversation si elle
+        n'existe pas encore (couple annonce/acheteur), enregistre le message
+        et met à jour la conversation, de façon atomique.
+        
+        Args:
+            conversation: La conversation visée (sans conversation_id)
+            sender_id: ID de l'expéditeur
+            content: Contenu du message
+            
+        Returns:
+            Le message avec son message_id et son conversation_id
+        """
+        pass
+    
+    @abstractmethod
+    def find_by_conversation(
+        self,
+        conversation_id: int,
+        limit: int,
+        before_message_id: Optional[int] = None,
+        after_message_id: Optional[int] = None
+    ) -> List[Message]:
+        """
+        Retourne une page de messages d'une conversation (pagination par
+        curseur sur message_id, coût constant quelle que soit la page).
+        
+        - sans curseur: les `limit` messages les plus récents;
+        - before_message_id: les `limit` messages précédant ce message;
+        - after_message_id: les `limit` messages suivant ce message.
+        
+        Args:
+            conversation_id: ID de la conversation
+            limit: Nombre maximal de messages
+            before_message_id: Curseur vers les messages plus anciens
+            after_message_id: Curseur vers les messages plus récents
+            
+        Returns:
+            Messages triés par message_id croissant
+        """
+        pass
+    
+    @abstractmethod
+    def find_received_after(self, user_id: str, after_message_id: int, limit: int) -> List[Message]:
+        """
+        Retourne les messages reçus par un utilisateur dont l'ID est
+        strictement supérieur à `after_message_id` (reprise d'un flux SSE).
+        
+        Args:
+            user_id: ID du destinataire
+            after_message_id: Dernier message déjà reçu par le client
+            limit: Nombre maximal de messages
+            
+        Returns:
+            Messages triés par message_id croissant
+        """
+        pass
+    
+    @abstractmethod
+    def count_unread_for_user(self, user_id: str) -> int:
+        """
+        Compte les messages non lus reçus par un utilisateur
+        (somme des compteurs dénormalisés de ses conversations).
+        
+        Args:
+            user_id: ID du destinataire
+        """
+        pass
+    
+    @abstractmethod
+    def mark_conversation_read(self, conversation_id: int, reader_id: str) -> int:
+        """
+        Marque comme lus les messages reçus par `reader_id` dans une
+        conversation et remet son compteur de non-lus à zéro.
+        
+        Args:
+            conversation_id: ID de la conversation
+            reader_id: ID du participant qui lit
+            
+        Returns:
+            Nombre de messages passés à lus
+        """
+        pass
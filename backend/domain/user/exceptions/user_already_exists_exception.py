@@ -0,0 +1,20 @@
+"""
+Exception métier: UserAlreadyExistsException
+Levée quand un IDUL est déjà inscrit.
+"""
+
+
+class UserAlreadyExistsException(ValueError):
+    """
+    Exception levée lors d'une inscription avec un IDUL déjà utilisé.
+    """
+    
+    def __init__(self, idul: str):
+        """
+        Crée l'exception.
+        
+        Args:
+            idul: IDUL déjà inscrit
+        """
+        super().__init__(f"Un compte existe déjà pour l'IDUL: {idul}")
+        self.idul = idul
@@ -0,0 +1,104 @@
+"""
+Entité: User
+Représente un compte étudiant (table `users`).
+"""
+from datetime import datetime
+from typing import Optional
+
+
+class User:
+    """
+    Entité représentant un compte utilisateur.
+    
+    Le compte est identifié par son IDUL (identifiant ULaval) et
+    son courriel institutionnel; le mot de passe n'est connu que
+    par son empreinte bcrypt.
+    """
+    
+    EMAIL_DOMAIN = 'ulaval.ca'
+    
+    def __init__(
+        self,
+        idul: str,
+        password_hash: str,
+        email: Optional[str] = None,
+        user_id: Optional[str] = None,
+        is_verified: bool = False,
+        is_active: bool = True,
+        created_at: Optional[datetime] = None
+    ):
+        """
+        Crée un utilisateur.
+        
+        Args:
+            idul: Identifiant ULaval (unique)
+            password_hash: Empreinte bcrypt du mot de passe
+            email: Courriel (idul@ulaval.ca par défaut)
+            user_id: Identifiant en base (None avant insertion)
+            is_verified: Courriel vérifié
+            is_active: Compte actif
+            created_at: Date de création
+        
+        Raises:
+            ValueError: Si les données sont invalides
+        """
+        if not idul or not idul.strip():
+            raise ValueError("L'IDUL est requis")
+        
+        if not password_hash:
+            raise ValueError("L'empreinte du mot de passe est requise")
+        
+        self._user_id = str(user_id) if user_id is not None else None
+        self._idul = idul.strip().lower()
+        self._email = email or f"{self._idul}@{self.EMAIL_DOMAIN}"
+        self._password_hash = password_hash
+        self._is_verified = is_verified
+        self._is_active = is_active
+        self._created_at = created_at if created_at else datetime.now()
+    
+    # ===== Properties (Getters) =====
+    
+    @property
+    def user_id(self) -> Optional[str]:
+        return self._user_id
+    
+    @property
+    def idul(self) -> str:
+        return self._idul
+    
+    @property
+    def email(self) -> str:
+        return self._email
+    
+    @property
+    def password_hash(self) -> str:
+        return self._password_hash
+    
+    @property
+    def is_verified(self) -> bool:
+        return self._is_verified
+    
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    # ===== Méthodes Métier =====
+    
+    def change_password_hash(self, password_hash: str) -> None:
+        """
+        Remplace l'empreinte du mot de passe (changement de mot de passe
+        ou recalcul avec un nouveau coût bcrypt).
+        
+        Args:
+            password_hash: Nouvelle empreinte bcrypt
+        """
+        if not password_hash:
+            raise ValueError("L'empreinte du mot de passe est requise")
+        self._password_hash = password_hash
+    
+    def __repr__(self) -> str:
+        return f"User(id={self._user_id}, idul='{self._idul}', is_active={self._is_active})"
@@ -0,0 +1,52 @@
+"""
+Interface (Port) : UserRepository
+Définit le contrat pour la persistance des comptes utilisateurs.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from domain.user.user import User
+
+
+class UserRepository(ABC):
+    """
+    Interface définissant les opérations de persistance pour les utilisateurs.
+    
+    Cette interface est un PORT dans l'architecture hexagonale.
+    """
+    
+    @abstractmethod
+    def find_by_idul(self, idul: str) -> Optional[User]:
+        """
+        Trouve un utilisateur par son IDUL.
+        
+        Args:
+            idul: Identifiant ULaval
+            
+        Returns:
+            L'utilisateur si trouvé, None sinon
+        """
+        pass
+    
+    @abstractmethod
+    def save(self, user: User) -> User:
+        """
+        Crée un nouvel utilisateur.
+        
+        Args:
+            user: L'utilisateur à créer (sans user_id)
+            
+        Returns:
+            L'utilisateur avec son user_id attribué
+        """
+        pass
+    
+    @abstractmethod
+    def update_password_hash(self, user_id: str, password_hash: str) -> None:
+        """
+        Met à jour l'empreinte du mot de passe.
+        
+        Args:
+            user_id: ID de l'utilisateur
+            password_hash: Nouvelle empreinte bcrypt
+        """
+        pass
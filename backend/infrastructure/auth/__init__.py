@@ -0,0 +1 @@
+"""Auth utilities (cache de sessions, révocation)"""
@@ -0,0 +1,219 @@
+"""
+Module de diffusion des révocations de sessions.
+
+Chaque worker (processus gunicorn) garde son propre SessionCache. Lorsqu'une
+session est révoquée (logout, réinitialisation du mot de passe), les autres
+workers doivent oublier leur entrée en cache: ce module diffuse l'événement
+sur un canal local à la machine.
+"""
+import glob
+import logging
+import os
+import socket
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Types d'événements diffusés
+KIND_TOKEN = 'token'  # valeur: empreinte SHA-256 du jeton
+KIND_USER = 'user'    # valeur: ID de l'utilisateur
+
+RevocationListener = Callable[[str, str], None]
+
+
+class RevocationChannel(ABC):
+    """
+    Canal de diffusion des révocations.
+    
+    Un événement est un couple (kind, value). Les abonnés du processus
+    courant le reçoivent immédiatement lors de publish(); les implémentations
+    inter-processus le relaient aussi aux autres workers.
+    """
+    
+    def __init__(self):
+        self._listeners: List[RevocationListener] = []
+        self._listeners_lock = threading.Lock()
+    
+    def subscribe(self, listener: RevocationListener) -> None:
+        """
+        Abonne une fonction aux révocations.
+        
+        Args:
+            listener: Fonction appelée avec (kind, value)
+        """
+        with self._listeners_lock:
+            self._listeners.append(listener)
+    
+    @abstractmethod
+    def publish(self, kind: str, value: str) -> None:
+        """
+        Diffuse une révocation à tous les abonnés.
+        
+        Args:
+            kind: KIND_TOKEN ou KIND_USER
+            value: Empreinte du jeton ou ID de l'utilisateur
+        """
+        pass
+    
+    def close(self) -> None:
+        """Libère les ressources du canal (rien par défaut)"""
+        pass
+    
+    def _dispatch(self, kind: str, value: str) -> None:
+        """Appelle chaque abonné; une erreur d'abonné n'interrompt pas les autres"""
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        
+        for listener in listeners:
+            try:
+                listener(kind, value)
+            except Exception as e:
+                logger.error(f"Erreur dans un abonné de révocation: {str(e)}", exc_info=True)
+
+
+class LocalRevocationChannel(RevocationChannel):
+    """
+    Canal limité au processus courant.
+    
+    Suffisant en développement (un seul worker) et pour les tests.
+    """
+    
+    def publish(self, kind: str, value: str) -> None:
+        self._dispatch(kind, value)
+
+
+class UnixSocketRevocationChannel(RevocationChannel):
+    """
+    Canal inter-processus basé sur des sockets Unix en mode datagramme.
+    
+    Chaque worker lie un socket `<directory>/<pid>.sock` et l'écoute dans un
+    thread démon. publish() envoie un datagramme à chaque socket du répertoire:
+    aucune dépendance externe (Redis, etc.) n'est nécessaire tant que les
+    workers tournent sur la même machine.
+    
+    Le socket est lié paresseusement et re-lié après un fork (gunicorn
+    --preload), pour que chaque worker ait bien son propre point de réception.
+    """
+    
+    SOCKET_SUFFIX = '.sock'
+    MAX_DATAGRAM_SIZE = 1024
+    
+    def __init__(self, directory: str):
+        """
+        Initialise le canal.
+        
+        Args:
+            directory: Répertoire partagé par les workers de la machine
+        """
+        super().__init__()
+        self._directory = directory
+        self._socket: Optional[socket.socket] = None
+        self._socket_path: Optional[str] = None
+        self._pid: Optional[int] = None
+        self._bind_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    @property
+    def socket_path(self) -> Optional[str]:
+        return self._socket_path
+    
+    def subscribe(self, listener: RevocationListener) -> None:
+        super().subscribe(listener)
+        self._ensure_bound()
+    
+    def publish(self, kind: str, value: str) -> None:
+        # Les abonnés locaux d'abord: le worker qui révoque est à jour immédiatement
+        self._dispatch(kind, value)
+        self._ensure_bound()
+        
+        payload = f"{kind}:{value}".encode('utf-8')
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            for peer_path in glob.glob(os.path.join(self._directory, '*' + self.SOCKET_SUFFIX)):
+                if peer_path == self._socket_path:
+                    continue
+                try:
+                    sender.sendto(payload, peer_path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Worker terminé sans nettoyer son socket
+                    self._remove_stale_socket(peer_path)
+                except OSError as e:
+                    logger.warning(f"Révocation non transmise à {peer_path}: {str(e)}")
+        finally:
+            sender.close()
+    
+    def close(self) -> None:
+        with self._bind_lock:
+            if self._socket is not None:
+                try:
+                    # shutdown() réveille le thread bloqué dans recv()
+                    self._socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                try:
+                    self._socket.close()
+                except Exception:
+                    pass  # Ignorer les erreurs de fermeture
+                self._socket = None
+            
+            if self._socket_path is not None and self._pid == os.getpid():
+                self._remove_stale_socket(self._socket_path)
+            self._socket_path = None
+            self._pid = None
+    
+    def _ensure_bound(self) -> None:
+        """Lie le socket de réception du processus courant si nécessaire"""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        
+        with self._bind_lock:
+            if self._pid == pid:
+                return
+            
+            # Après un fork, le socket hérité appartient au parent
+            self._socket = None
+            path = os.path.join(self._directory, f"{pid}{self.SOCKET_SUFFIX}")
+            self._remove_stale_socket(path)
+            
+            receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            receiver.bind(path)
+            self._socket = receiver
+            self._socket_path = path
+            self._pid = pid
+            
+            listener_thread = threading.Thread(
+                target=self._listen,
+                args=(receiver,),
+                name='session-revocation-listener',
+                daemon=True
+            )
+            listener_thread.start()
+    
+    def _listen(self, receiver: socket.socket) -> None:
+        """Boucle de réception (thread démon)"""
+        while True:
+            try:
+                payload = receiver.recv(self.MAX_DATAGRAM_SIZE)
+            except OSError:
+                return  # Socket fermé
+            
+            if not payload:
+                return  # shutdown() appelé par close()
+            
+            kind, separator, value = payload.decode('utf-8', errors='replace').partition(':')
+            if not separator:
+                logger.warning("Message de révocation mal formé ignoré")
+                continue
+            self._dispatch(kind, value)
+    
+    @staticmethod
+    def _remove_stale_socket(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Impossible de supprimer le socket {path}: {str(e)}")
@@ -0,0 +1,226 @@
+"""
+Module de cache LRU des sessions validées.
+Évite un aller-retour à la table `sessions` pour chaque requête protégée.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Set
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """
+    Entrée du cache: résultat d'une validation réussie en base.
+    
+    Attributes:
+        user_id: ID de l'utilisateur propriétaire du jeton
+        expires_at: Date d'expiration de la session (colonne expires_at)
+        verified_at: Instant (horloge monotone) de la vérification en base
+    """
+    
+    user_id: str
+    expires_at: datetime
+    verified_at: float
+
+
+class SessionCache:
+    """
+    Cache LRU borné: empreinte du jeton → (user_id, expires_at).
+    
+    Les clés sont les empreintes calculées par Session.hash_token(): les
+    jetons bruts ne sont jamais conservés en mémoire. Une entrée est ignorée (et retirée) dès que la
+    session expire, ou après `max_age_seconds` pour forcer une revérification
+    périodique en base même si un message de révocation a été perdu.
+    
+    Une validation en base concurrente d'une révocation ne doit pas remettre
+    en cache la session révoquée: l'appelant lit `generation()` avant la
+    lecture en base et la passe à `put()`, qui ignore l'entrée si une
+    révocation a eu lieu entre-temps.
+    
+    Thread-safe: toutes les opérations prennent un verrou court (O(1)).
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 10000,
+        max_age_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise le cache.
+        
+        Args:
+            max_size: Nombre maximal d'entrées avant éviction LRU
+            max_age_seconds: Durée maximale de confiance d'une entrée
+            clock: Horloge monotone (injectable pour les tests)
+        
+        Raises:
+            ValueError: Si max_size ou max_age_seconds n'est pas positif
+        """
+        if max_size <= 0:
+            raise ValueError("La taille du cache doit être positive")
+        if max_age_seconds <= 0:
+            raise ValueError("La durée de vie du cache doit être positive")
+        
+        self._max_size = max_size
+        self._max_age = max_age_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedSession]" = OrderedDict()
+        self._hashes_by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        # Incrémentée à chaque révocation
+        self._generation = 0
+        
+        # Compteurs pour l'observabilité
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+    
+    def get(self, token_hash: str, now: Optional[datetime] = None) -> Optional[CachedSession]:
+        """
+        Retourne l'entrée si elle est encore valide.
+        
+        Args:
+            token_hash: Empreinte du jeton
+            now: Instant de référence pour l'expiration (datetime.now() par défaut)
+            
+        Returns:
+            L'entrée du cache, ou None (absente, expirée ou trop ancienne)
+        """
+        now = now or datetime.now()
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            too_old = self._clock() - entry.verified_at >= self._max_age
+            if entry.expires_at <= now or too_old:
+                self._remove(token_hash)
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(token_hash)
+            self._hits += 1
+            return entry
+    
+    def generation(self) -> int:
+        """Génération courante des révocations (à lire avant la validation en base)"""
+        with self._lock:
+            return self._generation
+    
+    def put(
+        self,
+        token_hash: str,
+        user_id: str,
+        expires_at: datetime,
+        generation: Optional[int] = None
+    ) -> bool:
+        """
+        Ajoute (ou rafraîchit) une entrée après une validation réussie.
+        
+        Args:
+            token_hash: Empreinte du jeton
+            user_id: ID de l'utilisateur
+            expires_at: Date d'expiration de la session
+            generation: Génération lue avant la validation en base (None: pas de contrôle)
+        
+        Returns:
+            False si une révocation a eu lieu depuis `generation` (entrée ignorée)
+        """
+        user_id = str(user_id)
+        entry = CachedSession(user_id=user_id, expires_at=expires_at, verified_at=self._clock())
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if token_hash in self._entries:
+                self._remove(token_hash)
+            
+            self._entries[token_hash] = entry
+            self._hashes_by_user.setdefault(user_id, set()).add(token_hash)
+            
+            while len(self._entries) > self._max_size:
+                oldest_hash = next(iter(self._entries))
+                self._remove(oldest_hash)
+                self._evictions += 1
+            return True
+    
+    def invalidate(self, token_hash: str) -> bool:
+        """
+        Retire une entrée (logout).
+        
+        Args:
+            token_hash: Empreinte du jeton révoqué
+            
+        Returns:
+            True si une entrée a été retirée
+        """
+        with self._lock:
+            self._generation += 1
+            if token_hash not in self._entries:
+                return False
+            self._remove(token_hash)
+            self._invalidations += 1
+            return True
+    
+    def invalidate_user(self, user_id: str) -> int:
+        """
+        Retire toutes les entrées d'un utilisateur (réinitialisation du mot de passe).
+        
+        Args:
+            user_id: ID de l'utilisateur
+            
+        Returns:
+            Nombre d'entrées retirées
+        """
+        with self._lock:
+            self._generation += 1
+            hashes = list(self._hashes_by_user.get(str(user_id), ()))
+            for token_hash in hashes:
+                self._remove(token_hash)
+            self._invalidations += len(hashes)
+            return len(hashes)
+    
+    def clear(self) -> None:
+        """Vide complètement le cache"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._hashes_by_user.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Retourne les compteurs du cache.
+        
+        Returns:
+            Dict contenant size, max_size, hits, misses, evictions et invalidations
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self._max_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations
+            }
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def _remove(self, token_hash: str) -> None:
+        """Retire une entrée et son index par utilisateur (verrou déjà pris)"""
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+        
+        user_hashes = self._hashes_by_user.get(entry.user_id)
+        if user_hashes is not None:
+            user_hashes.discard(token_hash)
+            if not user_hashes:
+                del self._hashes_by_user[entry.user_id]
@@ -0,0 +1 @@
+"""Caches applicatifs (instantanés reconstruits en arrière-plan)"""
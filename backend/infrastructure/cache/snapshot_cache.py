@@ -0,0 +1,216 @@
+"""
+Module des instantanés servis périmés pendant leur reconstruction
+(« stale-while-revalidate »).
+
+Un instantané est le résultat précalculé d'une lecture très demandée et
+rarement modifiée (la première page du catalogue). Il est servi tel quel;
+une écriture ne le reconstruit pas tout de suite: elle le marque périmé et
+réveille un thread de fond, qui attend que les écritures se calment
+(`debounce_seconds`) puis reconstruit tous les instantanés d'un coup.
+
+D'ici là, l'instantané périmé reste servi, mais au plus
+`max_staleness_seconds`: au-delà (reconstruction en échec ou trop lente),
+la requête le reconstruit elle-même, une seule fois pour tous les appelants
+simultanés.
+
+Les instantanés sont propres au processus: une écriture faite par un autre
+worker n'est vue qu'à l'expiration de `max_age_seconds`.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, Iterable, Optional, Set, TypeVar
+
+from infrastructure.concurrency.single_flight import SingleFlight
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class _Snapshot(Generic[T]):
+    """Instantané, instant de sa construction et de sa péremption (None tant qu'il est à jour)"""
+    
+    def __init__(self, value: T, built_at: float, stale_since: Optional[float]):
+        self.value = value
+        self.built_at = built_at
+        self.stale_since = stale_since
+
+
+class SnapshotCache(Generic[T]):
+    """
+    Instantanés par clé, reconstruits en arrière-plan après les écritures.
+    
+    Usage:
+        snapshots = SnapshotCache('catalogue', build=render_catalogue)
+        payload = snapshots.get(('category', 6))
+        ...
+        snapshots.invalidate()  # après une écriture
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[Hashable], T],
+        debounce_seconds: float = 0.5,
+        max_staleness_seconds: float = 5.0,
+        max_age_seconds: Optional[float] = 60.0,
+        background: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            name: Nom des instantanés (étiquette des métriques)
+            build: Construction de l'instantané d'une clé
+            debounce_seconds: Calme attendu après une écriture avant de reconstruire
+            max_staleness_seconds: Âge maximal d'un instantané périmé encore servi
+            max_age_seconds: Âge au-delà duquel un instantané est reconstruit sans écriture
+                connue (écritures des autres processus; None: jamais)
+            background: Reconstruire dans un thread de fond (False: refresh() appelé par l'appelant)
+            clock: Horloge monotone (injectable pour les tests)
+            registry: Registre des métriques
+        """
+        if debounce_seconds < 0 or max_staleness_seconds <= debounce_seconds:
+            raise ValueError("Il faut 0 <= debounce_seconds < max_staleness_seconds")
+        self._name = name
+        self._build = build
+        self._debounce = debounce_seconds
+        self._max_staleness = max_staleness_seconds
+        self._max_age = max_age_seconds
+        self._background = background
+        self._clock = clock
+        self._snapshots: Dict[Hashable, _Snapshot[T]] = {}
+        self._wanted: Set[Hashable] = set()
+        self._version = 0
+        self._pending_since: Optional[float] = None
+        self._last_change = 0.0
+        self._single_flight: SingleFlight = SingleFlight()
+        self._condition = threading.Condition()
+        self._thread_pid: Optional[int] = None
+        
+        self._requests = registry.counter(
+            'snapshot_requests_total',
+            "Lectures d'instantanés par résultat (fresh, stale, expired, miss)"
+        )
+        self._rebuilds = registry.counter(
+            'snapshot_rebuilds_total',
+            "Reconstructions d'instantanés par résultat (ok, error)"
+        )
+    
+    def get(self, key: Hashable) -> T:
+        """
+        Instantané de `key`: à jour, périmé depuis moins de max_staleness_seconds, ou reconstruit.
+        
+        Raises:
+            Exception: L'erreur de construction, si aucun instantané servable n'existe
+        """
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            now = self._clock()
+            if snapshot.stale_since is None:
+                if self._max_age is not None and now - snapshot.built_at > self._max_age:
+                    self.invalidate()
+                else:
+                    self._requests.inc(snapshot=self._name, result='fresh')
+                    return snapshot.value
+            if now - snapshot.stale_since <= self._max_staleness:
+                self._requests.inc(snapshot=self._name, result='stale')
+                return snapshot.value
+        self._requests.inc(snapshot=self._name, result='expired' if snapshot is not None else 'miss')
+        value, _ = self._single_flight.do(key, lambda: self._rebuild(key))
+        return value
+    
+    def invalidate(self) -> None:
+        """Marque tous les instantanés périmés et programme leur reconstruction"""
+        with self._condition:
+            now = self._clock()
+            self._version += 1
+            self._last_change = now
+            if self._pending_since is None:
+                self._pending_since = now
+            for snapshot in self._snapshots.values():
+                if snapshot.stale_since is None:
+                    snapshot.stale_since = now
+            self._condition.notify_all()
+        self._ensure_worker()
+    
+    def warm(self, keys: Iterable[Hashable]) -> None:
+        """Programme la construction d'instantanés pas encore demandés (au démarrage)"""
+        with self._condition:
+            self._wanted.update(keys)
+            if self._pending_since is None:
+                # Rien à attendre: aucune écriture en cours
+                self._pending_since = self._last_change = self._clock() - self._debounce
+            self._condition.notify_all()
+        self._ensure_worker()
+    
+    def refresh(self) -> int:
+        """
+        Reconstruit les instantanés périmés ou attendus.
+        
+        Returns:
+            Nombre d'instantanés reconstruits
+        """
+        with self._condition:
+            self._pending_since = None
+            keys = [key for key, snapshot in self._snapshots.items() if snapshot.stale_since is not None]
+            keys.extend(key for key in self._wanted if key not in self._snapshots)
+            self._wanted.clear()
+        rebuilt = 0
+        for key in keys:
+            try:
+                self._single_flight.do(key, lambda: self._rebuild(key))
+                rebuilt += 1
+            except Exception as e:
+                # L'instantané périmé reste servi jusqu'à max_staleness_seconds
+                logger.error(f"Échec de la reconstruction de l'instantané {self._name} {key}: {str(e)}", exc_info=True)
+        return rebuilt
+    
+    def _rebuild(self, key: Hashable) -> T:
+        version = self._version
+        built_at = self._clock()
+        try:
+            value = self._build(key)
+        except Exception:
+            self._rebuilds.inc(snapshot=self._name, result='error')
+            raise
+        self._rebuilds.inc(snapshot=self._name, result='ok')
+        with self._condition:
+            # Une écriture pendant la construction: l'instantané naît périmé
+            if self._version == version:
+                stale_since = None
+            else:
+                stale_since = self._pending_since if self._pending_since is not None else self._last_change
+            self._snapshots[key] = _Snapshot(value, built_at, stale_since)
+        return value
+    
+    def _ensure_worker(self) -> None:
+        """Démarre le thread de reconstruction du processus courant (après un fork, le thread n'existe plus)"""
+        if not self._background:
+            return
+        pid = os.getpid()
+        with self._condition:
+            if self._thread_pid == pid:
+                return
+            self._thread_pid = pid
+        threading.Thread(target=self._run, name=f'snapshot-{self._name}', daemon=True).start()
+    
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending_since is None:
+                    self._condition.wait()
+                # Attendre le calme après la dernière écriture, sans dépasser la moitié de la péremption tolérée
+                while True:
+                    deadline = min(self._last_change + self._debounce, self._pending_since + self._max_staleness / 2)
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Échec de la reconstruction des instantanés {self._name}: {str(e)}", exc_info=True)
@@ -0,0 +1 @@
+"""Compression des réponses HTTP (gzip, brotli)"""
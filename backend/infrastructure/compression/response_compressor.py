@@ -0,0 +1,207 @@
+"""
+Module de compression des corps de réponse.
+
+Les listes d'annonces sont de gros JSON très répétitifs: gzip ou brotli les
+réduisent d'un facteur 5 à 10. La compression coûte toutefois du CPU à
+chaque requête; deux mécanismes l'évitent pour les corps servis souvent:
+- PrecompressedPayload: un corps figé (instantané, cache applicatif) est
+  compressé une fois, quand il est construit;
+- le compresseur garde les derniers corps compressés par empreinte du
+  contenu: une réponse identique à une précédente coûte un hachage et une
+  copie au lieu d'une passe de compression.
+
+brotli est une dépendance optionnelle: sans elle, seul gzip est proposé.
+"""
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    brotli = None
+
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+GZIP = 'gzip'
+BROTLI = 'br'
+
+# Corps reconstruits pendant que le service tourne (instantanés): niveaux
+# modérés, une reconstruction doit rester bien plus courte que la péremption
+# tolérée (brotli 11 coûte ~50 fois brotli 5 pour quelques % de gain)
+REBUILT_LEVELS: Dict[str, int] = {GZIP: 6, BROTLI: 5}
+# Fichiers statiques compressés une seule fois, à la construction du déploiement
+STATIC_LEVELS: Dict[str, int] = {GZIP: 9, BROTLI: 11}
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodages proposés, par ordre de préférence à qualité égale côté client"""
+    return (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """Compresse un corps complet"""
+    if encoding == BROTLI:
+        return brotli.compress(body, quality=level)
+    if encoding == GZIP:
+        # wbits=31: en-tête et somme de contrôle gzip (contrairement à zlib.compress)
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    raise ValueError(f"Encodage non supporté: {encoding}")
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str, level: int) -> Iterator[bytes]:
+    """Compresse un corps au fil de l'eau, sans le garder entier en mémoire"""
+    if encoding == BROTLI:
+        compressor = brotli.Compressor(quality=level)
+        process, finish = compressor.process, compressor.finish
+    elif encoding == GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        process, finish = compressor.compress, compressor.flush
+    else:
+        raise ValueError(f"Encodage non supporté: {encoding}")
+    for chunk in chunks:
+        compressed = process(chunk)
+        if compressed:
+            yield compressed
+    tail = finish()
+    if tail:
+        yield tail
+
+
+class PrecompressedPayload:
+    """
+    Corps figé et ses variantes compressées, produites à la construction.
+    
+    À construire hors du chemin de la requête (reconstruction d'un cache):
+    servir une variante n'est ensuite qu'une copie.
+    """
+    
+    def __init__(
+        self,
+        body: bytes,
+        mimetype: str = 'application/json',
+        encodings: Optional[Iterable[str]] = None,
+        levels: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            body: Corps non compressé
+            mimetype: Type du corps
+            encodings: Encodages à produire (par défaut, tous ceux disponibles)
+            levels: Niveau par encodage (REBUILT_LEVELS par défaut; STATIC_LEVELS
+                pour un fichier compressé une seule fois)
+        """
+        levels = levels if levels is not None else REBUILT_LEVELS
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self._variants: Dict[str, bytes] = {}
+        for encoding in encodings if encodings is not None else available_encodings():
+            compressed = compress(body, encoding, levels[encoding])
+            # Un corps incompressible est servi tel quel
+            if len(compressed) < len(body):
+                self._variants[encoding] = compressed
+    
+    @property
+    def encodings(self) -> Tuple[str, ...]:
+        return tuple(encoding for encoding in available_encodings() if encoding in self._variants)
+    
+    def variant(self, encoding: Optional[str]) -> bytes:
+        """Corps dans l'encodage demandé (non compressé si None ou indisponible)"""
+        return self._variants.get(encoding, self.body) if encoding is not None else self.body
+
+
+class ResponseCompressor:
+    """
+    Compression des corps de réponse, avec cache des derniers corps compressés.
+    
+    Partagé par les threads du processus.
+    """
+    
+    def __init__(
+        self,
+        min_bytes: int = 1024,
+        stream_threshold_bytes: int = 256 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_entries: int = 32,
+        chunk_bytes: int = 64 * 1024,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            min_bytes: Taille en deçà de laquelle un corps n'est pas compressé
+            stream_threshold_bytes: Taille à partir de laquelle un corps est compressé au fil de l'eau
+            gzip_level: Niveau gzip des corps compressés à la volée
+            brotli_quality: Qualité brotli des corps compressés à la volée
+            cache_entries: Corps compressés gardés par empreinte (0 désactive)
+            chunk_bytes: Taille des morceaux compressés au fil de l'eau
+            registry: Registre des métriques
+        """
+        self.min_bytes = min_bytes
+        self.stream_threshold_bytes = stream_threshold_bytes
+        self._levels = {GZIP: gzip_level, BROTLI: brotli_quality}
+        self._cache_entries = cache_entries
+        self._chunk_bytes = chunk_bytes
+        self._cache: 'OrderedDict[Tuple[bytes, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self._responses = registry.counter(
+            'http_compressed_responses_total',
+            "Réponses compressées, par encodage et provenance (compressé, cache, précompressé)"
+        )
+        self._input_bytes = registry.counter('http_compression_input_bytes_total', "Octets avant compression")
+        self._output_bytes = registry.counter('http_compression_output_bytes_total', "Octets après compression")
+    
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compresse un corps, ou reprend la compression d'un corps identique récent"""
+        key = (hashlib.blake2b(body, digest_size=16).digest(), encoding) if self._cache_entries else None
+        if key is not None:
+            with self._lock:
+                compressed = self._cache.get(key)
+                if compressed is not None:
+                    self._cache.move_to_end(key)
+            if compressed is not None:
+                self._count(encoding, 'cache', len(body), len(compressed))
+                return compressed
+        
+        compressed = compress(body, encoding, self._levels[encoding])
+        if key is not None:
+            with self._lock:
+                self._cache[key] = compressed
+                while len(self._cache) > self._cache_entries:
+                    self._cache.popitem(last=False)
+        self._count(encoding, 'compressed', len(body), len(compressed))
+        return compressed
+    
+    def stream(self, chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+        """Compresse un corps au fil de l'eau (corps volumineux ou produit par un générateur)"""
+        written = 0
+        for compressed in compress_stream(self._counting(chunks), encoding, self._levels[encoding]):
+            written += len(compressed)
+            yield compressed
+        self._responses.inc(encoding=encoding, source='stream')
+        self._output_bytes.inc(written)
+    
+    def chunks(self, body: bytes) -> Iterator[bytes]:
+        """Découpe un corps déjà en mémoire pour le compresser au fil de l'eau"""
+        view = memoryview(body)
+        for start in range(0, len(body), self._chunk_bytes):
+            yield bytes(view[start:start + self._chunk_bytes])
+    
+    def served_precompressed(self, encoding: str, payload: PrecompressedPayload) -> None:
+        """Compte une variante précompressée servie telle quelle"""
+        self._count(encoding, 'precompressed', len(payload.body), len(payload.variant(encoding)))
+    
+    def _counting(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self._input_bytes.inc(len(chunk))
+            yield chunk
+    
+    def _count(self, encoding: str, source: str, input_bytes: int, output_bytes: int) -> None:
+        self._responses.inc(encoding=encoding, source=source)
+        self._input_bytes.inc(input_bytes)
+        self._output_bytes.inc(output_bytes)
@@ -0,0 +1 @@
+"""Primitives de concurrence partagées (coalescence des appels)"""
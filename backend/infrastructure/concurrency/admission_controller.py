@@ -0,0 +1,172 @@
+"""
+Module de contrôle d'admission (délestage).
+
+Quand la base ralentit, les requêtes s'accumulent dans les threads du
+serveur et la latence explose pour toutes les routes. Le contrôleur borne
+le nombre de requêtes en cours par une limite adaptative (AIMD): +1/limite
+à chaque requête rapide, ×0,9 quand la latence observée dépasse la cible.
+Au-delà, la requête est refusée tout de suite (ServiceOverloadedException,
+convertie en 503 + Retry-After).
+
+Les classes de priorité se partagent la limite: une requête de priorité
+basse est refusée plus tôt, ce qui garde de la place pour les lectures
+prioritaires. La file d'attente du pool de connexions est un second signal:
+dès que des threads attendent une connexion, les priorités basses sont
+refusées avant même d'emprunter.
+"""
+import enum
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+
+class Priority(enum.Enum):
+    """Classe de priorité d'une requête"""
+    
+    # Jamais refusée ni comptée (santé, métriques, flux SSE de longue durée)
+    CRITICAL = 'critical'
+    HIGH = 'high'
+    NORMAL = 'normal'
+    # Traitements de lot, exports
+    LOW = 'low'
+
+
+class AdmissionController:
+    """
+    Limite adaptative de requêtes en cours, partagée par les threads du processus.
+    
+    Usage:
+        started = controller.admit(Priority.NORMAL)
+        try:
+            ...
+        finally:
+            controller.complete(Priority.NORMAL, started)
+    """
+    
+    # Part de la limite (et de la file d'attente tolérée) ouverte à chaque priorité
+    SHARES: Dict[Priority, float] = {
+        Priority.HIGH: 1.0,
+        Priority.NORMAL: 0.8,
+        Priority.LOW: 0.5,
+    }
+    
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 4,
+        max_limit: int = 200,
+        latency_target_seconds: float = 0.5,
+        backoff: float = 0.9,
+        queue_depth: Optional[Callable[[], int]] = None,
+        max_queue_depth: int = 10,
+        retry_after_seconds: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            initial_limit: Limite de départ (requêtes en cours)
+            min_limit: Plancher de la limite
+            max_limit: Plafond de la limite
+            latency_target_seconds: Latence au-delà de laquelle la limite diminue
+            backoff: Facteur de diminution multiplicative
+            queue_depth: Threads en attente d'une connexion (voir ConnectionPool.waiting)
+            max_queue_depth: File d'attente tolérée pour la priorité haute
+            retry_after_seconds: Délai suggéré au client refusé (Retry-After)
+            clock: Horloge monotone (injectable pour les tests)
+            registry: Registre des métriques
+        
+        Raises:
+            ValueError: Si les bornes de la limite sont incohérentes
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Il faut 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("Le facteur de diminution doit être entre 0 et 1")
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target = latency_target_seconds
+        self._backoff = backoff
+        self._queue_depth = queue_depth or (lambda: 0)
+        self._max_queue_depth = max_queue_depth
+        self._retry_after = retry_after_seconds
+        self._clock = clock
+        self._in_flight = 0
+        self._last_decrease = float('-inf')
+        self._lock = threading.Lock()
+        
+        self._rejected = registry.counter(
+            'admission_rejected_total',
+            "Requêtes refusées par le contrôle d'admission, par priorité et motif"
+        )
+        registry.gauge('admission_concurrency_limit', "Limite adaptative de requêtes en cours", lambda: self.limit)
+        registry.gauge('admission_in_flight', "Requêtes admises en cours", lambda: self.in_flight)
+    
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    def admit(self, priority: Priority) -> float:
+        """
+        Admet une requête ou la refuse.
+        
+        Returns:
+            L'instant d'admission, à rendre à complete()
+        
+        Raises:
+            ServiceOverloadedException: Si la part de la limite de cette priorité est atteinte
+        """
+        now = self._clock()
+        if priority is Priority.CRITICAL:
+            return now
+        share = self.SHARES[priority]
+        queued = self._queue_depth()
+        with self._lock:
+            if queued > self._max_queue_depth * share:
+                reason = 'pool'
+            elif self._in_flight >= max(1, math.floor(self._limit * share)):
+                reason = 'limit'
+            else:
+                self._in_flight += 1
+                return now
+        self._rejected.inc(priority=priority.value, reason=reason)
+        raise ServiceOverloadedException(
+            "Serveur surchargé, réessayez plus tard",
+            retry_after=self._retry_after
+        )
+    
+    def complete(self, priority: Priority, started: float, sample: bool = True) -> None:
+        """
+        Termine une requête admise et ajuste la limite.
+        
+        Args:
+            priority: Priorité passée à admit()
+            started: Valeur retournée par admit()
+            sample: Tenir compte de la latence (False pour une requête interrompue)
+        """
+        if priority is Priority.CRITICAL:
+            return
+        now = self._clock()
+        latency = now - started
+        with self._lock:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if not sample:
+                return
+            if latency > self._target:
+                # Une seule diminution par épisode de lenteur (les requêtes lentes finissent ensemble)
+                if now - self._last_decrease >= self._target:
+                    self._limit = max(self._min_limit, self._limit * self._backoff)
+                    self._last_decrease = now
+            elif in_flight >= self._limit / 2:
+                # N'augmenter que si la limite sert: au repos, elle ne croît pas sans fin
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
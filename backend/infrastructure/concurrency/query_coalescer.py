@@ -0,0 +1,63 @@
+"""
+Module de coalescence des lectures identiques concurrentes.
+
+Aux pauses entre les cours, des centaines d'utilisateurs chargent la même
+page du catalogue dans la même seconde: sans coalescence, chacun exécute la
+même requête. Le QueryCoalescer fait exécuter une seule fois les lectures
+identiques en cours (SingleFlight) et compte les requêtes absorbées.
+
+Un suiveur n'attend pas indéfiniment: passé le délai d'attente, il exécute
+sa propre lecture plutôt que de rester bloqué derrière une lecture lente.
+"""
+from typing import Callable, Hashable, TypeVar
+
+from infrastructure.concurrency.single_flight import SingleFlight, SingleFlightTimeout
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+T = TypeVar('T')
+
+
+class QueryCoalescer:
+    """
+    Exécute une seule fois les lectures identiques en cours.
+    
+    Usage:
+        listings = coalescer.run(('category', '6'), lambda: repository.find_by_categories(['6']))
+    """
+    
+    def __init__(self, name: str, wait_timeout_seconds: float = 2.0, registry: MetricsRegistry = metrics_registry):
+        """
+        Args:
+            name: Nom des lectures coalescées (étiquette des métriques)
+            wait_timeout_seconds: Attente maximale d'un suiveur avant d'exécuter sa propre lecture
+            registry: Registre des métriques
+        """
+        self._name = name
+        self._wait_timeout = wait_timeout_seconds
+        self._single_flight: SingleFlight = SingleFlight()
+        self._requests = registry.counter(
+            'query_coalescing_requests_total',
+            "Lectures coalescées par résultat (executed, absorbed, timeout)"
+        )
+    
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Exécute `fn`, ou partage le résultat de la lecture identique en cours.
+        
+        Le résultat partagé est le même objet pour tous: il ne doit pas être modifié.
+        
+        Args:
+            key: Lecture normalisée (deux clés égales donnent le même résultat)
+            fn: Lecture à exécuter
+        """
+        try:
+            result, shared = self._single_flight.do(key, fn, timeout=self._wait_timeout)
+        except SingleFlightTimeout:
+            self._requests.inc(query=self._name, result='timeout')
+            return fn()
+        self._requests.inc(query=self._name, result='absorbed' if shared else 'executed')
+        return result
+    
+    def in_flight(self) -> int:
+        """Nombre de lectures en cours"""
+        return self._single_flight.in_flight()
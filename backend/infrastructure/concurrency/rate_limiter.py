@@ -0,0 +1,222 @@
+"""
+Module de limitation de débit par seaux de jetons.
+
+Chaque client (utilisateur ou IP) a, par politique, un seau de `capacity`
+jetons rempli à `refill_per_second`; une requête consomme un jeton, et un
+seau vide fait refuser la requête jusqu'au prochain jeton.
+
+Les seaux vivent dans une table de taille fixe en mémoire partagée (un
+fichier projeté par mmap, sous /dev/shm par défaut): tous les workers
+gunicorn de la machine voient les mêmes seaux, sans serveur à interroger.
+Une clé est hachée vers un groupe de SLOTS_PER_GROUP cases; seul ce groupe
+est verrouillé (verrou de thread rayé, puis verrou fcntl sur ses octets),
+si bien que deux clients différents ne s'attendent presque jamais. Le
+contrôle coûte un hachage, deux appels système et quelques lectures: O(1).
+
+Un seau plein équivaut à un seau neuf: une case dont le seau est rempli
+est réutilisable par une autre clé sans rien perdre. Si les cases d'un
+groupe sont toutes actives, la plus ancienne est évincée (le client évincé
+repart avec un seau plein: la table se trompe en faveur du client).
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - dépend de l'environnement (Windows)
+    fcntl = None
+
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Case: empreinte de la clé (0 = libre), jetons, dernière mise à jour, instant où le seau sera plein
+_SLOT = struct.Struct('<Qddd')
+
+
+def default_path() -> str:
+    """Fichier partagé par défaut: en mémoire (/dev/shm) quand il existe"""
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(directory, 'ulavalmarket-rate-limits')
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """
+    Politique de débit d'une famille de routes.
+    
+    Attributes:
+        name: Nom de la politique (préfixe des clés et étiquette des métriques)
+        capacity: Rafale tolérée (jetons d'un seau plein)
+        refill_per_second: Débit soutenu autorisé
+    """
+    name: str
+    capacity: float
+    refill_per_second: float
+    
+    def __post_init__(self):
+        if self.capacity < 1 or self.refill_per_second <= 0:
+            raise ValueError("Une politique exige capacity >= 1 et refill_per_second > 0")
+
+
+@dataclass(frozen=True)
+class RateDecision:
+    """
+    Résultat d'un contrôle.
+    
+    Attributes:
+        allowed: La requête peut être servie
+        remaining: Jetons restants après le contrôle
+        retry_after: Secondes avant le prochain jeton (0 si la requête est admise)
+    """
+    allowed: bool
+    remaining: float
+    retry_after: float
+
+
+class RateLimiter:
+    """
+    Table de seaux de jetons partagée entre processus.
+    
+    Usage:
+        decision = rate_limiter.take('listings_search:user:42', SEARCH_POLICY)
+        if not decision.allowed:
+            ...  # 429, Retry-After: decision.retry_after
+    """
+    
+    SLOTS_PER_GROUP = 4
+    THREAD_LOCK_STRIPES = 64
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        slots: int = 65536,
+        clock: Callable[[], float] = time.monotonic,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            path: Fichier partagé (None: table propre au processus, sans partage)
+            slots: Nombre de cases (arrondi au multiple de SLOTS_PER_GROUP)
+            clock: Horloge commune aux processus (CLOCK_MONOTONIC l'est sous Linux)
+            registry: Registre des métriques
+        """
+        self._path = path
+        self._groups = max(1, slots // self.SLOTS_PER_GROUP)
+        self._group_size = self.SLOTS_PER_GROUP * _SLOT.size
+        self._clock = clock
+        self._table: Optional[mmap.mmap] = None
+        self._fd: Optional[int] = None
+        self._open_lock = threading.Lock()
+        # Les verrous fcntl appartiennent au processus: ils n'excluent pas les threads entre eux
+        self._thread_locks = [threading.Lock() for _ in range(self.THREAD_LOCK_STRIPES)]
+        
+        self._requests = registry.counter(
+            'rate_limit_requests_total',
+            "Requêtes contrôlées par la limitation de débit, par politique et résultat"
+        )
+        self._evictions = registry.counter(
+            'rate_limit_evictions_total',
+            "Seaux actifs évincés faute de case libre dans leur groupe"
+        )
+    
+    def take(self, key: str, policy: RatePolicy, cost: float = 1) -> RateDecision:
+        """
+        Consomme `cost` jetons du seau de `key`, s'il en a assez.
+        
+        Args:
+            key: Identité du client, préfixée par la politique
+            policy: Capacité et débit du seau
+            cost: Jetons consommés par la requête
+        
+        Returns:
+            La décision (un refus ne consomme rien)
+        """
+        fingerprint = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little') or 1
+        group = fingerprint % self._groups
+        table = self._table if self._table is not None else self._open()
+        offset = group * self._group_size
+        
+        with self._thread_locks[group % self.THREAD_LOCK_STRIPES], self._file_lock(offset):
+            now = self._clock()
+            position, tokens = self._find_slot(table, offset, fingerprint, now, policy)
+            tokens = min(policy.capacity, tokens)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            full_at = now + (policy.capacity - tokens) / policy.refill_per_second
+            _SLOT.pack_into(table, position, fingerprint, tokens, now, full_at)
+        
+        self._requests.inc(policy=policy.name, result='allowed' if allowed else 'rejected')
+        retry_after = 0.0 if allowed else (cost - tokens) / policy.refill_per_second
+        return RateDecision(allowed=allowed, remaining=tokens, retry_after=retry_after)
+    
+    def _find_slot(self, table: mmap.mmap, offset: int, fingerprint: int, now: float, policy: RatePolicy):
+        """Case de la clé dans son groupe et jetons disponibles (seau rempli depuis la dernière mise à jour)"""
+        reusable = None
+        oldest = None
+        for position in range(offset, offset + self._group_size, _SLOT.size):
+            owner, tokens, updated, full_at = _SLOT.unpack_from(table, position)
+            if owner == fingerprint:
+                if now < updated:
+                    # Horloge remise à zéro (redémarrage de la machine): seau considéré plein
+                    return position, policy.capacity
+                return position, tokens + (now - updated) * policy.refill_per_second
+            if reusable is None and (owner == 0 or full_at <= now):
+                reusable = position
+            if oldest is None or updated < oldest[1]:
+                oldest = (position, updated)
+        if reusable is None:
+            reusable = oldest[0]
+            self._evictions.inc()
+        return reusable, policy.capacity
+    
+    @contextmanager
+    def _file_lock(self, offset: int) -> Iterator[None]:
+        if self._fd is None:
+            yield
+            return
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self._group_size, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self._group_size, offset)
+    
+    def _open(self) -> mmap.mmap:
+        """Projette la table au premier contrôle (pas de fichier créé à l'import)"""
+        with self._open_lock:
+            if self._table is not None:
+                return self._table
+            size = self._groups * self._group_size
+            if self._path is not None and fcntl is not None:
+                try:
+                    fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+                    # Plusieurs workers peuvent agrandir en même temps: même taille, fichier rempli de zéros
+                    if os.fstat(fd).st_size < size:
+                        os.ftruncate(fd, size)
+                    self._table = mmap.mmap(fd, size)
+                    self._fd = fd
+                    return self._table
+                except OSError as error:
+                    logger.warning(f"Table de débit partagée indisponible ({self._path}): {error}; limites par processus")
+            self._table = mmap.mmap(-1, size)
+            return self._table
+    
+    def close(self) -> None:
+        """Libère la projection (le fichier reste pour les autres processus)"""
+        with self._open_lock:
+            if self._table is not None:
+                self._table.close()
+                self._table = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
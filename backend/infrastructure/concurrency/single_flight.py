@@ -0,0 +1,88 @@
+"""
+Module de coalescence des appels concurrents (single-flight).
+
+Quand plusieurs threads demandent en même temps le même résultat coûteux
+(redimensionnement d'une image, lecture d'une annonce...), un seul calcule;
+les autres attendent et reçoivent le même résultat, ou la même exception.
+"""
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlightTimeout(TimeoutError):
+    """Le calcul partagé n'a pas fini dans le délai d'attente du suiveur"""
+
+
+class _Call(Generic[T]):
+    """Appel en cours pour une clé"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Regroupe les appels concurrents d'une même clé en une seule exécution.
+    
+    La coalescence ne couvre que les appels simultanés: une fois l'appel
+    terminé, la clé est oubliée (pas de cache). La portée est le processus.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call[T]] = {}
+    
+    def do(self, key: Hashable, fn: Callable[[], T], timeout: Optional[float] = None) -> Tuple[T, bool]:
+        """
+        Exécute `fn`, ou attend l'exécution déjà en cours pour `key`.
+        
+        Args:
+            key: Identifiant du résultat demandé
+            fn: Calcul à effectuer (appelé par un seul thread)
+            timeout: Attente maximale d'un suiveur (None: sans limite)
+            
+        Returns:
+            (résultat, partagé): partagé vaut True si le résultat vient
+            de l'appel d'un autre thread
+            
+        Raises:
+            SingleFlightTimeout: Si le calcul en cours dépasse `timeout` (suiveurs seulement)
+            Exception: L'exception levée par `fn`, pour tous les appelants
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+        
+        if not is_leader:
+            if not call.done.wait(timeout):
+                raise SingleFlightTimeout(f"Calcul partagé en cours depuis plus de {timeout} s")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        
+        return call.result, False
+    
+    def in_flight(self) -> int:
+        """Nombre de clés en cours de calcul"""
+        with self._lock:
+            return len(self._calls)
@@ -3,7 +3,7 @@ Module de configuration pour la connexion MySQL.
 Gère les paramètres de connexion à la base de données.
 """
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence, Union
 
 
 class DatabaseConfig:
@@ -20,13 +20,18 @@ class DatabaseConfig:
         password: str = None,
         database: str = None,
         charset: str = None,
-        autocommit: bool = None
+        autocommit: bool = None,
+        replicas: Optional[Sequence[Union[str, 'DatabaseConfig']]] = None
     ):
         """
         Initialise la configuration de la base de données.
         
         Les valeurs peuvent être passées directement ou via variables d'environnement.
         Valeurs par défaut: localhost, 3306, root, @Lskdj1220Kevin, ulaval_market
+        
+        Les réplicas en lecture sont donnés par `replicas` (« hôte:port » ou
+        DatabaseConfig) ou par DB_REPLICAS (« hôte1:3307,hôte2:3308 »); une
+        adresse seule reprend les identifiants et la base du primaire.
         """
         # Paramètres de connexion avec valeurs par défaut
         self.host: str = host or os.getenv('DB_HOST', 'localhost')
@@ -36,6 +41,12 @@ class DatabaseConfig:
         self.database: str = database or os.getenv('DB_NAME', 'ulaval_market')
         self.charset: str = charset or os.getenv('DB_CHARSET', 'utf8mb4')
         self.autocommit: bool = autocommit if autocommit is not None else os.getenv('DB_AUTOCOMMIT', 'False').lower() == 'true'
+        if replicas is None:
+            replicas = [address for address in os.getenv('DB_REPLICAS', '').split(',') if address.strip()]
+        self.replicas: List['DatabaseConfig'] = [
+            replica if isinstance(replica, DatabaseConfig) else self._replica_at(replica)
+            for replica in replicas
+        ]
     
     def get_connection_params(self) -> Dict[str, Any]:
         """
@@ -53,3 +64,26 @@ class DatabaseConfig:
             'charset': self.charset,
             'autocommit': self.autocommit
         }
+    
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+    
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+    
+    def _replica_at(self, address: str) -> 'DatabaseConfig':
+        host, _, port = address.strip().rpartition(':')
+        if not host:
+            host, port = port, ''
+        return DatabaseConfig(
+            host=host,
+            port=int(port) if port else self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset=self.charset,
+            autocommit=self.autocommit,
+            replicas=()
+        )
@@ -1,13 +1,24 @@
 """
 Module de gestion des connexions MySQL.
 Fournit une classe DatabaseConnection pour gérer les connexions de manière centralisée.
+
+La connexion est présumée saine: aucun ping avant chaque curseur ou
+commit. Une coupure est détectée par le code d'erreur de la requête
+(2006, 2013, 2055) et un ping n'est envoyé qu'après une période d'inactivité.
+
+Les requêtes des repositories passent par des instructions préparées
+gardées dans un cache LRU par connexion (voir statement_cache.py).
 """
-from typing import Optional, Any
+import os
+import time
+import weakref
+from typing import Callable, Optional, Any
 import mysql.connector
 from mysql.connector import MySQLConnection
 from mysql.connector.cursor import MySQLCursor
 
 from infrastructure.database.config import DatabaseConfig
+from infrastructure.database.statement_cache import StatementCache
 from domain.exceptions.database_exception import DatabaseException
 
 
@@ -21,16 +32,49 @@ class DatabaseConnection:
     automatique des ressources.
     """
     
-    def __init__(self, config: DatabaseConfig = None):
+    # MySQL server has gone away, Lost connection during query, Lost connection to server
+    CONNECTION_LOST_ERRORS = frozenset({2006, 2013, 2055})
+    
+    # Deadlock, Lock wait timeout exceeded: conflits transitoires, la transaction peut être rejouée
+    CONFLICT_ERRORS = frozenset({1213, 1205})
+    
+    # Inactivité au-delà de laquelle is_connected() vérifie la connexion par un ping
+    DEFAULT_PING_IDLE_SECONDS = 30.0
+    
+    def __init__(
+        self,
+        config: DatabaseConfig = None,
+        ping_idle_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        statement_cache_size: Optional[int] = None
+    ):
         """
         Initialise le gestionnaire de connexion.
         
         Args:
             config: Configuration de la base de données. Si None, utilise DatabaseConfig par défaut.
+            ping_idle_seconds: Inactivité avant un ping de vérification (DB_PING_IDLE_SECONDS;
+                0 pour pinger à chaque vérification)
+            clock: Horloge monotone (injectable pour les tests)
+            statement_cache_size: Requêtes préparées gardées par connexion
+                (DB_STATEMENT_CACHE_SIZE; 0 désactive le cache)
         """
         self._config = config or DatabaseConfig()
         self._connection: Optional[MySQLConnection] = None
-        self._cursor: Optional[MySQLCursor] = None
+        # Curseurs ordinaires prêtés, fermés avec la connexion s'ils sont encore ouverts
+        self._cursors: 'weakref.WeakSet[MySQLCursor]' = weakref.WeakSet()
+        self._statements = StatementCache(self._prepare_cursor, size=statement_cache_size)
+        if ping_idle_seconds is None:
+            ping_idle_seconds = float(os.getenv('DB_PING_IDLE_SECONDS', str(self.DEFAULT_PING_IDLE_SECONDS)))
+        self._ping_idle = ping_idle_seconds
+        self._clock = clock
+        self._last_used = float('-inf')
+        self._lost = False
+        # Curseurs ouverts depuis le dernier commit/rollback (instructions de la transaction;
+        # au plus 1 en autocommit)
+        self._transaction_statements = 0
+        self._autocommit = False
+        self.pings = 0
     
     def connect(self) -> None:
         """
@@ -42,6 +86,10 @@ class DatabaseConnection:
         try:
             params = self._config.get_connection_params()
             self._connection = mysql.connector.connect(**params)
+            self._autocommit = bool(params.get('autocommit'))
+            self._last_used = self._clock()
+            self._lost = False
+            self._transaction_statements = 0
         except mysql.connector.Error as e:
             raise DatabaseException(
                 f"Échec de connexion à la base de données: {str(e)}",
@@ -54,12 +102,13 @@ class DatabaseConnection:
         
         Cette méthode est sûre à appeler même si la connexion n'est pas établie.
         """
-        if self._cursor is not None:
+        self._statements.clear()
+        for cursor in list(self._cursors):
             try:
-                self._cursor.close()
+                cursor.close()
             except Exception:
                 pass  # Ignorer les erreurs lors de la fermeture du curseur
-            self._cursor = None
+        self._cursors.clear()
         
         if self._connection is not None:
             try:
@@ -72,21 +121,85 @@ class DatabaseConnection:
         """
         Vérifie si la connexion est établie et active.
         
+        Sans ping si la connexion a servi depuis moins de `ping_idle_seconds`
+        et qu'aucune coupure n'a été signalée (voir handle_error()).
+        
         Returns:
             True si la connexion est active, False sinon.
         """
-        if self._connection is None:
+        if self._connection is None or self._lost:
             return False
+        now = self._clock()
+        if now - self._last_used < self._ping_idle:
+            return True
+        self.pings += 1
         try:
-            return self._connection.is_connected()
+            alive = bool(self._connection.is_connected())
         except Exception:
+            alive = False
+        if alive:
+            self._last_used = now
+        else:
+            self._lost = True
+        return alive
+    
+    @classmethod
+    def is_connection_lost(cls, error: BaseException) -> bool:
+        """Indique si l'erreur MySQL signale une connexion coupée"""
+        return getattr(error, 'errno', None) in cls.CONNECTION_LOST_ERRORS
+    
+    @classmethod
+    def is_conflict(cls, error: BaseException) -> bool:
+        """Indique si l'erreur (MySQL, ou DatabaseException qui l'enveloppe) est un conflit de verrous"""
+        original = getattr(error, 'original_error', None) or error
+        return getattr(original, 'errno', None) in cls.CONFLICT_ERRORS
+    
+    def handle_error(self, error: BaseException) -> None:
+        """
+        Prend acte d'une erreur SQL: une coupure rend la connexion inutilisable
+        (is_connected() retourne False et le pool la rouvrira) et perd ses
+        requêtes préparées.
+        """
+        if self.is_connection_lost(error):
+            self._lost = True
+            self._statements.clear()
+    
+    def recover_read(self, error: BaseException, discard_statements: bool = False) -> bool:
+        """
+        Reconnecte après une coupure pour rejouer une lecture.
+        
+        Une coupure annule la transaction en cours côté serveur: la relecture
+        n'est sûre que si la lecture était sa première instruction, sauf si
+        l'appelant sait qu'aucune écriture n'a été faite (`discard_statements`).
+        
+        Args:
+            error: Erreur levée par la lecture
+            discard_statements: Accepter de perdre les lectures précédentes de la transaction
+        
+        Returns:
+            True si la connexion est rouverte et la lecture peut être rejouée
+        """
+        self.handle_error(error)
+        if not self._lost or (self._transaction_statements > 1 and not discard_statements):
             return False
+        self.disconnect()
+        try:
+            self.connect()
+        except DatabaseException:
+            return False
+        return True
     
-    def get_cursor(self) -> MySQLCursor:
+    def get_cursor(self, statement: Optional[str] = None) -> MySQLCursor:
         """
         Retourne un curseur pour exécuter des requêtes.
         
         La connexion doit être établie avant d'appeler cette méthode.
+        Avec `statement`, le curseur est le curseur préparé de cette requête,
+        pris dans le cache de la connexion: il ne doit exécuter qu'elle, et
+        close() le rend au cache au lieu de le fermer.
+        
+        Args:
+            statement: Texte SQL que le curseur exécutera (optionnel)
         
         Returns:
             Un curseur MySQLCursor.
@@ -98,14 +211,24 @@ class DatabaseConnection:
             raise DatabaseException("La connexion n'est pas établie. Appelez connect() d'abord.")
         
         try:
-            self._cursor = self._connection.cursor()
-            return self._cursor
+            if statement is not None and self._statements.enabled:
+                cursor = self._statements.checkout(statement)
+            else:
+                cursor = self._connection.cursor()
+                self._cursors.add(cursor)
+            self._last_used = self._clock()
+            # En autocommit, chaque instruction est sa propre transaction: aucune ne s'accumule
+            self._transaction_statements = 1 if self._autocommit else self._transaction_statements + 1
+            return cursor
         except mysql.connector.Error as e:
             raise DatabaseException(
                 f"Impossible de créer le curseur: {str(e)}",
                 original_error=e
             )
     
+    def _prepare_cursor(self) -> MySQLCursor:
+        return self._connection.cursor(prepared=True)
+    
     def commit(self) -> None:
         """
         Valide les transactions en cours.
@@ -118,7 +241,10 @@ class DatabaseConnection:
         
         try:
             self._connection.commit()
+            self._last_used = self._clock()
+            self._transaction_statements = 0
         except mysql.connector.Error as e:
+            self.handle_error(e)
             raise DatabaseException(
                 f"Échec du commit: {str(e)}",
                 original_error=e
@@ -136,7 +262,10 @@ class DatabaseConnection:
         
         try:
             self._connection.rollback()
+            self._last_used = self._clock()
+            self._transaction_statements = 0
         except mysql.connector.Error as e:
+            self.handle_error(e)
             raise DatabaseException(
                 f"Échec du rollback: {str(e)}",
                 original_error=e
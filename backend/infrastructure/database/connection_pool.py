@@ -0,0 +1,154 @@
+"""
+Module du pool de connexions MySQL.
+
+Les connexions (DatabaseConnection) sont ouvertes à la demande jusqu'à la
+taille maximale, puis réutilisées. Le pool est LIFO: la dernière connexion
+rendue est la prochaine prêtée, ce qui garde un petit nombre de connexions
+chaudes quand la charge est faible.
+"""
+import threading
+import time
+from typing import Callable, List, Optional
+
+from infrastructure.database.config import DatabaseConfig
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+from domain.exceptions.database_exception import DatabaseException
+
+
+class ConnectionPool:
+    """
+    Pool borné de DatabaseConnection, partagé par les threads du processus.
+    
+    Une connexion empruntée appartient à un seul emprunteur jusqu'à
+    release(); celui-ci doit avoir terminé sa transaction (commit ou
+    rollback) avant de la rendre.
+    """
+    
+    def __init__(
+        self,
+        config: DatabaseConfig = None,
+        size: int = 10,
+        acquire_timeout_seconds: float = 5.0,
+        connection_factory: Optional[Callable[[DatabaseConfig], DatabaseConnection]] = None,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Initialise le pool (aucune connexion n'est ouverte ici).
+        
+        Args:
+            config: Configuration MySQL. Si None, utilise DatabaseConfig par défaut.
+            size: Nombre maximal de connexions ouvertes
+            acquire_timeout_seconds: Attente maximale d'une connexion libre
+            connection_factory: Fabrique de connexion (par défaut DatabaseConnection)
+            registry: Registre des métriques
+        
+        Raises:
+            ValueError: Si la taille est inférieure à 1
+        """
+        if size < 1:
+            raise ValueError("La taille du pool doit être au moins 1")
+        self._config = config or DatabaseConfig()
+        self._size = size
+        self._acquire_timeout = acquire_timeout_seconds
+        self._factory = connection_factory or DatabaseConnection
+        self._idle: List[DatabaseConnection] = []
+        self._opened = 0
+        self._waiting = 0
+        self._condition = threading.Condition()
+        
+        self._timeouts = registry.counter(
+            'db_pool_acquire_timeouts_total',
+            "Emprunts de connexion abandonnés faute de connexion libre"
+        )
+        registry.gauge('db_pool_connections_open', 'Connexions MySQL ouvertes par le pool', lambda: self._opened)
+        registry.gauge('db_pool_connections_in_use', 'Connexions MySQL empruntées', lambda: self.in_use)
+        registry.gauge('db_pool_waiters', "Threads en attente d'une connexion libre", lambda: self.waiting)
+    
+    @property
+    def size(self) -> int:
+        return self._size
+    
+    @property
+    def in_use(self) -> int:
+        with self._condition:
+            return self._opened - len(self._idle)
+    
+    @property
+    def waiting(self) -> int:
+        """Threads bloqués dans acquire() faute de connexion libre"""
+        return self._waiting
+    
+    def acquire(self) -> DatabaseConnection:
+        """
+        Emprunte une connexion ouverte.
+        
+        Returns:
+            Une connexion dédiée à l'appelant jusqu'à release()
+        
+        Raises:
+            DatabaseException: Si aucune connexion ne se libère à temps ou si l'ouverture échoue
+        """
+        deadline = time.monotonic() + self._acquire_timeout
+        with self._condition:
+            while not self._idle and self._opened >= self._size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts.inc()
+                    raise DatabaseException(
+                        f"Aucune connexion libre après {self._acquire_timeout:g} s (pool de {self._size})"
+                    )
+                self._waiting += 1
+                try:
+                    self._condition.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                connection = None
+                self._opened += 1
+        
+        if connection is not None and connection.is_connected():
+            return connection
+        return self._open(connection)
+    
+    def release(self, connection: DatabaseConnection, discard: bool = False) -> None:
+        """
+        Rend une connexion au pool.
+        
+        Args:
+            connection: Connexion obtenue par acquire()
+            discard: Fermer la connexion au lieu de la réutiliser (état incertain)
+        """
+        if discard:
+            connection.disconnect()
+        with self._condition:
+            if discard:
+                self._opened -= 1
+            else:
+                self._idle.append(connection)
+            self._condition.notify()
+    
+    def close(self) -> None:
+        """Ferme les connexions libres (les connexions empruntées restent à l'emprunteur)"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            connection.disconnect()
+    
+    def _open(self, connection: Optional[DatabaseConnection]) -> DatabaseConnection:
+        try:
+            if connection is None:
+                connection = self._factory(self._config)
+            else:
+                connection.disconnect()
+            connection.connect()
+            return connection
+        except Exception:
+            with self._condition:
+                self._opened -= 1
+                self._condition.notify()
+            raise
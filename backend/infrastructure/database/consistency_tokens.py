@@ -0,0 +1,128 @@
+"""
+Module des jetons de cohérence (lecture de ses propres écritures).
+
+Après une écriture, le GTID du primaire est retenu pour l'utilisateur
+pendant une courte fenêtre: ses lectures ne vont qu'à un réplica qui a
+appliqué ce GTID. Le jeton est aussi renvoyé au client (en-tête
+X-Consistency-Token) pour qu'un autre worker puisse l'honorer.
+
+Le jeton client est signé (HMAC-SHA256 avec la clé secrète de
+l'application): un client ne peut ni repousser son échéance ni choisir un
+GTID pour épingler indéfiniment ses lectures au primaire.
+"""
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+# Ensemble GTID: « uuid[:tag]:intervalles » séparés par des virgules
+_GTID_SET = re.compile(r'^[0-9A-Za-z_:,\-]{0,4096}$')
+
+
+class ConsistencyTokenStore:
+    """
+    Dernier GTID écrit par utilisateur, oublié après `window_seconds`.
+    
+    Borné à `max_entries` (les plus anciennes entrées partent d'abord).
+    Thread-safe.
+    """
+    
+    CLOCK_SKEW_SECONDS = 1.0
+    SIGNATURE_HEX_LENGTH = 32
+    
+    def __init__(
+        self,
+        window_seconds: float = 5.0,
+        max_entries: int = 100_000,
+        clock: Callable[[], float] = time.time,
+        secret_key: Optional[str] = None
+    ):
+        """
+        Args:
+            window_seconds: Durée pendant laquelle les lectures attendent l'écriture
+            max_entries: Nombre maximal d'utilisateurs suivis
+            clock: Horloge murale (les jetons circulent entre processus)
+            secret_key: Clé de signature des jetons, commune aux workers
+                (SECRET_KEY); sans elle, une clé aléatoire propre au processus
+        
+        Raises:
+            ValueError: Si la fenêtre n'est pas positive
+        """
+        if window_seconds <= 0:
+            raise ValueError("La fenêtre de cohérence doit être positive")
+        self._window = window_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._secret = secret_key.encode('utf-8') if secret_key else os.urandom(32)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def remember(self, key: Optional[str], gtid_set: str) -> str:
+        """
+        Retient le GTID d'une écriture.
+        
+        Args:
+            key: Utilisateur (None pour une requête anonyme: rien n'est retenu)
+            gtid_set: GTID relevé après le commit ('' épingle au primaire)
+        
+        Returns:
+            Le jeton à renvoyer au client (voir encode())
+        """
+        expires_at = self._clock() + self._window
+        if key is not None:
+            with self._lock:
+                self._entries.pop(key, None)
+                self._entries[key] = (gtid_set, expires_at)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return self.encode(gtid_set, expires_at)
+    
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Retourne le GTID encore valide de l'utilisateur, ou None"""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= self._clock():
+                del self._entries[key]
+                return None
+            return entry[0]
+    
+    def encode(self, gtid_set: str, expires_at: float) -> str:
+        payload = f"{expires_at:.3f};{gtid_set}"
+        return f"{payload};{self._sign(payload)}"
+    
+    def decode(self, token: Optional[str]) -> Optional[str]:
+        """
+        Retourne le GTID d'un jeton client encore valide, ou None.
+        
+        Un jeton mal formé, mal signé ou dont l'échéance dépasse la fenêtre
+        est ignoré.
+        """
+        if not token:
+            return None
+        payload, separator, signature = token.rpartition(';')
+        if not separator or not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+        expires_text, separator, gtid_set = payload.partition(';')
+        if not separator or not _GTID_SET.match(gtid_set):
+            return None
+        try:
+            expires_at = float(expires_text)
+        except ValueError:
+            return None
+        now = self._clock()
+        # Tolérance: arrondi de encode() et décalage d'horloge entre serveurs
+        if not now < expires_at <= now + self._window + self.CLOCK_SKEW_SECONDS:
+            return None
+        return gtid_set
+    
+    def _sign(self, payload: str) -> str:
+        digest = hmac.new(self._secret, payload.encode('utf-8'), hashlib.sha256).hexdigest()
+        return digest[:self.SIGNATURE_HEX_LENGTH]
@@ -0,0 +1,53 @@
+-- =====================================================================
+-- Migration 001: boîte de réception dénormalisée
+--
+-- Ajoute à `conversations` un aperçu du dernier message et un compteur
+-- de non-lus par participant, maintenus par le backend dans la même
+-- transaction que l'insertion du message (MySQLMessageRepository.save).
+-- La boîte de réception devient une seule requête indexée triée par
+-- last_message_at (MySQLConversationRepository.find_inbox).
+--
+-- Application: mysql -u root -p < 001_conversation_inbox.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+ALTER TABLE conversations
+    ADD COLUMN last_message_id INTEGER NULL AFTER seller_id,
+    ADD COLUMN last_message_preview VARCHAR(140) NULL AFTER last_message_id,
+    ADD COLUMN last_sender_id INTEGER NULL AFTER last_message_preview,
+    ADD COLUMN buyer_unread_count INTEGER UNSIGNED NOT NULL DEFAULT 0 AFTER last_message_at,
+    ADD COLUMN seller_unread_count INTEGER UNSIGNED NOT NULL DEFAULT 0 AFTER buyer_unread_count;
+
+-- Index de la boîte de réception: chaque participant lit ses conversations
+-- déjà triées. Ils remplacent idx_buyer / idx_seller (même préfixe, les
+-- clés étrangères restent couvertes).
+ALTER TABLE conversations
+    ADD INDEX idx_buyer_inbox (buyer_id, last_message_at),
+    ADD INDEX idx_seller_inbox (seller_id, last_message_at);
+
+ALTER TABLE conversations
+    DROP INDEX idx_buyer,
+    DROP INDEX idx_seller;
+
+-- Rattrapage des conversations existantes
+UPDATE conversations c
+JOIN messages m ON m.message_id = (
+    SELECT MAX(m2.message_id) FROM messages m2 WHERE m2.conversation_id = c.conversation_id
+)
+SET c.last_message_id = m.message_id,
+    c.last_message_preview = LEFT(m.content, 140),
+    c.last_sender_id = m.sender_id,
+    c.last_message_at = m.created_at;
+
+UPDATE conversations c
+SET c.buyer_unread_count = (
+        SELECT COUNT(*) FROM messages m
+        WHERE m.conversation_id = c.conversation_id
+          AND m.sender_id = c.seller_id AND m.is_read = FALSE
+    ),
+    c.seller_unread_count = (
+        SELECT COUNT(*) FROM messages m
+        WHERE m.conversation_id = c.conversation_id
+          AND m.sender_id = c.buyer_id AND m.is_read = FALSE
+    );
@@ -0,0 +1,76 @@
+-- =====================================================================
+-- Migration 002: envoi de message atomique en un aller-retour
+--
+-- SendMessage regroupe dans une transaction serveur:
+--   1. la création de la conversation si p_conversation_id est NULL
+--      (INSERT ... ON DUPLICATE KEY UPDATE sur unique_conversation:
+--      ni SELECT préalable, ni course entre deux premiers messages);
+--   2. l'insertion du message;
+--   3. la mise à jour de l'aperçu et du compteur de non-lus (migration 001).
+-- Retourne une ligne (conversation_id, message_id).
+--
+-- Appelée par MySQLMessageRepository via un CALL direct.
+-- Application: mysql -u root -p < 002_procedure_send_message.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+DROP PROCEDURE IF EXISTS SendMessage;
+
+DELIMITER //
+
+CREATE PROCEDURE SendMessage(
+    IN p_conversation_id INTEGER,
+    IN p_listing_id INTEGER,
+    IN p_buyer_id INTEGER,
+    IN p_seller_id INTEGER,
+    IN p_sender_id INTEGER,
+    IN p_content TEXT,
+    IN p_preview_length INTEGER
+)
+BEGIN
+    DECLARE v_conversation_id INTEGER DEFAULT p_conversation_id;
+    DECLARE v_message_id INTEGER;
+    
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+    
+    START TRANSACTION;
+    
+    IF v_conversation_id IS NULL THEN
+        INSERT INTO conversations (listing_id, buyer_id, seller_id)
+        VALUES (p_listing_id, p_buyer_id, p_seller_id)
+        ON DUPLICATE KEY UPDATE conversation_id = LAST_INSERT_ID(conversation_id);
+        SET v_conversation_id = LAST_INSERT_ID();
+    END IF;
+    
+    INSERT INTO messages (conversation_id, sender_id, content)
+    VALUES (v_conversation_id, p_sender_id, p_content);
+    SET v_message_id = LAST_INSERT_ID();
+    
+    -- Le compteur incrémenté est celui du participant qui n'envoie pas
+    UPDATE conversations
+    SET last_message_id = v_message_id,
+        last_message_preview = LEFT(p_content, p_preview_length),
+        last_sender_id = p_sender_id,
+        last_message_at = NOW(),
+        updated_at = NOW(),
+        buyer_unread_count = buyer_unread_count + (seller_id = p_sender_id),
+        seller_unread_count = seller_unread_count + (buyer_id = p_sender_id)
+    WHERE conversation_id = v_conversation_id
+      AND (buyer_id = p_sender_id OR seller_id = p_sender_id);
+    
+    IF ROW_COUNT() = 0 THEN
+        SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'SendMessage: expediteur absent de la conversation';
+    END IF;
+    
+    COMMIT;
+    
+    SELECT v_conversation_id AS conversation_id, v_message_id AS message_id;
+END //
+
+DELIMITER ;
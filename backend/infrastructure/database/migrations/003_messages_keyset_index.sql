@@ -0,0 +1,23 @@
+-- =====================================================================
+-- Migration 003: index de pagination de l'historique des messages
+--
+-- L'historique d'une conversation se pagine par curseur sur message_id
+-- (before_message_id / after_message_id) au lieu de ORDER BY created_at
+-- LIMIT/OFFSET: chaque page est un parcours borné de cet index, dans un
+-- sens ou dans l'autre, sans tri ni relecture des pages précédentes
+-- (MySQLMessageRepository.find_by_conversation).
+--
+-- InnoDB ajoute déjà la clé primaire à idx_conversation; l'index explicite
+-- fixe l'ordre attendu par les requêtes et remplace idx_conversation
+-- (même préfixe: la clé étrangère reste couverte).
+--
+-- Application: mysql -u root -p < 003_messages_keyset_index.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+ALTER TABLE messages
+    ADD INDEX idx_conversation_message (conversation_id, message_id);
+
+ALTER TABLE messages
+    DROP INDEX idx_conversation;
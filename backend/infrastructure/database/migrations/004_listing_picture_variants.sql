@@ -0,0 +1,25 @@
+-- =====================================================================
+-- Migration 004: variantes redimensionnées des photos d'annonces
+--
+-- Les photos sont envoyées en flux sur disque et l'annonce est retournée
+-- sans attendre; la miniature et la variante moyenne sont générées en
+-- arrière-plan puis leurs chemins écrits ici (NULL tant qu'elles ne sont
+-- pas prêtes: l'original est servi à la place).
+--
+-- L'index (listing_id, is_cover) sert la recherche des couvertures d'une
+-- page du catalogue (MySQLListingPictureRepository.find_covers) et la
+-- sous-requête de la boîte de réception; il remplace idx_listing (même
+-- préfixe: la clé étrangère reste couverte).
+--
+-- Application: mysql -u root -p < 004_listing_picture_variants.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+ALTER TABLE listing_pictures
+    ADD COLUMN thumbnail_path VARCHAR(255) NULL AFTER file_path,
+    ADD COLUMN medium_path VARCHAR(255) NULL AFTER thumbnail_path,
+    ADD INDEX idx_listing_cover (listing_id, is_cover);
+
+ALTER TABLE listing_pictures
+    DROP INDEX idx_listing;
@@ -0,0 +1,17 @@
+-- =====================================================================
+-- Migration 005: compteur de références des photos
+--
+-- Les photos sont stockées sous l'empreinte SHA-256 de leur contenu: la
+-- même photo envoyée pour plusieurs annonces n'est écrite qu'une fois, et
+-- plusieurs lignes de listing_pictures partagent alors le même file_path.
+-- Le ramasse-miettes compte les références de ses candidats par lots
+-- (MySQLListingPictureRepository.count_references); cet index en fait
+-- des recherches par clé plutôt qu'un parcours de la table.
+--
+-- Application: mysql -u root -p < 005_listing_pictures_file_path_index.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+ALTER TABLE listing_pictures
+    ADD INDEX idx_file_path (file_path);
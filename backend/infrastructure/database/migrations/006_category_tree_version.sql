@@ -0,0 +1,48 @@
+-- =====================================================================
+-- Migration 006: version de l'arbre des catégories
+--
+-- L'arbre des catégories (parent_id) est chargé une fois en mémoire par
+-- chaque worker (CategoryService): filtrer sur « Électronique » devient
+-- un category_id IN (5, 6, 7) sans requête récursive. Pour savoir si
+-- l'arbre a changé, les workers lisent une seule ligne: sa version,
+-- incrémentée par des triggers à chaque écriture dans `categories`.
+--
+-- Application: mysql -u root -p < 006_category_tree_version.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+CREATE TABLE IF NOT EXISTS category_tree_version (
+    id TINYINT PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CHECK (id = 1)
+);
+
+INSERT IGNORE INTO category_tree_version (id, version) VALUES (1, 1);
+
+DROP TRIGGER IF EXISTS trg_categories_after_insert;
+DROP TRIGGER IF EXISTS trg_categories_after_update;
+DROP TRIGGER IF EXISTS trg_categories_after_delete;
+
+DELIMITER //
+
+CREATE TRIGGER trg_categories_after_insert AFTER INSERT ON categories
+FOR EACH ROW
+BEGIN
+    UPDATE category_tree_version SET version = version + 1 WHERE id = 1;
+END //
+
+CREATE TRIGGER trg_categories_after_update AFTER UPDATE ON categories
+FOR EACH ROW
+BEGIN
+    UPDATE category_tree_version SET version = version + 1 WHERE id = 1;
+END //
+
+CREATE TRIGGER trg_categories_after_delete AFTER DELETE ON categories
+FOR EACH ROW
+BEGIN
+    UPDATE category_tree_version SET version = version + 1 WHERE id = 1;
+END //
+
+DELIMITER ;
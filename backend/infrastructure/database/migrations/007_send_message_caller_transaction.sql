@@ -0,0 +1,67 @@
+-- =====================================================================
+-- Migration 007: SendMessage dans la transaction de l'appelant
+--
+-- La version de la migration 002 ouvrait et validait sa propre
+-- transaction: appelée dans une unité de travail, elle validait aussi
+-- les écritures précédentes de la requête, et l'unité, jamais marquée
+-- comme ayant écrit, ne relevait pas le GTID de lecture de ses écritures.
+--
+-- SendMessage n'a plus de START TRANSACTION, COMMIT ni ROLLBACK: elle
+-- s'exécute dans la transaction courante, que l'appelant valide (commit
+-- de l'unité de travail) ou annule. Une erreur remonte telle quelle.
+--
+-- Application: mysql -u root -p < 007_send_message_caller_transaction.sql
+-- =====================================================================
+
+USE ulaval_market;
+
+DROP PROCEDURE IF EXISTS SendMessage;
+
+DELIMITER //
+
+CREATE PROCEDURE SendMessage(
+    IN p_conversation_id INTEGER,
+    IN p_listing_id INTEGER,
+    IN p_buyer_id INTEGER,
+    IN p_seller_id INTEGER,
+    IN p_sender_id INTEGER,
+    IN p_content TEXT,
+    IN p_preview_length INTEGER
+)
+BEGIN
+    DECLARE v_conversation_id INTEGER DEFAULT p_conversation_id;
+    DECLARE v_message_id INTEGER;
+    
+    IF v_conversation_id IS NULL THEN
+        INSERT INTO conversations (listing_id, buyer_id, seller_id)
+        VALUES (p_listing_id, p_buyer_id, p_seller_id)
+        ON DUPLICATE KEY UPDATE conversation_id = LAST_INSERT_ID(conversation_id);
+        SET v_conversation_id = LAST_INSERT_ID();
+    END IF;
+    
+    INSERT INTO messages (conversation_id, sender_id, content)
+    VALUES (v_conversation_id, p_sender_id, p_content);
+    SET v_message_id = LAST_INSERT_ID();
+    
+    -- Le compteur incrémenté est celui du participant qui n'envoie pas
+    UPDATE conversations
+    SET last_message_id = v_message_id,
+        last_message_preview = LEFT(p_content, p_preview_length),
+        last_sender_id = p_sender_id,
+        last_message_at = NOW(),
+        updated_at = NOW(),
+        buyer_unread_count = buyer_unread_count + (seller_id = p_sender_id),
+        seller_unread_count = seller_unread_count + (buyer_id = p_sender_id)
+    WHERE conversation_id = v_conversation_id
+      AND (buyer_id = p_sender_id OR seller_id = p_sender_id);
+    
+    IF ROW_COUNT() = 0 THEN
+        -- L'appelant annule la transaction (conversation et message compris)
+        SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'SendMessage: expediteur absent de la conversation';
+    END IF;
+    
+    SELECT v_conversation_id AS conversation_id, v_message_id AS message_id;
+END //
+
+DELIMITER ;
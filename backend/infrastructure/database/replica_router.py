@@ -0,0 +1,211 @@
+"""
+Module du routage des lectures vers les réplicas MySQL.
+
+Les unités de travail en lecture seule empruntent une connexion à un
+réplica; les écritures restent sur le primaire. Le réplica est choisi par
+un tourniquet pondéré (smooth weighted round-robin) dont les poids sont
+l'inverse de la latence mesurée: un réplica deux fois plus lent reçoit
+deux fois moins de lectures.
+
+Lecture de ses propres écritures: après un commit, le GTID exécuté par le
+primaire sert de jeton de cohérence. Tant que le jeton est valide, une
+lecture ne va qu'à un réplica qui a déjà appliqué ce GTID
+(GTID_SUBSET), sinon au primaire. Un jeton vide (GTID désactivé) épingle
+au primaire.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+from domain.exceptions.database_exception import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+class _Replica:
+    """Pool d'un réplica et latence lissée (moyenne mobile exponentielle)"""
+    
+    def __init__(self, name: str, pool: ConnectionPool, initial_latency: float):
+        self.name = name
+        self.pool = pool
+        self.latency = initial_latency
+        self.current_weight = 0.0
+        self.last_probe = float('-inf')
+        self.down_until = float('-inf')
+
+
+class ReplicaRouter:
+    """
+    Choix de la connexion d'une unité de travail: primaire ou réplica.
+    
+    Thread-safe; une seule instance par processus.
+    """
+    
+    # Poids de la dernière mesure dans la latence lissée
+    SMOOTHING = 0.2
+    
+    def __init__(
+        self,
+        primary: ConnectionPool,
+        replicas: Sequence[Tuple[str, ConnectionPool]],
+        probe_interval_seconds: float = 1.0,
+        failure_cooldown_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            primary: Pool du primaire (écritures et repli)
+            replicas: Couples (nom, pool) des réplicas
+            probe_interval_seconds: Intervalle minimal entre deux mesures de latence d'un réplica
+            failure_cooldown_seconds: Mise à l'écart d'un réplica injoignable
+            clock: Horloge monotone (injectable pour les tests)
+            registry: Registre des métriques
+        """
+        self._primary = primary
+        self._replicas = [_Replica(name, pool, 0.001) for name, pool in replicas]
+        self._by_pool: Dict[int, _Replica] = {id(replica.pool): replica for replica in self._replicas}
+        self._probe_interval = probe_interval_seconds
+        self._cooldown = failure_cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._reads = registry.counter('db_replica_reads_total', "Unités de travail en lecture, par cible (réplica ou primaire)")
+        self._fallbacks = registry.counter(
+            'db_replica_primary_fallbacks_total',
+            "Lectures envoyées au primaire faute de réplica à jour ou disponible, par raison"
+        )
+        self._latency_gauge = registry.gauge('db_replica_latency_seconds', "Latence lissée de chaque réplica")
+    
+    @property
+    def primary(self) -> ConnectionPool:
+        return self._primary
+    
+    @property
+    def replica_names(self) -> List[str]:
+        return [replica.name for replica in self._replicas]
+    
+    def weights(self) -> Dict[str, float]:
+        """Part des lectures attribuée à chaque réplica disponible (somme 1)"""
+        with self._lock:
+            now = self._clock()
+            available = [replica for replica in self._replicas if replica.down_until <= now]
+            total = sum(1.0 / replica.latency for replica in available)
+            return {replica.name: (1.0 / replica.latency) / total for replica in available}
+    
+    def acquire_read(self, consistency_token: Optional[str] = None) -> Tuple[DatabaseConnection, ConnectionPool]:
+        """
+        Emprunte une connexion pour une unité de travail en lecture seule.
+        
+        Args:
+            consistency_token: GTID de la dernière écriture de l'utilisateur
+                ('' pour exiger le primaire, None si aucune écriture récente)
+        
+        Returns:
+            La connexion et le pool auquel la rendre
+        
+        Raises:
+            DatabaseException: Si le primaire lui-même est indisponible
+        """
+        if consistency_token == '':
+            return self._primary_read('pinned')
+        
+        for replica in self._candidates():
+            try:
+                connection = replica.pool.acquire()
+            except DatabaseException as error:
+                self._mark_down(replica, error)
+                continue
+            try:
+                caught_up = self._check(replica, connection, consistency_token)
+            except DatabaseException as error:
+                replica.pool.release(connection, discard=True)
+                self._mark_down(replica, error)
+                continue
+            if caught_up:
+                self._reads.inc(target=replica.name)
+                return connection, replica.pool
+            replica.pool.release(connection)
+        
+        return self._primary_read('lagging' if consistency_token and self._replicas else 'unavailable')
+    
+    def capture_token(self, connection: DatabaseConnection) -> str:
+        """
+        Relève le GTID exécuté par le primaire après un commit.
+        
+        Returns:
+            L'ensemble GTID, ou '' si GTID est désactivé (épinglage au primaire)
+        """
+        cursor = connection.get_cursor()
+        try:
+            cursor.execute("SELECT @@GLOBAL.gtid_executed")
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        return (row[0] or '').replace('\n', '') if row else ''
+    
+    def close(self) -> None:
+        self._primary.close()
+        for replica in self._replicas:
+            replica.pool.close()
+    
+    def _primary_read(self, reason: str) -> Tuple[DatabaseConnection, ConnectionPool]:
+        self._fallbacks.inc(reason=reason)
+        self._reads.inc(target='primary')
+        return self._primary.acquire(), self._primary
+    
+    def _candidates(self) -> List[_Replica]:
+        """Réplicas disponibles, le choix du tourniquet pondéré en premier"""
+        with self._lock:
+            now = self._clock()
+            available = [replica for replica in self._replicas if replica.down_until <= now]
+            if not available:
+                return []
+            total = 0.0
+            best = None
+            for replica in available:
+                weight = 1.0 / replica.latency
+                replica.current_weight += weight
+                total += weight
+                if best is None or replica.current_weight > best.current_weight:
+                    best = replica
+            best.current_weight -= total
+            return [best] + sorted((r for r in available if r is not best), key=lambda r: r.latency)
+    
+    def _check(self, replica: _Replica, connection: DatabaseConnection, consistency_token: Optional[str]) -> bool:
+        """Vérifie le GTID si nécessaire; mesure la latence au passage ou périodiquement"""
+        now = self._clock()
+        if consistency_token is None and now - replica.last_probe < self._probe_interval:
+            return True
+        started = time.perf_counter()
+        cursor = connection.get_cursor()
+        try:
+            if consistency_token is None:
+                cursor.execute("SELECT 1")
+            else:
+                cursor.execute("SELECT GTID_SUBSET(%s, @@GLOBAL.gtid_executed)", (consistency_token,))
+            row = cursor.fetchone()
+        except Exception as error:
+            raise DatabaseException(f"Réplica {replica.name} injoignable: {error}", original_error=error)
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self._observe(replica, time.perf_counter() - started, now)
+        return consistency_token is None or bool(row and row[0])
+    
+    def _observe(self, replica: _Replica, seconds: float, now: float) -> None:
+        with self._lock:
+            replica.latency += self.SMOOTHING * (max(seconds, 1e-5) - replica.latency)
+            replica.last_probe = now
+        self._latency_gauge.set(replica.latency, replica=replica.name)
+    
+    def _mark_down(self, replica: _Replica, error: Exception) -> None:
+        logger.warning(f"Réplica {replica.name} écarté {self._cooldown:g} s: {error}")
+        with self._lock:
+            replica.down_until = self._clock() + self._cooldown
+            replica.current_weight = 0.0
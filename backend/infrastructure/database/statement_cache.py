@@ -0,0 +1,175 @@
+"""
+Module du cache de requêtes préparées.
+
+Chaque DatabaseConnection garde ses curseurs préparés (COM_STMT_PREPARE)
+dans un cache LRU indexé par le texte SQL: une requête déjà vue n'est plus
+analysée par le serveur, seuls ses paramètres voyagent (protocole binaire).
+Les instructions préparées vivent dans la session MySQL: le cache est vidé
+quand la connexion est fermée, rouverte ou perdue.
+"""
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+
+class CachedStatementCursor:
+    """
+    Curseur préparé prêté par le cache.
+    
+    S'utilise comme le curseur MySQL qu'il enveloppe; close() ne ferme pas
+    l'instruction préparée mais la rend au cache (les lignes non lues sont
+    consommées pour libérer la connexion).
+    """
+    
+    def __init__(self, cache: 'StatementCache', statement: str, cursor: Any):
+        self._cache = cache
+        self._statement = statement
+        self._cursor = cursor
+        self._released = False
+    
+    def execute(self, operation: str, params: Any = None) -> Any:
+        # Le curseur préparé ne réutilise l'instruction que pour le même objet str
+        return self._cursor.execute(self._statement, params)
+    
+    def close(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._cache.release(self._statement, self._cursor)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class StatementCache:
+    """
+    Cache LRU borné de curseurs préparés d'une connexion.
+    
+    Non thread-safe: une connexion n'a qu'un emprunteur à la fois (voir
+    ConnectionPool). Une requête dont le curseur est déjà prêté (curseurs
+    imbriqués) reçoit un curseur préparé hors cache, fermé à close().
+    """
+    
+    DEFAULT_SIZE = 64
+    
+    def __init__(
+        self,
+        cursor_factory: Callable[[], Any],
+        size: Optional[int] = None,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            cursor_factory: Ouvre un curseur préparé sur la connexion
+            size: Nombre maximal d'instructions gardées (DB_STATEMENT_CACHE_SIZE;
+                0 désactive le cache)
+            registry: Registre des métriques
+        """
+        if size is None:
+            size = int(os.getenv('DB_STATEMENT_CACHE_SIZE', str(self.DEFAULT_SIZE)))
+        if size < 0:
+            raise ValueError("La taille du cache de requêtes doit être positive ou nulle")
+        self._factory = cursor_factory
+        self._size = size
+        # texte SQL -> (texte préparé, curseur)
+        self._cursors: 'OrderedDict[str, Tuple[str, Any]]' = OrderedDict()
+        self._borrowed: Dict[str, Tuple[str, Any]] = {}
+        
+        self._requests = registry.counter(
+            'db_statement_cache_requests_total',
+            "Requêtes préparées demandées au cache, par résultat (hit, miss)"
+        )
+        self._evictions = registry.counter(
+            'db_statement_cache_evictions_total',
+            "Instructions préparées fermées pour faire de la place dans le cache"
+        )
+        requests = self._requests
+        
+        def hit_ratio() -> float:
+            hits = requests.value(result='hit')
+            total = hits + requests.value(result='miss')
+            return hits / total if total else 0.0
+        
+        registry.gauge(
+            'db_statement_cache_hit_ratio',
+            "Part des requêtes servies par une instruction déjà préparée",
+            callback=hit_ratio
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0
+    
+    def __len__(self) -> int:
+        return len(self._cursors) + len(self._borrowed)
+    
+    def checkout(self, statement: str) -> CachedStatementCursor:
+        """
+        Prête le curseur préparé de la requête (préparé au premier usage).
+        
+        Le curseur doit être rendu par close() avant que la requête soit de
+        nouveau demandée.
+        """
+        entry = self._cursors.pop(statement, None)
+        if entry is not None:
+            self._requests.inc(result='hit')
+        elif statement in self._borrowed:
+            # Même requête déjà prêtée: curseur éphémère, fermé à la restitution
+            self._requests.inc(result='miss')
+            return CachedStatementCursor(self, statement, _Unshared(self._factory()))
+        else:
+            self._requests.inc(result='miss')
+            entry = (statement, self._factory())
+        self._borrowed[statement] = entry
+        # Le texte gardé (le premier objet str vu) est celui que le curseur a préparé
+        return CachedStatementCursor(self, entry[0], entry[1])
+    
+    def release(self, statement: str, cursor: Any) -> None:
+        """Rend un curseur prêté; il redevient le plus récemment utilisé"""
+        if isinstance(cursor, _Unshared):
+            _close_quietly(cursor.cursor)
+            return
+        entry = self._borrowed.get(statement)
+        if entry is None or entry[1] is not cursor:
+            # Cache vidé pendant le prêt (connexion fermée ou perdue)
+            _close_quietly(cursor)
+            return
+        del self._borrowed[statement]
+        try:
+            if cursor.with_rows:
+                cursor.fetchall()
+        except Exception:
+            _close_quietly(cursor)
+            return
+        self._cursors[statement] = entry
+        while len(self) > self._size and self._cursors:
+            _, (_, evicted) = self._cursors.popitem(last=False)
+            self._evictions.inc()
+            _close_quietly(evicted)
+    
+    def clear(self) -> None:
+        """Ferme toutes les instructions (recyclage de la connexion)"""
+        entries = list(self._cursors.values()) + list(self._borrowed.values())
+        self._cursors.clear()
+        self._borrowed.clear()
+        for _, cursor in entries:
+            _close_quietly(cursor)
+
+
+class _Unshared:
+    """Curseur préparé hors cache (requête déjà prêtée)"""
+    
+    def __init__(self, cursor: Any):
+        self.cursor = cursor
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cursor, name)
+
+
+def _close_quietly(cursor: Any) -> None:
+    try:
+        cursor.close()
+    except Exception:
+        pass
@@ -0,0 +1,166 @@
+"""
+Module de reprise des transactions en conflit.
+
+MySQL interrompt une transaction en conflit de verrous: 1213 (deadlock,
+transaction annulée) ou 1205 (attente de verrou dépassée). Le conflit est
+transitoire: rejouer toute l'unité de travail réussit presque toujours.
+Le TransactionRunner rejoue l'unité avec une attente exponentielle tirée
+au hasard (« full jitter », pour désynchroniser les transactions rivales),
+dans un budget par requête: nombre de reprises et durée totale bornés, ce
+qui borne aussi la latence de queue sous contention.
+"""
+import logging
+import random
+import time
+from typing import Callable, Optional, TypeVar, Union
+
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.unit_of_work import TokenProvider, UnitOfWork, UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_CONFLICT_LABELS = {1213: 'deadlock', 1205: 'lock_wait_timeout'}
+
+
+class TransactionRunner:
+    """
+    Exécute une unité de travail et la rejoue sur conflit de verrous.
+    
+    Le travail rejoué doit être rejouable: tout ce qu'il fait hors de la
+    base (appels externes, fichiers) est refait à chaque tentative.
+    """
+    
+    def __init__(
+        self,
+        manager: UnitOfWorkManager,
+        max_retries: int = 3,
+        base_delay_seconds: float = 0.01,
+        max_delay_seconds: float = 0.2,
+        budget_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Args:
+            manager: Gestionnaire des unités de travail
+            max_retries: Reprises au plus par exécution
+            base_delay_seconds: Attente maximale avant la première reprise (doublée à chaque reprise)
+            max_delay_seconds: Plafond de l'attente entre deux tentatives
+            budget_seconds: Durée au-delà de laquelle on ne rejoue plus (depuis la première tentative)
+            clock: Horloge monotone (injectable pour les tests)
+            sleep: Attente (injectable pour les tests)
+            jitter: Tirage dans [0, 1) (injectable pour les tests)
+            registry: Registre des métriques
+        """
+        self._manager = manager
+        self._max_retries = max_retries
+        self._base_delay = base_delay_seconds
+        self._max_delay = max_delay_seconds
+        self._budget = budget_seconds
+        self.clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        
+        self._conflicts = registry.counter(
+            'db_transaction_conflicts_total',
+            "Transactions interrompues par un conflit de verrous, par type"
+        )
+        self._retries = registry.counter('db_transaction_retries_total', "Unités de travail rejouées après un conflit")
+        self._exhausted = registry.counter(
+            'db_transaction_retries_exhausted_total',
+            "Conflits non résolus dans le budget de reprise"
+        )
+        self._waited = registry.counter(
+            'db_transaction_retry_wait_seconds_total',
+            "Temps passé à attendre avant de rejouer une unité de travail"
+        )
+    
+    def run(
+        self,
+        work: Callable[[], T],
+        read_only: bool = False,
+        consistency_token: Union[None, str, TokenProvider] = None
+    ) -> T:
+        """
+        Exécute `work` dans une unité de travail, rejouée sur conflit.
+        
+        Usage:
+            conversation = transaction_runner.run(lambda: service.start_conversation(dto))
+        
+        Returns:
+            Le résultat de la tentative validée
+        
+        Raises:
+            L'erreur de la dernière tentative si elle n'est pas un conflit ou si le budget est épuisé
+        """
+        started = self.clock()
+        attempt = 0
+        while True:
+            token = self._manager.begin(read_only, consistency_token)
+            try:
+                result = work()
+            except BaseException as error:
+                unit = self._manager.end(token, error)
+                conflict = self.conflict_of(unit, error)
+                if conflict is None or not self.backoff(conflict, attempt, started):
+                    raise
+                attempt += 1
+                continue
+            
+            unit = self._manager.current
+            conflict = self.conflict_of(unit)
+            if conflict is not None:
+                # Conflit rattrapé par le travail: l'unité est condamnée, rien n'a été validé
+                self._manager.end(token, conflict)
+                if not self.backoff(conflict, attempt, started):
+                    raise conflict
+                attempt += 1
+                continue
+            
+            try:
+                self._manager.end(token)
+            except Exception as error:
+                if not DatabaseConnection.is_conflict(error) or not self.backoff(error, attempt, started):
+                    raise
+                attempt += 1
+                continue
+            return result
+    
+    @staticmethod
+    def conflict_of(unit: Optional[UnitOfWork], error: Optional[BaseException] = None) -> Optional[BaseException]:
+        """Conflit de verrous de la tentative: signalé à l'unité ou porté par l'erreur levée"""
+        if unit is not None and unit.conflict is not None:
+            return unit.conflict
+        if error is not None and DatabaseConnection.is_conflict(error):
+            return error
+        return None
+    
+    def backoff(self, conflict: BaseException, attempt: int, started: float) -> bool:
+        """
+        Compte le conflit et attend avant la reprise `attempt + 1`, si le budget le permet.
+        
+        Args:
+            conflict: Erreur de verrou de la tentative
+            attempt: Numéro de la tentative en échec (0 pour la première)
+            started: Instant de la première tentative (voir `clock`)
+        
+        Returns:
+            True si l'unité doit être rejouée
+        """
+        original = getattr(conflict, 'original_error', None) or conflict
+        self._conflicts.inc(error=_CONFLICT_LABELS.get(getattr(original, 'errno', None), 'other'))
+        delay = self._jitter() * min(self._max_delay, self._base_delay * 2 ** attempt)
+        if attempt >= self._max_retries or self.clock() + delay - started > self._budget:
+            self._exhausted.inc()
+            logger.warning(f"Conflit de verrous non résolu après {attempt + 1} tentative(s): {conflict}")
+            return False
+        self._retries.inc()
+        if delay > 0:
+            self._waited.inc(delay)
+            self._sleep(delay)
+        return True
@@ -0,0 +1,374 @@
+"""
+Module de l'unité de travail (Unit of Work) MySQL.
+
+Une unité de travail couvre une requête HTTP (ou un traitement de fond):
+elle emprunte au plus une connexion au pool, à la première requête SQL,
+la partage entre tous les repositories, valide une seule fois à la fin
+(ou annule sur exception) et rend la connexion.
+
+Les repositories reçoivent une ScopedConnection: elle expose l'interface
+de DatabaseConnection mais délègue à l'unité de travail active. Leurs
+appels à commit() sont différés jusqu'à la fin de l'unité.
+
+Les effets hors base (notifications temps réel...) s'enregistrent avec
+after_commit(): ils ne partent qu'une fois la transaction validée, jamais
+pour une unité annulée ou rejouée après un conflit.
+
+Avec un ReplicaRouter, une unité en lecture seule emprunte sa connexion
+à un réplica; une unité qui a écrit relève, après son commit, le jeton
+de cohérence (GTID) de l'écriture.
+"""
+import contextvars
+import logging
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Union
+
+from mysql.connector.cursor import MySQLCursor
+
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+from domain.exceptions.database_exception import DatabaseException
+
+if TYPE_CHECKING:
+    from infrastructure.database.replica_router import ReplicaRouter
+
+logger = logging.getLogger(__name__)
+
+TokenProvider = Callable[[], Optional[str]]
+
+
+class UnitOfWork:
+    """
+    Transaction unique sur une connexion empruntée à la demande.
+    
+    Utilisable comme context manager: commit en sortie normale, rollback
+    si une exception traverse le bloc; la connexion est toujours rendue.
+    """
+    
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        registry: MetricsRegistry = metrics_registry,
+        router: Optional['ReplicaRouter'] = None,
+        read_only: bool = False,
+        consistency_token: Union[None, str, TokenProvider] = None
+    ):
+        """
+        Args:
+            pool: Pool auquel emprunter la connexion (le primaire)
+            registry: Registre des métriques
+            router: Routeur des lectures vers les réplicas (optionnel)
+            read_only: Unité sans écriture, routable vers un réplica
+            consistency_token: GTID de la dernière écriture de l'utilisateur,
+                ou fonction qui le fournit au moment de l'emprunt
+        """
+        self._pool = pool
+        self._router = router
+        self._read_only = read_only
+        self._consistency_token = consistency_token
+        self._connection: Optional[DatabaseConnection] = None
+        self._closed = False
+        self._rollback_only = False
+        self._dirty = False
+        self._conflict: Optional[BaseException] = None
+        self._after_commit: List[Callable[[], None]] = []
+        self.written_token: Optional[str] = None
+        self._commits = registry.counter('db_unit_of_work_commits_total', "Unités de travail validées")
+        self._rollbacks = registry.counter('db_unit_of_work_rollbacks_total', "Unités de travail annulées")
+    
+    @property
+    def connection(self) -> DatabaseConnection:
+        """
+        Connexion de l'unité, empruntée au premier accès.
+        
+        Raises:
+            DatabaseException: Si l'unité est terminée ou si le pool est épuisé
+        """
+        if self._closed:
+            raise DatabaseException("L'unité de travail est terminée")
+        if self._connection is None:
+            if self._router is not None and self._read_only:
+                token = self._consistency_token
+                self._connection, self._pool = self._router.acquire_read(token() if callable(token) else token)
+            else:
+                self._connection = self._pool.acquire()
+        return self._connection
+    
+    @property
+    def has_connection(self) -> bool:
+        return self._connection is not None
+    
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+    
+    @property
+    def rollback_only(self) -> bool:
+        return self._rollback_only
+    
+    @property
+    def conflict(self) -> Optional[BaseException]:
+        """Erreur de verrou (1213, 1205) rencontrée par l'unité, même rattrapée par l'appelant"""
+        return self._conflict
+    
+    def mark_conflict(self, error: BaseException) -> None:
+        """Signale un conflit de verrous: la transaction est condamnée et peut être rejouée"""
+        if self._conflict is None:
+            self._conflict = error
+        self._rollback_only = True
+    
+    def mark_rollback_only(self) -> None:
+        """Condamne la transaction: la fin de l'unité annulera au lieu de valider"""
+        self._rollback_only = True
+    
+    def mark_dirty(self) -> None:
+        """Signale une écriture (un repository a demandé un commit)"""
+        self._dirty = True
+    
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Diffère `callback` jusqu'à la validation de l'unité (abandonné si elle est annulée)"""
+        self._after_commit.append(callback)
+    
+    def commit(self) -> None:
+        """
+        Valide la transaction et rend la connexion.
+        
+        Sans connexion empruntée (aucune requête SQL), ne fait rien. Une
+        transaction condamnée par mark_rollback_only() est annulée. Après
+        une écriture, `written_token` reçoit le GTID du primaire. Les
+        rappels after_commit() s'exécutent une fois la connexion rendue.
+        
+        Raises:
+            DatabaseException: Si la validation échoue (la transaction est alors annulée)
+        """
+        if self._rollback_only:
+            logger.warning("Unité de travail condamnée par une erreur SQL: annulation au lieu du commit")
+            self.rollback()
+            return
+        if self._connection is None:
+            self._closed = True
+            self._run_after_commit()
+            return
+        try:
+            self._connection.commit()
+        except DatabaseException:
+            self.rollback()
+            raise
+        self._commits.inc()
+        if self._router is not None and self._dirty and not self._read_only:
+            try:
+                self.written_token = self._router.capture_token(self._connection)
+            except Exception as error:
+                logger.warning(f"GTID illisible après commit, lectures épinglées au primaire: {error}")
+                self.written_token = ''
+        self._release(discard=False)
+        self._run_after_commit()
+    
+    def rollback(self) -> None:
+        """Annule la transaction et rend la connexion (jetée si l'annulation échoue)"""
+        self._after_commit.clear()
+        if self._connection is None:
+            self._closed = True
+            return
+        discard = False
+        try:
+            self._connection.rollback()
+        except DatabaseException as error:
+            logger.warning(f"Rollback impossible, connexion écartée: {error}")
+            discard = True
+        self._rollbacks.inc()
+        self._release(discard)
+    
+    def __enter__(self) -> 'UnitOfWork':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+    
+    def _run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as error:
+                # La transaction est validée: un effet secondaire ne la remet pas en cause
+                logger.error(f"Échec d'un rappel après commit: {error}", exc_info=True)
+    
+    def _release(self, discard: bool) -> None:
+        connection, self._connection = self._connection, None
+        self._closed = True
+        self._pool.release(connection, discard=discard)
+
+
+class UnitOfWorkManager:
+    """
+    Unité de travail courante, propre à chaque requête.
+    
+    L'unité active est portée par une ContextVar: chaque thread (ou
+    contexte) de serveur voit la sienne.
+    """
+    
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        registry: MetricsRegistry = metrics_registry,
+        router: Optional['ReplicaRouter'] = None
+    ):
+        """
+        Args:
+            pool: Pool du primaire
+            registry: Registre des métriques
+            router: Routeur des lectures vers les réplicas (optionnel)
+        """
+        self._pool = pool
+        self._registry = registry
+        self._router = router
+        self._current: contextvars.ContextVar[Optional[UnitOfWork]] = contextvars.ContextVar('unit_of_work', default=None)
+    
+    @property
+    def current(self) -> Optional[UnitOfWork]:
+        return self._current.get()
+    
+    def begin(
+        self,
+        read_only: bool = False,
+        consistency_token: Union[None, str, TokenProvider] = None
+    ) -> contextvars.Token:
+        """
+        Ouvre une unité de travail pour le contexte courant.
+        
+        Args:
+            read_only: Unité sans écriture, routable vers un réplica
+            consistency_token: GTID (ou fonction qui le fournit) à attendre sur le réplica
+        
+        Returns:
+            Jeton à passer à end()
+        
+        Raises:
+            DatabaseException: Si une unité est déjà active dans ce contexte
+        """
+        if self._current.get() is not None:
+            raise DatabaseException("Une unité de travail est déjà active")
+        return self._current.set(UnitOfWork(self._pool, self._registry, self._router, read_only, consistency_token))
+    
+    def end(self, token: contextvars.Token, error: Optional[BaseException] = None) -> Optional[UnitOfWork]:
+        """
+        Termine l'unité courante: commit si `error` est None, rollback sinon.
+        
+        Returns:
+            L'unité terminée (pour lire `written_token`)
+        
+        Raises:
+            DatabaseException: Si le commit échoue (l'unité est alors annulée)
+        """
+        unit = self._current.get()
+        try:
+            if unit is not None:
+                if error is None:
+                    unit.commit()
+                else:
+                    unit.rollback()
+        finally:
+            self._current.reset(token)
+        return unit
+    
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Exécute `callback` après le commit de l'unité courante.
+        
+        Hors unité de travail, il n'y a rien à attendre: `callback` est
+        exécuté immédiatement.
+        """
+        unit = self._current.get()
+        if unit is None:
+            callback()
+        else:
+            unit.after_commit(callback)
+    
+    @contextmanager
+    def scope(self, join_current: bool = False) -> Iterator[UnitOfWork]:
+        """
+        Unité de travail hors requête HTTP (scripts, tâches de fond).
+        
+        Usage:
+            with unit_of_work_manager.scope():
+                user_repository.save(user)
+                session_repository.save(session)
+        
+        Args:
+            join_current: Rejoindre l'unité déjà active s'il y en a une (code
+                appelé tantôt dans une requête, tantôt depuis un thread de fond),
+                au lieu de lever DatabaseException; son propriétaire la termine
+        """
+        if join_current and self._current.get() is not None:
+            yield self._current.get()
+            return
+        token = self.begin()
+        try:
+            yield self._current.get()
+        except BaseException as error:
+            self.end(token, error)
+            raise
+        self.end(token)
+    
+    def connection(self) -> 'ScopedConnection':
+        """Connexion à injecter dans les repositories MySQL"""
+        return ScopedConnection(self)
+
+
+class ScopedConnection:
+    """
+    Façade DatabaseConnection de l'unité de travail active.
+    
+    commit() est différé à la fin de l'unité; rollback() la condamne (même
+    si l'appelant rattrape l'exception, rien ne sera validé). Hors unité de
+    travail, tout accès lève DatabaseException.
+    """
+    
+    def __init__(self, manager: UnitOfWorkManager):
+        self._manager = manager
+    
+    def is_connected(self) -> bool:
+        unit = self._manager.current
+        return unit is not None and unit.has_connection and unit.connection.is_connected()
+    
+    def get_cursor(self, statement: Optional[str] = None) -> MySQLCursor:
+        """
+        Raises:
+            DatabaseException: Hors unité de travail, ou si la connexion est indisponible
+        """
+        return self._unit().connection.get_cursor(statement)
+    
+    def commit(self) -> None:
+        self._unit().mark_dirty()
+    
+    def handle_error(self, error: BaseException) -> None:
+        unit = self._manager.current
+        if unit is None:
+            return
+        if DatabaseConnection.is_conflict(error):
+            unit.mark_conflict(error)
+        if unit.has_connection:
+            unit.connection.handle_error(error)
+    
+    def recover_read(self, error: BaseException) -> bool:
+        """Rejoue une lecture après coupure si l'unité n'a encore rien écrit"""
+        unit = self._unit()
+        if unit.dirty:
+            unit.connection.handle_error(error)
+            return False
+        return unit.connection.recover_read(error, discard_statements=True)
+    
+    def rollback(self) -> None:
+        self._unit().mark_rollback_only()
+    
+    def _unit(self) -> UnitOfWork:
+        unit = self._manager.current
+        if unit is None:
+            raise DatabaseException("Aucune unité de travail active (requête HTTP ou unit_of_work_manager.scope())")
+        return unit
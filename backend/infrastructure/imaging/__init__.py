@@ -0,0 +1 @@
+"""Traitement des images (variantes redimensionnées)"""
@@ -0,0 +1,198 @@
+"""
+Module de redimensionnement des photos à la demande.
+
+Chaque composant du frontend (carte du catalogue, page d'annonce, annonces
+en vedette) demande sa propre taille. Plutôt que de pré-générer toutes les
+tailles, la première requête produit la version demandée dans le pool de
+processus et la range dans un cache disque LRU; les suivantes la lisent.
+Les premières requêtes simultanées sont regroupées en un seul calcul.
+"""
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from infrastructure.concurrency.single_flight import SingleFlight
+from infrastructure.imaging.resized_image_cache import ResizedImageCache
+from infrastructure.imaging.thumbnail_generator import ThumbnailGenerator
+from infrastructure.metrics.metrics_registry import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResizeRequest:
+    """
+    Paramètres d'un redimensionnement.
+    
+    Largeur et hauteur sont arrondies au multiple de SIZE_STEP supérieur:
+    des tailles arbitraires ne peuvent pas remplir le cache de variantes
+    quasi identiques.
+    """
+    
+    width: Optional[int]
+    height: Optional[int]
+    output_format: str = 'jpeg'
+    
+    MAX_DIMENSION = 2048
+    SIZE_STEP = 16
+    FORMATS = ('jpeg', 'webp', 'png')
+    
+    @classmethod
+    def parse(cls, width: Optional[int], height: Optional[int], output_format: Optional[str]) -> 'ResizeRequest':
+        """
+        Valide et normalise les paramètres de la requête.
+        
+        Raises:
+            ValueError: Si les paramètres sont invalides
+        """
+        if width is None and height is None:
+            raise ValueError("Au moins un des paramètres w ou h est requis")
+        
+        output_format = (output_format or 'jpeg').lower()
+        if output_format == 'jpg':
+            output_format = 'jpeg'
+        if output_format not in cls.FORMATS:
+            raise ValueError(f"Format non supporté (formats acceptés: {', '.join(cls.FORMATS)})")
+        
+        return cls(cls._normalize(width, 'w'), cls._normalize(height, 'h'), output_format)
+    
+    @classmethod
+    def _normalize(cls, value: Optional[int], name: str) -> Optional[int]:
+        if value is None:
+            return None
+        if value < 1 or value > cls.MAX_DIMENSION:
+            raise ValueError(f"Le paramètre {name} doit être entre 1 et {cls.MAX_DIMENSION}")
+        return min(cls.MAX_DIMENSION, -(-value // cls.SIZE_STEP) * cls.SIZE_STEP)
+    
+    @property
+    def box(self) -> Tuple[int, int]:
+        return (self.width or self.MAX_DIMENSION, self.height or self.MAX_DIMENSION)
+    
+    @property
+    def extension(self) -> str:
+        return 'jpg' if self.output_format == 'jpeg' else self.output_format
+
+
+class ImageResizer:
+    """
+    Redimensionne une photo stockée et retourne le fichier en cache.
+    
+    Métriques (registre partagé): media_resize_requests_total{result=hit|miss|coalesced},
+    media_resize_cache_hit_ratio, media_resize_cache_bytes, media_resize_cache_evictions.
+    """
+    
+    def __init__(
+        self,
+        root_dir: str,
+        generator: ThumbnailGenerator,
+        cache: ResizedImageCache,
+        render_timeout_seconds: float = 30,
+        registry: MetricsRegistry = metrics_registry
+    ):
+        """
+        Initialise le service de redimensionnement.
+        
+        Args:
+            root_dir: Dossier racine des uploads
+            generator: Pool de processus de rendu
+            cache: Cache disque des résultats
+            render_timeout_seconds: Attente maximale d'un rendu
+            registry: Registre de métriques
+        """
+        self._root_dir = os.path.abspath(root_dir)
+        self._generator = generator
+        self._cache = cache
+        self._render_timeout_seconds = render_timeout_seconds
+        self._single_flight: SingleFlight[str] = SingleFlight()
+        
+        self._requests = registry.counter(
+            'media_resize_requests_total',
+            "Requêtes de redimensionnement par résultat (hit, miss, coalesced)"
+        )
+        registry.gauge(
+            'media_resize_cache_hit_ratio',
+            "Part des requêtes servies par le cache disque",
+            callback=self.hit_ratio
+        )
+        registry.gauge(
+            'media_resize_cache_bytes',
+            "Taille totale du cache disque des images redimensionnées",
+            callback=lambda: self._cache.total_bytes
+        )
+        registry.gauge(
+            'media_resize_cache_evictions',
+            "Fichiers évincés du cache disque (processus courant)",
+            callback=lambda: self._cache.evictions
+        )
+    
+    @property
+    def is_available(self) -> bool:
+        return self._generator.is_available
+    
+    def hit_ratio(self) -> float:
+        hits = self._requests.value(result='hit')
+        total = hits + self._requests.value(result='miss') + self._requests.value(result='coalesced')
+        return hits / total if total else 0.0
+    
+    def cache_key(self, relative_path: str, request: ResizeRequest) -> str:
+        """
+        Clé de cache: empreinte du contenu + paramètres.
+        
+        Les fichiers adressés par contenu portent leur empreinte dans leur
+        nom; pour les anciens noms libres, chemin, date et taille en tiennent lieu.
+        """
+        stem, _ = os.path.splitext(os.path.basename(relative_path))
+        if len(stem) == 64 and all(c in '0123456789abcdef' for c in stem):
+            content_id = stem
+        else:
+            stat = os.stat(os.path.join(self._root_dir, relative_path))
+            content_id = hashlib.sha256(
+                f"{relative_path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')
+            ).hexdigest()
+        return f"{content_id}-{request.width or 0}x{request.height or 0}.{request.extension}"
+    
+    def resized_path(self, relative_path: str, request: ResizeRequest) -> str:
+        """
+        Retourne le fichier redimensionné, en le produisant au besoin.
+        
+        Args:
+            relative_path: Chemin de l'original, relatif au dossier racine
+            request: Paramètres normalisés
+        
+        Returns:
+            Chemin absolu du fichier en cache
+        
+        Raises:
+            FileNotFoundError: Si l'original n'existe pas
+            TimeoutError: Si le rendu dépasse render_timeout_seconds
+        """
+        key = self.cache_key(relative_path, request)
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._requests.inc(result='hit')
+            return cached
+        
+        path, shared = self._single_flight.do(key, lambda: self._render(key, relative_path, request))
+        self._requests.inc(result='coalesced' if shared else 'miss')
+        return path
+    
+    def _render(self, key: str, relative_path: str, request: ResizeRequest) -> str:
+        # Un autre worker a pu produire le fichier entre-temps
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        temp_path = self._cache.new_temp_path(key)
+        try:
+            future = self._generator.render(relative_path, request.box, request.output_format, temp_path)
+            future.result(timeout=self._render_timeout_seconds)
+            return self._cache.put(key, temp_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
@@ -0,0 +1,156 @@
+"""
+Module du cache disque des images redimensionnées à la demande.
+
+Cache LRU borné en octets. Les fichiers sont partagés par les workers
+(même dossier); chaque processus tient son propre index d'accès et adopte
+les fichiers produits par les autres au premier accès. Un fichier supprimé
+par un autre worker est simplement traité comme un défaut de cache.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResizedImageCache:
+    """
+    Cache LRU sur disque, clé → fichier.
+    
+    Les clés sont des noms de fichiers sûrs (empreinte du contenu +
+    paramètres), construits par l'appelant.
+    """
+    
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialise le cache et reconstruit l'index depuis le disque.
+        
+        Args:
+            cache_dir: Dossier du cache (créé au besoin)
+            max_bytes: Taille totale maximale des fichiers
+        """
+        if max_bytes < 1:
+            raise ValueError("La taille maximale du cache doit être positive")
+        
+        self._cache_dir = os.path.abspath(cache_dir)
+        self._max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, int]' = OrderedDict()
+        self._total_bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(self._cache_dir, exist_ok=True)
+        self._load_index()
+    
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+    
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+    
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def path_for(self, key: str) -> str:
+        """Chemin du fichier d'une clé (qu'il existe ou non)"""
+        return os.path.join(self._cache_dir, key[:2], key)
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retourne le fichier d'une clé et le marque comme récemment utilisé.
+        
+        Returns:
+            Chemin absolu du fichier, ou None (défaut de cache)
+        """
+        path = self.path_for(key)
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(key)
+            return None
+        
+        with self._lock:
+            if key not in self._entries:
+                # Produit par un autre worker: adopté dans l'index local
+                self._entries[key] = size
+                self._total_bytes += size
+            self._entries.move_to_end(key)
+        return path
+    
+    def put(self, key: str, source_path: str) -> str:
+        """
+        Range un fichier produit dans le cache (renommage atomique) puis
+        évince les entrées les moins récemment utilisées au-delà de la limite.
+        
+        Args:
+            key: Clé du fichier
+            source_path: Fichier produit, sur le même système de fichiers
+        
+        Returns:
+            Chemin absolu du fichier en cache
+        """
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(source_path, path)
+        size = os.stat(path).st_size
+        
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+        return path
+    
+    def new_temp_path(self, key: str) -> str:
+        """Chemin temporaire où produire le fichier d'une clé avant `put()`"""
+        return os.path.join(self._cache_dir, f".{key}.{os.getpid()}.{threading.get_ident()}.part")
+    
+    def _forget(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+    
+    def _evict(self) -> None:
+        """Supprime les entrées les plus anciennes (appelé sous verrou)"""
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._evictions += 1
+            try:
+                os.unlink(self.path_for(key))
+            except FileNotFoundError:
+                pass
+    
+    def _load_index(self) -> None:
+        """Reconstruit l'index au démarrage, du plus ancien au plus récent accès"""
+        found = []
+        for shard in os.listdir(self._cache_dir):
+            shard_dir = os.path.join(self._cache_dir, shard)
+            if shard.startswith('.') or not os.path.isdir(shard_dir):
+                continue
+            with os.scandir(shard_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        found.append((stat.st_mtime, entry.name, stat.st_size))
+        
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+        
+        with self._lock:
+            self._evict()
+        
+        if found:
+            logger.info(f"Cache d'images: {len(self._entries)} fichier(s), {self._total_bytes} octets")
@@ -0,0 +1,241 @@
+"""
+Module de génération des variantes redimensionnées des photos.
+
+Décoder et redimensionner une photo de téléphone prend des centaines de
+millisecondes de CPU: fait dans la requête, l'upload monopoliserait le
+worker. Les variantes sont donc produites dans un pool de processus, et
+l'annonce est retournée sans les attendre.
+
+Pillow est une dépendance optionnelle: sans elle, les variantes ne sont pas
+générées et l'original est servi partout.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    Image = None
+    ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+# Nom de la variante → boîte englobante (largeur, hauteur) en pixels
+DEFAULT_VARIANTS: Dict[str, Tuple[int, int]] = {
+    'thumbnail': (320, 320),
+    'medium': (1024, 1024),
+}
+
+
+def _render_variants(
+    root_dir: str,
+    relative_path: str,
+    variants: Dict[str, Tuple[int, int]],
+    quality: int
+) -> Dict[str, str]:
+    """
+    Exécuté dans un processus du pool: produit les variantes JPEG d'une photo.
+    
+    Le stockage étant adressé par contenu, une photo déjà envoyée pour une
+    autre annonce a déjà ses variantes: elles sont réutilisées sans décodage.
+    
+    Returns:
+        Nom de la variante → chemin relatif du fichier produit
+    """
+    source_path = os.path.join(root_dir, relative_path)
+    stem, _ = os.path.splitext(relative_path)
+    produced = {name: f"{stem}_{name}.jpg" for name in variants}
+    
+    if all(os.path.exists(os.path.join(root_dir, path)) for path in produced.values()):
+        return produced
+    
+    with Image.open(source_path) as original:
+        # Appliquer l'orientation EXIF (photos de téléphone) puis aplatir la transparence
+        image = ImageOps.exif_transpose(original).convert('RGB')
+    
+    for name, box in variants.items():
+        variant = image.copy()
+        variant.thumbnail(box, Image.Resampling.LANCZOS)
+        # Écriture puis renommage: un lecteur ne voit jamais de variante tronquée
+        variant_path = os.path.join(root_dir, produced[name])
+        partial_path = f"{variant_path}.{os.getpid()}.part"
+        variant.save(partial_path, 'JPEG', quality=quality, optimize=True, progressive=True)
+        os.replace(partial_path, variant_path)
+    
+    return produced
+
+
+# Format demandé → (format Pillow, mode de couleur)
+_OUTPUT_FORMATS = {
+    'jpeg': ('JPEG', 'RGB'),
+    'webp': ('WEBP', 'RGBA'),
+    'png': ('PNG', 'RGBA'),
+}
+
+
+def _render_resized(
+    root_dir: str,
+    relative_path: str,
+    box: Tuple[int, int],
+    output_format: str,
+    quality: int,
+    target_path: str
+) -> str:
+    """
+    Exécuté dans un processus du pool: produit une version redimensionnée
+    (jamais agrandie) d'une photo dans `target_path`.
+    """
+    pil_format, mode = _OUTPUT_FORMATS[output_format]
+    
+    with Image.open(os.path.join(root_dir, relative_path)) as original:
+        # JPEG: décodage directement à l'échelle réduite (boîte carrée: l'orientation EXIF
+        # peut encore échanger largeur et hauteur)
+        original.draft('RGB', (max(box), max(box)))
+        image = ImageOps.exif_transpose(original)
+        image.thumbnail(box, Image.Resampling.LANCZOS)
+        image = image.convert(mode if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+    
+    image.save(target_path, pil_format, quality=quality, optimize=True)
+    return target_path
+
+
+class ThumbnailGenerator:
+    """
+    Génère les variantes des photos dans un pool de processus.
+    
+    - Le pool est créé paresseusement, par processus (après le fork des
+      workers gunicorn).
+    - `submit()` ne bloque jamais: le callback reçoit les chemins produits
+      quand le travail est terminé, dans un thread du pool.
+    """
+    
+    def __init__(
+        self,
+        root_dir: str,
+        variants: Optional[Dict[str, Tuple[int, int]]] = None,
+        quality: int = 82,
+        max_workers: Optional[int] = None,
+        executor_factory: Optional[Callable[[], Executor]] = None
+    ):
+        """
+        Initialise le générateur.
+        
+        Args:
+            root_dir: Dossier racine des uploads
+            variants: Variantes à produire (DEFAULT_VARIANTS par défaut)
+            quality: Qualité JPEG des variantes
+            max_workers: Nombre de processus du pool (moitié des CPU par défaut)
+            executor_factory: Fabrique d'Executor (tests); ProcessPoolExecutor par défaut
+        """
+        self._root_dir = root_dir
+        self._variants = dict(variants or DEFAULT_VARIANTS)
+        self._quality = quality
+        self._max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self._executor_factory = executor_factory or self._create_process_pool
+        self._executor: Optional[Executor] = None
+        self._executor_pid: Optional[int] = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def is_available(self) -> bool:
+        """False si Pillow n'est pas installé"""
+        return Image is not None
+    
+    @property
+    def variant_names(self) -> Tuple[str, ...]:
+        return tuple(self._variants)
+    
+    def submit(
+        self,
+        relative_path: str,
+        on_done: Callable[[Dict[str, str]], None]
+    ) -> Optional[Future]:
+        """
+        Planifie la génération des variantes d'une photo.
+        
+        Args:
+            relative_path: Chemin de l'original, relatif au dossier racine
+            on_done: Appelé avec {variante: chemin} quand les variantes sont prêtes
+        
+        Returns:
+            Le Future du travail, ou None si Pillow n'est pas disponible
+        """
+        if not self.is_available:
+            logger.warning("Pillow absent: variantes non générées, l'original sera servi")
+            return None
+        
+        future = self._get_executor().submit(
+            _render_variants, self._root_dir, relative_path, self._variants, self._quality
+        )
+        future.add_done_callback(lambda done: self._complete(relative_path, done, on_done))
+        return future
+    
+    def render(
+        self,
+        relative_path: str,
+        box: Tuple[int, int],
+        output_format: str,
+        target_path: str
+    ) -> Future:
+        """
+        Planifie un redimensionnement à la demande dans le pool.
+        
+        Args:
+            relative_path: Chemin de l'original, relatif au dossier racine
+            box: Boîte englobante (largeur, hauteur)
+            output_format: 'jpeg', 'webp' ou 'png'
+            target_path: Fichier à produire
+            
+        Returns:
+            Future résolu avec target_path
+            
+        Raises:
+            RuntimeError: Si Pillow n'est pas disponible
+        """
+        if not self.is_available:
+            raise RuntimeError("Pillow n'est pas installé")
+        if output_format not in _OUTPUT_FORMATS:
+            raise ValueError(f"Format non supporté: {output_format}")
+        
+        return self._get_executor().submit(
+            _render_resized, self._root_dir, relative_path, box, output_format, self._quality, target_path
+        )
+    
+    def shutdown(self) -> None:
+        """Arrête le pool de processus (attend les travaux en cours)"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._executor_pid = None
+    
+    @staticmethod
+    def _complete(relative_path: str, future: Future, on_done: Callable[[Dict[str, str]], None]) -> None:
+        try:
+            on_done(future.result())
+        except Exception as e:
+            # Photo corrompue ou base indisponible: l'original reste servi
+            logger.error(f"Échec de la génération des variantes de {relative_path}: {str(e)}", exc_info=True)
+    
+    def _get_executor(self) -> Executor:
+        """Retourne le pool du processus courant (créé au premier appel)"""
+        pid = os.getpid()
+        if self._executor is not None and self._executor_pid == pid:
+            return self._executor
+        
+        with self._executor_lock:
+            if self._executor is None or self._executor_pid != pid:
+                self._executor = self._executor_factory()
+                self._executor_pid = pid
+            return self._executor
+    
+    def _create_process_pool(self) -> Executor:
+        # spawn: pas de fork d'un processus qui contient déjà des threads Flask
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
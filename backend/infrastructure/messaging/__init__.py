@@ -0,0 +1 @@
+"""Messagerie temps réel (pub/sub en processus)"""
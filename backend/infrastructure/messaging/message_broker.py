@@ -0,0 +1,193 @@
+"""
+Module de pub/sub en processus pour les événements de messagerie.
+
+Le chemin d'envoi d'un message publie dans le broker; chaque flux SSE
+ouvert s'y abonne pour son utilisateur. Le broker est local au worker:
+un client reconnecté sur un autre worker rattrape les messages manqués
+grâce à Last-Event-ID (relecture en base).
+"""
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BrokerEvent:
+    """
+    Événement diffusé à un abonné.
+    
+    Attributes:
+        event: Type d'événement SSE (ex: 'message', 'unread')
+        data: Contenu sérialisable en JSON
+        event_id: Identifiant SSE (message_id), None pour les événements d'état
+    """
+    
+    event: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    event_id: Optional[int] = None
+
+
+class Subscription:
+    """
+    Abonnement d'un flux SSE aux événements d'un utilisateur.
+    
+    La file est bornée: un client trop lent qui la remplit est marqué
+    `overflowed`; son flux doit alors être fermé pour qu'il se reconnecte
+    et relise les messages manqués depuis la base.
+    """
+    
+    def __init__(self, broker: 'MessageBroker', user_id: str, queue_size: int):
+        self._broker = broker
+        self._user_id = user_id
+        self._queue: "queue.Queue[BrokerEvent]" = queue.Queue(maxsize=queue_size)
+        self._overflowed = False
+        self._closed = False
+    
+    @property
+    def user_id(self) -> str:
+        return self._user_id
+    
+    @property
+    def overflowed(self) -> bool:
+        return self._overflowed
+    
+    def get(self, timeout: float) -> Optional[BrokerEvent]:
+        """
+        Attend le prochain événement.
+        
+        Args:
+            timeout: Délai maximal d'attente en secondes
+            
+        Returns:
+            L'événement, ou None si le délai est écoulé (heartbeat à envoyer)
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def close(self) -> None:
+        """Retire l'abonnement du broker (idempotent)"""
+        if not self._closed:
+            self._closed = True
+            self._broker._unsubscribe(self)
+    
+    def _offer(self, event: BrokerEvent) -> bool:
+        """Dépose un événement sans bloquer l'expéditeur"""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self._overflowed = True
+            return False
+    
+    def __enter__(self) -> 'Subscription':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class MessageBroker:
+    """
+    Broker pub/sub en processus, indexé par utilisateur.
+    
+    Chaque flux SSE occupe un thread du worker pendant toute sa durée:
+    le nombre d'abonnements simultanés est donc plafonné par worker
+    (ServiceOverloadedException au-delà, convertie en 503).
+    """
+    
+    def __init__(self, max_connections: int = 100, queue_size: int = 100):
+        """
+        Initialise le broker.
+        
+        Args:
+            max_connections: Nombre maximal de flux ouverts dans ce worker
+            queue_size: Taille de la file d'attente de chaque abonnement
+        """
+        if max_connections < 1:
+            raise ValueError("Le broker doit accepter au moins une connexion")
+        
+        self._max_connections = max_connections
+        self._queue_size = queue_size
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._connection_count = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def connection_count(self) -> int:
+        return self._connection_count
+    
+    @property
+    def max_connections(self) -> int:
+        return self._max_connections
+    
+    def subscribe(self, user_id: str) -> Subscription:
+        """
+        Ouvre un abonnement aux événements d'un utilisateur.
+        
+        Args:
+            user_id: ID de l'utilisateur
+            
+        Returns:
+            L'abonnement (à fermer quand le flux se termine)
+            
+        Raises:
+            ServiceOverloadedException: Si le plafond de connexions est atteint
+        """
+        user_id = str(user_id)
+        with self._lock:
+            if self._connection_count >= self._max_connections:
+                logger.warning("Plafond de flux temps réel atteint: connexion refusée")
+                raise ServiceOverloadedException(
+                    "Trop de connexions temps réel sur ce serveur, réessayez sous peu",
+                    retry_after=5
+                )
+            
+            subscription = Subscription(self, user_id, self._queue_size)
+            self._subscriptions.setdefault(user_id, []).append(subscription)
+            self._connection_count += 1
+            return subscription
+    
+    def publish(
+        self,
+        user_id: str,
+        event: str,
+        data: Dict[str, Any],
+        event_id: Optional[int] = None
+    ) -> int:
+        """
+        Diffuse un événement à tous les flux ouverts d'un utilisateur.
+        
+        Ne bloque jamais l'expéditeur: un abonné dont la file est pleine
+        est marqué en débordement.
+        
+        Args:
+            user_id: Destinataire
+            event: Type d'événement
+            data: Contenu de l'événement
+            event_id: Identifiant SSE (optionnel)
+            
+        Returns:
+            Nombre d'abonnements qui ont reçu l'événement
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(str(user_id), ()))
+        
+        broker_event = BrokerEvent(event=event, data=data, event_id=event_id)
+        return sum(1 for subscription in subscriptions if subscription._offer(broker_event))
+    
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            user_subscriptions = self._subscriptions.get(subscription.user_id)
+            if user_subscriptions and subscription in user_subscriptions:
+                user_subscriptions.remove(subscription)
+                self._connection_count -= 1
+                if not user_subscriptions:
+                    del self._subscriptions[subscription.user_id]
@@ -0,0 +1 @@
+"""Métriques de fonctionnement (format texte Prometheus)"""
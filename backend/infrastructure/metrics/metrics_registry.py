@@ -0,0 +1,143 @@
+"""
+Module du registre de métriques.
+
+Compteurs et jauges en mémoire, exposés au format texte de Prometheus par
+GET /metrics. Les valeurs sont propres au processus: avec plusieurs workers
+gunicorn, chaque scrape lit le worker qui répond (le label `pid` permet de
+les distinguer).
+"""
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def _label_set(labels: Dict[str, object]) -> LabelSet:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(label_set: LabelSet) -> str:
+    if not label_set:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in label_set
+    )
+    return '{' + pairs + '}'
+
+
+class _Metric:
+    """Base commune: nom, description et valeurs par ensemble de labels"""
+    
+    TYPE = 'untyped'
+    
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelSet, float] = {}
+        self._lock = threading.Lock()
+    
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_set(labels), 0.0)
+    
+    def samples(self) -> List[Tuple[LabelSet, float]]:
+        with self._lock:
+            return list(self._values.items())
+
+
+class Counter(_Metric):
+    """Valeur croissante (événements comptés depuis le démarrage)"""
+    
+    TYPE = 'counter'
+    
+    def inc(self, amount: float = 1, **labels) -> None:
+        """
+        Incrémente le compteur.
+        
+        Raises:
+            ValueError: Si amount est négatif
+        """
+        if amount < 0:
+            raise ValueError("Un compteur ne peut pas diminuer")
+        key = _label_set(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Valeur instantanée, fixée ou calculée à la lecture"""
+    
+    TYPE = 'gauge'
+    
+    def __init__(self, name: str, description: str, callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, description)
+        self._callback = callback
+    
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[_label_set(labels)] = float(value)
+    
+    def samples(self) -> List[Tuple[LabelSet, float]]:
+        if self._callback is not None:
+            return [((), float(self._callback()))]
+        return super().samples()
+
+
+class MetricsRegistry:
+    """
+    Registre des métriques d'un processus.
+    
+    `counter()` et `gauge()` retournent la métrique existante si le nom est
+    déjà enregistré: chaque module déclare ses métriques sans coordination.
+    """
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def counter(self, name: str, description: str) -> Counter:
+        return self._register(name, lambda: Counter(name, description), Counter)
+    
+    def gauge(self, name: str, description: str, callback: Optional[Callable[[], float]] = None) -> Gauge:
+        """
+        Déclare une jauge.
+        
+        Args:
+            name: Nom Prometheus
+            description: Texte HELP
+            callback: Fonction appelée à chaque lecture (remplace set())
+        """
+        return self._register(name, lambda: Gauge(name, description, callback), Gauge)
+    
+    def render(self) -> str:
+        """Retourne toutes les métriques au format texte Prometheus 0.0.4"""
+        pid = os.getpid()
+        lines = []
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for label_set, value in sorted(metric.samples()):
+                labels = _format_labels(label_set + (('pid', str(pid)),))
+                text = str(int(value)) if float(value).is_integer() else repr(float(value))
+                lines.append(f"{metric.name}{labels} {text}")
+        
+        return '\n'.join(lines) + '\n'
+    
+    def _register(self, name: str, factory: Callable[[], _Metric], expected_type: type):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            elif not isinstance(metric, expected_type):
+                raise ValueError(f"La métrique {name} existe déjà avec un autre type")
+            return metric
+
+
+# Registre du processus, partagé par tous les modules
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,67 @@
+"""
+Repository: InMemoryCategoryRepository
+Implémentation en mémoire du CategoryRepository (tests et développement).
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+from domain.category.category import Category
+from domain.category.category_repository import CategoryRepository
+
+# Mêmes lignes que database/dml (category_id, nom, parent)
+DEFAULT_CATEGORIES = (
+    Category(1, 'Livres & Cours', None, '📚', 'Manuels, notes de cours et livres universitaires'),
+    Category(2, 'Sciences', 1, '🔬', 'Livres de sciences et laboratoire'),
+    Category(3, 'Génie', 1, '⚙️', 'Manuels de génie et ingénierie'),
+    Category(4, 'Lettres & SHS', 1, '📖', 'Sciences humaines, littérature, histoire'),
+    Category(5, 'Électronique', None, '💻', 'Ordinateurs, tablettes, accessoires tech'),
+    Category(6, 'Calculatrices', 5, '🧮', 'Calculatrices graphiques et scientifiques'),
+    Category(7, 'Ordinateurs', 5, '🖥️', 'Laptops, desktops et composants'),
+    Category(8, 'Fournitures', None, '✏️', 'Cahiers, stylos, sacs à dos'),
+    Category(9, 'Mobilier', None, '🪑', 'Meubles pour appartement étudiant'),
+    Category(10, 'Location', None, '🏠', 'Sous-location logements, colocs'),
+    Category(11, 'Transport', None, '🚲', 'Vélos, voitures, transport local'),
+    Category(12, 'Billets & Événements', None, '🎫', 'Billets pour événements étudiants'),
+)
+
+
+class InMemoryCategoryRepository(CategoryRepository):
+    """
+    Stocke les catégories dans un dictionnaire indexé par ID.
+    
+    Initialisé avec les catégories de démonstration; la version augmente à
+    chaque écriture, comme les triggers de la migration 006.
+    """
+    
+    def __init__(self, categories: Optional[Iterable[Category]] = None):
+        self._categories: Dict[int, Category] = {}
+        self._version = 1
+        self._lock = threading.Lock()
+        
+        for category in (DEFAULT_CATEGORIES if categories is None else categories):
+            self._categories[category.category_id] = category
+    
+    def find_all(self) -> List[Category]:
+        with self._lock:
+            return list(self._categories.values())
+    
+    def get_version(self) -> int:
+        with self._lock:
+            return self._version
+    
+    def save(self, category: Category) -> None:
+        """Ajoute ou remplace une catégorie"""
+        with self._lock:
+            self._categories[category.category_id] = category
+            self._version += 1
+    
+    def delete(self, category_id: int) -> None:
+        """Supprime une catégorie; ses enfants deviennent des racines (ON DELETE SET NULL)"""
+        with self._lock:
+            if self._categories.pop(category_id, None) is None:
+                return
+            for child_id, child in list(self._categories.items()):
+                if child.parent_id == category_id:
+                    self._categories[child_id] = Category(
+                        child.category_id, child.name, None, child.icon, child.description
+                    )
+            self._version += 1
@@ -0,0 +1,73 @@
+"""
+Repository: InMemoryConversationRepository
+Implémentation en mémoire du ConversationRepository (tests et développement).
+"""
+import threading
+from typing import Dict, List, Optional, Tuple
+from domain.message.conversation import Conversation
+from domain.message.conversation_repository import ConversationRepository
+from domain.message.inbox_entry import InboxEntry
+
+
+class InMemoryConversationRepository(ConversationRepository):
+    """
+    Stocke les conversations dans un dictionnaire indexé par ID,
+    avec un index (listing_id, buyer_id) qui reproduit `unique_conversation`.
+    """
+    
+    def __init__(self):
+        self._conversations: Dict[int, Conversation] = {}
+        self._by_listing_and_buyer: Dict[Tuple[str, str], int] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def find_by_id(self, conversation_id: int) -> Optional[Conversation]:
+        with self._lock:
+            return self._conversations.get(conversation_id)
+    
+    def find_by_listing_and_buyer(self, listing_id: str, buyer_id: str) -> Optional[Conversation]:
+        with self._lock:
+            conversation_id = self._by_listing_and_buyer.get((str(listing_id), str(buyer_id)))
+            return self._conversations.get(conversation_id)
+    
+    def find_by_user(self, user_id: str) -> List[Conversation]:
+        """Retourne les conversations d'un utilisateur (acheteur ou vendeur)"""
+        with self._lock:
+            return [c for c in self._conversations.values() if c.involves(user_id)]
+    
+    def find_inbox(self, user_id: str, limit: int) -> List[InboxEntry]:
+        # Pas de profils ni de photos en mémoire: seuls les champs de la conversation
+        conversations = sorted(
+            self.find_by_user(user_id),
+            key=lambda c: (c.last_message_at, c.conversation_id),
+            reverse=True
+        )
+        return [InboxEntry(c, user_id) for c in conversations[:limit]]
+    
+    def get_or_create(self, conversation: Conversation) -> Conversation:
+        with self._lock:
+            existing_id = self._by_listing_and_buyer.get((conversation.listing_id, conversation.buyer_id))
+            if existing_id is not None:
+                return self._conversations[existing_id]
+            return self._insert(conversation)
+    
+    def save(self, conversation: Conversation) -> Conversation:
+        with self._lock:
+            if (conversation.listing_id, conversation.buyer_id) in self._by_listing_and_buyer:
+                raise ValueError("Une conversation existe déjà pour cette annonce et cet acheteur")
+            return self._insert(conversation)
+    
+    def _insert(self, conversation: Conversation) -> Conversation:
+        """Insère une conversation (verrou déjà acquis)"""
+        saved = Conversation(
+            listing_id=conversation.listing_id,
+            buyer_id=conversation.buyer_id,
+            seller_id=conversation.seller_id,
+            conversation_id=self._next_id,
+            last_message_at=conversation.last_message_at,
+            created_at=conversation.created_at
+        )
+        self._next_id += 1
+        self._conversations[saved.conversation_id] = saved
+        self._by_listing_and_buyer[(saved.listing_id, saved.buyer_id)] = saved.conversation_id
+        return saved
@@ -0,0 +1,63 @@
+"""
+Repository: InMemoryListingPictureRepository
+Implémentation en mémoire du ListingPictureRepository (tests et développement).
+"""
+import itertools
+import threading
+from typing import Dict, Iterable, List, Optional
+from domain.listing.listing_picture import ListingPicture
+from domain.listing.listing_picture_repository import ListingPictureRepository
+
+
+class InMemoryListingPictureRepository(ListingPictureRepository):
+    """
+    Stocke les photos dans un dictionnaire indexé par picture_id.
+    
+    `update_variants` est appelé depuis les threads du pool de miniatures:
+    toutes les opérations passent par le verrou.
+    """
+    
+    def __init__(self):
+        self._pictures: Dict[int, ListingPicture] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def save(self, picture: ListingPicture) -> ListingPicture:
+        with self._lock:
+            saved = picture.with_id(next(self._ids))
+            self._pictures[saved.picture_id] = saved
+            return saved
+    
+    def find_by_id(self, picture_id: int) -> Optional[ListingPicture]:
+        with self._lock:
+            return self._pictures.get(picture_id)
+    
+    def find_by_listing(self, listing_id: str) -> List[ListingPicture]:
+        with self._lock:
+            pictures = [p for p in self._pictures.values() if p.listing_id == listing_id]
+        return sorted(pictures, key=lambda p: (not p.is_cover, p.picture_id))
+    
+    def find_covers(self, listing_ids: Iterable[str]) -> Dict[str, ListingPicture]:
+        wanted = set(listing_ids)
+        covers: Dict[str, ListingPicture] = {}
+        with self._lock:
+            # Parcours par picture_id croissant: la première couverture gagne, comme en SQL
+            for picture in self._pictures.values():
+                if picture.is_cover and picture.listing_id in wanted:
+                    covers.setdefault(picture.listing_id, picture)
+        return covers
+    
+    def update_variants(self, picture_id: int, thumbnail_path: str, medium_path: str) -> None:
+        with self._lock:
+            picture = self._pictures.get(picture_id)
+            if picture is not None:
+                picture.attach_variants(thumbnail_path, medium_path)
+    
+    def count_references(self, file_paths: Iterable[str]) -> Dict[str, int]:
+        wanted = set(file_paths)
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for picture in self._pictures.values():
+                if picture.file_path in wanted:
+                    counts[picture.file_path] = counts.get(picture.file_path, 0) + 1
+        return counts
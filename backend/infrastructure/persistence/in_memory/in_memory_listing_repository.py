@@ -0,0 +1,66 @@
+"""
+Repository: InMemoryListingRepository
+Implémentation en mémoire du ListingRepository (tests et développement).
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+from domain.listing.listing import Listing
+from domain.listing.listing_repository import ListingRepository
+
+
+class InMemoryListingRepository(ListingRepository):
+    """
+    Stocke les annonces dans un dictionnaire indexé par ID.
+    
+    L'ordre d'insertion est conservé (les dictionnaires Python sont
+    ordonnés): find_all retourne les annonces dans l'ordre de création.
+    """
+    
+    def __init__(self):
+        self._listings: Dict[str, Listing] = {}
+        self._lock = threading.Lock()
+    
+    def find_by_id(self, listing_id: str) -> Optional[Listing]:
+        with self._lock:
+            return self._listings.get(listing_id)
+    
+    def find_all(self) -> List[Listing]:
+        with self._lock:
+            return list(self._listings.values())
+    
+    def find_by_seller_id(self, seller_id: str) -> List[Listing]:
+        return [listing for listing in self.find_all() if listing.seller_id == seller_id]
+    
+    def find_by_category(self, category: str) -> List[Listing]:
+        return [listing for listing in self.find_all() if listing.category == category]
+    
+    def find_by_categories(self, categories: Iterable[str]) -> List[Listing]:
+        wanted = set(categories)
+        return [listing for listing in self.find_all() if listing.category in wanted]
+    
+    def search(self, query: str) -> List[Listing]:
+        terms = query.lower().split()
+        return [
+            listing for listing in self.find_all()
+            if all(
+                term in listing.title.lower() or term in listing.description.lower()
+                for term in terms
+            )
+        ]
+    
+    def save(self, listing: Listing) -> None:
+        with self._lock:
+            self._listings[listing.listing_id] = listing
+    
+    def delete(self, listing: Listing) -> None:
+        with self._lock:
+            self._listings.pop(listing.listing_id, None)
+    
+    def exists(self, listing_id: str) -> bool:
+        with self._lock:
+            return listing_id in self._listings
+    
+    def count(self) -> int:
+        """Retourne le nombre d'annonces (utilisé par /listings/health)"""
+        with self._lock:
+            return len(self._listings)
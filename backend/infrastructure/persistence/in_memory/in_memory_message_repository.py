@@ -0,0 +1,107 @@
+"""
+Repository: InMemoryMessageRepository
+Implémentation en mémoire du MessageRepository (tests et développement).
+"""
+import bisect
+import threading
+from typing import Dict, List, Optional
+from domain.message.conversation import Conversation
+from domain.message.message import Message
+from domain.message.message_repository import MessageRepository
+from infrastructure.persistence.in_memory.in_memory_conversation_repository import InMemoryConversationRepository
+
+
+class InMemoryMessageRepository(MessageRepository):
+    """
+    Stocke les messages dans une liste triée par message_id, plus une liste
+    par conversation (l'équivalent de l'index (conversation_id, message_id)).
+    
+    Le repository des conversations sert à déterminer les destinataires,
+    comme la jointure `messages` ⋈ `conversations` côté MySQL.
+    """
+    
+    def __init__(self, conversation_repository: InMemoryConversationRepository):
+        self._conversation_repository = conversation_repository
+        self._messages: List[Message] = []
+        self._by_conversation: Dict[int, List[Message]] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def save(self, message: Message) -> Message:
+        conversation = self._conversation_repository.find_by_id(message.conversation_id)
+        
+        with self._lock:
+            saved = message.with_id(self._next_id)
+            self._next_id += 1
+            self._messages.append(saved)
+            self._by_conversation.setdefault(saved.conversation_id, []).append(saved)
+            if conversation is not None:
+                conversation.record_message(saved)
+        return saved
+    
+    def save_with_conversation(self, conversation: Conversation, sender_id: str, content: str) -> Message:
+        existing = self._conversation_repository.get_or_create(conversation)
+        return self.save(Message(
+            conversation_id=existing.conversation_id,
+            sender_id=sender_id,
+            content=content
+        ))
+    
+    def find_by_conversation(
+        self,
+        conversation_id: int,
+        limit: int,
+        before_message_id: Optional[int] = None,
+        after_message_id: Optional[int] = None
+    ) -> List[Message]:
+        with self._lock:
+            thread = self._by_conversation.get(conversation_id, [])
+            
+            if after_message_id is not None:
+                start = bisect.bisect_right(thread, after_message_id, key=lambda m: m.message_id)
+                return thread[start:start + limit]
+            
+            end = len(thread)
+            if before_message_id is not None:
+                end = bisect.bisect_left(thread, before_message_id, key=lambda m: m.message_id)
+            return thread[max(0, end - limit):end]
+    
+    def find_received_after(self, user_id: str, after_message_id: int, limit: int) -> List[Message]:
+        received = []
+        for message in self._snapshot():
+            if message.message_id <= after_message_id:
+                continue
+            if self._is_received_by(message, user_id):
+                received.append(message)
+                if len(received) >= limit:
+                    break
+        return received
+    
+    def count_unread_for_user(self, user_id: str) -> int:
+        return sum(
+            conversation.unread_count_for(user_id)
+            for conversation in self._conversation_repository.find_by_user(user_id)
+        )
+    
+    def mark_conversation_read(self, conversation_id: int, reader_id: str) -> int:
+        conversation = self._conversation_repository.find_by_id(conversation_id)
+        marked = 0
+        
+        with self._lock:
+            for message in self._by_conversation.get(conversation_id, []):
+                if message.sender_id != str(reader_id) and not message.is_read:
+                    message.mark_as_read()
+                    marked += 1
+            if conversation is not None:
+                conversation.mark_read_by(reader_id)
+        return marked
+    
+    def _snapshot(self) -> List[Message]:
+        with self._lock:
+            return list(self._messages)
+    
+    def _is_received_by(self, message: Message, user_id: str) -> bool:
+        if message.sender_id == str(user_id):
+            return False
+        conversation = self._conversation_repository.find_by_id(message.conversation_id)
+        return conversation is not None and conversation.involves(user_id)
@@ -0,0 +1,68 @@
+"""
+Repository: InMemorySessionRepository
+Implémentation en mémoire du SessionRepository (tests et développement).
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from domain.auth.session import Session
+from domain.auth.session_repository import SessionRepository
+
+
+class InMemorySessionRepository(SessionRepository):
+    """
+    Stocke les sessions dans un dictionnaire indexé par jeton.
+    
+    Thread-safe: Flask sert les requêtes dans plusieurs threads.
+    """
+    
+    def __init__(self):
+        self._sessions: Dict[str, Session] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def find_active_by_token(self, token: str) -> Optional[Session]:
+        with self._lock:
+            session = self._sessions.get(token)
+        
+        if session is None or not session.is_active():
+            return None
+        return session
+    
+    def save(self, session: Session) -> None:
+        with self._lock:
+            if session.session_id is None:
+                session = Session(
+                    user_id=session.user_id,
+                    token=session.token,
+                    expires_at=session.expires_at,
+                    session_id=self._next_id,
+                    token_type=session.token_type,
+                    used_at=session.used_at,
+                    created_at=session.created_at
+                )
+                self._next_id += 1
+            self._sessions[session.token] = session
+    
+    def revoke(self, token: str) -> bool:
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None or session.used_at is not None:
+                return False
+            session.revoke()
+            return True
+    
+    def revoke_all_for_user(self, user_id: str) -> int:
+        now = datetime.now()
+        revoked = 0
+        with self._lock:
+            for session in self._sessions.values():
+                if session.user_id == str(user_id) and session.used_at is None:
+                    session.revoke(now)
+                    revoked += 1
+        return revoked
+    
+    def count(self) -> int:
+        """Retourne le nombre de sessions stockées (actives ou non)"""
+        with self._lock:
+            return len(self._sessions)
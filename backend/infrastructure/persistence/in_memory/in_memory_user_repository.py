@@ -0,0 +1,51 @@
+"""
+Repository: InMemoryUserRepository
+Implémentation en mémoire du UserRepository (tests et développement).
+"""
+import threading
+from typing import Dict, Optional
+from domain.user.user import User
+from domain.user.user_repository import UserRepository
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Stocke les utilisateurs dans un dictionnaire indexé par IDUL.
+    """
+    
+    def __init__(self):
+        self._users: Dict[str, User] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def find_by_idul(self, idul: str) -> Optional[User]:
+        with self._lock:
+            return self._users.get(idul.strip().lower())
+    
+    def save(self, user: User) -> User:
+        with self._lock:
+            saved = User(
+                idul=user.idul,
+                password_hash=user.password_hash,
+                email=user.email,
+                user_id=user.user_id or str(self._next_id),
+                is_verified=user.is_verified,
+                is_active=user.is_active,
+                created_at=user.created_at
+            )
+            if user.user_id is None:
+                self._next_id += 1
+            self._users[saved.idul] = saved
+            return saved
+    
+    def update_password_hash(self, user_id: str, password_hash: str) -> None:
+        with self._lock:
+            for user in self._users.values():
+                if user.user_id == str(user_id):
+                    user.change_password_hash(password_hash)
+                    return
+    
+    def count(self) -> int:
+        """Retourne le nombre d'utilisateurs"""
+        with self._lock:
+            return len(self._users)
@@ -3,14 +3,18 @@ Module du pattern Repository de base pour MySQL.
 Fournit une classe abstraite BaseMySQLRepository pour standardiser l'accès aux données.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Callable, Optional, List, Dict, Any, Tuple, TypeVar
 import mysql.connector
 from mysql.connector.cursor import MySQLCursor
 
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.persistence.mysql.row_mapper import RowMapper
 from domain.exceptions.database_exception import DatabaseException
 
 
+T = TypeVar('T')
+
+
 class BaseMySQLRepository(ABC):
     """
     Classe de base abstraite pour tous les repositories MySQL.
@@ -19,6 +23,12 @@ class BaseMySQLRepository(ABC):
     et gérer les transactions. Elle suit le pattern Template Method pour
     standardiser les opérations CRUD.
     
+    Les requêtes simples (_execute_insert, _fetch_one, _fetch_all) utilisent
+    le curseur préparé de la requête, gardé par la connexion: le texte SQL
+    doit être constant (les valeurs passent par `params`), sans quoi chaque
+    variante occupe une place du cache. _execute_query rend son curseur à
+    l'appelant: c'est un curseur ordinaire, hors du cache.
+    
     Attributes:
         _connection: Instance de DatabaseConnection injectée
     """
@@ -48,17 +58,19 @@ class BaseMySQLRepository(ABC):
             params: Paramètres pour la requête (optionnel)
             
         Returns:
-            Le curseur contenant les résultats
+            Le curseur contenant les résultats (à fermer par l'appelant)
             
         Raises:
             DatabaseException: Si une erreur SQL survient
         """
         cursor = None
         try:
+            # Curseur ordinaire: un curseur préparé non rendu par l'appelant resterait hors du cache
             cursor = self._connection.get_cursor()
             cursor.execute(query, params)
             return cursor
         except mysql.connector.Error as e:
+            self._connection.handle_error(e)
             raise DatabaseException(
                 f"Échec de l'exécution de la requête: {str(e)}",
                 original_error=e
@@ -92,6 +104,7 @@ class BaseMySQLRepository(ABC):
             self._connection.commit()
             return cursor.rowcount
         except mysql.connector.Error as e:
+            self._connection.handle_error(e)
             self._connection.rollback()
             raise DatabaseException(
                 f"Échec de l'exécution batch: {str(e)}",
@@ -104,42 +117,37 @@ class BaseMySQLRepository(ABC):
                 except Exception:
                     pass
     
-    def _fetch_one(
+    def _execute_insert(
         self, 
         query: str, 
         params: Optional[Tuple] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> int:
         """
-        Récupère un seul résultat de la requête.
+        Exécute un INSERT et retourne l'identifiant AUTO_INCREMENT généré.
         
-        Gère automatiquement le curseur et retourne le résultat
-        sous forme de dictionnaire.
+        Cette méthode gère la transaction (commit/rollback) comme _execute_many.
         
         Args:
-            query: Requête SQL SELECT
+            query: Requête INSERT à exécuter
             params: Paramètres pour la requête (optionnel)
             
         Returns:
-            Dictionnaire représentant l'enregistrement, ou None si pas trouvé
+            L'identifiant de la ligne insérée (cursor.lastrowid)
             
         Raises:
             DatabaseException: Si une erreur SQL survient
         """
         cursor = None
         try:
-            cursor = self._connection.get_cursor()
+            cursor = self._connection.get_cursor(query)
             cursor.execute(query, params)
-            row = cursor.fetchone()
-            
-            if row is None:
-                return None
-            
-            # Convertir en dictionnaire avec les noms de colonnes
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
+            self._connection.commit()
+            return cursor.lastrowid
         except mysql.connector.Error as e:
+            self._connection.handle_error(e)
+            self._connection.rollback()
             raise DatabaseException(
-                f"Échec de la récupération d'un enregistrement: {str(e)}",
+                f"Échec de l'insertion: {str(e)}",
                 original_error=e
             )
         finally:
@@ -149,6 +157,37 @@ class BaseMySQLRepository(ABC):
                 except Exception:
                     pass
     
+    def _fetch_one(
+        self, 
+        query: str, 
+        params: Optional[Tuple] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Récupère un seul résultat de la requête.
+        
+        Gère automatiquement le curseur et retourne le résultat
+        sous forme de dictionnaire.
+        
+        Args:
+            query: Requête SQL SELECT
+            params: Paramètres pour la requête (optionnel)
+            
+        Returns:
+            Dictionnaire représentant l'enregistrement, ou None si pas trouvé
+            
+        Raises:
+            DatabaseException: Si une erreur SQL survient
+        """
+        def consume(cursor: MySQLCursor) -> Optional[Dict[str, Any]]:
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            # Convertir en dictionnaire avec les noms de colonnes
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, row))
+        
+        return self._read(query, params, consume, "Échec de la récupération d'un enregistrement")
+    
     def _fetch_all(
         self, 
         query: str, 
@@ -170,29 +209,109 @@ class BaseMySQLRepository(ABC):
         Raises:
             DatabaseException: Si une erreur SQL survient
         """
-        cursor = None
-        try:
-            cursor = self._connection.get_cursor()
-            cursor.execute(query, params)
+        def consume(cursor: MySQLCursor) -> List[Dict[str, Any]]:
             rows = cursor.fetchall()
-            
             if not rows:
                 return []
-            
             # Convertir en liste de dictionnaires avec les noms de colonnes
             columns = [desc[0] for desc in cursor.description]
             return [dict(zip(columns, row)) for row in rows]
-        except mysql.connector.Error as e:
-            raise DatabaseException(
-                f"Échec de la récupération des enregistrements: {str(e)}",
-                original_error=e
-            )
-        finally:
-            if cursor is not None:
-                try:
-                    cursor.close()
-                except Exception:
-                    pass
+        
+        return self._read(query, params, consume, "Échec de la récupération des enregistrements")
+    
+    def _fetch_one_as(
+        self,
+        mapper: RowMapper[T],
+        query: str,
+        params: Optional[Tuple] = None
+    ) -> Optional[T]:
+        """
+        Récupère un seul résultat, construit directement par le RowMapper.
+        
+        Args:
+            mapper: Mappage compilé des colonnes vers l'entité
+            query: Requête SQL SELECT
+            params: Paramètres pour la requête (optionnel)
+            
+        Returns:
+            L'entité, ou None si pas trouvé
+            
+        Raises:
+            DatabaseException: Si une erreur SQL survient
+        """
+        def consume(cursor: MySQLCursor) -> Optional[T]:
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return mapper.compiled(cursor.description)(row)
+        
+        return self._read(query, params, consume, "Échec de la récupération d'un enregistrement")
+    
+    def _fetch_all_as(
+        self,
+        mapper: RowMapper[T],
+        query: str,
+        params: Optional[Tuple] = None
+    ) -> List[T]:
+        """
+        Récupère tous les résultats, construits directement par le RowMapper.
+        
+        Les tuples du curseur vont au constructeur sans dictionnaire
+        intermédiaire (voir row_mapper.py).
+        
+        Args:
+            mapper: Mappage compilé des colonnes vers l'entité
+            query: Requête SQL SELECT
+            params: Paramètres pour la requête (optionnel)
+            
+        Returns:
+            Liste des entités
+            
+        Raises:
+            DatabaseException: Si une erreur SQL survient
+        """
+        def consume(cursor: MySQLCursor) -> List[T]:
+            return mapper.map_rows(cursor.description, cursor.fetchall())
+        
+        return self._read(query, params, consume, "Échec de la récupération des enregistrements")
+    
+    def _read(
+        self,
+        query: str,
+        params: Optional[Tuple],
+        consume: Callable[[MySQLCursor], Any],
+        failure_message: str
+    ) -> Any:
+        """
+        Exécute une lecture, rejouée une fois si la connexion était coupée.
+        
+        Une lecture est idempotente: après une erreur 2006/2013, la connexion
+        est rouverte et la requête relancée, si la transaction en cours
+        n'avait rien d'autre à perdre (voir DatabaseConnection.recover_read()).
+        
+        Raises:
+            DatabaseException: Si une erreur SQL survient (ou persiste après reconnexion)
+        """
+        for attempt in range(2):
+            cursor = None
+            try:
+                cursor = self._connection.get_cursor(query)
+                cursor.execute(query, params)
+                return consume(cursor)
+            except mysql.connector.Error as e:
+                if attempt == 0 and DatabaseConnection.is_connection_lost(e) and self._connection.recover_read(e):
+                    continue
+                self._connection.handle_error(e)
+                raise DatabaseException(
+                    f"{failure_message}: {str(e)}",
+                    original_error=e
+                )
+            finally:
+                if cursor is not None:
+                    try:
+                        cursor.close()
+                    except Exception:
+                        pass
     
     @abstractmethod
     def _get_table_name(self) -> str:
@@ -0,0 +1,42 @@
+"""
+Repository: MySQLCategoryRepository
+Implémentation MySQL du CategoryRepository (table `categories`).
+"""
+from typing import Any, Dict, List
+
+from domain.category.category import Category
+from domain.category.category_repository import CategoryRepository
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+class MySQLCategoryRepository(BaseMySQLRepository, CategoryRepository):
+    """
+    Accès à la table `categories`.
+    
+    La version est tenue par des triggers sur `categories` (voir
+    infrastructure/database/migrations/006_category_tree_version.sql):
+    vérifier si l'arbre a changé est une lecture d'une ligne par clé.
+    """
+    
+    _SELECT_ALL = (
+        "SELECT category_id, name, icon, parent_id, description FROM categories "
+        "ORDER BY category_id"
+    )
+    
+    _ROW_MAPPER = RowMapper(Category, 'category_id', 'name', 'parent_id', 'icon', 'description')
+    
+    _SELECT_VERSION = "SELECT version FROM category_tree_version WHERE id = 1"
+    
+    def find_all(self) -> List[Category]:
+        return self._fetch_all_as(self._ROW_MAPPER, self._SELECT_ALL)
+    
+    def get_version(self) -> int:
+        row = self._fetch_one(self._SELECT_VERSION)
+        return int(row['version']) if row else 0
+    
+    def _get_table_name(self) -> str:
+        return "categories"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> Category:
+        return self._ROW_MAPPER.from_dict(data)
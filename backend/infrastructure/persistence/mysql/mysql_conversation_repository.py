@@ -0,0 +1,112 @@
+"""
+Repository: MySQLConversationRepository
+Implémentation MySQL du ConversationRepository (table `conversations`).
+"""
+from typing import Any, Dict, List, Optional
+
+from domain.message.conversation import Conversation
+from domain.message.conversation_repository import ConversationRepository
+from domain.message.inbox_entry import InboxEntry
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+def _as_count(value: Any) -> int:
+    return int(value or 0)
+
+
+class MySQLConversationRepository(BaseMySQLRepository, ConversationRepository):
+    """
+    Accès à la table `conversations`.
+    """
+    
+    _COLUMNS = (
+        "conversation_id, listing_id, buyer_id, seller_id, last_message_at, created_at, "
+        "last_message_id, last_message_preview, last_sender_id, "
+        "buyer_unread_count, seller_unread_count"
+    )
+    
+    _ROW_MAPPER = RowMapper(
+        Conversation,
+        'conversation_id', ('listing_id', str), ('buyer_id', str), ('seller_id', str),
+        'last_message_at', 'created_at', 'last_message_id', 'last_message_preview', 'last_sender_id',
+        ('buyer_unread_count', _as_count), ('seller_unread_count', _as_count)
+    )
+    
+    _SELECT_BY_ID = f"SELECT {_COLUMNS} FROM conversations WHERE conversation_id = %s"
+    
+    # Utilise la contrainte unique_conversation (listing_id, buyer_id)
+    _SELECT_BY_LISTING_AND_BUYER = (
+        f"SELECT {_COLUMNS} FROM conversations WHERE listing_id = %s AND buyer_id = %s"
+    )
+    
+    # Boîte de réception en une requête: chaque branche parcourt un index
+    # (buyer_id|seller_id, last_message_at) déjà trié et s'arrête à `limit`;
+    # profil et photo de couverture sont des recherches par clé, ligne à ligne
+    # (miniature de la couverture, sinon l'original tant qu'elle n'est pas prête).
+    # Voir infrastructure/database/migrations/001_conversation_inbox.sql et 004.
+    _SELECT_INBOX = (
+        "SELECT inbox.*, up.username AS other_party_username, "
+        "(SELECT COALESCE(lp.thumbnail_path, lp.file_path) FROM listing_pictures lp "
+        " WHERE lp.listing_id = inbox.listing_id AND lp.is_cover = TRUE "
+        " ORDER BY lp.picture_id LIMIT 1) AS cover_picture_path "
+        "FROM ("
+        f" (SELECT {_COLUMNS}, seller_id AS other_party_id FROM conversations "
+        "  WHERE buyer_id = %s ORDER BY last_message_at DESC LIMIT %s)"
+        " UNION ALL"
+        f" (SELECT {_COLUMNS}, buyer_id AS other_party_id FROM conversations "
+        "  WHERE seller_id = %s ORDER BY last_message_at DESC LIMIT %s)"
+        ") AS inbox "
+        "LEFT JOIN users_profiles up ON up.profile_id = inbox.other_party_id "
+        "ORDER BY inbox.last_message_at DESC, inbox.conversation_id DESC "
+        "LIMIT %s"
+    )
+    
+    _INSERT = "INSERT INTO conversations (listing_id, buyer_id, seller_id) VALUES (%s, %s, %s)"
+    
+    # Sur doublon, LAST_INSERT_ID(conversation_id) fait remonter l'ID existant
+    # dans lastrowid: pas de SELECT préalable, pas de course entre deux créations.
+    _UPSERT = (
+        f"{_INSERT} "
+        "ON DUPLICATE KEY UPDATE conversation_id = LAST_INSERT_ID(conversation_id)"
+    )
+    
+    def find_by_id(self, conversation_id: int) -> Optional[Conversation]:
+        return self._fetch_one_as(self._ROW_MAPPER, self._SELECT_BY_ID, (conversation_id,))
+    
+    def find_by_listing_and_buyer(self, listing_id: str, buyer_id: str) -> Optional[Conversation]:
+        return self._fetch_one_as(
+            self._ROW_MAPPER, self._SELECT_BY_LISTING_AND_BUYER, (listing_id, buyer_id)
+        )
+    
+    def find_inbox(self, user_id: str, limit: int) -> List[InboxEntry]:
+        rows = self._fetch_all(self._SELECT_INBOX, (user_id, limit, user_id, limit, limit))
+        return [
+            InboxEntry(
+                self._map_to_entity(row),
+                user_id,
+                other_party_username=row.get('other_party_username'),
+                cover_picture_path=row.get('cover_picture_path')
+            )
+            for row in rows
+        ]
+    
+    def get_or_create(self, conversation: Conversation) -> Conversation:
+        conversation_id = self._execute_insert(
+            self._UPSERT,
+            (conversation.listing_id, conversation.buyer_id, conversation.seller_id)
+        )
+        return self.find_by_id(conversation_id)
+    
+    def save(self, conversation: Conversation) -> Conversation:
+        conversation_id = self._execute_insert(
+            self._INSERT,
+            (conversation.listing_id, conversation.buyer_id, conversation.seller_id)
+        )
+        return self.find_by_id(conversation_id)
+    
+    def _get_table_name(self) -> str:
+        return "conversations"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> Conversation:
+        return self._ROW_MAPPER.from_dict(data)
@@ -0,0 +1,99 @@
+"""
+Repository: MySQLListingPictureRepository
+Implémentation MySQL du ListingPictureRepository (table `listing_pictures`).
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from domain.listing.listing_picture import ListingPicture
+from domain.listing.listing_picture_repository import ListingPictureRepository
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+class MySQLListingPictureRepository(BaseMySQLRepository, ListingPictureRepository):
+    """
+    Accès à la table `listing_pictures`.
+    
+    Colonnes thumbnail_path / medium_path: voir
+    infrastructure/database/migrations/004_listing_picture_variants.sql.
+    """
+    
+    _COLUMNS = "picture_id, listing_id, file_path, is_cover, thumbnail_path, medium_path, created_at"
+    
+    _ROW_MAPPER = RowMapper(
+        ListingPicture,
+        'picture_id', ('listing_id', str), 'file_path', ('is_cover', bool),
+        'thumbnail_path', 'medium_path', 'created_at'
+    )
+    
+    _INSERT = "INSERT INTO listing_pictures (listing_id, file_path, is_cover) VALUES (%s, %s, %s)"
+    
+    _SELECT_BY_ID = f"SELECT {_COLUMNS} FROM listing_pictures WHERE picture_id = %s"
+    
+    _SELECT_BY_LISTING = (
+        f"SELECT {_COLUMNS} FROM listing_pictures WHERE listing_id = %s "
+        "ORDER BY is_cover DESC, picture_id"
+    )
+    
+    # Une page du catalogue = une requête: chaque annonce est une recherche
+    # dans l'index (listing_id, is_cover); la première couverture gagne.
+    _SELECT_COVERS = (
+        f"SELECT {_COLUMNS} FROM listing_pictures "
+        "WHERE is_cover = TRUE AND listing_id IN ({placeholders}) "
+        "ORDER BY picture_id"
+    )
+    
+    # Compteur de références du stockage adressé par contenu (index idx_file_path,
+    # migration 005): un lot de fichiers candidats au ramasse-miettes par requête
+    _COUNT_REFERENCES = (
+        "SELECT file_path, COUNT(*) AS reference_count FROM listing_pictures "
+        "WHERE file_path IN ({placeholders}) GROUP BY file_path"
+    )
+    
+    _UPDATE_VARIANTS = (
+        "UPDATE listing_pictures SET thumbnail_path = %s, medium_path = %s WHERE picture_id = %s"
+    )
+    
+    def save(self, picture: ListingPicture) -> ListingPicture:
+        picture_id = self._execute_insert(
+            self._INSERT,
+            (picture.listing_id, picture.file_path, picture.is_cover)
+        )
+        return picture.with_id(picture_id)
+    
+    def find_by_id(self, picture_id: int) -> Optional[ListingPicture]:
+        return self._fetch_one_as(self._ROW_MAPPER, self._SELECT_BY_ID, (picture_id,))
+    
+    def find_by_listing(self, listing_id: str) -> List[ListingPicture]:
+        return self._fetch_all_as(self._ROW_MAPPER, self._SELECT_BY_LISTING, (listing_id,))
+    
+    def find_covers(self, listing_ids: Iterable[str]) -> Dict[str, ListingPicture]:
+        ids = list(dict.fromkeys(listing_ids))
+        if not ids:
+            return {}
+        
+        query = self._SELECT_COVERS.format(placeholders=", ".join(["%s"] * len(ids)))
+        covers: Dict[str, ListingPicture] = {}
+        for picture in self._fetch_all_as(self._ROW_MAPPER, query, tuple(ids)):
+            covers.setdefault(picture.listing_id, picture)
+        return covers
+    
+    def update_variants(self, picture_id: int, thumbnail_path: str, medium_path: str) -> None:
+        self._execute_many(self._UPDATE_VARIANTS, [(thumbnail_path, medium_path, picture_id)])
+    
+    def count_references(self, file_paths: Iterable[str]) -> Dict[str, int]:
+        paths = list(dict.fromkeys(file_paths))
+        if not paths:
+            return {}
+        
+        query = self._COUNT_REFERENCES.format(placeholders=", ".join(["%s"] * len(paths)))
+        return {
+            row['file_path']: int(row['reference_count'])
+            for row in self._fetch_all(query, tuple(paths))
+        }
+    
+    def _get_table_name(self) -> str:
+        return "listing_pictures"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> ListingPicture:
+        return self._ROW_MAPPER.from_dict(data)
@@ -0,0 +1,208 @@
+"""
+Repository: MySQLMessageRepository
+Implémentation MySQL du MessageRepository (table `messages`).
+"""
+from typing import Any, Dict, List, Optional
+
+import mysql.connector
+
+from domain.exceptions.database_exception import DatabaseException
+from domain.message.conversation import Conversation
+from domain.message.message import Message
+from domain.message.message_repository import MessageRepository
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+class MySQLMessageRepository(BaseMySQLRepository, MessageRepository):
+    """
+    Accès à la table `messages`.
+    """
+    
+    _COLUMNS = "m.message_id, m.conversation_id, m.sender_id, m.content, m.is_read, m.created_at"
+    
+    _ROW_MAPPER = RowMapper(
+        Message,
+        'message_id', 'conversation_id', ('sender_id', str), 'content', ('is_read', bool), 'created_at'
+    )
+    
+    # Envoi en un seul appel: la procédure SendMessage (migrations 002, 007)
+    # crée au besoin la conversation (INSERT ... ON DUPLICATE KEY UPDATE sur
+    # unique_conversation), insère le message et met à jour l'aperçu et le
+    # compteur du destinataire dans la transaction de l'appelant.
+    # CALL direct plutôt que cursor.callproc(), qui ajoute un SET par appel.
+    _CALL_SEND_MESSAGE = "CALL SendMessage(%s, %s, %s, %s, %s, %s, %s)"
+    
+    # Pagination par curseur: chaque page est un parcours borné de l'index
+    # (conversation_id, message_id) (migration 003), sans OFFSET ni tri.
+    # Les pages « récentes » et « avant » lisent l'index à rebours.
+    _SELECT_LATEST = (
+        f"SELECT {_COLUMNS} FROM messages m "
+        "WHERE m.conversation_id = %s "
+        "ORDER BY m.message_id DESC LIMIT %s"
+    )
+    
+    _SELECT_BEFORE = (
+        f"SELECT {_COLUMNS} FROM messages m "
+        "WHERE m.conversation_id = %s AND m.message_id < %s "
+        "ORDER BY m.message_id DESC LIMIT %s"
+    )
+    
+    _SELECT_AFTER = (
+        f"SELECT {_COLUMNS} FROM messages m "
+        "WHERE m.conversation_id = %s AND m.message_id > %s "
+        "ORDER BY m.message_id ASC LIMIT %s"
+    )
+    
+    # Messages reçus: l'utilisateur participe à la conversation sans être l'expéditeur
+    _SELECT_RECEIVED_AFTER = (
+        f"SELECT {_COLUMNS} FROM messages m "
+        "JOIN conversations c ON c.conversation_id = m.conversation_id "
+        "WHERE (c.buyer_id = %s OR c.seller_id = %s) AND m.sender_id <> %s "
+        "AND m.message_id > %s "
+        "ORDER BY m.message_id LIMIT %s"
+    )
+    
+    # Somme des compteurs dénormalisés: deux parcours d'index, sans toucher `messages`
+    _COUNT_UNREAD = (
+        "SELECT COALESCE(SUM(unread), 0) AS unread FROM ("
+        " SELECT buyer_unread_count AS unread FROM conversations WHERE buyer_id = %s"
+        " UNION ALL"
+        " SELECT seller_unread_count AS unread FROM conversations WHERE seller_id = %s"
+        ") AS counters"
+    )
+    
+    _MARK_MESSAGES_READ = (
+        "UPDATE messages SET is_read = TRUE "
+        "WHERE conversation_id = %s AND sender_id <> %s AND is_read = FALSE"
+    )
+    
+    _RESET_UNREAD = (
+        "UPDATE conversations SET "
+        "buyer_unread_count = IF(buyer_id = %s, 0, buyer_unread_count), "
+        "seller_unread_count = IF(seller_id = %s, 0, seller_unread_count) "
+        "WHERE conversation_id = %s"
+    )
+    
+    def save(self, message: Message) -> Message:
+        conversation_id, message_id = self._send(
+            (message.conversation_id, None, None, None, message.sender_id, message.content)
+        )
+        return message.with_id(message_id)
+    
+    def save_with_conversation(self, conversation: Conversation, sender_id: str, content: str) -> Message:
+        Message.validate_content(content)
+        conversation_id, message_id = self._send((
+            None,
+            conversation.listing_id,
+            conversation.buyer_id,
+            conversation.seller_id,
+            sender_id,
+            content
+        ))
+        return Message(
+            conversation_id=conversation_id,
+            sender_id=sender_id,
+            content=content,
+            message_id=message_id
+        )
+    
+    def _send(self, params: tuple) -> tuple:
+        """
+        Appelle SendMessage et retourne (conversation_id, message_id).
+        
+        La procédure s'exécute dans la transaction courante (migration 007):
+        commit() la valide, ou, dans une unité de travail, la marque comme
+        ayant écrit (validée avec le reste de la requête, GTID relevé).
+        
+        Raises:
+            DatabaseException: Si l'envoi échoue (transaction annulée)
+        """
+        cursor = None
+        try:
+            cursor = self._connection.get_cursor()
+            cursor.execute(self._CALL_SEND_MESSAGE, params + (Conversation.PREVIEW_LENGTH,))
+            row = cursor.fetchone()
+            # Consommer le statut final du CALL pour libérer la connexion
+            while cursor.nextset():
+                pass
+            if row is None:
+                # La procédure a pu écrire avant de ne rien retourner: rien ne doit être validé
+                self._connection.rollback()
+                raise DatabaseException("SendMessage n'a retourné aucun identifiant")
+            self._connection.commit()
+            return int(row[0]), int(row[1])
+        except mysql.connector.Error as e:
+            self._connection.handle_error(e)
+            self._connection.rollback()
+            raise DatabaseException(
+                f"Échec de l'envoi du message: {str(e)}",
+                original_error=e
+            )
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+    
+    def find_by_conversation(
+        self,
+        conversation_id: int,
+        limit: int,
+        before_message_id: Optional[int] = None,
+        after_message_id: Optional[int] = None
+    ) -> List[Message]:
+        if after_message_id is not None:
+            return self._fetch_all_as(
+                self._ROW_MAPPER, self._SELECT_AFTER, (conversation_id, after_message_id, limit)
+            )
+        
+        if before_message_id is not None:
+            messages = self._fetch_all_as(
+                self._ROW_MAPPER, self._SELECT_BEFORE, (conversation_id, before_message_id, limit)
+            )
+        else:
+            messages = self._fetch_all_as(self._ROW_MAPPER, self._SELECT_LATEST, (conversation_id, limit))
+        messages.reverse()
+        return messages
+    
+    def find_received_after(self, user_id: str, after_message_id: int, limit: int) -> List[Message]:
+        return self._fetch_all_as(
+            self._ROW_MAPPER,
+            self._SELECT_RECEIVED_AFTER,
+            (user_id, user_id, user_id, after_message_id, limit)
+        )
+    
+    def count_unread_for_user(self, user_id: str) -> int:
+        row = self._fetch_one(self._COUNT_UNREAD, (user_id, user_id))
+        return int(row['unread']) if row else 0
+    
+    def mark_conversation_read(self, conversation_id: int, reader_id: str) -> int:
+        cursor = None
+        try:
+            cursor = self._connection.get_cursor()
+            cursor.execute(self._MARK_MESSAGES_READ, (conversation_id, reader_id))
+            marked = cursor.rowcount
+            cursor.execute(self._RESET_UNREAD, (reader_id, reader_id, conversation_id))
+            self._connection.commit()
+            return marked
+        except mysql.connector.Error as e:
+            self._connection.handle_error(e)
+            self._connection.rollback()
+            raise DatabaseException(
+                f"Échec du marquage des messages comme lus: {str(e)}",
+                original_error=e
+            )
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+    
+    def _get_table_name(self) -> str:
+        return "messages"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> Message:
+        return self._ROW_MAPPER.from_dict(data)
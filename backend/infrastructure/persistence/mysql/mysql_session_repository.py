@@ -0,0 +1,68 @@
+"""
+Repository: MySQLSessionRepository
+Implémentation MySQL du SessionRepository (table `sessions`).
+"""
+from typing import Any, Dict, Optional
+
+from domain.auth.session import Session
+from domain.auth.session_repository import SessionRepository
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+class MySQLSessionRepository(BaseMySQLRepository, SessionRepository):
+    """
+    Accès à la table `sessions`.
+    
+    La recherche par jeton utilise l'index `idx_token`.
+    La révocation renseigne `used_at` plutôt que de supprimer la ligne,
+    ce qui conserve l'historique des connexions.
+    """
+    
+    _SELECT_ACTIVE_BY_TOKEN = (
+        "SELECT session_id, user_id, token, token_type, expires_at, used_at, created_at "
+        "FROM sessions "
+        "WHERE token = %s AND token_type = 'auth' "
+        "AND used_at IS NULL AND expires_at > NOW()"
+    )
+    
+    _ROW_MAPPER = RowMapper(
+        Session,
+        'session_id', ('user_id', str), 'token', 'token_type', 'expires_at', 'used_at', 'created_at'
+    )
+    
+    _INSERT = (
+        "INSERT INTO sessions (user_id, token, token_type, expires_at) "
+        "VALUES (%s, %s, %s, %s)"
+    )
+    
+    _REVOKE_BY_TOKEN = (
+        "UPDATE sessions SET used_at = NOW() "
+        "WHERE token = %s AND used_at IS NULL"
+    )
+    
+    _REVOKE_BY_USER = (
+        "UPDATE sessions SET used_at = NOW() "
+        "WHERE user_id = %s AND token_type = 'auth' AND used_at IS NULL"
+    )
+    
+    def find_active_by_token(self, token: str) -> Optional[Session]:
+        return self._fetch_one_as(self._ROW_MAPPER, self._SELECT_ACTIVE_BY_TOKEN, (token,))
+    
+    def save(self, session: Session) -> None:
+        self._execute_many(
+            self._INSERT,
+            [(session.user_id, session.token, session.token_type, session.expires_at)]
+        )
+    
+    def revoke(self, token: str) -> bool:
+        return self._execute_many(self._REVOKE_BY_TOKEN, [(token,)]) > 0
+    
+    def revoke_all_for_user(self, user_id: str) -> int:
+        return self._execute_many(self._REVOKE_BY_USER, [(user_id,)])
+    
+    def _get_table_name(self) -> str:
+        return "sessions"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> Session:
+        return self._ROW_MAPPER.from_dict(data)
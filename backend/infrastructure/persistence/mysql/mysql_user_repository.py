@@ -0,0 +1,52 @@
+"""
+Repository: MySQLUserRepository
+Implémentation MySQL du UserRepository (table `users`).
+"""
+from typing import Any, Dict, Optional
+
+from domain.user.user import User
+from domain.user.user_repository import UserRepository
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+class MySQLUserRepository(BaseMySQLRepository, UserRepository):
+    """
+    Accès à la table `users` (comptes non supprimés uniquement).
+    """
+    
+    _SELECT_BY_IDUL = (
+        "SELECT user_id, idul, email, password_hash, is_verified, is_active, created_at "
+        "FROM users WHERE idul = %s AND deleted_at IS NULL"
+    )
+    
+    _ROW_MAPPER = RowMapper(
+        User,
+        'user_id', 'idul', 'email', 'password_hash', ('is_verified', bool), ('is_active', bool), 'created_at'
+    )
+    
+    _INSERT = (
+        "INSERT INTO users (idul, email, password_hash, is_verified, is_active) "
+        "VALUES (%s, %s, %s, %s, %s)"
+    )
+    
+    _UPDATE_PASSWORD_HASH = "UPDATE users SET password_hash = %s WHERE user_id = %s"
+    
+    def find_by_idul(self, idul: str) -> Optional[User]:
+        return self._fetch_one_as(self._ROW_MAPPER, self._SELECT_BY_IDUL, (idul.strip().lower(),))
+    
+    def save(self, user: User) -> User:
+        self._execute_many(
+            self._INSERT,
+            [(user.idul, user.email, user.password_hash, user.is_verified, user.is_active)]
+        )
+        return self.find_by_idul(user.idul)
+    
+    def update_password_hash(self, user_id: str, password_hash: str) -> None:
+        self._execute_many(self._UPDATE_PASSWORD_HASH, [(password_hash, user_id)])
+    
+    def _get_table_name(self) -> str:
+        return "users"
+    
+    def _map_to_entity(self, data: Dict[str, Any]) -> User:
+        return self._ROW_MAPPER.from_dict(data)
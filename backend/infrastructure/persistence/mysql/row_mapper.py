@@ -0,0 +1,114 @@
+"""
+Module de mappage direct des lignes MySQL vers les entités.
+
+Un RowMapper déclare une fois les colonnes d'une entité (et leur
+conversion). Pour chaque forme de résultat (`cursor.description`), il
+compile une fonction qui passe les valeurs du tuple, par position, au
+constructeur de l'entité: ni dictionnaire intermédiaire ni recherche par
+nom de colonne à chaque ligne.
+"""
+import threading
+from typing import Any, Callable, Dict, Generic, List, Mapping, Sequence, Tuple, TypeVar, Union
+
+from domain.exceptions.database_exception import DatabaseException
+
+
+T = TypeVar('T')
+
+Column = Union[str, Tuple[str, Callable[[Any], Any]]]
+
+
+class RowMapper(Generic[T]):
+    """
+    Mappage compilé des lignes d'un résultat vers une entité.
+    
+    Chaque colonne déclarée est passée au constructeur sous son nom
+    (argument nommé), convertie si une fonction est fournie:
+        
+        RowMapper(Message, 'message_id', ('sender_id', str), ('is_read', bool))
+    
+    Les colonnes du résultat peuvent être dans n'importe quel ordre; les
+    colonnes non déclarées sont ignorées.
+    """
+    
+    def __init__(self, factory: Callable[..., T], *columns: Column):
+        """
+        Args:
+            factory: Constructeur de l'entité (ou du DTO)
+            columns: Noms de colonnes, ou paires (nom, conversion)
+        
+        Raises:
+            ValueError: Si une colonne n'est pas un identifiant Python ou est déclarée deux fois
+        """
+        self._factory = factory
+        self._columns = tuple(
+            (column, None) if isinstance(column, str) else tuple(column)
+            for column in columns
+        )
+        names = [name for name, _ in self._columns]
+        invalid = [name for name in names if not name.isidentifier()]
+        if invalid:
+            raise ValueError(f"Noms de colonnes invalides: {', '.join(invalid)}")
+        if len(set(names)) != len(names):
+            raise ValueError("Colonne déclarée deux fois")
+        self._compiled: Dict[Tuple[str, ...], Callable[[Sequence[Any]], T]] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(name for name, _ in self._columns)
+    
+    def compiled(self, description: Sequence[Sequence[Any]]) -> Callable[[Sequence[Any]], T]:
+        """
+        Retourne la fonction ligne → entité pour cette forme de résultat.
+        
+        Args:
+            description: `cursor.description` (le nom de colonne en position 0)
+        
+        Raises:
+            DatabaseException: Si une colonne déclarée manque au résultat
+        """
+        return self._for_names(tuple(column[0] for column in description))
+    
+    def map_rows(self, description: Sequence[Sequence[Any]], rows: Sequence[Sequence[Any]]) -> List[T]:
+        """Mappe toutes les lignes d'un résultat"""
+        if not rows:
+            return []
+        return list(map(self.compiled(description), rows))
+    
+    def from_dict(self, data: Mapping[str, Any]) -> T:
+        """Mappe une ligne déjà convertie en dictionnaire (même conversion)"""
+        return self._for_names(tuple(data))(tuple(data.values()))
+    
+    def _for_names(self, names: Tuple[str, ...]) -> Callable[[Sequence[Any]], T]:
+        mapper = self._compiled.get(names)
+        if mapper is None:
+            with self._lock:
+                mapper = self._compiled.get(names)
+                if mapper is None:
+                    mapper = self._compiled[names] = self._compile(names)
+        return mapper
+    
+    def _compile(self, names: Tuple[str, ...]) -> Callable[[Sequence[Any]], T]:
+        positions = {name: index for index, name in enumerate(names)}
+        missing = [name for name, _ in self._columns if name not in positions]
+        if missing:
+            raise DatabaseException(
+                f"Colonnes absentes du résultat pour {self._factory_name()}: {', '.join(missing)}"
+            )
+        
+        namespace: Dict[str, Any] = {'_factory': self._factory}
+        arguments = []
+        for name, convert in self._columns:
+            value = f"row[{positions[name]}]"
+            if convert is not None:
+                namespace[f"_convert_{name}"] = convert
+                value = f"_convert_{name}({value})"
+            arguments.append(f"{name}={value}")
+        
+        source = f"def map_row(row):\n    return _factory({', '.join(arguments)})\n"
+        exec(compile(source, f"<RowMapper {self._factory_name()}>", 'exec'), namespace)
+        return namespace['map_row']
+    
+    def _factory_name(self) -> str:
+        return getattr(self._factory, '__name__', repr(self._factory))
@@ -0,0 +1,291 @@
+"""
+Module de hachage des mots de passe (bcrypt).
+
+bcrypt est volontairement coûteux (~100-300 ms de CPU par opération). Exécuté
+dans un thread Flask, il monopolise le GIL et affame les autres requêtes du
+worker. Les opérations sont donc déléguées à un pool de processus borné.
+"""
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Tuple
+
+import bcrypt
+
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+
+logger = logging.getLogger(__name__)
+
+# Format bcrypt: $2b$<coût>$<sel+empreinte>
+_BCRYPT_COST_PATTERN = re.compile(r'^\$2[abxy]?\$(\d{2})\$')
+
+
+def _hash_in_worker(password: bytes, rounds: int) -> bytes:
+    """Exécuté dans un processus du pool"""
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _verify_in_worker(password: bytes, hashed: bytes) -> bool:
+    """Exécuté dans un processus du pool"""
+    try:
+        return bcrypt.checkpw(password, hashed)
+    except ValueError:
+        return False  # Empreinte mal formée
+
+
+class PasswordHasher:
+    """
+    Hachage et vérification bcrypt dans un pool de processus borné.
+    
+    - Le pool est créé paresseusement (après le fork des workers gunicorn).
+    - Au plus `max_pending` opérations sont acceptées à la fois (en cours +
+      en attente); au-delà, ServiceOverloadedException est levée
+      immédiatement (503) au lieu d'allonger la file.
+    - `needs_rehash()` détecte les empreintes créées avec un autre coût,
+      pour les mettre à jour de façon transparente à la connexion. Le coût
+      doit donc être le même pour tous les workers: il est fixé par la
+      configuration, pas calibré par chaque worker.
+    - Un pool dont un processus est mort (BrokenProcessPool) est remplacé,
+      et l'opération réessayée une fois.
+    """
+    
+    MIN_ROUNDS = 10
+    MAX_ROUNDS = 16
+    DEFAULT_ROUNDS = 12
+    
+    def __init__(
+        self,
+        rounds: int = DEFAULT_ROUNDS,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        executor_factory: Optional[Callable[[], Executor]] = None
+    ):
+        """
+        Initialise le hacheur.
+        
+        Args:
+            rounds: Facteur de coût bcrypt (log2 du nombre d'itérations)
+            max_workers: Nombre de processus du pool (moitié des CPU par défaut)
+            max_pending: Opérations acceptées simultanément (4 x max_workers par défaut)
+            executor_factory: Fabrique d'Executor (tests); ProcessPoolExecutor par défaut
+        
+        Raises:
+            ValueError: Si un paramètre est hors bornes
+        """
+        if not 4 <= rounds <= 31:
+            raise ValueError("Le coût bcrypt doit être compris entre 4 et 31")
+        
+        self._rounds = rounds
+        self._max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self._max_pending = max_pending or self._max_workers * 4
+        
+        if self._max_pending < 1:
+            raise ValueError("La file d'attente doit accepter au moins une opération")
+        
+        self._executor_factory = executor_factory or self._create_process_pool
+        self._executor: Optional[Executor] = None
+        self._executor_pid: Optional[int] = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self._max_pending)
+        self._rejected = 0
+        self._dummy_hash: Optional[bytes] = None
+    
+    @property
+    def rounds(self) -> int:
+        return self._rounds
+    
+    @property
+    def rejected_count(self) -> int:
+        """Nombre d'opérations refusées pour cause de saturation"""
+        return self._rejected
+    
+    @classmethod
+    def calibrate(
+        cls,
+        target_ms: float = 250.0,
+        min_rounds: int = MIN_ROUNDS,
+        max_rounds: int = MAX_ROUNDS
+    ) -> int:
+        """
+        Choisit le coût bcrypt le plus élevé qui respecte la durée cible
+        sur la machine courante.
+        
+        Chaque incrément du coût double le temps de calcul: une seule mesure
+        au coût minimal suffit pour extrapoler.
+        
+        À exécuter une fois au déploiement (`python -m
+        infrastructure.security.password_hasher`) pour fixer BCRYPT_ROUNDS:
+        calibré par chaque worker, le coût pourrait varier d'un worker à
+        l'autre et faire recalculer les empreintes à chaque connexion.
+        
+        Args:
+            target_ms: Durée cible d'un hachage en millisecondes
+            min_rounds: Coût plancher (sécurité minimale)
+            max_rounds: Coût plafond
+            
+        Returns:
+            Le coût retenu
+        """
+        start = time.perf_counter()
+        bcrypt.hashpw(b'calibration', bcrypt.gensalt(min_rounds))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        rounds = min_rounds
+        while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+            elapsed_ms *= 2
+            rounds += 1
+        
+        logger.info(f"Coût bcrypt calibré: {rounds} (~{elapsed_ms:.0f} ms par hachage)")
+        return rounds
+    
+    def hash_password(self, password: str) -> str:
+        """
+        Hache un mot de passe.
+        
+        Args:
+            password: Mot de passe en clair
+            
+        Returns:
+            Empreinte bcrypt
+            
+        Raises:
+            ServiceOverloadedException: Si trop d'opérations sont en cours
+        """
+        hashed = self._run(_hash_in_worker, password.encode('utf-8'), self._rounds)
+        return hashed.decode('utf-8')
+    
+    def verify_password(self, password: str, hashed: str) -> bool:
+        """
+        Vérifie un mot de passe contre son empreinte.
+        
+        Args:
+            password: Mot de passe en clair
+            hashed: Empreinte bcrypt stockée
+            
+        Returns:
+            True si le mot de passe correspond
+            
+        Raises:
+            ServiceOverloadedException: Si trop d'opérations sont en cours
+        """
+        return self._run(_verify_in_worker, password.encode('utf-8'), hashed.encode('utf-8'))
+    
+    def verify_dummy(self, password: str) -> None:
+        """
+        Vérification factice, au même coût qu'une vraie (compte inconnu ou inactif).
+        
+        Sans elle, la durée de la réponse révèle si un compte existe.
+        
+        Raises:
+            ServiceOverloadedException: Si trop d'opérations sont en cours
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = self._run(_hash_in_worker, b'compte-inexistant', self._rounds)
+        self._run(_verify_in_worker, password.encode('utf-8'), self._dummy_hash)
+    
+    def needs_rehash(self, hashed: str) -> bool:
+        """
+        Indique si une empreinte a été créée avec un autre coût que le coût courant.
+        
+        Args:
+            hashed: Empreinte bcrypt stockée
+            
+        Returns:
+            True si l'empreinte doit être recalculée
+        """
+        match = _BCRYPT_COST_PATTERN.match(hashed or '')
+        if match is None:
+            return True
+        return int(match.group(1)) != self._rounds
+    
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Vérifie un mot de passe et recalcule l'empreinte si le coût a changé.
+        
+        Args:
+            password: Mot de passe en clair
+            hashed: Empreinte bcrypt stockée
+            
+        Returns:
+            (valide, nouvelle_empreinte): nouvelle_empreinte vaut None si
+            aucune mise à jour n'est nécessaire (ou si le mot de passe est faux)
+        """
+        if not self.verify_password(password, hashed):
+            return False, None
+        
+        if not self.needs_rehash(hashed):
+            return True, None
+        
+        return True, self.hash_password(password)
+    
+    def shutdown(self) -> None:
+        """Arrête le pool de processus"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._executor_pid = None
+    
+    def _run(self, function, *args):
+        """Soumet une opération au pool en respectant la borne de la file"""
+        if not self._slots.acquire(blocking=False):
+            self._rejected += 1
+            logger.warning("Pool bcrypt saturé: opération refusée")
+            raise ServiceOverloadedException(
+                "Trop de demandes d'authentification simultanées, réessayez sous peu",
+                retry_after=1
+            )
+        
+        try:
+            executor = self._get_executor()
+            try:
+                return executor.submit(function, *args).result()
+            except BrokenProcessPool:
+                # Processus du pool tué (OOM, signal): nouveau pool, un seul nouvel essai
+                logger.error("Pool bcrypt brisé: recréation du pool")
+                self._discard_executor(executor)
+                return self._get_executor().submit(function, *args).result()
+        finally:
+            self._slots.release()
+    
+    def _get_executor(self) -> Executor:
+        """Retourne le pool du processus courant (créé au premier appel)"""
+        pid = os.getpid()
+        if self._executor is not None and self._executor_pid == pid:
+            return self._executor
+        
+        with self._executor_lock:
+            if self._executor is None or self._executor_pid != pid:
+                self._executor = self._executor_factory()
+                self._executor_pid = pid
+            return self._executor
+    
+    def _discard_executor(self, executor: Executor) -> None:
+        """Oublie un pool brisé (sauf s'il a déjà été remplacé par un autre thread)"""
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+                self._executor_pid = None
+        executor.shutdown(wait=False)
+    
+    def _create_process_pool(self) -> Executor:
+        # spawn: pas de fork d'un processus qui contient déjà des threads Flask
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+
+
+if __name__ == '__main__':
+    # Au déploiement: coût à reporter dans BCRYPT_ROUNDS pour tous les workers
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Calibre le coût bcrypt sur cette machine")
+    parser.add_argument('--target-ms', type=float, default=float(os.getenv('BCRYPT_TARGET_MS', '250')))
+    arguments = parser.parse_args()
+    print(PasswordHasher.calibrate(target_ms=arguments.target_ms))
@@ -0,0 +1 @@
+"""Stockage des fichiers envoyés par les utilisateurs"""
@@ -0,0 +1,136 @@
+"""
+Module de ramasse-miettes du stockage des photos.
+
+Une photo n'est plus supprimée avec l'annonce (elle peut servir à d'autres):
+les originaux que plus aucune ligne de `listing_pictures` ne référence sont
+supprimés en arrière-plan, avec leurs variantes.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from typing import List, Optional
+
+from domain.listing.listing_picture_repository import ListingPictureRepository
+from infrastructure.storage.upload_store import LocalUploadStore
+
+logger = logging.getLogger(__name__)
+
+
+class BlobGarbageCollector:
+    """
+    Supprime périodiquement les fichiers non référencés.
+    
+    - Délai de grâce: un fichier récent (ou réutilisé récemment par un
+      upload identique) est épargné, sa ligne `listing_pictures` pouvant
+      ne pas encore être insérée.
+    - Les références sont comptées par lots (une requête par lot).
+    - Un thread démon par processus, démarré par `start()`.
+    """
+    
+    def __init__(
+        self,
+        store: LocalUploadStore,
+        picture_repository: ListingPictureRepository,
+        url_prefix: str = '/uploads/',
+        grace_seconds: float = 3600,
+        interval_seconds: float = 3600,
+        batch_size: int = 500
+    ):
+        """
+        Initialise le ramasse-miettes.
+        
+        Args:
+            store: Stockage des photos
+            picture_repository: Repository des photos (compteur de références)
+            url_prefix: Préfixe des chemins enregistrés dans file_path
+            grace_seconds: Âge minimal d'un fichier avant suppression
+            interval_seconds: Délai entre deux passages
+            batch_size: Nombre de fichiers vérifiés par requête
+        """
+        if grace_seconds < 0 or interval_seconds <= 0 or batch_size < 1:
+            raise ValueError("Paramètres du ramasse-miettes invalides")
+        
+        self._store = store
+        self._picture_repository = picture_repository
+        self._url_prefix = url_prefix
+        self._grace_seconds = grace_seconds
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._stop_event = threading.Event()
+        self._thread_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+    
+    def collect(self) -> int:
+        """
+        Effectue un passage complet.
+        
+        Returns:
+            Nombre d'originaux supprimés
+        """
+        cutoff = time.time() - self._grace_seconds
+        deleted = 0
+        
+        for temp_path in self._store.iter_stale_temp_files(cutoff):
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+        
+        batch: List[str] = []
+        for relative_path, modified_at in self._store.iter_blobs():
+            if modified_at >= cutoff:
+                continue
+            batch.append(relative_path)
+            if len(batch) >= self._batch_size:
+                deleted += self._collect_batch(batch, cutoff)
+                batch = []
+        if batch:
+            deleted += self._collect_batch(batch, cutoff)
+        
+        if deleted:
+            logger.info(f"Ramasse-miettes des photos: {deleted} fichier(s) supprimé(s)")
+        return deleted
+    
+    def start(self) -> None:
+        """Démarre le thread du processus courant (sans effet s'il tourne déjà)"""
+        pid = os.getpid()
+        with self._start_lock:
+            if self._thread_pid == pid:
+                return
+            self._stop_event.clear()
+            self._thread_pid = pid
+            threading.Thread(target=self._run, name='upload-blob-gc', daemon=True).start()
+    
+    def stop(self) -> None:
+        """Arrête le thread après le passage en cours"""
+        self._stop_event.set()
+        with self._start_lock:
+            self._thread_pid = None
+    
+    def _collect_batch(self, batch: List[str], cutoff: float) -> int:
+        references = self._picture_repository.count_references(
+            self._url_prefix + relative_path for relative_path in batch
+        )
+        deleted = 0
+        for relative_path in batch:
+            if references.get(self._url_prefix + relative_path, 0) > 0:
+                continue
+            # Date relue juste avant la suppression: un upload identique a pu
+            # réutiliser le fichier depuis le parcours
+            if self._store.delete_blob(relative_path, older_than=cutoff):
+                deleted += 1
+        return deleted
+    
+    def _run(self) -> None:
+        # Décalage aléatoire: les workers ne passent pas tous en même temps
+        if self._stop_event.wait(random.uniform(0, self._interval_seconds)):
+            return
+        while True:
+            try:
+                self.collect()
+            except Exception as e:
+                logger.error(f"Échec du ramasse-miettes des photos: {str(e)}", exc_info=True)
+            if self._stop_event.wait(self._interval_seconds):
+                return
@@ -0,0 +1,305 @@
+"""
+Module de stockage local des photos envoyées.
+
+Les fichiers d'un formulaire multipart sont écrits sur disque morceau par
+morceau pendant la lecture de la requête (stream_factory de werkzeug): une
+photo n'est jamais chargée entière en mémoire, et un envoi trop gros est
+interrompu dès que la limite est franchie.
+
+Le stockage est adressé par contenu: une photo est rangée sous l'empreinte
+SHA-256 de ses octets (`ab/abcdef….jpg`). La même photo envoyée pour
+plusieurs annonces n'existe qu'une fois sur disque; les lignes de
+`listing_pictures` qui la référencent font office de compteur de références
+(voir BlobGarbageCollector).
+"""
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+from typing import IO, Iterator, Optional, Tuple
+
+from domain.listing.exceptions.invalid_picture_exception import InvalidPictureException
+from domain.listing.exceptions.picture_too_large_exception import PictureTooLargeException
+
+logger = logging.getLogger(__name__)
+
+# Signatures des formats acceptés (premiers octets du fichier)
+_SIGNATURES = {
+    'jpg': b'\xff\xd8\xff',
+    'png': b'\x89PNG\r\n\x1a\n',
+}
+
+_EXTENSIONS = {'jpg': 'jpg', 'jpeg': 'jpg', 'png': 'png', 'webp': 'webp'}
+
+# Préfixe des fichiers temporaires d'upload (à la racine du dossier)
+TEMP_PREFIX = '.incoming-'
+
+
+class CappedUploadFile:
+    """
+    Fichier temporaire d'upload qui refuse de dépasser `max_size` octets.
+    
+    Créé dans le dossier d'uploads (même système de fichiers): la mise en
+    place finale est un simple renommage, sans recopie. L'empreinte du
+    contenu est calculée au fil de l'écriture, sans relire le fichier.
+    """
+    
+    def __init__(self, directory: str, max_size: int):
+        self._max_size = max_size
+        self._size = 0
+        self._head = b''
+        self._hash = hashlib.sha256()
+        self._file = tempfile.NamedTemporaryFile(
+            mode='w+b', dir=directory, prefix=TEMP_PREFIX, suffix='.part', delete=False
+        )
+    
+    @property
+    def name(self) -> str:
+        return self._file.name
+    
+    @property
+    def size(self) -> int:
+        return self._size
+    
+    @property
+    def head(self) -> bytes:
+        """Premiers octets reçus (détection du format)"""
+        return self._head
+    
+    @property
+    def digest(self) -> str:
+        """Empreinte SHA-256 (hexadécimale) des octets reçus"""
+        return self._hash.hexdigest()
+    
+    def write(self, data: bytes) -> int:
+        self._size += len(data)
+        if self._size > self._max_size:
+            raise PictureTooLargeException(self._max_size)
+        if len(self._head) < 16:
+            self._head = (self._head + bytes(data))[:16]
+        self._hash.update(data)
+        return self._file.write(data)
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def discard(self) -> None:
+        """Ferme et supprime le fichier temporaire"""
+        self._file.close()
+        try:
+            os.unlink(self._file.name)
+        except FileNotFoundError:
+            pass
+
+
+class UploadBatch:
+    """
+    Fichiers temporaires d'une requête d'upload.
+    
+    Si la requête échoue (limite dépassée, validation), `discard()` supprime
+    tout ce qui n'a pas été mis en place.
+    """
+    
+    def __init__(self, directory: str, max_file_size: int):
+        self._directory = directory
+        self._max_file_size = max_file_size
+        self._files = []
+    
+    def stream_factory(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str],
+        content_length: Optional[int] = None
+    ) -> IO[bytes]:
+        """
+        Fabrique de fichiers pour werkzeug.formparser.FormDataParser:
+        chaque partie fichier du formulaire est écrite dans un CappedUploadFile.
+        """
+        upload = CappedUploadFile(self._directory, self._max_file_size)
+        self._files.append(upload)
+        return upload
+    
+    def discard(self) -> None:
+        """Supprime les fichiers temporaires restants (déjà mis en place: ignorés)"""
+        for upload in self._files:
+            upload.discard()
+        self._files.clear()
+
+
+class LocalUploadStore:
+    """
+    Stockage des photos dans un dossier local (backend/uploads par défaut),
+    adressé par contenu.
+    
+    Les chemins retournés sont relatifs au dossier racine: c'est ce qui est
+    enregistré dans `listing_pictures.file_path`. Les variantes d'une photo
+    (`<empreinte>_<variante>.jpg`) sont rangées à côté de l'original.
+    """
+    
+    DEFAULT_MAX_FILE_SIZE = 8 * 1024 * 1024
+    
+    def __init__(self, root_dir: str, max_file_size: int = DEFAULT_MAX_FILE_SIZE):
+        """
+        Initialise le stockage.
+        
+        Args:
+            root_dir: Dossier racine des uploads (créé au besoin)
+            max_file_size: Taille maximale d'une photo en octets
+        """
+        if max_file_size < 1:
+            raise ValueError("La taille maximale doit être positive")
+        
+        self._root_dir = os.path.abspath(root_dir)
+        self._max_file_size = max_file_size
+        os.makedirs(self._root_dir, exist_ok=True)
+    
+    @property
+    def root_dir(self) -> str:
+        return self._root_dir
+    
+    @property
+    def max_file_size(self) -> int:
+        return self._max_file_size
+    
+    def new_batch(self) -> UploadBatch:
+        """Ouvre un lot de fichiers temporaires pour une requête d'upload"""
+        return UploadBatch(self._root_dir, self._max_file_size)
+    
+    def commit(self, upload: CappedUploadFile, filename: str) -> str:
+        """
+        Valide le format d'un fichier reçu et le range sous son empreinte.
+        
+        Si une photo identique est déjà stockée, le fichier reçu est
+        simplement supprimé: les octets ne sont écrits qu'une fois.
+        
+        Args:
+            upload: Fichier temporaire rempli par le parseur
+            filename: Nom d'origine (pour l'extension)
+            
+        Returns:
+            Chemin relatif du fichier stocké
+            
+        Raises:
+            InvalidPictureException: Si le fichier n'est pas une image acceptée
+        """
+        extension = self._extension_of(filename)
+        if extension is None or not self._matches_signature(extension, upload.head):
+            upload.discard()
+            raise InvalidPictureException(filename, "Seules les images JPEG, PNG et WebP sont acceptées")
+        
+        digest = upload.digest
+        relative_path = f"{digest[:2]}/{digest}.{extension}"
+        path = self.path_for(relative_path)
+        
+        if os.path.exists(path):
+            upload.discard()
+            # Rafraîchir la date: le ramasse-miettes épargne un fichier
+            # dont la ligne listing_pictures n'est pas encore insérée
+            os.utime(path)
+            logger.info(f"Photo déjà stockée, réutilisée: {relative_path}")
+            return relative_path
+        
+        upload.close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(upload.name, path)
+        
+        logger.info(f"Photo stockée: {relative_path} ({upload.size} octets)")
+        return relative_path
+    
+    def path_for(self, relative_path: str) -> str:
+        """
+        Retourne le chemin absolu d'un fichier stocké.
+        
+        Raises:
+            ValueError: Si le chemin sort du dossier racine
+        """
+        path = os.path.abspath(os.path.join(self._root_dir, relative_path))
+        if os.path.commonpath([path, self._root_dir]) != self._root_dir:
+            raise ValueError("Chemin de fichier invalide")
+        return path
+    
+    def iter_blobs(self) -> Iterator[Tuple[str, float]]:
+        """
+        Parcourt les originaux stockés (sans les variantes).
+        
+        Yields:
+            (chemin relatif, date de dernière modification)
+        """
+        for shard in sorted(os.listdir(self._root_dir)):
+            shard_dir = os.path.join(self._root_dir, shard)
+            if shard.startswith('.') or not os.path.isdir(shard_dir):
+                continue
+            with os.scandir(shard_dir) as entries:
+                for entry in entries:
+                    stem, _ = os.path.splitext(entry.name)
+                    if '_' in stem or not entry.is_file():
+                        continue
+                    try:
+                        yield f"{shard}/{entry.name}", entry.stat().st_mtime
+                    except FileNotFoundError:
+                        continue
+    
+    def iter_stale_temp_files(self, older_than: float) -> Iterator[str]:
+        """Fichiers temporaires abandonnés (worker arrêté pendant un upload)"""
+        with os.scandir(self._root_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith(TEMP_PREFIX):
+                    continue
+                try:
+                    if entry.stat().st_mtime < older_than:
+                        yield entry.path
+                except FileNotFoundError:
+                    continue
+    
+    def delete_blob(self, relative_path: str, older_than: Optional[float] = None) -> bool:
+        """
+        Supprime un original et ses variantes.
+        
+        Args:
+            relative_path: Chemin relatif de l'original
+            older_than: Ne supprimer que si le fichier n'a pas été modifié
+                (ou réutilisé par commit) depuis ce timestamp
+            
+        Returns:
+            True si le fichier a été supprimé
+        """
+        path = self.path_for(relative_path)
+        try:
+            if older_than is not None and os.stat(path).st_mtime >= older_than:
+                return False
+            os.unlink(path)
+        except FileNotFoundError:
+            return False
+        
+        stem, _ = os.path.splitext(path)
+        for variant_path in glob.glob(f"{glob.escape(stem)}_*"):
+            try:
+                os.unlink(variant_path)
+            except FileNotFoundError:
+                pass
+        return True
+    
+    @staticmethod
+    def _extension_of(filename: str) -> Optional[str]:
+        _, _, extension = (filename or '').rpartition('.')
+        return _EXTENSIONS.get(extension.lower())
+    
+    @staticmethod
+    def _matches_signature(extension: str, head: bytes) -> bool:
+        if extension == 'webp':
+            return head[:4] == b'RIFF' and head[8:12] == b'WEBP'
+        return head.startswith(_SIGNATURES[extension])
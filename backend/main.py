@@ -32,12 +32,16 @@ def create_app():
         r"/api/*": {
             "origins": os.getenv('FRONTEND_URL', 'http://localhost:5173'),
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"]
+            "allow_headers": ["Content-Type", "Authorization", "X-Consistency-Token", "X-User-Id"],
+            "expose_headers": ["X-Consistency-Token"]
         }
     })
     
+    from api.admission_control import Priority, admission_priority
+    
     # Route de santé (health check)
     @app.route('/health', methods=['GET'])
+    @admission_priority(Priority.CRITICAL)
     def health_check():
         return {
             'status': 'healthy',
@@ -47,6 +51,7 @@ def create_app():
     
     # Route racine
     @app.route('/', methods=['GET'])
+    @admission_priority(Priority.CRITICAL)
     def index():
         return {
             'message': 'Bienvenue sur l\'API ULavalMarket',
@@ -57,13 +62,64 @@ def create_app():
     logger.info("Application Flask initialisée avec succès")
     
     # Enregistrer les blueprints (resources)
-    from api.listing_resource import listing_bp
+    from api.listing_resource import listing_bp, blob_collector, warm_catalogue_snapshots
     app.register_blueprint(listing_bp, url_prefix='/api')
     logger.info("Blueprint 'listings' enregistré")
     
+    # Instantanés du catalogue construits en arrière-plan avant les premières lectures
+    warm_catalogue_snapshots()
+    
+    if os.getenv('UPLOAD_GC_ENABLED', 'true').lower() == 'true':
+        blob_collector.start()
+        logger.info("Ramasse-miettes des photos démarré")
+    
+    from api.auth_resource import auth_bp
+    app.register_blueprint(auth_bp, url_prefix='/api')
+    logger.info("Blueprint 'auth' enregistré")
+    
+    from api.message_resource import messages_bp
+    app.register_blueprint(messages_bp, url_prefix='/api')
+    logger.info("Blueprint 'messages' enregistré")
+    
+    from api.media_resource import media_bp
+    app.register_blueprint(media_bp)
+    logger.info("Blueprint 'media' enregistré")
+    
+    from api.metrics_resource import metrics_bp
+    app.register_blueprint(metrics_bp)
+    logger.info("Blueprint 'metrics' enregistré")
+    
+    # Compression gzip/brotli: enregistrée en premier, appliquée au corps final
+    from api.compression import register_compression
+    register_compression(app)
+    logger.info("Compression des réponses enregistrée")
+    
+    # Limitation de débit par client: 429 avant toute autre admission
+    # (adresse du client prise dans X-Forwarded-For derrière nginx)
+    from api.rate_limiting import register_proxy_fix, register_rate_limiting
+    register_proxy_fix(app)
+    register_rate_limiting(app)
+    logger.info("Limitation de débit enregistrée")
+    
+    # Délestage: refuse tôt (503) quand la limite adaptative est atteinte
+    from api.admission_control import register_admission_control
+    register_admission_control(app)
+    logger.info("Contrôle d'admission enregistré")
+    
+    # Unité de travail par requête (une connexion du pool, un seul commit)
+    from api.unit_of_work import register_unit_of_work
+    register_unit_of_work(app)
+    logger.info("Unité de travail par requête enregistrée")
+    
     # Enregistrer les exception handlers
     from api.exceptions.mappers.listing_exception_mapper import register_listing_exception_handlers
     register_listing_exception_handlers(app)
+    from api.exceptions.mappers.auth_exception_mapper import register_auth_exception_handlers
+    register_auth_exception_handlers(app)
+    from api.exceptions.mappers.message_exception_mapper import register_message_exception_handlers
+    register_message_exception_handlers(app)
+    from api.exceptions.mappers.service_exception_mapper import register_service_exception_handlers
+    register_service_exception_handlers(app)
     logger.info("Exception handlers enregistrés")
     
     return app
@@ -0,0 +1,76 @@
+"""
+Tests unitaires pour le garde de routes require_session.
+"""
+import pytest
+from datetime import datetime, timedelta
+from flask import Flask, g, jsonify
+
+from api.auth.session_guard import require_session
+from api.exceptions.mappers.auth_exception_mapper import register_auth_exception_handlers
+from application.auth.session_validation_service import SessionValidationService
+from domain.auth.session import Session
+from infrastructure.auth.session_cache import SessionCache
+from infrastructure.persistence.in_memory.in_memory_session_repository import InMemorySessionRepository
+
+
+class TestRequireSession:
+    """Tests pour le décorateur require_session"""
+    
+    @pytest.fixture
+    def client(self):
+        repository = InMemorySessionRepository()
+        repository.save(Session(
+            user_id='7',
+            token='valid-token',
+            expires_at=datetime.now() + timedelta(hours=1)
+        ))
+        service = SessionValidationService(repository, SessionCache())
+        
+        app = Flask(__name__)
+        register_auth_exception_handlers(app)
+        
+        @app.route('/protected')
+        @require_session(service)
+        def protected():
+            return jsonify({'user_id': g.user_id})
+        
+        @app.route('/stream')
+        @require_session(service, allow_query_token=True)
+        def stream():
+            return jsonify({'user_id': g.user_id})
+        
+        return app.test_client()
+    
+    def test_valid_bearer_token(self, client):
+        """Vérifie qu'un jeton valide donne accès à la route"""
+        response = client.get('/protected', headers={'Authorization': 'Bearer valid-token'})
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'user_id': '7'}
+    
+    def test_missing_header_returns_401(self, client):
+        """Vérifie qu'une requête sans en-tête est refusée"""
+        response = client.get('/protected')
+        
+        assert response.status_code == 401
+        assert response.get_json()['error'] == 'UNAUTHORIZED'
+        assert response.headers['WWW-Authenticate'] == 'Bearer'
+    
+    def test_wrong_scheme_returns_401(self, client):
+        """Vérifie qu'un schéma autre que Bearer est refusé"""
+        response = client.get('/protected', headers={'Authorization': 'Basic valid-token'})
+        
+        assert response.status_code == 401
+    
+    def test_query_token_refused_by_default(self, client):
+        """Vérifie que le jeton en paramètre n'est pas accepté partout"""
+        response = client.get('/protected?access_token=valid-token')
+        
+        assert response.status_code == 401
+    
+    def test_query_token_accepted_when_allowed(self, client):
+        """Vérifie que les routes EventSource acceptent access_token"""
+        response = client.get('/stream?access_token=valid-token')
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'user_id': '7'}
@@ -0,0 +1,159 @@
+"""
+Tests unitaires pour GET /api/listings (instantanés, coalescence et lecture de ses écritures).
+"""
+import time
+
+import pytest
+from flask import Flask
+
+import api.listing_resource as listing_resource
+from api.unit_of_work import CONSISTENCY_HEADER, consistency_tokens, unit_of_work_manager
+from application.category.category_service import CategoryService
+from application.listing.listing_assembler import ListingAssembler
+from application.listing.listing_service import ListingService
+from infrastructure.cache.snapshot_cache import SnapshotCache
+from infrastructure.concurrency.query_coalescer import QueryCoalescer
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.in_memory.in_memory_category_repository import InMemoryCategoryRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+
+
+class _SpyService(ListingService):
+    """ListingService qui retient les lectures faites hors instantané"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.direct_reads = []
+    
+    def query_listings(self, seller_id=None, category=None, search=None, coalesce=True, render=None):
+        self.direct_reads.append(coalesce)
+        return super().query_listings(seller_id, category, search, coalesce, render)
+
+
+@pytest.fixture
+def snapshots(monkeypatch):
+    built = []
+    
+    def build(key):
+        built.append(key)
+        return listing_resource._render_catalogue(key)
+    
+    snapshots = SnapshotCache('catalogue', build=build, background=False, registry=MetricsRegistry())
+    snapshots.built = built
+    monkeypatch.setattr(listing_resource, 'catalogue_snapshots', snapshots)
+    return snapshots
+
+
+@pytest.fixture
+def service(monkeypatch, snapshots):
+    service = _SpyService(
+        InMemoryListingRepository(),
+        ListingAssembler(),
+        category_service=CategoryService(InMemoryCategoryRepository()),
+        catalogue_snapshots=snapshots
+    )
+    monkeypatch.setattr(listing_resource, 'listing_service', service)
+    return service
+
+
+@pytest.fixture
+def client(service):
+    app = Flask(__name__)
+    app.register_blueprint(listing_resource.listing_bp, url_prefix='/api')
+    return app.test_client()
+
+
+class TestCatalogueSnapshots:
+    """Tests pour le service du catalogue depuis l'instantané"""
+    
+    def _snapshot_reads(self, service, snapshots):
+        # La construction de l'instantané passe aussi par query_listings (sans coalescence)
+        return len(service.direct_reads) - len(snapshots.built)
+    
+    def test_unfiltered_catalogue_is_served_from_snapshot(self, client, service, snapshots):
+        """Vérifie que les lectures suivantes ne touchent pas le repository"""
+        for _ in range(3):
+            assert client.get('/api/listings').status_code == 200
+        
+        assert snapshots.built == [None]
+        assert self._snapshot_reads(service, snapshots) == 0
+    
+    @pytest.mark.parametrize('header', [
+        'nimporte-quoi',
+        '9999999999.000;A:1-3',
+        consistency_tokens.encode('A:1-3', time.time() - 1),
+    ])
+    def test_invalid_or_expired_token_still_gets_snapshot(self, client, service, snapshots, header):
+        """Vérifie qu'un jeton forgé, mal signé ou expiré ne contourne pas l'instantané"""
+        response = client.get('/api/listings', headers={CONSISTENCY_HEADER: header})
+        
+        assert response.status_code == 200
+        assert snapshots.built == [None]
+        assert self._snapshot_reads(service, snapshots) == 0
+    
+    def test_valid_token_reads_own_writes(self, client, service, snapshots):
+        """Vérifie qu'un jeton valide lit le repository, sans coalescence"""
+        header = consistency_tokens.remember(None, 'A:1-3')
+        
+        response = client.get('/api/listings', headers={CONSISTENCY_HEADER: header})
+        
+        assert response.status_code == 200
+        assert snapshots.built == []
+        assert service.direct_reads == [False]
+    
+    def test_background_rebuild_opens_a_unit_of_work(self, service, monkeypatch):
+        """Vérifie que la reconstruction hors requête (thread des instantanés) lit dans une unité de travail"""
+        units = []
+        query_listings = service.query_listings
+        
+        def spy(**kwargs):
+            units.append(unit_of_work_manager.current)
+            return query_listings(**kwargs)
+        
+        monkeypatch.setattr(service, 'query_listings', spy)
+        
+        listing_resource._render_catalogue(None)
+        
+        assert units[0] is not None
+        assert unit_of_work_manager.current is None
+    
+    def test_unknown_category_is_rejected(self, client):
+        """Vérifie qu'une catégorie inconnue reste une erreur 400"""
+        response = client.get('/api/listings?category=electronics')
+        
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'INVALID_CATEGORY'
+
+
+class TestCatalogueSearch:
+    """Tests pour la recherche coalescée, servie précompressée"""
+    
+    @pytest.fixture
+    def coalescer(self, service, monkeypatch):
+        coalescer = QueryCoalescer('listings', registry=MetricsRegistry())
+        monkeypatch.setattr(service, '_query_coalescer', coalescer)
+        return coalescer
+    
+    def test_search_is_rendered_in_the_coalesced_read(self, client, coalescer, monkeypatch):
+        """Vérifie que le rendu (JSON compressé) est fait dans la lecture partagée"""
+        rendered = []
+        render = listing_resource._listings_payload
+        monkeypatch.setattr(listing_resource, '_listings_payload', lambda data: rendered.append(data) or render(data))
+        
+        response = client.get('/api/listings?search=velo', headers={'Accept-Encoding': 'gzip'})
+        
+        assert response.status_code == 200
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert len(rendered) == 1
+    
+    @pytest.mark.parametrize('header, coalesced', [
+        ('nimporte-quoi', True),
+        (consistency_tokens.encode('A:1-3', time.time() - 1), True),
+        (consistency_tokens.remember(None, 'A:1-3'), False),
+    ])
+    def test_only_valid_token_bypasses_coalescing(self, client, service, coalescer, header, coalesced):
+        """Vérifie qu'un en-tête invalide ou expiré ne désactive pas la coalescence"""
+        response = client.get('/api/listings?search=velo', headers={CONSISTENCY_HEADER: header})
+        
+        assert response.status_code == 200
+        assert service.direct_reads == [coalesced]
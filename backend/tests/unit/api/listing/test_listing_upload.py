@@ -0,0 +1,94 @@
+"""
+Tests unitaires pour la création d'annonce avec photos (multipart/form-data).
+"""
+import io
+import os
+import pytest
+from flask import Flask
+
+import api.listing_resource as listing_resource
+from api.exceptions.mappers.listing_exception_mapper import register_listing_exception_handlers
+from application.listing.listing_assembler import ListingAssembler
+from application.listing.listing_service import ListingService
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.storage.upload_store import LocalUploadStore
+
+JPEG_BYTES = b'\xff\xd8\xff\xe0' + b'\x00' * 60
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = LocalUploadStore(str(tmp_path), max_file_size=1024)
+    service = ListingService(InMemoryListingRepository(), ListingAssembler(), InMemoryListingPictureRepository())
+    monkeypatch.setattr(listing_resource, 'upload_store', store)
+    monkeypatch.setattr(listing_resource, 'UPLOAD_MAX_FILE_SIZE', 1024)
+    monkeypatch.setattr(listing_resource, 'listing_service', service)
+    return store
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(listing_resource.listing_bp, url_prefix='/api')
+    register_listing_exception_handlers(app)
+    return app.test_client()
+
+
+def _form(*pictures):
+    return {
+        'seller_id': 'seller-1',
+        'title': 'Calculatrice TI-84',
+        'description': 'En excellent état',
+        'price': '85',
+        'category': 'Calculatrices',
+        'condition': 'Comme neuf',
+        'location': 'Pavillon Adrien-Pouliot',
+        'pictures': [(io.BytesIO(content), name) for name, content in pictures]
+    }
+
+
+class TestCreateListingWithPictures:
+    """Tests pour POST /api/listings en multipart/form-data"""
+    
+    def test_pictures_are_stored_and_listing_returned(self, client, store):
+        """Vérifie la création avec photos et la couverture provisoire"""
+        response = client.post(
+            '/api/listings',
+            data=_form(('a.jpg', JPEG_BYTES), ('b.jpg', JPEG_BYTES + b'b'), ('c.jpg', JPEG_BYTES)),
+            content_type='multipart/form-data'
+        )
+        
+        assert response.status_code == 201
+        body = response.get_json()
+        assert len(body['images']) == 3
+        assert body['cover_image'] == body['images'][0]
+        # a.jpg et c.jpg ont le même contenu: un seul fichier sur disque
+        assert body['images'][0] == body['images'][2]
+        assert {path for path, _ in store.iter_blobs()} == {
+            image[len('/uploads/'):] for image in body['images']
+        }
+    
+    def test_oversized_picture_is_rejected_without_leftovers(self, client, store):
+        """Vérifie le 413 et le nettoyage des fichiers déjà reçus"""
+        response = client.post(
+            '/api/listings',
+            data=_form(('a.jpg', JPEG_BYTES), ('big.jpg', JPEG_BYTES * 32)),
+            content_type='multipart/form-data'
+        )
+        
+        assert response.status_code == 413
+        assert response.get_json()['error'] == 'PICTURE_TOO_LARGE'
+        assert os.listdir(store.root_dir) == []
+    
+    def test_file_that_is_not_an_image_is_rejected(self, client, store):
+        """Vérifie le 400 sur un contenu qui n'est pas une image"""
+        response = client.post(
+            '/api/listings',
+            data=_form(('a.jpg', b'not an image')),
+            content_type='multipart/form-data'
+        )
+        
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'INVALID_PICTURE'
+        assert os.listdir(store.root_dir) == []
@@ -0,0 +1,168 @@
+"""
+Tests unitaires pour le service des photos (/uploads).
+"""
+import hashlib
+import io
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+
+import api.media_resource as media_resource
+from api.exceptions.mappers.listing_exception_mapper import register_listing_exception_handlers
+from application.listing.listing_assembler import ListingAssembler
+from application.listing.listing_service import ListingService
+from domain.listing.listing_picture import ListingPicture
+from infrastructure.imaging.image_resizer import ImageResizer
+from infrastructure.imaging.resized_image_cache import ResizedImageCache
+from infrastructure.imaging.thumbnail_generator import ThumbnailGenerator
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.storage.upload_store import LocalUploadStore
+
+CONTENT = b'\xff\xd8\xff\xe0' + bytes(range(256)) * 4
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = LocalUploadStore(str(tmp_path))
+    monkeypatch.setattr(media_resource, 'upload_store', store)
+    return store
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(media_resource.media_bp)
+    register_listing_exception_handlers(app)
+    return app.test_client()
+
+
+@pytest.fixture
+def stored_path(store):
+    upload = store.new_batch().stream_factory(None, 'image/jpeg', 'photo.jpg')
+    upload.write(CONTENT)
+    return store.commit(upload, 'photo.jpg')
+
+
+class TestGetUpload:
+    """Tests pour GET /uploads/{chemin}"""
+    
+    def test_content_hashed_file_is_immutable(self, client, stored_path):
+        """Vérifie l'ETag (empreinte) et le Cache-Control immuable"""
+        response = client.get(f"/uploads/{stored_path}")
+        
+        assert response.status_code == 200
+        assert response.data == CONTENT
+        assert response.headers['ETag'] == f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == media_resource.IMMUTABLE_MAX_AGE
+        assert response.headers['Accept-Ranges'] == 'bytes'
+    
+    def test_known_etag_returns_304(self, client, stored_path):
+        """Vérifie la revalidation sans corps"""
+        etag = hashlib.sha256(CONTENT).hexdigest()
+        
+        response = client.get(f"/uploads/{stored_path}", headers={'If-None-Match': f'"{etag}"'})
+        
+        assert response.status_code == 304
+        assert response.data == b''
+    
+    def test_range_request_returns_partial_content(self, client, stored_path):
+        """Vérifie la réponse 206 sur une plage"""
+        response = client.get(f"/uploads/{stored_path}", headers={'Range': 'bytes=4-99'})
+        
+        assert response.status_code == 206
+        assert response.data == CONTENT[4:100]
+        assert response.headers['Content-Range'] == f"bytes 4-99/{len(CONTENT)}"
+    
+    def test_legacy_name_is_revalidated(self, client, store):
+        """Vérifie qu'un nom libre n'est pas déclaré immuable"""
+        with open(os.path.join(store.root_dir, 'ti83_1.jpg'), 'wb') as legacy:
+            legacy.write(CONTENT)
+        
+        response = client.get('/uploads/ti83_1.jpg')
+        
+        assert response.status_code == 200
+        assert not response.cache_control.immutable
+        assert response.cache_control.max_age == media_resource.MUTABLE_MAX_AGE
+    
+    def test_accel_redirect_delegates_transfer(self, client, stored_path, monkeypatch):
+        """Vérifie l'en-tête X-Accel-Redirect sans corps"""
+        monkeypatch.setattr(media_resource, 'MEDIA_OFFLOAD', 'x-accel-redirect')
+        
+        response = client.get(f"/uploads/{stored_path}")
+        
+        assert response.headers['X-Accel-Redirect'] == f"/protected-uploads/{stored_path}"
+        assert response.data == b''
+        assert response.mimetype == 'image/jpeg'
+    
+    def test_x_sendfile_sends_absolute_path(self, client, store, stored_path, monkeypatch):
+        """Vérifie l'en-tête X-Sendfile"""
+        monkeypatch.setattr(media_resource, 'MEDIA_OFFLOAD', 'x-sendfile')
+        
+        response = client.get(f"/uploads/{stored_path}")
+        
+        assert response.headers['X-Sendfile'] == store.path_for(stored_path)
+    
+    @pytest.mark.parametrize('path', ['missing.jpg', '../outside.jpg'])
+    def test_missing_or_outside_file_returns_404(self, client, store, path):
+        """Vérifie le 404 (y compris pour un chemin hors du dossier)"""
+        assert client.get(f"/uploads/{path}").status_code == 404
+
+
+class TestGetResizedPicture:
+    """Tests pour GET /media/{picture_id}"""
+    
+    @pytest.fixture
+    def picture_id(self, store, monkeypatch):
+        image_module = pytest.importorskip('PIL.Image')
+        buffer = io.BytesIO()
+        image_module.new('RGB', (640, 480), (10, 200, 30)).save(buffer, 'JPEG')
+        upload = store.new_batch().stream_factory(None, 'image/jpeg', 'photo.jpg')
+        upload.write(buffer.getvalue())
+        relative_path = store.commit(upload, 'photo.jpg')
+        
+        pictures = InMemoryListingPictureRepository()
+        picture = pictures.save(ListingPicture('listing-1', '/uploads/' + relative_path, is_cover=True))
+        generator = ThumbnailGenerator(store.root_dir, executor_factory=lambda: ThreadPoolExecutor(max_workers=1))
+        monkeypatch.setattr(
+            media_resource, 'listing_service',
+            ListingService(InMemoryListingRepository(), ListingAssembler(), pictures)
+        )
+        monkeypatch.setattr(
+            media_resource, '_image_resizer',
+            ImageResizer(
+                store.root_dir, generator,
+                ResizedImageCache(os.path.join(store.root_dir, '.cache')),
+                registry=MetricsRegistry()
+            )
+        )
+        yield picture.picture_id
+        generator.shutdown()
+    
+    def test_resized_picture_is_cached_and_immutable(self, client, picture_id):
+        """Vérifie le rendu, l'ETag (empreinte + paramètres) et le 304"""
+        image_module = pytest.importorskip('PIL.Image')
+        
+        response = client.get(f"/media/{picture_id}?w=160&fmt=webp")
+        
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        with image_module.open(io.BytesIO(response.data)) as rendered:
+            assert (rendered.format, rendered.size) == ('WEBP', (160, 120))
+        
+        revalidated = client.get(f"/media/{picture_id}?w=160&fmt=webp", headers={'If-None-Match': response.headers['ETag']})
+        assert revalidated.status_code == 304
+    
+    def test_invalid_parameters_return_400(self, client, picture_id):
+        """Vérifie le refus d'une taille hors limites"""
+        assert client.get(f"/media/{picture_id}?w=99999").status_code == 400
+    
+    def test_unknown_picture_returns_404(self, client, picture_id):
+        """Vérifie le 404 d'une photo inexistante"""
+        response = client.get(f"/media/{picture_id + 1}?w=100")
+        
+        assert response.status_code == 404
+        assert response.get_json()['error'] == 'PICTURE_NOT_FOUND'
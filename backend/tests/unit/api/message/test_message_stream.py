@@ -0,0 +1,235 @@
+"""
+Tests unitaires pour le flux SSE des messages.
+"""
+import pytest
+from unittest.mock import Mock
+from datetime import datetime, timedelta
+from flask import Flask
+
+import api.message_resource as message_resource
+from api.auth_resource import session_validation_service
+from api.exceptions.mappers.auth_exception_mapper import register_auth_exception_handlers
+from api.exceptions.mappers.listing_exception_mapper import register_listing_exception_handlers
+from api.exceptions.mappers.service_exception_mapper import register_service_exception_handlers
+from application.message.message_assembler import MessageAssembler
+from application.message.message_service import MessageService
+from domain.auth.session import Session
+from infrastructure.messaging.message_broker import MessageBroker
+from infrastructure.persistence.in_memory.in_memory_conversation_repository import InMemoryConversationRepository
+from infrastructure.persistence.in_memory.in_memory_message_repository import InMemoryMessageRepository
+from tests.unit.application.message.test_message_service import listings_of_seller
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = MessageBroker(max_connections=1)
+    conversation_repository = InMemoryConversationRepository()
+    message_repository = InMemoryMessageRepository(conversation_repository)
+    service = MessageService(conversation_repository, message_repository, listings_of_seller(), MessageAssembler(), broker)
+    monkeypatch.setattr(message_resource, '_message_broker', broker)
+    monkeypatch.setattr(message_resource, '_message_service', service)
+    return broker
+
+
+@pytest.fixture
+def service(broker):
+    return message_resource._message_service
+
+
+def open_stream(service, subscription, last_event_id=None, heartbeat_seconds=message_resource.SSE_HEARTBEAT_SECONDS):
+    """Flux de 'seller' avec les lectures faites par la vue"""
+    missed = service.get_missed_messages('seller', last_event_id) if last_event_id is not None else []
+    return message_resource.generate_event_stream(
+        'seller', subscription, missed, service.get_unread_count('seller'), last_event_id, heartbeat_seconds
+    )
+
+
+class TestGenerateEventStream:
+    """Tests pour le générateur du flux"""
+    
+    def test_stream_starts_with_retry_and_unread(self, broker, service):
+        """Vérifie l'en-tête du flux: délai de reconnexion puis compteur"""
+        stream = open_stream(service, broker.subscribe('seller'))
+        
+        assert next(stream).startswith('retry: ')
+        assert next(stream) == 'event: unread\ndata: {"unread_count": 0}\n\n'
+        stream.close()
+    
+    def test_heartbeat_when_idle(self, broker, service):
+        """Vérifie qu'un commentaire est envoyé quand rien ne se passe"""
+        stream = open_stream(service, broker.subscribe('seller'), heartbeat_seconds=0.01)
+        next(stream)
+        next(stream)
+        
+        assert next(stream) == ': heartbeat\n\n'
+        stream.close()
+    
+    def test_pushes_new_message(self, broker, service):
+        """Vérifie qu'un message envoyé est poussé avec son id"""
+        conversation = service.start_conversation('listing-1', 'buyer')
+        stream = open_stream(service, broker.subscribe('seller'))
+        next(stream)
+        next(stream)
+        
+        sent = service.send_message(conversation.conversation_id, 'buyer', 'Bonjour')
+        
+        chunk = next(stream)
+        assert chunk.startswith(f"id: {sent.message_id}\nevent: message\n")
+        assert '"content": "Bonjour"' in chunk
+        stream.close()
+    
+    def test_resume_replays_missed_messages_without_duplicates(self, broker, service):
+        """Vérifie la reprise Last-Event-ID sans doublon avec la file du broker"""
+        conversation = service.start_conversation('listing-1', 'buyer')
+        first = service.send_message(conversation.conversation_id, 'buyer', 'Un')
+        
+        subscription = broker.subscribe('seller')
+        # Envoyé entre l'abonnement et la relecture: présent dans la base ET la file
+        second = service.send_message(conversation.conversation_id, 'buyer', 'Deux')
+        stream = open_stream(service, subscription, first.message_id, 0.01)
+        
+        chunks = [next(stream) for _ in range(3)]
+        assert chunks[1].startswith(f"id: {second.message_id}\n")
+        assert chunks[2].startswith('event: unread')
+        
+        # L'événement 'message' en file est écarté, seul le compteur passe
+        assert next(stream).startswith('event: unread')
+        assert next(stream) == ': heartbeat\n\n'
+        stream.close()
+    
+    def test_closing_stream_releases_subscription(self, broker, service):
+        """Vérifie que la déconnexion du client libère la place"""
+        stream = open_stream(service, broker.subscribe('seller'))
+        next(stream)
+        
+        stream.close()
+        
+        assert broker.connection_count == 0
+
+
+class TestStreamEndpoint:
+    """Tests pour GET /api/messages/stream"""
+    
+    @pytest.fixture
+    def client(self, broker):
+        session_validation_service._session_repository.save(Session(
+            user_id='seller',
+            token='stream-token',
+            expires_at=datetime.now() + timedelta(hours=1)
+        ))
+        
+        app = Flask(__name__)
+        app.register_blueprint(message_resource.messages_bp, url_prefix='/api')
+        register_auth_exception_handlers(app)
+        register_service_exception_handlers(app)
+        return app.test_client()
+    
+    def test_stream_headers(self, client):
+        """Vérifie le type de contenu et la désactivation des tampons"""
+        response = client.get('/api/messages/stream?access_token=stream-token', buffered=False)
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert response.headers['X-Accel-Buffering'] == 'no'
+        response.close()
+    
+    def test_stream_requires_session(self, client):
+        """Vérifie qu'un flux sans jeton est refusé"""
+        response = client.get('/api/messages/stream')
+        
+        assert response.status_code == 401
+    
+    def test_connection_cap_returns_503(self, client, broker):
+        """Vérifie le 503 + Retry-After quand le worker est plein"""
+        broker.subscribe('someone-else')
+        
+        response = client.get('/api/messages/stream?access_token=stream-token')
+        
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '5'
+    
+    def test_head_request_releases_subscription(self, client, broker):
+        """Vérifie qu'un flux dont le corps n'est jamais lu libère sa place"""
+        for _ in range(3):
+            response = client.head('/api/messages/stream?access_token=stream-token', buffered=True)
+            assert response.status_code == 200
+            assert broker.connection_count == 0
+    
+    def test_replay_is_read_before_the_body(self, client, broker, service, monkeypatch):
+        """Vérifie que la relecture est faite par la vue, dans l'unité de travail de la requête"""
+        conversation = service.start_conversation('listing-1', 'buyer')
+        first = service.send_message(conversation.conversation_id, 'buyer', 'Un')
+        second = service.send_message(conversation.conversation_id, 'buyer', 'Deux')
+        
+        response = client.get(
+            '/api/messages/stream?access_token=stream-token',
+            headers={'Last-Event-ID': str(first.message_id)},
+            buffered=False
+        )
+        # Corps lu hors de la requête: plus aucune lecture en base permise
+        for method in ('get_missed_messages', 'get_unread_count'):
+            monkeypatch.setattr(service, method, Mock(side_effect=AssertionError("lecture hors requête")))
+        
+        chunks = response.iter_encoded()
+        next(chunks)
+        assert next(chunks).startswith(f"id: {second.message_id}\n".encode())
+        assert next(chunks) == b'event: unread\ndata: {"unread_count": 2}\n\n'
+        response.close()
+    
+    def test_failed_replay_releases_subscription(self, client, broker, service, monkeypatch):
+        """Vérifie qu'une lecture en échec ne garde pas la place du flux"""
+        monkeypatch.setattr(service, 'get_unread_count', lambda user_id: 1 / 0)
+        
+        response = client.get('/api/messages/stream?access_token=stream-token')
+        
+        assert response.status_code == 500
+        assert broker.connection_count == 0
+    
+    def test_client_gone_before_first_chunk_releases_subscription(self, client, broker):
+        """Vérifie la libération quand le client part avant le premier événement"""
+        response = client.get('/api/messages/stream?access_token=stream-token', buffered=False)
+        assert broker.connection_count == 1
+        
+        response.close()
+        
+        assert broker.connection_count == 0
+
+
+class TestStartConversationEndpoint:
+    """Tests pour POST /api/conversations"""
+    
+    @pytest.fixture
+    def client(self, broker):
+        for user_id in ('buyer', 'seller'):
+            session_validation_service._session_repository.save(Session(
+                user_id=user_id,
+                token=f"{user_id}-token",
+                expires_at=datetime.now() + timedelta(hours=1)
+            ))
+        
+        app = Flask(__name__)
+        app.register_blueprint(message_resource.messages_bp, url_prefix='/api')
+        register_auth_exception_handlers(app)
+        register_listing_exception_handlers(app)
+        return app.test_client()
+    
+    def _post(self, client, user_id, body):
+        return client.post('/api/conversations', json=body, headers={'Authorization': f"Bearer {user_id}-token"})
+    
+    def test_seller_comes_from_listing(self, client, broker):
+        """Vérifie qu'un seller_id envoyé par le client est ignoré"""
+        seller_stream = broker.subscribe('seller')
+        
+        response = self._post(client, 'buyer', {'listing_id': 'listing-1', 'seller_id': 'intrus', 'content': 'Bonjour'})
+        
+        assert response.status_code == 201
+        assert seller_stream.get(timeout=0.1).event == 'message'
+    
+    def test_unknown_listing_returns_404(self, client):
+        """Vérifie le 404 pour une annonce inexistante"""
+        assert self._post(client, 'buyer', {'listing_id': 'listing-404'}).status_code == 404
+    
+    def test_own_listing_returns_400(self, client):
+        """Vérifie le 400 quand l'acheteur est le vendeur"""
+        assert self._post(client, 'seller', {'listing_id': 'listing-1'}).status_code == 400
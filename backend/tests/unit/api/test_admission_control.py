@@ -0,0 +1,105 @@
+"""
+Tests unitaires pour le contrôle d'admission des requêtes HTTP.
+"""
+import threading
+
+import pytest
+from flask import Flask, jsonify
+
+from api.admission_control import Priority, admission_priority, register_admission_control
+from api.exceptions.mappers.service_exception_mapper import register_service_exception_handlers
+from infrastructure.concurrency.admission_controller import AdmissionController
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestAdmissionControlHooks:
+    """Tests pour l'admission autour des requêtes"""
+    
+    @pytest.fixture
+    def context(self):
+        controller = AdmissionController(initial_limit=5, min_limit=1, registry=MetricsRegistry())
+        seen = []
+        
+        app = Flask(__name__)
+        register_admission_control(app, controller)
+        register_service_exception_handlers(app)
+        
+        @app.route('/listings/<listing_id>')
+        @admission_priority(Priority.HIGH)
+        def get_listing(listing_id):
+            seen.append(controller.in_flight)
+            return jsonify({'id': listing_id})
+        
+        @app.route('/export')
+        @admission_priority(Priority.LOW)
+        def export():
+            return jsonify({'ok': True})
+        
+        @app.route('/health')
+        @admission_priority(Priority.CRITICAL)
+        def health():
+            return jsonify({'status': 'ok'})
+        
+        @app.route('/boom')
+        def boom():
+            raise RuntimeError("échec")
+        
+        return app.test_client(), controller, seen
+    
+    def _saturate(self, controller, count):
+        for _ in range(count):
+            controller.admit(Priority.HIGH)
+    
+    def test_admitted_request_is_counted_then_released(self, context):
+        client, controller, seen = context
+        
+        response = client.get('/listings/1')
+        
+        assert response.status_code == 200
+        assert seen == [1]
+        assert controller.in_flight == 0
+    
+    def test_saturation_rejects_batch_but_serves_listing_reads(self, context):
+        client, controller, _ = context
+        self._saturate(controller, 3)
+        
+        rejected = client.get('/export')
+        served = client.get('/listings/1')
+        
+        assert rejected.status_code == 503
+        assert rejected.headers['Retry-After'] == '1'
+        assert rejected.get_json()['error'] == 'SERVICE_OVERLOADED'
+        assert served.status_code == 200
+    
+    def test_health_is_never_shed(self, context):
+        client, controller, _ = context
+        self._saturate(controller, 5)
+        
+        assert client.get('/health').status_code == 200
+        assert client.get('/listings/1').status_code == 503
+    
+    def test_unhandled_error_releases_slot(self, context):
+        client, controller, _ = context
+        client.application.config['PROPAGATE_EXCEPTIONS'] = False
+        
+        assert client.get('/boom').status_code == 500
+        assert controller.in_flight == 0
+    
+    def test_concurrent_requests_never_exceed_limit(self, context):
+        client, controller, seen = context
+        barrier = threading.Barrier(8)
+        statuses = []
+        
+        def request():
+            barrier.wait()
+            statuses.append(client.get('/listings/1').status_code)
+        
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert max(seen) <= 5
+        assert controller.in_flight == 0
+        assert set(statuses) <= {200, 503}
@@ -0,0 +1,129 @@
+"""
+Tests unitaires pour la compression des réponses HTTP.
+"""
+import gzip
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from api.compression import precompressed_response, register_compression
+from infrastructure.compression.response_compressor import PrecompressedPayload, ResponseCompressor
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+LISTINGS = [{'listing_id': str(index), 'title': 'Manuel de calcul', 'price': 40} for index in range(300)]
+
+
+class TestCompressionHooks:
+    """Tests pour la négociation et la compression après la vue"""
+    
+    @pytest.fixture
+    def client(self):
+        compressor = ResponseCompressor(stream_threshold_bytes=64 * 1024, registry=MetricsRegistry())
+        payload = PrecompressedPayload(b'[' + b','.join(b'{"title": "Manuel de calcul"}' for _ in range(300)) + b']')
+        
+        app = Flask(__name__)
+        register_compression(app, compressor)
+        
+        @app.route('/listings')
+        def listings():
+            return jsonify(LISTINGS)
+        
+        @app.route('/large')
+        def large():
+            return jsonify(LISTINGS * 10)
+        
+        @app.route('/small')
+        def small():
+            return jsonify({'ok': True})
+        
+        @app.route('/stream')
+        def stream():
+            return Response((f"ligne {index}\n" for index in range(2000)), mimetype='text/plain')
+        
+        @app.route('/events')
+        def events():
+            return Response((f"data: {index}\n\n" for index in range(2000)), mimetype='text/event-stream')
+        
+        @app.route('/snapshot')
+        def snapshot():
+            return precompressed_response(payload, compressor=compressor)
+        
+        return app.test_client(), payload
+    
+    def test_json_is_gzipped_when_accepted(self, client):
+        client, _ = client
+        
+        response = client.get('/listings', headers={'Accept-Encoding': 'gzip, deflate'})
+        
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert int(response.headers['Content-Length']) == len(response.data)
+        assert gzip.decompress(response.data).startswith(b'[{')
+    
+    def test_identity_when_not_accepted(self, client):
+        client, _ = client
+        
+        response = client.get('/listings')
+        
+        assert 'Content-Encoding' not in response.headers
+        assert 'Accept-Encoding' in response.headers['Vary']
+    
+    def test_small_body_is_not_compressed(self, client):
+        client, _ = client
+        
+        response = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+        
+        assert 'Content-Encoding' not in response.headers
+    
+    def test_large_body_is_streamed(self, client):
+        client, _ = client
+        
+        response = client.get('/large', headers={'Accept-Encoding': 'gzip'})
+        
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Content-Length' not in response.headers
+        assert len(gzip.decompress(response.data)) > 64 * 1024
+    
+    def test_generator_response_is_compressed_on_the_fly(self, client):
+        client, _ = client
+        
+        response = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+        
+        assert gzip.decompress(response.data).splitlines()[-1] == b'ligne 1999'
+    
+    def test_event_stream_is_never_compressed(self, client):
+        client, _ = client
+        
+        response = client.get('/events', headers={'Accept-Encoding': 'gzip'})
+        
+        assert 'Content-Encoding' not in response.headers
+    
+    def test_precompressed_payload_is_served_as_is(self, client):
+        client, payload = client
+        
+        compressed = client.get('/snapshot', headers={'Accept-Encoding': 'gzip'})
+        plain = client.get('/snapshot', headers={'Accept-Encoding': 'identity'})
+        
+        assert compressed.data == payload.variant('gzip')
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert plain.data == payload.body
+    
+    def test_precompressed_payload_revalidates_per_variant(self, client):
+        client, payload = client
+        
+        compressed = client.get('/snapshot', headers={'Accept-Encoding': 'gzip'})
+        revalidated = client.get(
+            '/snapshot',
+            headers={'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag']}
+        )
+        plain = client.get(
+            '/snapshot',
+            headers={'Accept-Encoding': 'identity', 'If-None-Match': compressed.headers['ETag']}
+        )
+        
+        assert compressed.headers['ETag'] == f'"{payload.etag}-gzip"'
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+        assert plain.status_code == 200
+        assert plain.data == payload.body
@@ -0,0 +1,146 @@
+"""
+Tests unitaires pour la limitation de débit des requêtes HTTP.
+"""
+import pytest
+from flask import Flask, jsonify, request
+
+from api.exceptions.mappers.service_exception_mapper import register_service_exception_handlers
+from api.rate_limiting import (
+    BROWSE_POLICY,
+    SEARCH_POLICY,
+    catalogue_policy,
+    client_identity,
+    rate_limit,
+    register_proxy_fix,
+    register_rate_limiting,
+)
+from infrastructure.concurrency.rate_limiter import RateLimiter, RatePolicy
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestRateLimitingHooks:
+    """Tests pour le contrôle du débit avant les vues"""
+    
+    @pytest.fixture
+    def client(self):
+        limiter = RateLimiter(registry=MetricsRegistry())
+        
+        app = Flask(__name__)
+        register_rate_limiting(app, limiter)
+        register_service_exception_handlers(app)
+        
+        @app.route('/listings')
+        @rate_limit(RatePolicy('search', capacity=2, refill_per_second=0.1))
+        def search():
+            return jsonify([])
+        
+        @app.route('/health')
+        def health():
+            return jsonify({'status': 'ok'})
+        
+        return app.test_client()
+    
+    def test_exhausted_bucket_returns_429(self, client):
+        statuses = [client.get('/listings', headers={'X-User-Id': '42'}).status_code for _ in range(3)]
+        response = client.get('/listings', headers={'X-User-Id': '42'})
+        
+        assert statuses == [200, 200, 429]
+        assert response.get_json()['error'] == 'RATE_LIMITED'
+        assert response.headers['Retry-After'] == '10'
+    
+    def test_users_are_limited_separately_from_anonymous_ip(self, client):
+        for _ in range(2):
+            client.get('/listings', headers={'X-User-Id': '42'})
+        
+        assert client.get('/listings', headers={'X-User-Id': '43'}).status_code == 200
+        assert client.get('/listings').status_code == 200
+    
+    def test_routes_without_policy_are_not_limited(self, client):
+        assert {client.get('/health').status_code for _ in range(10)} == {200}
+
+
+class TestRequestDependentPolicy:
+    """Tests pour la politique choisie selon la requête (recherche ou consultation)"""
+    
+    @pytest.fixture
+    def client(self):
+        limiter = RateLimiter(registry=MetricsRegistry())
+        search = RatePolicy('search', capacity=1, refill_per_second=0.1)
+        browse = RatePolicy('browse', capacity=3, refill_per_second=0.1)
+        
+        app = Flask(__name__)
+        register_rate_limiting(app, limiter)
+        register_service_exception_handlers(app)
+        
+        @app.route('/listings')
+        @rate_limit(lambda: search if request.args.get('search') else browse)
+        def listings():
+            return jsonify([])
+        
+        return app.test_client()
+    
+    def test_browsing_does_not_spend_search_bucket(self, client):
+        browsing = [client.get('/listings').status_code for _ in range(3)]
+        
+        assert browsing == [200, 200, 200]
+        assert client.get('/listings?search=velo').status_code == 200
+        assert client.get('/listings?search=velo').status_code == 429
+        assert client.get('/listings').status_code == 429
+    
+    def test_catalogue_policy_selects_search_bucket_only_with_search(self):
+        app = Flask(__name__)
+        
+        with app.test_request_context('/listings?search=velo'):
+            assert catalogue_policy() is SEARCH_POLICY
+        with app.test_request_context('/listings?category=6&search=%20'):
+            assert catalogue_policy() is BROWSE_POLICY
+
+
+class TestProxyFix:
+    """Tests pour l'adresse du client derrière un mandataire"""
+    
+    def _client(self, hops=None):
+        limiter = RateLimiter(registry=MetricsRegistry())
+        
+        app = Flask(__name__)
+        if hops is None:
+            register_proxy_fix(app)
+        else:
+            register_proxy_fix(app, hops)
+        register_rate_limiting(app, limiter)
+        register_service_exception_handlers(app)
+        
+        @app.route('/listings')
+        @rate_limit(RatePolicy('search', capacity=1, refill_per_second=0.1))
+        def search():
+            return jsonify(client_identity())
+        
+        return app.test_client()
+    
+    def test_forwarded_clients_get_their_own_bucket(self):
+        client = self._client(hops=1)
+        
+        first = client.get('/listings', headers={'X-Forwarded-For': '203.0.113.7'})
+        other = client.get('/listings', headers={'X-Forwarded-For': '203.0.113.8'})
+        
+        assert first.get_json() == 'ip:203.0.113.7'
+        assert other.status_code == 200
+        assert client.get('/listings', headers={'X-Forwarded-For': '203.0.113.7'}).status_code == 429
+    
+    def test_addresses_added_by_client_are_not_trusted(self):
+        client = self._client(hops=1)
+        
+        response = client.get('/listings', headers={'X-Forwarded-For': '10.0.0.1, 203.0.113.7'})
+        
+        assert response.get_json() == 'ip:203.0.113.7'
+    
+    def test_without_trusted_proxy_forwarded_header_is_ignored(self):
+        client = self._client(hops=0)
+        
+        assert client.get('/listings', headers={'X-Forwarded-For': '203.0.113.7'}).get_json() == 'ip:127.0.0.1'
+    
+    def test_forwarded_header_is_not_trusted_by_default(self):
+        # TRUSTED_PROXY_HOPS non déclaré: le déploiement derrière nginx doit l'activer
+        client = self._client()
+        
+        assert client.get('/listings', headers={'X-Forwarded-For': '203.0.113.7'}).get_json() == 'ip:127.0.0.1'
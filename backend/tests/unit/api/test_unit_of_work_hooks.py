@@ -0,0 +1,184 @@
+"""
+Tests unitaires pour l'unité de travail par requête HTTP.
+"""
+import io
+
+import pytest
+from flask import Flask, jsonify, request
+
+from api.exceptions.mappers.service_exception_mapper import register_service_exception_handlers
+from api.unit_of_work import CONSISTENCY_HEADER, register_unit_of_work
+from infrastructure.database.consistency_tokens import ConsistencyTokenStore
+from infrastructure.database.transaction_runner import TransactionRunner
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from tests.unit.infrastructure.database.test_replica_router import FakeServer, _router
+from tests.unit.infrastructure.database.test_transaction_runner import DEADLOCK
+from tests.unit.infrastructure.database.test_unit_of_work import RowRepository, _pool
+
+
+class TestUnitOfWorkHooks:
+    """Tests pour l'ouverture et la fermeture de l'unité autour des requêtes"""
+    
+    @pytest.fixture
+    def context(self):
+        pool = _pool()
+        manager = UnitOfWorkManager(pool, MetricsRegistry())
+        listings, messages = RowRepository(manager.connection()), RowRepository(manager.connection())
+        connections = []
+        
+        app = Flask(__name__)
+        register_unit_of_work(app, manager)
+        
+        @app.route('/publish', methods=['POST'])
+        def publish():
+            listings.add('annonce')
+            messages.add('message')
+            connections.append(manager.current.connection)
+            return jsonify({'ok': True}), 201
+        
+        @app.route('/invalid', methods=['POST'])
+        def invalid():
+            listings.add('annonce')
+            connections.append(manager.current.connection)
+            return jsonify({'error': 'INVALID'}), 400
+        
+        @app.route('/health')
+        def health():
+            return jsonify({'status': 'ok'})
+        
+        return app.test_client(), pool, connections
+    
+    def test_one_commit_per_request(self, context):
+        client, pool, connections = context
+        
+        response = client.post('/publish')
+        
+        assert response.status_code == 201
+        assert connections[0].commits == 1
+        assert pool.in_use == 0
+    
+    def test_error_response_rolls_back(self, context):
+        client, pool, connections = context
+        
+        client.post('/invalid')
+        
+        assert (connections[0].commits, connections[0].rollbacks) == (0, 1)
+        assert pool.in_use == 0
+    
+    def test_request_without_sql_borrows_nothing(self, context):
+        client, pool, _ = context
+        
+        client.get('/health')
+        
+        assert pool.in_use == 0
+        assert pool.size == 2
+    
+    def test_failed_commit_returns_500(self, context):
+        client, pool, connections = context
+        client.post('/publish')
+        connections[0].fail_commit = True
+        
+        response = client.post('/publish')
+        
+        assert response.status_code == 500
+        assert response.get_json()['error'] == 'DATABASE_ERROR'
+        assert pool.in_use == 0
+
+
+class TestConflictRetryHooks:
+    """Tests pour le rejeu de la requête sur conflit de verrous"""
+    
+    @pytest.fixture
+    def context(self):
+        pool = _pool()
+        registry = MetricsRegistry()
+        manager = UnitOfWorkManager(pool, registry)
+        runner = TransactionRunner(manager, max_retries=2, sleep=lambda seconds: None, registry=registry)
+        repository = RowRepository(manager.connection())
+        deadlocks = []
+        attempts = []
+        
+        app = Flask(__name__)
+        register_unit_of_work(app, manager, ConsistencyTokenStore(window_seconds=5), runner)
+        register_service_exception_handlers(app)
+        
+        @app.route('/publish', methods=['POST'])
+        def publish():
+            attempts.append(request.files['photo'].read())
+            try:
+                repository.add('annonce')
+                if deadlocks and deadlocks.pop(0):
+                    # Comme un repository MySQL: l'erreur est signalée à la connexion puis levée
+                    manager.connection().handle_error(DEADLOCK)
+                    raise DEADLOCK
+            except Exception:
+                # Les ressources rattrapent tout: seule l'unité de travail connaît le conflit
+                return jsonify({'error': 'INTERNAL_ERROR'}), 500
+            return jsonify({'ok': True}), 201
+        
+        return app.test_client(), pool, deadlocks, attempts, registry
+    
+    def _post(self, client):
+        return client.post('/publish', data={'photo': (io.BytesIO(b'jpeg'), 'photo.jpg')})
+    
+    def test_deadlock_swallowed_by_resource_replays_request(self, context):
+        client, pool, deadlocks, attempts, registry = context
+        deadlocks.extend([True])
+        
+        response = self._post(client)
+        
+        assert response.status_code == 201
+        assert attempts == [b'jpeg', b'jpeg']
+        assert registry.counter('db_transaction_retries_total', '').value() == 1
+        assert pool.in_use == 0
+    
+    def test_exhausted_budget_returns_503(self, context):
+        client, pool, deadlocks, attempts, _ = context
+        deadlocks.extend([True] * 5)
+        
+        response = self._post(client)
+        
+        assert response.status_code == 503
+        assert 'Retry-After' in response.headers
+        assert len(attempts) == 3
+        assert pool.in_use == 0
+
+
+class TestReadYourWritesHooks:
+    """Tests pour le routage des lectures et l'en-tête de cohérence"""
+    
+    @pytest.fixture
+    def context(self):
+        servers = FakeServer('primary', 'A:1-10'), FakeServer('r1', 'A:1-10'), FakeServer('r2', 'A:1-10')
+        router = _router(servers)
+        manager = UnitOfWorkManager(router.primary, MetricsRegistry(), router=router)
+        repository = RowRepository(manager.connection())
+        
+        app = Flask(__name__)
+        register_unit_of_work(app, manager, ConsistencyTokenStore(window_seconds=5))
+        
+        @app.route('/listings', methods=['GET', 'POST'])
+        def listings():
+            if request.method == 'POST':
+                repository.add('annonce')
+            return jsonify({'server': manager.current.connection.server.name})
+        
+        return app.test_client(), servers
+    
+    def test_get_reads_from_replica(self, context):
+        client, _ = context
+        
+        assert client.get('/listings').get_json()['server'] in ('r1', 'r2')
+    
+    def test_write_returns_token_that_pins_next_read(self, context):
+        client, (primary, r1, r2) = context
+        primary.gtid_after_commit = 'A:1-11'
+        
+        written = client.post('/listings')
+        r1.gtid_executed = 'A:1-11'
+        reads = [client.get('/listings', headers={CONSISTENCY_HEADER: written.headers[CONSISTENCY_HEADER]})
+                 for _ in range(4)]
+        
+        assert written.get_json()['server'] == 'primary'
+        assert {read.get_json()['server'] for read in reads} == {'r1'}
@@ -0,0 +1,94 @@
+"""
+Tests unitaires pour AuthenticationService.
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from application.auth.authentication_service import AuthenticationService
+from domain.auth.exceptions.invalid_credentials_exception import InvalidCredentialsException
+from domain.user.user import User
+from domain.user.exceptions.user_already_exists_exception import UserAlreadyExistsException
+from infrastructure.persistence.in_memory.in_memory_session_repository import InMemorySessionRepository
+from infrastructure.persistence.in_memory.in_memory_user_repository import InMemoryUserRepository
+from infrastructure.security.password_hasher import PasswordHasher
+
+
+class TestAuthenticationService:
+    """Tests pour la classe AuthenticationService"""
+    
+    @pytest.fixture
+    def user_repository(self):
+        return InMemoryUserRepository()
+    
+    @pytest.fixture
+    def session_repository(self):
+        return InMemorySessionRepository()
+    
+    @pytest.fixture
+    def hasher(self):
+        hasher = PasswordHasher(rounds=4, executor_factory=lambda: ThreadPoolExecutor(2))
+        yield hasher
+        hasher.shutdown()
+    
+    @pytest.fixture
+    def service(self, user_repository, session_repository, hasher):
+        return AuthenticationService(user_repository, session_repository, hasher)
+    
+    def test_register_hashes_password(self, service, user_repository):
+        """Vérifie que le mot de passe est stocké haché"""
+        user = service.register('abk1234', 'motdepasse123')
+        
+        assert user.user_id is not None
+        assert user.email == 'abk1234@ulaval.ca'
+        assert user_repository.find_by_idul('abk1234').password_hash.startswith('$2b$04$')
+    
+    def test_register_duplicate_idul_raises(self, service):
+        """Vérifie qu'un IDUL ne peut être inscrit deux fois"""
+        service.register('abk1234', 'motdepasse123')
+        
+        with pytest.raises(UserAlreadyExistsException):
+            service.register('ABK1234', 'autremotdepasse')
+    
+    def test_login_creates_session(self, service, session_repository):
+        """Vérifie qu'une connexion réussie ouvre une session"""
+        user = service.register('abk1234', 'motdepasse123')
+        
+        session = service.login('abk1234', 'motdepasse123')
+        
+        assert session.user_id == user.user_id
+        assert session_repository.find_active_by_token(session.token) is not None
+    
+    def test_login_wrong_password_raises(self, service):
+        """Vérifie qu'un mauvais mot de passe est refusé"""
+        service.register('abk1234', 'motdepasse123')
+        
+        with pytest.raises(InvalidCredentialsException):
+            service.login('abk1234', 'mauvais-mot-de-passe')
+    
+    def test_login_unknown_user_raises(self, service):
+        """Vérifie qu'un IDUL inconnu est refusé avec la même erreur"""
+        with pytest.raises(InvalidCredentialsException):
+            service.login('inconnu', 'motdepasse123')
+    
+    def test_login_unknown_user_verifies_dummy_hash(self, service, hasher, monkeypatch):
+        """Vérifie qu'un IDUL inconnu coûte une vérification bcrypt (pas de fuite par la durée)"""
+        verified = []
+        monkeypatch.setattr(hasher, 'verify_dummy', verified.append)
+        
+        with pytest.raises(InvalidCredentialsException):
+            service.login('inconnu', 'motdepasse123')
+        
+        assert verified == ['motdepasse123']
+    
+    def test_login_rehashes_password_when_cost_changed(self, service, user_repository):
+        """Vérifie le recalcul transparent de l'empreinte à la connexion"""
+        old_hash = bcrypt.hashpw(b'motdepasse123', bcrypt.gensalt(5)).decode()
+        user_repository.save(User(idul='jdl5678', password_hash=old_hash))
+        
+        service.login('jdl5678', 'motdepasse123')
+        
+        new_hash = user_repository.find_by_idul('jdl5678').password_hash
+        assert new_hash != old_hash
+        assert new_hash.startswith('$2b$04$')
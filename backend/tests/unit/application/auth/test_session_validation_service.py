@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour SessionValidationService.
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from application.auth.session_validation_service import SessionValidationService
+from domain.auth.session import Session
+from domain.auth.session_repository import SessionRepository
+from domain.auth.exceptions.invalid_session_exception import InvalidSessionException
+from infrastructure.auth.revocation_channel import LocalRevocationChannel
+from infrastructure.auth.session_cache import SessionCache
+from infrastructure.persistence.in_memory.in_memory_session_repository import InMemorySessionRepository
+
+
+class TestSessionValidationService:
+    """Tests pour la classe SessionValidationService"""
+    
+    @pytest.fixture
+    def repository(self):
+        repository = InMemorySessionRepository()
+        expires_at = datetime.now() + timedelta(hours=1)
+        repository.save(Session(user_id='1', token='token-alice', expires_at=expires_at))
+        repository.save(Session(user_id='1', token='token-alice-2', expires_at=expires_at))
+        repository.save(Session(user_id='2', token='token-bob', expires_at=expires_at))
+        return repository
+    
+    @pytest.fixture
+    def cache(self):
+        return SessionCache(max_size=100)
+    
+    @pytest.fixture
+    def channel(self):
+        return LocalRevocationChannel()
+    
+    @pytest.fixture
+    def service(self, repository, cache, channel):
+        return SessionValidationService(repository, cache, channel)
+    
+    def test_validate_token_returns_user_id(self, service):
+        """Vérifie qu'un jeton actif retourne son utilisateur"""
+        assert service.validate_token('token-alice') == '1'
+    
+    def test_validate_missing_token_raises(self, service):
+        """Vérifie qu'un jeton absent est refusé"""
+        with pytest.raises(InvalidSessionException):
+            service.validate_token(None)
+    
+    def test_validate_unknown_token_raises(self, service):
+        """Vérifie qu'un jeton inconnu est refusé"""
+        with pytest.raises(InvalidSessionException):
+            service.validate_token('inconnu')
+    
+    def test_second_validation_hits_cache(self):
+        """Vérifie qu'une seule lecture en base est faite pour un même jeton"""
+        repository = Mock(spec=SessionRepository)
+        repository.find_active_by_token.return_value = Session(
+            user_id='5', token='t', expires_at=datetime.now() + timedelta(hours=1)
+        )
+        service = SessionValidationService(repository, SessionCache())
+        
+        service.validate_token('t')
+        service.validate_token('t')
+        
+        repository.find_active_by_token.assert_called_once_with('t')
+    
+    def test_without_cache_every_validation_reads_repository(self):
+        """Vérifie le comportement sans cache (une lecture par requête)"""
+        repository = Mock(spec=SessionRepository)
+        repository.find_active_by_token.return_value = Session(
+            user_id='5', token='t', expires_at=datetime.now() + timedelta(hours=1)
+        )
+        service = SessionValidationService(repository)
+        
+        service.validate_token('t')
+        service.validate_token('t')
+        
+        assert repository.find_active_by_token.call_count == 2
+    
+    def test_revoke_session_invalidates_cache(self, service):
+        """Vérifie qu'un jeton révoqué est refusé même s'il était en cache"""
+        service.validate_token('token-alice')
+        
+        assert service.revoke_session('token-alice') is True
+        
+        with pytest.raises(InvalidSessionException):
+            service.validate_token('token-alice')
+    
+    def test_revoke_user_sessions_invalidates_all_user_tokens(self, service):
+        """Vérifie que la réinitialisation du mot de passe révoque toutes les sessions"""
+        service.validate_token('token-alice')
+        service.validate_token('token-alice-2')
+        service.validate_token('token-bob')
+        
+        assert service.revoke_user_sessions('1') == 2
+        
+        with pytest.raises(InvalidSessionException):
+            service.validate_token('token-alice-2')
+        assert service.validate_token('token-bob') == '2'
+    
+    def test_revocation_from_other_worker_invalidates_cache(self, repository, cache, channel):
+        """Vérifie qu'une révocation reçue sur le canal retire l'entrée locale"""
+        service = SessionValidationService(repository, cache, channel)
+        service.validate_token('token-bob')
+        
+        # Un autre worker a révoqué la session en base puis l'a diffusé
+        repository.revoke('token-bob')
+        channel.publish('token', Session.hash_token('token-bob'))
+        
+        with pytest.raises(InvalidSessionException):
+            service.validate_token('token-bob')
+    
+    def test_revocation_during_lookup_is_not_cached(self, repository, cache, channel):
+        """Vérifie qu'une session révoquée pendant la lecture en base n'est pas mise en cache"""
+        service = SessionValidationService(repository, cache, channel)
+        find_active_by_token = repository.find_active_by_token
+        
+        def lookup_then_revoke(token):
+            session = find_active_by_token(token)
+            # Révocation arrivée entre la lecture en base et la mise en cache
+            repository.revoke(token)
+            channel.publish('token', Session.hash_token(token))
+            return session
+        
+        repository.find_active_by_token = lookup_then_revoke
+        assert service.validate_token('token-bob') == '2'
+        repository.find_active_by_token = find_active_by_token
+        
+        assert cache.get(Session.hash_token('token-bob')) is None
+        with pytest.raises(InvalidSessionException):
+            service.validate_token('token-bob')
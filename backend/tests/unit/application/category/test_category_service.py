@@ -0,0 +1,147 @@
+"""
+Tests unitaires pour l'arbre des catégories et CategoryService.
+"""
+import pytest
+
+from application.category.category_service import CategoryService
+from domain.category.category import Category
+from domain.category.category_tree import CategoryTree
+from domain.category.exceptions.category_not_found_exception import CategoryNotFoundException
+from infrastructure.persistence.in_memory.in_memory_category_repository import InMemoryCategoryRepository
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class _CountingRepository(InMemoryCategoryRepository):
+    """Repository qui compte les chargements complets et peut tomber en panne"""
+    
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+        self.version_reads = 0
+        self.failing = False
+    
+    def find_all(self):
+        self.loads += 1
+        return super().find_all()
+    
+    def get_version(self):
+        self.version_reads += 1
+        if self.failing:
+            raise RuntimeError("Base indisponible")
+        return super().get_version()
+
+
+class TestCategoryTree:
+    """Tests pour la construction de l'arbre et les descendants"""
+    
+    @pytest.fixture
+    def tree(self):
+        return CategoryTree(InMemoryCategoryRepository().find_all(), version=1)
+    
+    def test_descendants_include_self_and_subcategories(self, tree):
+        """Vérifie les descendants précalculés d'une racine et d'une feuille"""
+        assert tree.descendants(5) == {5, 6, 7}
+        assert tree.descendants(1) == {1, 2, 3, 4}
+        assert tree.descendants(6) == {6}
+        assert tree.descendants(99) == frozenset()
+    
+    def test_find_by_id_or_name(self, tree):
+        """Vérifie la recherche par ID, chaîne de chiffres ou nom sans égard à la casse"""
+        assert tree.find(5).name == 'Électronique'
+        assert tree.find(' 5 ').name == 'Électronique'
+        assert tree.find('électronique').category_id == 5
+        assert tree.find('billets  &  événements').category_id == 12
+        assert tree.find('electronics') is None
+        assert tree.find(True) is None
+    
+    def test_non_ascii_digits_are_names_not_ids(self, tree):
+        """Vérifie qu'un chiffre Unicode ('²', '٥') n'est ni un ID ni une erreur"""
+        assert tree.find('²') is None
+        assert tree.find('٥') is None
+    
+    def test_parent_and_children_maps(self, tree):
+        """Vérifie les liens parent/enfants et les racines"""
+        assert [child.category_id for child in tree.children_of(5)] == [6, 7]
+        assert tree.parent_of(7).category_id == 5
+        assert tree.parent_of(5) is None
+        assert [root.category_id for root in tree.roots] == [1, 5, 8, 9, 10, 11, 12]
+    
+    def test_deep_tree_and_missing_parent(self):
+        """Vérifie un arbre profond et un parent absent (traité comme racine)"""
+        categories = [Category(1, 'Racine')] + [Category(i, f'Niveau {i}', i - 1) for i in range(2, 2001)]
+        categories.append(Category(3000, 'Orpheline', 2999))
+        tree = CategoryTree(categories)
+        
+        assert len(tree.descendants(1)) == 2000
+        assert tree.descendants(3000) == {3000}
+        assert tree.parent_of(3000) is None
+    
+    def test_cycle_is_rejected(self):
+        """Vérifie qu'un cycle de parents est refusé"""
+        with pytest.raises(ValueError):
+            CategoryTree([Category(1, 'A', 2), Category(2, 'B', 1), Category(3, 'C')])
+
+
+class TestCategoryService:
+    """Tests pour le chargement unique et le rafraîchissement par version"""
+    
+    @pytest.fixture
+    def clock(self):
+        return _FakeClock()
+    
+    @pytest.fixture
+    def repository(self):
+        return _CountingRepository()
+    
+    @pytest.fixture
+    def service(self, repository, clock):
+        return CategoryService(repository, refresh_interval_seconds=30, clock=clock)
+    
+    def test_expand_filter_returns_flat_id_list(self, service):
+        """Vérifie qu'un filtre sur une catégorie parente inclut ses sous-catégories"""
+        assert service.expand_filter('Électronique') == [5, 6, 7]
+        assert service.expand_filter('6') == [6]
+        with pytest.raises(CategoryNotFoundException):
+            service.expand_filter('electronics')
+    
+    def test_tree_is_loaded_once_between_checks(self, service, repository, clock):
+        """Vérifie que la version n'est relue qu'une fois par intervalle"""
+        for _ in range(100):
+            assert service.is_valid('Mobilier')
+        assert repository.loads == 1
+        assert repository.version_reads == 1
+        
+        clock.now = 31
+        service.is_valid('Mobilier')
+        assert repository.version_reads == 2
+        assert repository.loads == 1
+    
+    def test_version_bump_reloads_the_tree(self, service, repository, clock):
+        """Vérifie qu'une nouvelle catégorie est visible après le prochain contrôle"""
+        assert not service.is_valid('Tablettes')
+        repository.save(Category(13, 'Tablettes', 5))
+        
+        assert not service.is_valid('Tablettes')
+        clock.now = 31
+        assert service.resolve('tablettes').category_id == 13
+        assert service.expand_filter(5) == [5, 6, 7, 13]
+        assert repository.loads == 2
+    
+    def test_known_tree_is_kept_when_version_check_fails(self, service, repository, clock):
+        """Vérifie que l'arbre connu reste servi si la base est indisponible"""
+        service.resolve(1)
+        repository.failing = True
+        clock.now = 31
+        
+        assert service.expand_filter('Livres & Cours') == [1, 2, 3, 4]
+        
+        clock.now = 40
+        service.tree
+        assert repository.version_reads == 2
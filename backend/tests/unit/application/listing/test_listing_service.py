@@ -0,0 +1,286 @@
+"""
+Tests unitaires pour ListingService (photos et couvertures).
+"""
+import pytest
+
+from application.category.category_service import CategoryService
+from application.listing.dtos.listing_creation_dto import ListingCreationDto
+from application.listing.listing_assembler import ListingAssembler
+from application.listing.listing_service import ListingService
+from domain.category.exceptions.category_not_found_exception import CategoryNotFoundException
+from domain.listing.exceptions.invalid_picture_exception import InvalidPictureException
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.in_memory.in_memory_category_repository import InMemoryCategoryRepository
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from tests.unit.infrastructure.database.test_unit_of_work import _pool
+
+
+class _DeferredGenerator:
+    """Générateur de variantes qui attend qu'on termine ses travaux"""
+    
+    def __init__(self):
+        self.pending = []
+    
+    def submit(self, relative_path, on_done):
+        self.pending.append((relative_path, on_done))
+    
+    def finish_all(self):
+        for relative_path, on_done in self.pending:
+            stem = relative_path.rsplit('.', 1)[0]
+            on_done({'thumbnail': f"{stem}_thumbnail.jpg", 'medium': f"{stem}_medium.jpg"})
+        self.pending.clear()
+
+
+def _creation_dto() -> ListingCreationDto:
+    return ListingCreationDto(
+        seller_id='seller-1',
+        title='Calculatrice TI-84',
+        description='En excellent état',
+        price=85.0,
+        category='6',
+        condition='Comme neuf',
+        location='Pavillon Adrien-Pouliot'
+    )
+
+
+class TestListingServicePictures:
+    """Tests pour l'ajout de photos et la couverture du catalogue"""
+    
+    @pytest.fixture
+    def generator(self):
+        return _DeferredGenerator()
+    
+    @pytest.fixture
+    def service(self, generator):
+        return ListingService(
+            InMemoryListingRepository(),
+            ListingAssembler(),
+            InMemoryListingPictureRepository(),
+            generator
+        )
+    
+    def test_listing_is_returned_before_variants_are_ready(self, service, generator):
+        """Vérifie que l'original sert de couverture en attendant la miniature"""
+        created = service.create_listing_with_pictures(_creation_dto(), ['a.jpg', 'b.png'])
+        
+        assert created.cover_image == '/uploads/a.jpg'
+        assert created.images == ['/uploads/a.jpg', '/uploads/b.png']
+        assert [path for path, _ in generator.pending] == ['a.jpg', 'b.png']
+    
+    def test_catalogue_serves_thumbnail_once_ready(self, service, generator):
+        """Vérifie que le catalogue bascule sur la miniature de la couverture"""
+        created = service.create_listing_with_pictures(_creation_dto(), ['a.jpg', 'b.png'])
+        
+        generator.finish_all()
+        
+        listings = service.get_all_listings()
+        assert [listing.cover_image for listing in listings] == ['/uploads/a_thumbnail.jpg']
+        assert service.get_listing_by_id(created.listing_id).cover_image == '/uploads/a_thumbnail.jpg'
+    
+    def test_variants_are_written_in_a_unit_of_work(self, generator):
+        """Vérifie que le rappel du pool écrit dans sa propre unité de travail"""
+        manager = UnitOfWorkManager(_pool(), MetricsRegistry())
+        pictures = InMemoryListingPictureRepository()
+        units = []
+        update_variants = pictures.update_variants
+        pictures.update_variants = lambda *args: (units.append(manager.current), update_variants(*args))
+        service = ListingService(
+            InMemoryListingRepository(), ListingAssembler(), pictures, generator, unit_of_work_manager=manager
+        )
+        service.create_listing_with_pictures(_creation_dto(), ['a.jpg'])
+        
+        generator.finish_all()
+        
+        assert len(units) == 1 and units[0] is not None
+        assert manager.current is None
+    
+    def test_listing_without_pictures_has_no_cover(self, service):
+        """Vérifie qu'une annonce sans photo n'a pas de couverture"""
+        service.create_listing(_creation_dto())
+        
+        assert service.get_all_listings()[0].cover_image is None
+    
+    def test_too_many_pictures_is_rejected_before_creation(self, service):
+        """Vérifie la limite de photos par annonce"""
+        paths = [f"{index}.jpg" for index in range(ListingService.MAX_PICTURES + 1)]
+        
+        with pytest.raises(InvalidPictureException):
+            service.create_listing_with_pictures(_creation_dto(), paths)
+        assert service.get_all_listings() == []
+
+
+class TestListingServiceCategories:
+    """Tests pour la catégorie enregistrée et le filtre par sous-catégories"""
+    
+    @pytest.fixture
+    def service(self):
+        return ListingService(
+            InMemoryListingRepository(),
+            ListingAssembler(),
+            category_service=CategoryService(InMemoryCategoryRepository())
+        )
+    
+    def test_category_name_is_stored_as_id(self, service):
+        """Vérifie que la catégorie donnée par nom est enregistrée par ID"""
+        dto = _creation_dto()
+        dto.category = 'calculatrices'
+        
+        created = service.create_listing(dto)
+        
+        assert created.category == '6'
+    
+    def test_parent_filter_includes_subcategories(self, service):
+        """Vérifie que filtrer sur Électronique inclut Calculatrices et Ordinateurs"""
+        for category in ('Électronique', 'Calculatrices', 'Ordinateurs', 'Mobilier'):
+            dto = _creation_dto()
+            dto.category = category
+            service.create_listing(dto)
+        
+        assert sorted(listing.category for listing in service.get_listings_by_category('Électronique')) == ['5', '6', '7']
+        assert [listing.category for listing in service.get_listings_by_category('7')] == ['7']
+    
+    def test_unknown_category_is_rejected(self, service):
+        """Vérifie le refus d'une catégorie absente de la table"""
+        dto = _creation_dto()
+        dto.category = 'electronics'
+        
+        with pytest.raises(CategoryNotFoundException):
+            service.create_listing(dto)
+
+
+class _RecordingCoalescer:
+    """Coalesceur qui retient les clés des lectures"""
+    
+    def __init__(self):
+        self.keys = []
+    
+    def run(self, key, fn):
+        self.keys.append(key)
+        return fn()
+
+
+class TestListingServiceQueries:
+    """Tests pour la lecture sérialisée et coalescée du catalogue"""
+    
+    @pytest.fixture
+    def coalescer(self):
+        return _RecordingCoalescer()
+    
+    @pytest.fixture
+    def service(self, coalescer):
+        service = ListingService(
+            InMemoryListingRepository(),
+            ListingAssembler(),
+            category_service=CategoryService(InMemoryCategoryRepository()),
+            query_coalescer=coalescer
+        )
+        for category in ('Calculatrices', 'Mobilier'):
+            dto = _creation_dto()
+            dto.category = category
+            service.create_listing(dto)
+        return service
+    
+    def test_results_are_serialized(self, service):
+        """Vérifie que la lecture retourne les dictionnaires servis par l'API"""
+        listings = service.query_listings()
+        
+        assert sorted(listing['category'] for listing in listings) == ['6', '9']
+    
+    def test_equivalent_filters_share_a_key(self, service, coalescer):
+        """Vérifie qu'une catégorie par nom ou par ID et une recherche mal espacée se coalescent"""
+        service.query_listings(category='Calculatrices')
+        service.query_listings(category='6')
+        service.query_listings(search='  TI-84 ')
+        service.query_listings(search='ti-84')
+        
+        assert coalescer.keys[0] == coalescer.keys[1] == ('category', ('6',))
+        assert coalescer.keys[2] == coalescer.keys[3] == ('search', 'ti-84')
+    
+    def test_seller_filter_takes_precedence(self, service, coalescer):
+        """Vérifie la priorité des filtres (vendeur, catégorie, recherche)"""
+        assert len(service.query_listings(seller_id='seller-1', category='Mobilier')) == 2
+        assert coalescer.keys == [('seller', 'seller-1')]
+    
+    def test_read_your_writes_bypasses_coalescing(self, service, coalescer):
+        """Vérifie qu'une lecture qui doit voir ses écritures n'est pas partagée"""
+        service.query_listings(coalesce=False)
+        
+        assert coalescer.keys == []
+    
+    def test_render_is_shared_with_the_read(self, service, coalescer):
+        """Vérifie que le rendu est fait dans la lecture partagée, sous une clé qui lui est propre"""
+        rendered = []
+        
+        def render(listings):
+            rendered.append(listings)
+            return b'rendu'
+        
+        assert service.query_listings(search='TI-84', render=render) == b'rendu'
+        assert len(rendered) == 1
+        assert coalescer.keys == [('search', 'ti-84', render)]
+    
+    def test_unknown_category_is_rejected_before_reading(self, service, coalescer):
+        """Vérifie que la catégorie est résolue avant la coalescence"""
+        with pytest.raises(CategoryNotFoundException):
+            service.query_listings(category='electronics')
+        assert coalescer.keys == []
+
+
+class _CountingSnapshots:
+    """Instantanés qui comptent les péremptions"""
+    
+    def __init__(self):
+        self.invalidations = 0
+    
+    def invalidate(self):
+        self.invalidations += 1
+
+
+class TestListingServiceSnapshots:
+    """Tests pour la péremption des instantanés du catalogue après les écritures"""
+    
+    @pytest.fixture
+    def snapshots(self):
+        return _CountingSnapshots()
+    
+    @pytest.fixture
+    def generator(self):
+        return _DeferredGenerator()
+    
+    @pytest.fixture
+    def service(self, snapshots, generator):
+        return ListingService(
+            InMemoryListingRepository(),
+            ListingAssembler(),
+            InMemoryListingPictureRepository(),
+            generator,
+            catalogue_snapshots=snapshots
+        )
+    
+    def test_creation_and_deletion_invalidate_snapshots(self, service, snapshots):
+        """Vérifie que chaque écriture du catalogue périme les instantanés"""
+        created = service.create_listing(_creation_dto())
+        service.delete_listing(created.listing_id, 'seller-1')
+        
+        assert snapshots.invalidations == 2
+    
+    def test_cover_thumbnail_invalidates_snapshots(self, service, snapshots, generator):
+        """Vérifie que la miniature de couverture prête périme les instantanés"""
+        service.create_listing_with_pictures(_creation_dto(), ['a.jpg', 'b.png'])
+        before = snapshots.invalidations
+        
+        generator.finish_all()
+        
+        assert snapshots.invalidations == before + 1
+    
+    def test_failed_invalidation_does_not_fail_write(self, service, snapshots):
+        """Vérifie qu'une péremption en échec n'annule pas l'écriture"""
+        def fail():
+            raise RuntimeError("instantanés indisponibles")
+        snapshots.invalidate = fail
+        
+        created = service.create_listing(_creation_dto())
+        
+        assert service.get_listing_by_id(created.listing_id).title == 'Calculatrice TI-84'
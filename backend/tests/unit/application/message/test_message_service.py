@@ -0,0 +1,290 @@
+"""
+Tests unitaires pour MessageService.
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from application.message.message_assembler import MessageAssembler
+from application.message.message_service import MessageService
+from domain.listing.exceptions.listing_not_found_exception import ListingNotFoundException
+from domain.listing.listing import Listing
+from domain.listing.listing_condition import ListingCondition
+from domain.listing.listing_price import ListingPrice
+from domain.message.exceptions.conversation_not_found_exception import ConversationNotFoundException
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.messaging.message_broker import MessageBroker
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.in_memory.in_memory_conversation_repository import InMemoryConversationRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.persistence.in_memory.in_memory_message_repository import InMemoryMessageRepository
+from tests.unit.infrastructure.database.test_unit_of_work import _pool
+
+
+def listings_of_seller() -> InMemoryListingRepository:
+    """Annonces listing-1, listing-2 et listing-9 du vendeur 'seller'"""
+    repository = InMemoryListingRepository()
+    for listing_id in ('listing-1', 'listing-2', 'listing-9'):
+        repository.save(Listing(
+            listing_id=listing_id,
+            seller_id='seller',
+            title='Calculatrice',
+            description='Calculatrice graphique',
+            price=ListingPrice(40),
+            category='1',
+            condition=ListingCondition.BON_ETAT,
+            location='Pavillon Pouliot'
+        ))
+    return repository
+
+
+class TestMessageService:
+    """Tests pour la classe MessageService"""
+    
+    @pytest.fixture
+    def broker(self):
+        return MessageBroker()
+    
+    @pytest.fixture
+    def service(self, broker):
+        conversation_repository = InMemoryConversationRepository()
+        message_repository = InMemoryMessageRepository(conversation_repository)
+        return MessageService(conversation_repository, message_repository, listings_of_seller(), MessageAssembler(), broker)
+    
+    @pytest.fixture
+    def conversation(self, service):
+        return service.start_conversation('listing-1', 'buyer')
+    
+    def test_start_conversation_is_get_or_create(self, service, conversation):
+        """Vérifie qu'une seule conversation existe par (annonce, acheteur)"""
+        again = service.start_conversation('listing-1', 'buyer')
+        
+        assert again.conversation_id == conversation.conversation_id
+    
+    def test_start_conversation_reads_seller_from_listing(self, service, conversation):
+        """Vérifie que le vendeur est celui de l'annonce"""
+        assert service.get_inbox('seller')[0].conversation_id == conversation.conversation_id
+    
+    def test_start_conversation_unknown_listing(self, service):
+        """Vérifie qu'une annonce inexistante lève une exception"""
+        with pytest.raises(ListingNotFoundException):
+            service.start_conversation('listing-404', 'buyer')
+        with pytest.raises(ListingNotFoundException):
+            service.start_conversation_with_message('listing-404', 'buyer', 'Bonjour')
+    
+    def test_start_conversation_rejects_own_listing(self, service):
+        """Vérifie qu'un vendeur ne peut pas s'écrire sur sa propre annonce"""
+        with pytest.raises(ValueError):
+            service.start_conversation('listing-1', 'seller')
+        with pytest.raises(ValueError):
+            service.start_conversation_with_message('listing-1', 'seller', 'Bonjour')
+    
+    def test_send_message_notifies_recipient_only(self, service, broker, conversation):
+        """Vérifie que le destinataire reçoit le message et son compteur de non-lus"""
+        seller_stream = broker.subscribe('seller')
+        buyer_stream = broker.subscribe('buyer')
+        
+        sent = service.send_message(conversation.conversation_id, 'buyer', 'Toujours disponible?')
+        
+        message_event = seller_stream.get(timeout=0.1)
+        assert message_event.event == 'message'
+        assert message_event.event_id == sent.message_id
+        assert message_event.data['content'] == 'Toujours disponible?'
+        
+        unread_event = seller_stream.get(timeout=0.1)
+        assert unread_event.event == 'unread'
+        assert unread_event.data == {'unread_count': 1}
+        
+        assert buyer_stream.get(timeout=0.01) is None
+    
+    def test_send_message_survives_broker_failure(self):
+        """Vérifie qu'une panne du broker n'empêche pas l'enregistrement"""
+        conversation_repository = InMemoryConversationRepository()
+        message_repository = InMemoryMessageRepository(conversation_repository)
+        broker = Mock()
+        broker.publish.side_effect = RuntimeError("broker indisponible")
+        service = MessageService(conversation_repository, message_repository, listings_of_seller(), MessageAssembler(), broker)
+        created = service.start_conversation('listing-1', 'buyer')
+        
+        service.send_message(created.conversation_id, 'buyer', 'Bonjour')
+        
+        assert len(message_repository.find_by_conversation(created.conversation_id, limit=10)) == 1
+    
+    def test_notifications_wait_for_commit(self, broker):
+        """Vérifie que rien n'est publié avant le commit, ni pour une transaction annulée"""
+        manager = UnitOfWorkManager(_pool(), MetricsRegistry())
+        conversation_repository = InMemoryConversationRepository()
+        service = MessageService(
+            conversation_repository,
+            InMemoryMessageRepository(conversation_repository),
+            listings_of_seller(),
+            MessageAssembler(),
+            broker,
+            manager
+        )
+        created = service.start_conversation('listing-1', 'buyer')
+        seller_stream = broker.subscribe('seller')
+        
+        with pytest.raises(RuntimeError):
+            with manager.scope():
+                service.send_message(created.conversation_id, 'buyer', 'Annulé')
+                raise RuntimeError("commit impossible")
+        assert seller_stream.get(timeout=0.01) is None
+        
+        with manager.scope():
+            sent = service.send_message(created.conversation_id, 'buyer', 'Bonjour')
+            assert seller_stream.get(timeout=0.01) is None
+        
+        assert seller_stream.get(timeout=0.1).event_id == sent.message_id
+        assert seller_stream.get(timeout=0.1).data == {'unread_count': 2}
+    
+    def test_send_message_rejects_outsider(self, service, conversation):
+        """Vérifie qu'un non-participant ne peut pas écrire"""
+        with pytest.raises(PermissionError):
+            service.send_message(conversation.conversation_id, 'intrus', 'Bonjour')
+    
+    def test_send_message_unknown_conversation(self, service):
+        """Vérifie qu'une conversation inexistante lève une exception"""
+        with pytest.raises(ConversationNotFoundException):
+            service.send_message(999, 'buyer', 'Bonjour')
+    
+    def test_get_conversation_messages_rejects_outsider(self, service, conversation):
+        """Vérifie qu'un non-participant ne peut pas lire"""
+        with pytest.raises(PermissionError):
+            service.get_conversation_messages(conversation.conversation_id, 'intrus')
+    
+    def test_get_missed_messages_returns_received_after_id(self, service, conversation):
+        """Vérifie la relecture des messages manqués (Last-Event-ID)"""
+        first = service.send_message(conversation.conversation_id, 'buyer', 'Un')
+        service.send_message(conversation.conversation_id, 'seller', 'Réponse')
+        third = service.send_message(conversation.conversation_id, 'buyer', 'Trois')
+        
+        missed = service.get_missed_messages('seller', first.message_id)
+        
+        assert [message.message_id for message in missed] == [third.message_id]
+    
+    def test_send_message_updates_denormalized_snapshot(self, service, conversation):
+        """Vérifie l'aperçu du dernier message et le compteur du destinataire"""
+        service.send_message(conversation.conversation_id, 'buyer', 'x' * 300)
+        sent = service.send_message(conversation.conversation_id, 'buyer', 'Toujours dispo?')
+        
+        seller_inbox = service.get_inbox('seller')
+        buyer_inbox = service.get_inbox('buyer')
+        
+        entry = seller_inbox[0].to_dict()
+        assert entry['last_message'] == {
+            'message_id': sent.message_id,
+            'preview': 'Toujours dispo?',
+            'sender_id': 'buyer',
+            'sent_at': sent.created_at
+        }
+        assert entry['other_party_id'] == 'buyer'
+        assert entry['unread_count'] == 2
+        assert buyer_inbox[0].unread_count == 0
+        assert service.get_unread_count('seller') == 2
+    
+    def test_inbox_is_ordered_by_last_message(self, service, conversation):
+        """Vérifie que la conversation la plus récente est en premier"""
+        other = service.start_conversation('listing-2', 'buyer')
+        service.send_message(other.conversation_id, 'buyer', 'Premier')
+        service.send_message(conversation.conversation_id, 'buyer', 'Second')
+        
+        inbox = service.get_inbox('seller')
+        
+        assert [entry.conversation_id for entry in inbox] == [
+            conversation.conversation_id, other.conversation_id
+        ]
+        assert [entry.conversation_id for entry in service.get_inbox('seller', limit=1)] == [
+            conversation.conversation_id
+        ]
+    
+    def test_inbox_rejects_invalid_limit(self, service):
+        """Vérifie qu'une limite nulle est refusée"""
+        with pytest.raises(ValueError):
+            service.get_inbox('seller', limit=0)
+    
+    def test_mark_conversation_read_resets_counter(self, service, broker, conversation):
+        """Vérifie la remise à zéro et la notification des autres onglets"""
+        service.send_message(conversation.conversation_id, 'buyer', 'Un')
+        service.send_message(conversation.conversation_id, 'buyer', 'Deux')
+        seller_stream = broker.subscribe('seller')
+        
+        marked = service.mark_conversation_read(conversation.conversation_id, 'seller')
+        
+        assert marked == 2
+        assert service.get_unread_count('seller') == 0
+        assert seller_stream.get(timeout=0.1).data == {'unread_count': 0}
+        assert all(m.is_read for m in service.get_conversation_messages(conversation.conversation_id, 'seller').messages)
+    
+    def test_mark_conversation_read_rejects_outsider(self, service, conversation):
+        """Vérifie qu'un non-participant ne peut pas marquer comme lu"""
+        with pytest.raises(PermissionError):
+            service.mark_conversation_read(conversation.conversation_id, 'intrus')
+    
+    def test_start_conversation_with_message_creates_thread(self, service, broker):
+        """Vérifie que le premier message crée le fil et notifie le vendeur"""
+        seller_stream = broker.subscribe('seller')
+        
+        sent = service.start_conversation_with_message('listing-9', 'buyer', 'Bonjour')
+        
+        assert sent.conversation_id is not None
+        assert seller_stream.get(timeout=0.1).event_id == sent.message_id
+        assert service.get_inbox('seller')[0].unread_count == 1
+    
+    def test_concurrent_first_messages_share_one_conversation(self, service):
+        """Vérifie l'absence de doublon quand deux premiers messages se croisent"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sent = list(executor.map(
+                lambda i: service.start_conversation_with_message('listing-9', 'buyer', f"msg {i}"),
+                range(32)
+            ))
+        
+        assert len({message.conversation_id for message in sent}) == 1
+        assert service.get_inbox('seller')[0].unread_count == 32
+    
+    def test_history_pages_backwards_with_cursor(self, service, conversation):
+        """Vérifie le défilement vers les messages plus anciens"""
+        sent = [service.send_message(conversation.conversation_id, 'buyer', f"msg {i}") for i in range(5)]
+        
+        latest = service.get_conversation_messages(conversation.conversation_id, 'seller', limit=2)
+        older = service.get_conversation_messages(
+            conversation.conversation_id, 'seller', limit=2, before_message_id=latest.before_message_id
+        )
+        oldest = service.get_conversation_messages(
+            conversation.conversation_id, 'seller', limit=2, before_message_id=older.before_message_id
+        )
+        
+        assert [m.content for m in latest.messages] == ['msg 3', 'msg 4']
+        assert [m.content for m in older.messages] == ['msg 1', 'msg 2']
+        assert [m.message_id for m in oldest.messages] == [sent[0].message_id]
+        assert (latest.has_more, older.has_more, oldest.has_more) == (True, True, False)
+    
+    def test_history_pages_forward_with_cursor(self, service, conversation):
+        """Vérifie le chargement des messages plus récents"""
+        sent = [service.send_message(conversation.conversation_id, 'buyer', f"msg {i}") for i in range(5)]
+        
+        page = service.get_conversation_messages(
+            conversation.conversation_id, 'seller', limit=3, after_message_id=sent[0].message_id
+        )
+        
+        assert [m.content for m in page.messages] == ['msg 1', 'msg 2', 'msg 3']
+        assert page.has_more is True
+        assert page.to_dict()['after_message_id'] == sent[3].message_id
+    
+    def test_history_cursors_are_exclusive(self, service, conversation):
+        """Vérifie que les deux curseurs ne peuvent pas être combinés"""
+        with pytest.raises(ValueError):
+            service.get_conversation_messages(
+                conversation.conversation_id, 'seller', before_message_id=5, after_message_id=1
+            )
+    
+    def test_history_is_scoped_to_conversation(self, service, conversation):
+        """Vérifie que les messages d'autres fils n'apparaissent pas dans la page"""
+        other = service.start_conversation('listing-2', 'buyer')
+        service.send_message(other.conversation_id, 'buyer', 'ailleurs')
+        service.send_message(conversation.conversation_id, 'buyer', 'ici')
+        
+        page = service.get_conversation_messages(conversation.conversation_id, 'seller')
+        
+        assert [m.content for m in page.messages] == ['ici']
+        assert page.has_more is False
@@ -0,0 +1,126 @@
+"""
+Tests unitaires pour la suite de benchmarks (runner, référence, scénarios).
+"""
+from contextlib import contextmanager
+
+import api.listing_resource as listing_resource
+from benchmarks.suite import BenchmarkRunner, Scenario, ScenarioResult, compare, load_baseline, save_baseline
+from benchmarks.suite.scenarios import build_scenarios
+
+
+class _StepTimer:
+    """Horloge qui avance de `step` ns à chaque opération mesurée"""
+    
+    def __init__(self, step: int):
+        self.step = step
+        self.now = 0
+    
+    def __call__(self):
+        return self.now
+    
+    def tick(self):
+        self.now += self.step
+
+
+def _result(name, median, minimum=None):
+    return ScenarioResult(name, 1, [minimum if minimum is not None else median, median, median])
+
+
+class TestBenchmarkRunner:
+    """Tests pour la calibration et les statistiques"""
+    
+    def test_iterations_are_calibrated_to_min_sample_time(self):
+        """Vérifie la calibration et la durée par opération"""
+        timer = _StepTimer(1_000)
+        
+        @contextmanager
+        def setup():
+            yield timer.tick
+        
+        runner = BenchmarkRunner(min_sample_seconds=0.001, samples=3, timer=timer)
+        result = runner.run(Scenario('fake', 'fake', setup))
+        
+        assert result.iterations >= 1_000
+        assert result.samples_ns == [1_000.0, 1_000.0, 1_000.0]
+        assert result.to_dict()['median_ns'] == 1_000.0
+    
+    def test_setup_is_cleaned_up(self):
+        """Vérifie que le contexte du scénario est refermé après la mesure"""
+        events = []
+        
+        @contextmanager
+        def setup():
+            events.append('setup')
+            yield lambda: None
+            events.append('teardown')
+        
+        BenchmarkRunner(min_sample_seconds=0.0001, samples=1).run(Scenario('noop', 'noop', setup))
+        
+        assert events == ['setup', 'teardown']
+
+
+class TestBaseline:
+    """Tests pour la référence JSON et la détection des régressions"""
+    
+    def test_baseline_round_trip(self, tmp_path):
+        """Vérifie l'enregistrement et la relecture de la référence"""
+        path = str(tmp_path / 'baseline.json')
+        
+        save_baseline(path, [_result('a', 100.0)])
+        document = load_baseline(path)
+        
+        assert document['scenarios']['a']['median_ns'] == 100.0
+        assert 'python' in document['environment']
+        assert load_baseline(str(tmp_path / 'absente.json')) is None
+    
+    def test_regression_requires_median_and_min_over_threshold(self, tmp_path):
+        """Vérifie les statuts: régression, bruit, amélioration, nouveau"""
+        path = str(tmp_path / 'baseline.json')
+        save_baseline(path, [_result('slow', 100.0), _result('noisy', 100.0), _result('fast', 100.0)])
+        
+        comparisons = {
+            comparison.name: comparison
+            for comparison in compare(
+                [_result('slow', 120.0), _result('noisy', 120.0, minimum=95.0), _result('fast', 80.0), _result('added', 1.0)],
+                load_baseline(path),
+                threshold_percent=10
+            )
+        }
+        
+        assert comparisons['slow'].regressed
+        assert round(comparisons['slow'].change_percent) == 20
+        assert comparisons['noisy'].status == 'unchanged'
+        assert comparisons['fast'].status == 'improved'
+        assert comparisons['added'].status == 'new'
+
+
+def test_every_scenario_runs():
+    """Vérifie que chaque scénario s'exécute et restaure l'état global"""
+    service = listing_resource.listing_service
+    snapshots = listing_resource.catalogue_snapshots
+    
+    for scenario in build_scenarios(listings=200):
+        with scenario.setup() as operation:
+            operation()
+            operation()
+    
+    assert listing_resource.listing_service is service
+    assert listing_resource.catalogue_snapshots is snapshots
+
+
+def test_catalogue_scenarios_read_the_scenario_service():
+    """Vérifie que l'instantané est construit depuis le catalogue du scénario, pas celui de l'application"""
+    scenarios = {scenario.name: scenario for scenario in build_scenarios(listings=200)}
+    
+    for name in ('http.list_by_category', 'http.list_by_category_uncached'):
+        with scenarios[name].setup() as operation:
+            assert operation().get_json()
+
+
+def test_fetch_all_scenarios_map_the_same_pictures():
+    """Vérifie que les chemins dictionnaire et RowMapper construisent les mêmes photos"""
+    scenarios = {scenario.name: scenario for scenario in build_scenarios(listings=200)}
+    
+    with scenarios['infrastructure.fetch_all_mapping'].setup() as mapping:
+        with scenarios['infrastructure.fetch_all_row_mapper'].setup() as row_mapper:
+            assert [vars(picture) for picture in mapping()] == [vars(picture) for picture in row_mapper()]
@@ -0,0 +1,121 @@
+"""
+Tests unitaires pour le générateur de charge (histogramme, moteur, rapport).
+"""
+import time
+
+import pytest
+
+from benchmarks.load import LatencyHistogram, LoadContext, LoadScenario, build_report, parse_mix, render_html, run_load
+
+
+def _context():
+    return LoadContext(
+        listings=[('1', '10')],
+        accounts=[('20', 'jeton')],
+        categories=['Livres'],
+        search_terms=['calculatrice'],
+        titles=['Calculatrice TI-84'],
+        locations=['PEPS']
+    )
+
+
+def _scenarios(delay_seconds=0.0):
+    def ok(client, context, rng):
+        if delay_seconds:
+            time.sleep(delay_seconds)
+        return 200
+    
+    def failing(client, context, rng):
+        raise ConnectionError("refusé")
+    
+    return {
+        'ok': LoadScenario('ok', 'GET /ok', 200, ok),
+        'ko': LoadScenario('ko', 'GET /ko', 200, failing)
+    }
+
+
+class TestLatencyHistogram:
+    """Tests pour les percentiles et la fusion"""
+    
+    def test_percentiles_within_one_percent(self):
+        histogram = LatencyHistogram()
+        for latency_us in range(1, 10_001):
+            histogram.record(latency_us)
+        
+        assert histogram.count == 10_000
+        assert histogram.percentile(50) == pytest.approx(5000, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(9900, rel=0.01)
+        assert histogram.percentile(100) == 10_000
+    
+    def test_merge_equals_single_histogram(self):
+        merged, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for latency_us in range(100, 2000, 7):
+            merged.record(latency_us)
+            (left if latency_us % 2 else right).record(latency_us)
+        
+        left.merge(right)
+        
+        assert left.summary() == merged.summary()
+
+
+class TestParseMix:
+    """Tests pour les pondérations"""
+    
+    def test_default_mix(self):
+        assert parse_mix(None)['browse'] == 40
+    
+    def test_custom_mix(self):
+        assert parse_mix('browse=3,open=1') == {'browse': 3.0, 'open': 1.0}
+    
+    def test_unknown_scenario_raises(self):
+        with pytest.raises(ValueError):
+            parse_mix('inconnu=1')
+
+
+class TestRunLoad:
+    """Tests pour les boucles fermée et ouverte"""
+    
+    def test_closed_loop_records_errors_per_endpoint(self):
+        result = run_load(object, _context(), {'ok': 3, 'ko': 1}, _scenarios(), duration_seconds=0.2, concurrency=2)
+        
+        endpoints = result.recorder.endpoints
+        assert endpoints['GET /ok'].errors == 0
+        assert endpoints['GET /ko'].errors == endpoints['GET /ko'].latency.count > 0
+        assert endpoints['GET /ko'].statuses == {'error:ConnectionError': endpoints['GET /ko'].errors}
+    
+    def test_open_loop_sends_at_target_rate(self):
+        result = run_load(object, _context(), {'ok': 1}, _scenarios(), mode='open', rate=200, duration_seconds=0.25, concurrency=2)
+        
+        assert result.total.latency.count == pytest.approx(50, abs=2)
+        assert result.target_rate == 200
+    
+    def test_open_loop_counts_queueing_delay(self):
+        # Un seul worker, 20 ms par requête, 100 arrivées/s: la file grossit
+        result = run_load(
+            object, _context(), {'ok': 1}, _scenarios(delay_seconds=0.02),
+            mode='open', rate=100, duration_seconds=0.2, concurrency=1
+        )
+        
+        latency = result.total.latency
+        assert latency.percentile(100) > 0.1 * 1e6
+        assert result.recorder.late_starts > 0
+    
+    def test_open_loop_requires_rate(self):
+        with pytest.raises(ValueError):
+            run_load(object, _context(), {'ok': 1}, _scenarios(), mode='open')
+
+
+class TestReport:
+    """Tests pour les rapports JSON et HTML"""
+    
+    def test_report_contains_summary_endpoints_and_timeline(self):
+        result = run_load(object, _context(), {'ok': 1, 'ko': 1}, _scenarios(), duration_seconds=0.2, concurrency=1)
+        
+        report = build_report(result, {'url': 'http://localhost:5000'})
+        
+        assert report['summary']['count'] == result.total.latency.count
+        assert 0 < report['summary']['error_rate'] < 1
+        assert set(report['endpoints']) == {'GET /ok', 'GET /ko'}
+        assert report['timeline'][0]['second'] == 0
+        html = render_html(report)
+        assert '<svg' in html and 'GET /ko' in html
@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour le générateur de jeu de données synthétique.
+"""
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from benchmarks.dataset import DatasetConfig, SeedVocabulary, SyntheticDataset, TABLES, populate_in_memory
+from benchmarks.dataset.generator import parse_scale
+from benchmarks.dataset.mysql_loader import format_tsv_value
+from benchmarks.dataset.vocabulary import iter_insert_rows
+from infrastructure.persistence.in_memory.in_memory_conversation_repository import InMemoryConversationRepository
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.persistence.in_memory.in_memory_listing_repository import InMemoryListingRepository
+from infrastructure.persistence.in_memory.in_memory_message_repository import InMemoryMessageRepository
+
+
+@pytest.fixture(scope='module')
+def vocabulary():
+    return SeedVocabulary.load()
+
+
+@pytest.fixture(scope='module')
+def dataset(vocabulary):
+    return SyntheticDataset(DatasetConfig(listings=2000, seed=7), vocabulary)
+
+
+class TestSeedVocabulary:
+    """Tests pour l'extraction du vocabulaire des données de démonstration"""
+    
+    def test_insert_rows_are_parsed(self):
+        """Vérifie les chaînes échappées, NULL et booléens"""
+        sql = (
+            "INSERT INTO messages (message_id, content, is_read, parent) VALUES\n"
+            "(1, 'J''en ai besoin, (vraiment)', TRUE, NULL),\n"
+            "(2, 'Prix: 12,50$', FALSE, 3.5);"
+        )
+        
+        rows = list(iter_insert_rows(sql))
+        
+        assert rows == [
+            ('messages', {'message_id': 1, 'content': "J'en ai besoin, (vraiment)", 'is_read': True, 'parent': None}),
+            ('messages', {'message_id': 2, 'content': 'Prix: 12,50$', 'is_read': False, 'parent': 3.5}),
+        ]
+    
+    def test_seed_scripts_provide_categories_and_titles(self, vocabulary):
+        """Vérifie que les catégories et les titres par catégorie sont extraits"""
+        assert [row[1] for row in vocabulary.categories][4] == 'Électronique'
+        assert 'Calculatrice TI-83 Plus' in vocabulary.titles[6]
+        assert vocabulary.messages
+
+
+class TestSyntheticDataset:
+    """Tests pour le déterminisme, l'intégrité et l'asymétrie des données"""
+    
+    def test_same_seed_gives_same_rows(self, vocabulary, dataset):
+        """Vérifie que la génération est reproductible, table par table"""
+        again = SyntheticDataset(DatasetConfig(listings=2000, seed=7), vocabulary)
+        other = SyntheticDataset(DatasetConfig(listings=2000, seed=8), vocabulary)
+        
+        assert list(again.rows('favorites')) == list(dataset.rows('favorites'))
+        assert list(other.rows('listings')) != list(dataset.rows('listings'))
+    
+    def test_rows_match_table_columns(self, dataset):
+        """Vérifie que chaque ligne a le nombre de colonnes de sa table"""
+        for table, columns in TABLES.items():
+            row = next(dataset.rows(table))
+            assert len(row) == len(columns), table
+    
+    def test_foreign_keys_and_unique_keys_hold(self, dataset):
+        """Vérifie les références et les contraintes d'unicité du schéma"""
+        config = dataset.config
+        sellers = {row[0]: row[1] for row in dataset.rows('listings')}
+        iduls = [row[1] for row in dataset.rows('users')]
+        favorites = [(row[1], row[2]) for row in dataset.rows('favorites')]
+        conversations = list(dataset.rows('conversations'))
+        conversation_ids = {row[0] for row in conversations}
+        
+        assert len(set(iduls)) == config.user_count and all(len(idul) == 7 for idul in iduls)
+        assert all(1 <= seller <= config.user_count for seller in sellers.values())
+        assert len(set(favorites)) == len(favorites)
+        assert all(user_id != sellers[listing_id] for user_id, listing_id in favorites)
+        assert len({(row[1], row[2]) for row in conversations}) == len(conversations)
+        assert all(row[3] == sellers[row[1]] for row in conversations)
+        assert all(row[1] in conversation_ids for row in dataset.rows('messages'))
+        assert all(row[1] in sellers for row in dataset.rows('listing_pictures'))
+    
+    def test_activity_is_skewed(self, dataset):
+        """Vérifie l'asymétrie: quelques vendeurs et quelques annonces dominent"""
+        sellers = Counter(row[1] for row in dataset.rows('listings'))
+        favorites = Counter(row[2] for row in dataset.rows('favorites'))
+        hottest = dataset.hot_listing_ids(1)[0]
+        
+        top_share = sum(count for _, count in sellers.most_common(10)) / dataset.config.listings
+        assert top_share > 0.25
+        assert favorites.most_common(1)[0][0] == hottest
+    
+    def test_populate_in_memory(self, dataset):
+        """Vérifie le chargement direct dans les repositories en mémoire"""
+        listings = InMemoryListingRepository()
+        conversations = InMemoryConversationRepository()
+        messages = InMemoryMessageRepository(conversations)
+        
+        counts = populate_in_memory(
+            dataset,
+            listings,
+            picture_repository=InMemoryListingPictureRepository(),
+            conversation_repository=conversations,
+            message_repository=messages
+        )
+        
+        deleted = sum(1 for row in dataset.rows('listings') if row[10])
+        assert counts['listings'] == listings.count() == dataset.config.listings - deleted
+        assert counts['messages'] == sum(1 for _ in dataset.rows('messages'))
+        assert len(messages.find_by_conversation(1, limit=100)) > 0
+
+
+def test_parse_scale():
+    """Vérifie les échelles nommées et numériques"""
+    assert parse_scale('10k') == 10_000
+    assert parse_scale('10M') == 10_000_000
+    assert parse_scale('2.5k') == 2_500
+    assert parse_scale('1234') == 1234
+
+
+def test_tsv_values_are_escaped():
+    """Vérifie le format par défaut de LOAD DATA"""
+    assert format_tsv_value(None) == '\\N'
+    assert format_tsv_value(True) == '1'
+    assert format_tsv_value(datetime(2024, 2, 1, 9, 30)) == '2024-02-01 09:30:00'
+    assert format_tsv_value('a\tb\nc\\d') == 'a\\tb\\nc\\\\d'
@@ -0,0 +1,109 @@
+"""
+Tests unitaires pour les canaux de révocation.
+"""
+import socket
+import threading
+
+from infrastructure.auth.revocation_channel import (
+    KIND_TOKEN,
+    KIND_USER,
+    LocalRevocationChannel,
+    UnixSocketRevocationChannel
+)
+
+
+class TestLocalRevocationChannel:
+    """Tests pour LocalRevocationChannel"""
+    
+    def test_publish_calls_subscribers(self):
+        """Vérifie que tous les abonnés reçoivent l'événement"""
+        channel = LocalRevocationChannel()
+        received = []
+        channel.subscribe(lambda kind, value: received.append((kind, value)))
+        channel.subscribe(lambda kind, value: received.append(('copie', value)))
+        
+        channel.publish(KIND_TOKEN, 'abc')
+        
+        assert received == [(KIND_TOKEN, 'abc'), ('copie', 'abc')]
+    
+    def test_failing_subscriber_does_not_stop_others(self):
+        """Vérifie qu'un abonné en erreur n'empêche pas la diffusion"""
+        channel = LocalRevocationChannel()
+        received = []
+        
+        def failing(kind, value):
+            raise RuntimeError("boom")
+        
+        channel.subscribe(failing)
+        channel.subscribe(lambda kind, value: received.append(value))
+        
+        channel.publish(KIND_USER, '7')
+        
+        assert received == ['7']
+
+
+class TestUnixSocketRevocationChannel:
+    """Tests pour UnixSocketRevocationChannel"""
+    
+    def test_publish_sends_datagram_to_other_workers(self, tmp_path):
+        """Vérifie qu'un événement publié est envoyé au socket des autres workers"""
+        other_worker = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        other_worker.bind(str(tmp_path / '12345.sock'))
+        other_worker.settimeout(2)
+        channel = UnixSocketRevocationChannel(str(tmp_path))
+        
+        try:
+            channel.publish(KIND_TOKEN, 'deadbeef')
+            
+            assert other_worker.recv(1024) == b'token:deadbeef'
+        finally:
+            channel.close()
+            other_worker.close()
+    
+    def test_datagram_from_other_worker_is_dispatched(self, tmp_path):
+        """Vérifie qu'un datagramme reçu d'un autre worker est transmis aux abonnés"""
+        channel = UnixSocketRevocationChannel(str(tmp_path))
+        delivered = threading.Event()
+        received = []
+        
+        def on_revocation(kind, value):
+            received.append((kind, value))
+            delivered.set()
+        
+        channel.subscribe(on_revocation)
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        
+        try:
+            sender.sendto(b'user:42', channel.socket_path)
+            
+            assert delivered.wait(timeout=2)
+            assert received == [(KIND_USER, '42')]
+        finally:
+            sender.close()
+            channel.close()
+    
+    def test_publish_notifies_local_subscribers(self, tmp_path):
+        """Vérifie que le worker qui publie applique aussi la révocation"""
+        channel = UnixSocketRevocationChannel(str(tmp_path))
+        received = []
+        channel.subscribe(lambda kind, value: received.append(value))
+        
+        try:
+            channel.publish(KIND_USER, '3')
+        finally:
+            channel.close()
+        
+        assert received == ['3']
+    
+    def test_stale_socket_is_removed(self, tmp_path):
+        """Vérifie qu'un socket orphelin (worker terminé) est nettoyé"""
+        stale_path = tmp_path / '99999.sock'
+        stale_path.write_text('')
+        channel = UnixSocketRevocationChannel(str(tmp_path))
+        
+        try:
+            channel.publish(KIND_TOKEN, 'abc')
+        finally:
+            channel.close()
+        
+        assert not stale_path.exists()
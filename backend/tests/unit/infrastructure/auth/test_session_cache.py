@@ -0,0 +1,116 @@
+"""
+Tests unitaires pour SessionCache.
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from infrastructure.auth.session_cache import SessionCache
+
+
+class FakeClock:
+    """Horloge monotone contrôlée par le test"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestSessionCache:
+    """Tests pour la classe SessionCache"""
+    
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+    
+    @pytest.fixture
+    def cache(self, clock):
+        return SessionCache(max_size=3, max_age_seconds=60, clock=clock)
+    
+    @pytest.fixture
+    def expires_at(self):
+        return datetime.now() + timedelta(hours=1)
+    
+    def test_rejects_invalid_size(self):
+        """Vérifie qu'une taille non positive est refusée"""
+        with pytest.raises(ValueError):
+            SessionCache(max_size=0)
+    
+    def test_get_returns_none_when_absent(self, cache):
+        """Vérifie qu'une clé absente est un échec de cache"""
+        assert cache.get('absent') is None
+        assert cache.stats()['misses'] == 1
+    
+    def test_put_then_get(self, cache, expires_at):
+        """Vérifie qu'une entrée ajoutée est retrouvée"""
+        cache.put('hash-1', 42, expires_at)
+        
+        entry = cache.get('hash-1')
+        
+        assert entry.user_id == '42'
+        assert entry.expires_at == expires_at
+        assert cache.stats()['hits'] == 1
+    
+    def test_expired_session_is_not_returned(self, cache):
+        """Vérifie que l'expiration de la session est respectée"""
+        cache.put('hash-1', '1', datetime.now() + timedelta(seconds=5))
+        
+        assert cache.get('hash-1', now=datetime.now() + timedelta(seconds=10)) is None
+        assert len(cache) == 0
+    
+    def test_entry_older_than_max_age_is_reverified(self, cache, clock, expires_at):
+        """Vérifie qu'une entrée trop ancienne force une revérification"""
+        cache.put('hash-1', '1', expires_at)
+        clock.now += 61
+        
+        assert cache.get('hash-1') is None
+    
+    def test_lru_eviction(self, cache, expires_at):
+        """Vérifie que l'entrée la moins récemment utilisée est évincée"""
+        cache.put('hash-1', '1', expires_at)
+        cache.put('hash-2', '2', expires_at)
+        cache.put('hash-3', '3', expires_at)
+        cache.get('hash-1')  # hash-2 devient la plus ancienne
+        
+        cache.put('hash-4', '4', expires_at)
+        
+        assert cache.get('hash-2') is None
+        assert cache.get('hash-1') is not None
+        assert cache.stats()['evictions'] == 1
+    
+    def test_invalidate(self, cache, expires_at):
+        """Vérifie qu'une entrée révoquée est retirée"""
+        cache.put('hash-1', '1', expires_at)
+        
+        assert cache.invalidate('hash-1') is True
+        assert cache.invalidate('hash-1') is False
+        assert cache.get('hash-1') is None
+    
+    def test_invalidate_user_removes_all_user_entries(self, cache, expires_at):
+        """Vérifie que toutes les sessions d'un utilisateur sont retirées"""
+        cache.put('hash-1', '1', expires_at)
+        cache.put('hash-2', '1', expires_at)
+        cache.put('hash-3', '2', expires_at)
+        
+        assert cache.invalidate_user('1') == 2
+        assert cache.get('hash-3') is not None
+        assert len(cache) == 1
+    
+    def test_eviction_keeps_user_index_consistent(self, cache, expires_at):
+        """Vérifie qu'une entrée évincée n'est plus comptée pour son utilisateur"""
+        cache.put('hash-1', '1', expires_at)
+        cache.put('hash-2', '2', expires_at)
+        cache.put('hash-3', '3', expires_at)
+        cache.put('hash-4', '4', expires_at)
+        
+        assert cache.invalidate_user('1') == 0
+    
+    def test_put_after_revocation_is_ignored(self, cache, expires_at):
+        """Vérifie qu'une validation antérieure à une révocation n'est pas mise en cache"""
+        generation = cache.generation()
+        cache.invalidate('hash-1')
+        
+        assert cache.put('hash-1', '1', expires_at, generation) is False
+        assert cache.get('hash-1') is None
+        assert cache.put('hash-1', '1', expires_at, cache.generation()) is True
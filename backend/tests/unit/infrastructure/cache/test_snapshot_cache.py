@@ -0,0 +1,178 @@
+"""
+Tests unitaires pour les instantanés servis périmés pendant leur reconstruction.
+"""
+import threading
+import time
+
+import pytest
+
+from infrastructure.cache.snapshot_cache import SnapshotCache
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class FakeClock:
+    """Horloge monotone contrôlée par le test"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class Catalogue:
+    """Construction comptée: le catalogue de la clé, à sa version courante"""
+    
+    def __init__(self):
+        self.version = 1
+        self.builds = []
+        self.fail = False
+    
+    def __call__(self, key):
+        self.builds.append(key)
+        if self.fail:
+            raise RuntimeError("base indisponible")
+        return (key, self.version)
+
+
+class TestSnapshotCache:
+    """Tests pour le service des instantanés à jour, périmés ou expirés"""
+    
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+    
+    @pytest.fixture
+    def catalogue(self):
+        return Catalogue()
+    
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+    
+    @pytest.fixture
+    def cache(self, catalogue, clock, registry):
+        return SnapshotCache(
+            'catalogue',
+            build=catalogue,
+            debounce_seconds=0.5,
+            max_staleness_seconds=5.0,
+            max_age_seconds=60.0,
+            background=False,
+            clock=clock,
+            registry=registry
+        )
+    
+    def _requests(self, registry, result):
+        return registry.counter('snapshot_requests_total', '').value(snapshot='catalogue', result=result)
+    
+    def test_first_read_builds_then_serves_snapshot(self, cache, catalogue, registry):
+        assert cache.get(None) == (None, 1)
+        assert cache.get(None) == (None, 1)
+        
+        assert catalogue.builds == [None]
+        assert self._requests(registry, 'miss') == 1
+        assert self._requests(registry, 'fresh') == 1
+    
+    def test_stale_snapshot_served_until_refresh(self, cache, catalogue, clock, registry):
+        cache.get(6)
+        catalogue.version = 2
+        cache.invalidate()
+        clock.now += 4
+        
+        assert cache.get(6) == (6, 1)
+        assert cache.refresh() == 1
+        assert cache.get(6) == (6, 2)
+        assert self._requests(registry, 'stale') == 1
+    
+    def test_snapshot_stale_too_long_is_rebuilt_by_reader(self, cache, catalogue, clock, registry):
+        cache.get(6)
+        catalogue.version = 2
+        cache.invalidate()
+        clock.now += 6
+        
+        assert cache.get(6) == (6, 2)
+        assert self._requests(registry, 'expired') == 1
+    
+    def test_staleness_counts_from_first_write(self, cache, catalogue, clock):
+        cache.get(None)
+        cache.invalidate()
+        clock.now += 3
+        cache.invalidate()
+        clock.now += 3
+        
+        cache.get(None)
+        
+        assert catalogue.builds == [None, None]
+    
+    def test_old_snapshot_is_rebuilt_without_known_write(self, cache, catalogue, clock):
+        cache.get(None)
+        catalogue.version = 2
+        clock.now += 61
+        
+        # Périmé par l'âge: servi le temps que le fond le reconstruise
+        assert cache.get(None) == (None, 1)
+        cache.refresh()
+        assert cache.get(None) == (None, 2)
+    
+    def test_failed_refresh_keeps_stale_snapshot(self, cache, catalogue, clock, registry):
+        cache.get(None)
+        cache.invalidate()
+        catalogue.fail = True
+        
+        assert cache.refresh() == 0
+        assert cache.get(None) == (None, 1)
+        rebuilds = registry.counter('snapshot_rebuilds_total', '')
+        assert rebuilds.value(snapshot='catalogue', result='error') == 1
+    
+    def test_write_during_build_leaves_snapshot_stale(self, catalogue, clock):
+        cache = None
+        
+        def build(key):
+            cache.invalidate()
+            return catalogue(key)
+        
+        cache = SnapshotCache('catalogue', build=build, background=False, clock=clock, registry=MetricsRegistry())
+        cache.get(None)
+        
+        assert cache.refresh() == 1
+    
+    def test_warm_builds_wanted_keys(self, cache, catalogue):
+        cache.warm([None, 6, 9])
+        
+        assert cache.refresh() == 3
+        assert sorted(catalogue.builds, key=str) == [6, 9, None]
+        assert cache.get(9) == (9, 1)
+        assert len(catalogue.builds) == 3
+    
+    def test_rejects_staleness_shorter_than_debounce(self, catalogue):
+        with pytest.raises(ValueError):
+            SnapshotCache('catalogue', build=catalogue, debounce_seconds=1.0, max_staleness_seconds=1.0)
+
+
+class TestSnapshotCacheBackground:
+    """Tests pour la reconstruction en arrière-plan"""
+    
+    def test_background_rebuild_after_debounce(self):
+        catalogue = Catalogue()
+        rebuilt = threading.Event()
+        
+        def build(key):
+            value = catalogue(key)
+            if catalogue.version == 2:
+                rebuilt.set()
+            return value
+        
+        cache = SnapshotCache(
+            'catalogue', build=build, debounce_seconds=0.01, max_staleness_seconds=5.0, registry=MetricsRegistry()
+        )
+        cache.get(None)
+        catalogue.version = 2
+        cache.invalidate()
+        
+        assert rebuilt.wait(timeout=5)
+        deadline = time.monotonic() + 5
+        while cache.get(None) != (None, 2) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get(None) == (None, 2)
+        assert catalogue.builds == [None, None]
@@ -0,0 +1,100 @@
+"""
+Tests unitaires pour la compression des corps de réponse.
+"""
+import gzip
+import json
+
+import pytest
+
+from infrastructure.compression.response_compressor import (
+    BROTLI,
+    GZIP,
+    REBUILT_LEVELS,
+    STATIC_LEVELS,
+    PrecompressedPayload,
+    ResponseCompressor,
+    compress,
+    compress_stream,
+)
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+BODY = json.dumps([{'listing_id': str(index), 'title': 'Vélo de route', 'price': 150} for index in range(200)]).encode()
+
+
+def _compressor(**kwargs):
+    registry = MetricsRegistry()
+    return ResponseCompressor(registry=registry, **kwargs), registry
+
+
+class TestResponseCompressor:
+    """Tests pour la compression et le cache par empreinte"""
+    
+    def test_gzip_round_trip(self):
+        compressor, _ = _compressor()
+        
+        compressed = compressor.compress(BODY, GZIP)
+        
+        assert gzip.decompress(compressed) == BODY
+        assert len(compressed) < len(BODY) / 5
+    
+    def test_identical_body_reuses_compression(self):
+        compressor, registry = _compressor()
+        
+        first = compressor.compress(BODY, GZIP)
+        second = compressor.compress(bytes(BODY), GZIP)
+        
+        assert second is first
+        responses = registry.counter('http_compressed_responses_total', '')
+        assert responses.value(encoding='gzip', source='compressed') == 1
+        assert responses.value(encoding='gzip', source='cache') == 1
+    
+    def test_cache_is_bounded(self):
+        compressor, registry = _compressor(cache_entries=2)
+        bodies = [BODY + str(index).encode() for index in range(3)]
+        for body in bodies:
+            compressor.compress(body, GZIP)
+        
+        compressor.compress(bodies[0], GZIP)
+        
+        responses = registry.counter('http_compressed_responses_total', '')
+        assert responses.value(encoding='gzip', source='compressed') == 4
+    
+    def test_stream_matches_whole_body(self):
+        compressor, registry = _compressor(chunk_bytes=1000)
+        
+        chunks = list(compressor.stream(compressor.chunks(BODY), GZIP))
+        
+        assert len(chunks) >= 1
+        assert gzip.decompress(b''.join(chunks)) == BODY
+        assert registry.counter('http_compression_input_bytes_total', '').value() == len(BODY)
+    
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError):
+            list(compress_stream([BODY], 'deflate', 6))
+
+
+class TestPrecompressedPayload:
+    """Tests pour les variantes produites à la construction"""
+    
+    def test_variants_are_built_once(self):
+        payload = PrecompressedPayload(BODY, encodings=[GZIP])
+        
+        assert payload.encodings == (GZIP,)
+        assert payload.variant(GZIP) is payload.variant(GZIP)
+        assert gzip.decompress(payload.variant(GZIP)) == BODY
+        assert payload.variant(None) is BODY
+    
+    def test_incompressible_body_has_no_variant(self):
+        payload = PrecompressedPayload(b'{}', encodings=[GZIP])
+        
+        assert payload.encodings == ()
+        assert payload.variant(GZIP) == b'{}'
+    
+    def test_rebuilt_payloads_use_moderate_levels(self):
+        default = PrecompressedPayload(BODY, encodings=[GZIP])
+        static = PrecompressedPayload(BODY, encodings=[GZIP], levels=STATIC_LEVELS)
+        
+        assert default.variant(GZIP) == compress(BODY, GZIP, REBUILT_LEVELS[GZIP])
+        assert static.variant(GZIP) == compress(BODY, GZIP, STATIC_LEVELS[GZIP])
+        assert REBUILT_LEVELS[BROTLI] < STATIC_LEVELS[BROTLI]
@@ -0,0 +1,138 @@
+"""
+Tests unitaires pour le contrôle d'admission adaptatif (AIMD).
+"""
+import pytest
+
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+from infrastructure.concurrency.admission_controller import AdmissionController, Priority
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def _controller(clock=None, queue_depth=None, **kwargs):
+    options = dict(initial_limit=10, min_limit=2, max_limit=20, latency_target_seconds=0.5)
+    options.update(kwargs)
+    registry = MetricsRegistry()
+    controller = AdmissionController(
+        clock=clock or FakeClock(), queue_depth=queue_depth, registry=registry, **options
+    )
+    return controller, registry
+
+
+class TestAdmissionController:
+    """Tests pour l'admission par priorité et l'ajustement de la limite"""
+    
+    def test_rejects_beyond_limit_with_retry_after(self):
+        controller, registry = _controller(retry_after_seconds=3)
+        for _ in range(10):
+            controller.admit(Priority.HIGH)
+        
+        with pytest.raises(ServiceOverloadedException) as exc_info:
+            controller.admit(Priority.HIGH)
+        
+        assert exc_info.value.retry_after == 3
+        assert controller.in_flight == 10
+        rejected = registry.counter('admission_rejected_total', '')
+        assert rejected.value(priority='high', reason='limit') == 1
+    
+    def test_low_priority_is_shed_before_high(self):
+        controller, _ = _controller()
+        for _ in range(5):
+            controller.admit(Priority.LOW)
+        
+        with pytest.raises(ServiceOverloadedException):
+            controller.admit(Priority.LOW)
+        for _ in range(3):
+            controller.admit(Priority.NORMAL)
+        with pytest.raises(ServiceOverloadedException):
+            controller.admit(Priority.NORMAL)
+        controller.admit(Priority.HIGH)
+        controller.admit(Priority.HIGH)
+        
+        assert controller.in_flight == 10
+    
+    def test_critical_requests_bypass_the_limit(self):
+        controller, _ = _controller()
+        for _ in range(10):
+            controller.admit(Priority.HIGH)
+        
+        started = controller.admit(Priority.CRITICAL)
+        controller.complete(Priority.CRITICAL, started)
+        
+        assert controller.in_flight == 10
+    
+    def test_connection_queue_sheds_low_priority_first(self):
+        waiting = [0]
+        controller, registry = _controller(queue_depth=lambda: waiting[0], max_queue_depth=4)
+        waiting[0] = 3
+        
+        with pytest.raises(ServiceOverloadedException):
+            controller.admit(Priority.LOW)
+        controller.admit(Priority.NORMAL)
+        controller.admit(Priority.HIGH)
+        
+        rejected = registry.counter('admission_rejected_total', '')
+        assert rejected.value(priority='low', reason='pool') == 1
+    
+    def test_slow_requests_decrease_limit_once_per_episode(self):
+        clock = FakeClock()
+        controller, _ = _controller(clock=clock)
+        starts = [controller.admit(Priority.NORMAL) for _ in range(3)]
+        clock.now = 2.0
+        
+        for started in starts:
+            controller.complete(Priority.NORMAL, started)
+        
+        assert controller.limit == 9
+        assert controller.in_flight == 0
+    
+    def test_limit_floor(self):
+        clock = FakeClock()
+        controller, _ = _controller(clock=clock)
+        for _ in range(50):
+            started = controller.admit(Priority.HIGH)
+            clock.now += 1.0
+            controller.complete(Priority.HIGH, started)
+        
+        assert controller.limit == 2
+    
+    def test_fast_requests_increase_limit_when_in_use(self):
+        clock = FakeClock()
+        controller, _ = _controller(clock=clock)
+        for _ in range(20):
+            starts = [controller.admit(Priority.HIGH) for _ in range(10)]
+            clock.now += 0.01
+            for started in starts:
+                controller.complete(Priority.HIGH, started)
+        
+        assert controller.limit > 10
+    
+    def test_idle_traffic_does_not_grow_limit(self):
+        clock = FakeClock()
+        controller, _ = _controller(clock=clock)
+        for _ in range(100):
+            controller.complete(Priority.HIGH, controller.admit(Priority.HIGH))
+        
+        assert controller.limit == 10
+    
+    def test_interrupted_request_is_not_sampled(self):
+        clock = FakeClock()
+        controller, _ = _controller(clock=clock)
+        started = controller.admit(Priority.NORMAL)
+        clock.now = 5.0
+        
+        controller.complete(Priority.NORMAL, started, sample=False)
+        
+        assert controller.limit == 10
+        assert controller.in_flight == 0
+    
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            _controller(initial_limit=1, min_limit=2)
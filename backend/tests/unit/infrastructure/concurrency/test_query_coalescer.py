@@ -0,0 +1,73 @@
+"""
+Tests unitaires pour la coalescence des lectures identiques.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from infrastructure.concurrency.query_coalescer import QueryCoalescer
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+def _coalescer(timeout=5.0):
+    registry = MetricsRegistry()
+    return QueryCoalescer('listings', wait_timeout_seconds=timeout, registry=registry), registry
+
+
+def _wait_for_followers(coalescer, key, count):
+    while coalescer.in_flight() == 0 or coalescer._single_flight._calls[key].waiters < count:
+        pass
+
+
+class TestQueryCoalescer:
+    """Tests pour le partage des lectures en cours"""
+    
+    def test_identical_reads_share_one_execution(self):
+        coalescer, registry = _coalescer()
+        release = threading.Event()
+        reads = []
+        
+        def read():
+            reads.append(1)
+            release.wait(timeout=5)
+            return [{'listing_id': '1'}]
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(coalescer.run, ('all',), read) for _ in range(5)]
+            _wait_for_followers(coalescer, ('all',), 4)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+        
+        assert len(reads) == 1
+        assert all(result is results[0] for result in results)
+        requests = registry.counter('query_coalescing_requests_total', '')
+        assert requests.value(query='listings', result='executed') == 1
+        assert requests.value(query='listings', result='absorbed') == 4
+    
+    def test_different_keys_are_not_shared(self):
+        coalescer, registry = _coalescer()
+        
+        assert coalescer.run(('search', 'velo'), lambda: 'vélos') == 'vélos'
+        assert coalescer.run(('search', 'livre'), lambda: 'livres') == 'livres'
+        
+        requests = registry.counter('query_coalescing_requests_total', '')
+        assert requests.value(query='listings', result='executed') == 2
+    
+    def test_follower_runs_its_own_read_after_timeout(self):
+        coalescer, registry = _coalescer(timeout=0.01)
+        started, release = threading.Event(), threading.Event()
+        
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+            return 'lent'
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(coalescer.run, ('all',), slow)
+            started.wait(timeout=5)
+            
+            assert coalescer.run(('all',), lambda: 'rapide') == 'rapide'
+            release.set()
+            assert leader.result(timeout=5) == 'lent'
+        
+        requests = registry.counter('query_coalescing_requests_total', '')
+        assert requests.value(query='listings', result='timeout') == 1
@@ -0,0 +1,123 @@
+"""
+Tests unitaires pour les seaux de jetons en mémoire partagée.
+"""
+import multiprocessing
+import threading
+
+import pytest
+
+from infrastructure.concurrency.rate_limiter import RateLimiter, RatePolicy
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+POLICY = RatePolicy('search', capacity=5, refill_per_second=1)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+def _limiter(path=None, slots=1024, clock=None):
+    registry = MetricsRegistry()
+    return RateLimiter(path=path, slots=slots, clock=clock or FakeClock(), registry=registry), registry
+
+
+def _take_in_child(path, count, results):
+    limiter, _ = _limiter(path=path)
+    results.put(sum(limiter.take('search:user:1', RatePolicy('search', capacity=30, refill_per_second=0.001)).allowed
+                    for _ in range(count)))
+
+
+class TestRateLimiter:
+    """Tests pour la consommation et le remplissage des seaux"""
+    
+    def test_burst_then_reject_with_retry_after(self):
+        limiter, registry = _limiter()
+        
+        decisions = [limiter.take('search:user:1', POLICY) for _ in range(6)]
+        
+        assert [decision.allowed for decision in decisions] == [True] * 5 + [False]
+        assert decisions[-1].retry_after == pytest.approx(1.0)
+        requests = registry.counter('rate_limit_requests_total', '')
+        assert requests.value(policy='search', result='rejected') == 1
+    
+    def test_refills_at_policy_rate_up_to_capacity(self):
+        clock = FakeClock()
+        limiter, _ = _limiter(clock=clock)
+        for _ in range(5):
+            limiter.take('search:user:1', POLICY)
+        
+        clock.now += 2.5
+        assert limiter.take('search:user:1', POLICY).remaining == pytest.approx(1.5)
+        
+        clock.now += 3600
+        assert limiter.take('search:user:1', POLICY).remaining == pytest.approx(4)
+    
+    def test_clients_have_separate_buckets(self):
+        limiter, _ = _limiter()
+        for _ in range(5):
+            limiter.take('search:user:1', POLICY)
+        
+        assert limiter.take('search:user:2', POLICY).allowed
+        assert not limiter.take('search:user:1', POLICY).allowed
+    
+    def test_full_buckets_free_their_slot(self):
+        clock = FakeClock()
+        limiter, registry = _limiter(slots=4, clock=clock)
+        for client in range(4):
+            limiter.take(f'search:user:{client}', POLICY)
+        
+        clock.now += 10
+        limiter.take('search:user:new', POLICY)
+        
+        assert registry.counter('rate_limit_evictions_total', '').value() == 0
+    
+    def test_full_group_evicts_oldest_bucket(self):
+        clock = FakeClock()
+        limiter, registry = _limiter(slots=4, clock=clock)
+        for client in range(5):
+            clock.now += 0.01
+            limiter.take(f'search:user:{client}', POLICY)
+        
+        assert registry.counter('rate_limit_evictions_total', '').value() == 1
+        # Le client évincé repart avec un seau plein
+        assert limiter.take('search:user:0', POLICY).remaining == pytest.approx(4)
+    
+    def test_threads_never_exceed_capacity(self):
+        limiter, _ = _limiter(path=None)
+        policy = RatePolicy('search', capacity=50, refill_per_second=0.001)
+        allowed = []
+        barrier = threading.Barrier(8)
+        
+        def worker():
+            barrier.wait()
+            allowed.append(sum(limiter.take('search:user:1', policy).allowed for _ in range(20)))
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert sum(allowed) == 50
+    
+    def test_processes_share_buckets_through_file(self, tmp_path):
+        path = str(tmp_path / 'rate-limits')
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        
+        children = [context.Process(target=_take_in_child, args=(path, 20, results)) for _ in range(3)]
+        for child in children:
+            child.start()
+        for child in children:
+            child.join()
+        
+        assert sum(results.get(timeout=5) for _ in children) == 30
+    
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            RatePolicy('search', capacity=0, refill_per_second=1)
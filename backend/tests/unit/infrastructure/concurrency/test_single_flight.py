@@ -0,0 +1,67 @@
+"""
+Tests unitaires pour SingleFlight.
+"""
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from infrastructure.concurrency.single_flight import SingleFlight, SingleFlightTimeout
+
+
+class TestSingleFlight:
+    """Tests pour la classe SingleFlight"""
+    
+    def test_concurrent_calls_share_one_execution(self):
+        """Vérifie qu'un seul appel s'exécute pour des demandes simultanées"""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            release.wait(timeout=5)
+            return 'result'
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flight.do, 'key', compute) for _ in range(4)]
+            # Attendre que les trois suiveurs soient en attente du premier appel
+            while flight.in_flight() == 0 or flight._calls['key'].waiters < 3:
+                pass
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+        
+        assert len(calls) == 1
+        assert [value for value, _ in results] == ['result'] * 4
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+    
+    def test_error_is_raised_to_every_caller_and_key_is_released(self):
+        """Vérifie la propagation de l'exception puis l'oubli de la clé"""
+        flight = SingleFlight()
+        
+        def fail():
+            raise OSError('disque plein')
+        
+        with pytest.raises(OSError):
+            flight.do('key', fail)
+        
+        assert flight.in_flight() == 0
+        assert flight.do('key', lambda: 42) == (42, False)
+    
+    def test_follower_gives_up_after_timeout(self):
+        """Vérifie qu'un suiveur n'attend pas au-delà de son délai"""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+            return 'lent'
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, 'key', slow)
+            started.wait(timeout=5)
+            with pytest.raises(SingleFlightTimeout):
+                flight.do('key', lambda: 'jamais', timeout=0.01)
+            release.set()
+            
+            assert leader.result(timeout=5) == ('lent', False)
@@ -19,7 +19,7 @@ class TestDatabaseConnection:
         
         assert db_conn._config is not None
         assert db_conn._connection is None
-        assert db_conn._cursor is None
+        assert len(db_conn._cursors) == 0
     
     def test_init_with_custom_config(self):
         """Vérifie que l'initialisation avec config personnalisée fonctionne"""
@@ -59,13 +59,13 @@ class TestDatabaseConnection:
         mock_connection = Mock()
         mock_cursor = Mock()
         db_conn._connection = mock_connection
-        db_conn._cursor = mock_cursor
+        db_conn._cursors.add(mock_cursor)
         
         db_conn.disconnect()
         
         mock_cursor.close.assert_called_once()
         mock_connection.close.assert_called_once()
-        assert db_conn._cursor is None
+        assert len(db_conn._cursors) == 0
         assert db_conn._connection is None
     
     def test_disconnect_safe_when_not_connected(self):
@@ -76,7 +76,7 @@ class TestDatabaseConnection:
         db_conn.disconnect()
         
         assert db_conn._connection is None
-        assert db_conn._cursor is None
+        assert len(db_conn._cursors) == 0
     
     def test_is_connected_returns_true_when_connected(self):
         """Vérifie que is_connected() retourne True quand connecté"""
@@ -254,3 +254,81 @@ class TestDatabaseConnectionContextManager:
             db_conn = conn
         
         assert isinstance(db_conn, DatabaseConnection)
+
+
+class TestConnectionLiveness:
+    """Tests pour la vérification de la connexion sans ping systématique"""
+    
+    @pytest.fixture
+    def clock(self):
+        return [100.0]
+    
+    @pytest.fixture
+    def db_conn(self, clock):
+        with patch('infrastructure.database.connection.mysql.connector.connect') as mock_connect:
+            mock_connect.return_value = Mock()
+            db_conn = DatabaseConnection(ping_idle_seconds=30, clock=lambda: clock[0])
+            db_conn.connect()
+        return db_conn
+    
+    def test_no_ping_while_connection_is_in_use(self, db_conn):
+        """Vérifie que curseurs et commits n'envoient pas de ping"""
+        db_conn.get_cursor()
+        db_conn.get_cursor()
+        db_conn.commit()
+        
+        db_conn._connection.is_connected.assert_not_called()
+        assert db_conn.pings == 0
+    
+    def test_ping_after_idle_threshold(self, db_conn, clock):
+        """Vérifie qu'une connexion inactive est vérifiée par un ping"""
+        clock[0] += 31
+        
+        assert db_conn.is_connected() is True
+        assert db_conn.is_connected() is True
+        db_conn._connection.is_connected.assert_called_once()
+    
+    def test_lost_connection_error_marks_connection_down(self, db_conn):
+        """Vérifie qu'une erreur 2013 rend la connexion inutilisable sans ping"""
+        db_conn.handle_error(mysql.connector.Error("Lost connection", errno=2013))
+        
+        assert db_conn.is_connected() is False
+        with pytest.raises(DatabaseException):
+            db_conn.get_cursor()
+    
+    def test_other_errors_keep_connection(self, db_conn):
+        """Vérifie qu'une erreur SQL ordinaire ne coupe pas la connexion"""
+        db_conn.handle_error(mysql.connector.Error("Duplicate entry", errno=1062))
+        
+        assert db_conn.is_connected() is True
+    
+    def test_recover_read_reconnects_for_first_statement(self, db_conn):
+        """Vérifie la reconnexion quand la lecture était la première instruction"""
+        db_conn.get_cursor()
+        
+        with patch('infrastructure.database.connection.mysql.connector.connect') as mock_connect:
+            assert db_conn.recover_read(mysql.connector.Error("Gone away", errno=2006)) is True
+            mock_connect.assert_called_once()
+        assert db_conn.is_connected() is True
+    
+    def test_recover_read_refuses_when_transaction_had_other_statements(self, db_conn):
+        """Vérifie qu'une transaction entamée n'est pas rejouée à moitié"""
+        db_conn.get_cursor()
+        db_conn.get_cursor()
+        
+        assert db_conn.recover_read(mysql.connector.Error("Gone away", errno=2006)) is False
+        assert db_conn.is_connected() is False
+    
+    def test_recover_read_after_many_autocommit_reads(self, clock):
+        """Vérifie qu'en autocommit, les lectures précédentes n'empêchent pas la reprise"""
+        with patch('infrastructure.database.connection.mysql.connector.connect') as mock_connect:
+            mock_connect.return_value = Mock()
+            db_conn = DatabaseConnection(DatabaseConfig(autocommit=True), ping_idle_seconds=30, clock=lambda: clock[0])
+            db_conn.connect()
+            for _ in range(5):
+                db_conn.get_cursor()
+            
+            assert db_conn.recover_read(mysql.connector.Error("Gone away", errno=2006)) is True
+            assert mock_connect.call_count == 2
+        assert db_conn.is_connected() is True
+        db_conn.get_cursor()
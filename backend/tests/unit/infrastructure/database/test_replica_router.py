@@ -0,0 +1,248 @@
+"""
+Tests pour le routage des lectures vers les réplicas et les jetons de cohérence.
+"""
+import time
+
+import pytest
+
+from domain.exceptions.database_exception import DatabaseException
+from infrastructure.database.config import DatabaseConfig
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.database.consistency_tokens import ConsistencyTokenStore
+from infrastructure.database.replica_router import ReplicaRouter
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from tests.unit.infrastructure.database.test_unit_of_work import RowRepository
+
+
+class FakeServer:
+    """Instance MySQL simulée: GTID exécuté, latence, disponibilité"""
+    
+    def __init__(self, name, gtid_executed='', delay=0.0):
+        self.name = name
+        self.gtid_executed = gtid_executed
+        self.delay = delay
+        self.reachable = True
+        self.connections = []
+        self.gtid_after_commit = None
+
+
+class FakeCursor:
+    def __init__(self, server):
+        self._server = server
+        self._row = None
+        self.lastrowid = 1
+    
+    def execute(self, query, params=None):
+        time.sleep(self._server.delay)
+        if 'GTID_SUBSET' in query:
+            required = set(params[0].split(',')) if params[0] else set()
+            self._row = (int(required <= set(self._server.gtid_executed.split(','))),)
+        elif 'gtid_executed' in query:
+            self._row = (self._server.gtid_executed,)
+        else:
+            self._row = (1,)
+    
+    def fetchone(self):
+        return self._row
+    
+    def close(self):
+        pass
+
+
+class FakeServerConnection:
+    def __init__(self, server):
+        self.server = server
+        self.connected = False
+        self.commits = 0
+    
+    def connect(self):
+        if not self.server.reachable:
+            raise DatabaseException(f"{self.server.name} injoignable")
+        self.connected = True
+    
+    def disconnect(self):
+        self.connected = False
+    
+    def is_connected(self):
+        return self.connected
+    
+    def get_cursor(self, statement=None):
+        return FakeCursor(self.server)
+    
+    def commit(self):
+        self.commits += 1
+        if self.server.gtid_after_commit:
+            self.server.gtid_executed = self.server.gtid_after_commit
+    
+    def rollback(self):
+        pass
+    
+    def handle_error(self, error):
+        pass
+    
+    def recover_read(self, error, discard_statements=False):
+        return False
+
+
+def _pool(server):
+    def factory(config):
+        connection = FakeServerConnection(server)
+        server.connections.append(connection)
+        return connection
+    return ConnectionPool(size=4, acquire_timeout_seconds=0.05, connection_factory=factory, registry=MetricsRegistry())
+
+
+@pytest.fixture
+def servers():
+    return FakeServer('primary', 'A:1-10'), FakeServer('r1', 'A:1-10'), FakeServer('r2', 'A:1-10')
+
+
+def _router(servers, **options):
+    primary, r1, r2 = servers
+    options.setdefault('probe_interval_seconds', 0.0)
+    return ReplicaRouter(_pool(primary), [('r1', _pool(r1)), ('r2', _pool(r2))], registry=MetricsRegistry(), **options)
+
+
+def _read(router, token=None):
+    connection, pool = router.acquire_read(token)
+    pool.release(connection)
+    return connection.server.name
+
+
+class TestReplicaRouter:
+    """Tests pour le choix du réplica"""
+    
+    def test_reads_are_spread_over_replicas(self, servers):
+        router = _router(servers)
+        
+        targets = [_read(router) for _ in range(10)]
+        
+        assert set(targets) == {'r1', 'r2'}
+    
+    def test_slower_replica_gets_fewer_reads(self, servers):
+        servers[2].delay = 0.004
+        router = _router(servers)
+        
+        targets = [_read(router) for _ in range(40)]
+        
+        assert targets.count('r1') > 2 * targets.count('r2')
+        assert router.weights()['r1'] > router.weights()['r2']
+    
+    def test_caught_up_replica_serves_own_writes(self, servers):
+        servers[2].gtid_executed = 'A:1-5'
+        router = _router(servers)
+        
+        assert {_read(router, 'A:1-10') for _ in range(6)} == {'r1'}
+    
+    def test_lagging_replicas_fall_back_to_primary(self, servers):
+        router = _router(servers)
+        
+        assert _read(router, 'A:1-10,B:1') == 'primary'
+    
+    def test_empty_token_pins_to_primary(self, servers):
+        router = _router(servers)
+        
+        assert _read(router, '') == 'primary'
+    
+    def test_unreachable_replica_is_skipped(self, servers):
+        servers[1].reachable = False
+        router = _router(servers)
+        
+        assert {_read(router) for _ in range(4)} == {'r2'}
+        assert 'r1' not in router.weights()
+
+
+class TestReadYourWrites:
+    """Tests pour le jeton de cohérence dans l'unité de travail"""
+    
+    def test_write_captures_gtid_and_read_waits_for_it(self, servers):
+        primary, r1, r2 = servers
+        router = _router(servers)
+        manager = UnitOfWorkManager(router.primary, MetricsRegistry(), router=router)
+        repository = RowRepository(manager.connection())
+        
+        primary.gtid_after_commit = 'A:1-11'
+        
+        with manager.scope() as writer:
+            repository.add('annonce')
+        r2.gtid_executed = 'A:1-11'
+        read = manager.begin(read_only=True, consistency_token=lambda: writer.written_token)
+        connection = manager.current.connection
+        manager.end(read)
+        
+        assert writer.written_token == 'A:1-11'
+        assert connection.server is r2
+    
+    def test_read_without_router_uses_primary_pool(self, servers):
+        router = _router(servers)
+        manager = UnitOfWorkManager(router.primary, MetricsRegistry())
+        
+        with manager.scope() as unit:
+            connection = unit.connection
+        
+        assert connection.server is servers[0]
+        assert unit.written_token is None
+
+
+class TestConsistencyTokenStore:
+    """Tests pour la fenêtre de lecture de ses propres écritures"""
+    
+    def test_token_expires_after_window(self):
+        now = [1000.0]
+        store = ConsistencyTokenStore(window_seconds=5, clock=lambda: now[0])
+        store.remember('7', 'A:1-3')
+        
+        assert store.get('7') == 'A:1-3'
+        now[0] += 5
+        assert store.get('7') is None
+    
+    def test_client_token_round_trip(self):
+        store = ConsistencyTokenStore(window_seconds=5)
+        
+        header = store.remember(None, 'A:1-3')
+        
+        assert store.decode(header) == 'A:1-3'
+        assert store.get(None) is None
+    
+    @pytest.mark.parametrize('header', ['', 'abc', '9999999999;A:1-3', "1;A:1-3", "2000000000;A'; DROP"])
+    def test_invalid_client_token_is_ignored(self, header):
+        store = ConsistencyTokenStore(window_seconds=5, clock=lambda: 1999999999.0)
+        
+        assert store.decode(header) is None
+        # Même signé, un jeton hors fenêtre ou mal formé reste ignoré
+        assert store.decode(f"{header};{store._sign(header)}") is None
+    
+    def test_forged_or_tampered_token_is_rejected(self):
+        now = [1000.0]
+        store = ConsistencyTokenStore(window_seconds=5, clock=lambda: now[0], secret_key='secret')
+        header = store.remember(None, 'A:1-3')
+        expires_text, gtid_set, signature = header.split(';')
+        
+        assert store.decode(f"1003.000;{gtid_set};{signature}") is None
+        assert store.decode(f"{expires_text};A:1-999;{signature}") is None
+        assert store.decode(f"{expires_text};{gtid_set}") is None
+        assert ConsistencyTokenStore(window_seconds=5, clock=lambda: now[0], secret_key='autre').decode(header) is None
+    
+    def test_workers_sharing_the_key_accept_each_other_tokens(self):
+        header = ConsistencyTokenStore(window_seconds=5, secret_key='secret').remember(None, 'A:1-3')
+        
+        assert ConsistencyTokenStore(window_seconds=5, secret_key='secret').decode(header) == 'A:1-3'
+
+
+class TestReplicaConfig:
+    """Tests pour la déclaration des réplicas"""
+    
+    def test_replicas_inherit_primary_credentials(self, monkeypatch):
+        monkeypatch.setenv('DB_REPLICAS', 'replica1:3307, replica2')
+        
+        config = DatabaseConfig(user='app', password='secret', port=3306)
+        
+        assert [replica.address for replica in config.replicas] == ['replica1:3307', 'replica2:3306']
+        assert config.replicas[0].user == 'app' and config.replicas[0].password == 'secret'
+        assert config.get_connection_params()['host'] == 'localhost'
+    
+    def test_no_replicas_by_default(self, monkeypatch):
+        monkeypatch.delenv('DB_REPLICAS', raising=False)
+        
+        assert not DatabaseConfig().has_replicas
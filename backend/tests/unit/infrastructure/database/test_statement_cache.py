@@ -0,0 +1,171 @@
+"""
+Tests du cache LRU de requêtes préparées.
+"""
+from unittest.mock import Mock
+
+import mysql.connector
+import pytest
+
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.statement_cache import StatementCache
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class FakePreparedCursor:
+    """Curseur préparé: exécutions, lignes en attente et fermeture"""
+    
+    def __init__(self):
+        self.executed = []
+        self.closed = False
+        self.pending = []
+        self.description = [('id',)]
+    
+    @property
+    def with_rows(self):
+        return bool(self.description)
+    
+    def execute(self, operation, params=None):
+        self.executed.append((operation, params))
+        self.pending = [(1,), (2,)]
+    
+    def fetchone(self):
+        return self.pending.pop(0) if self.pending else None
+    
+    def fetchall(self):
+        rows, self.pending = self.pending, []
+        return rows
+    
+    def close(self):
+        self.closed = True
+
+
+def _cache(size=2):
+    opened = []
+    
+    def factory():
+        cursor = FakePreparedCursor()
+        opened.append(cursor)
+        return cursor
+    
+    registry = MetricsRegistry()
+    return StatementCache(factory, size=size, registry=registry), opened, registry
+
+
+class TestStatementCache:
+    """Tests du cache LRU"""
+    
+    def test_reuses_prepared_cursor_for_same_statement(self):
+        cache, opened, registry = _cache()
+        
+        for _ in range(3):
+            cursor = cache.checkout("SELECT 1")
+            cursor.execute("SELECT 1")
+            cursor.close()
+        
+        assert len(opened) == 1
+        requests = registry.counter('db_statement_cache_requests_total', '')
+        assert requests.value(result='hit') == 2
+        assert requests.value(result='miss') == 1
+        assert registry.gauge('db_statement_cache_hit_ratio', '').samples()[0][1] == pytest.approx(2 / 3)
+    
+    def test_executes_the_cached_statement_object(self):
+        cache, opened, _ = _cache()
+        statement = "SELECT id FROM t WHERE id = %s"
+        cache.checkout(statement).close()
+        
+        cursor = cache.checkout("".join(["SELECT id FROM t ", "WHERE id = %s"]))
+        cursor.execute("ignored", (1,))
+        
+        assert opened[0].executed[0][0] is statement
+    
+    def test_evicts_least_recently_used_and_closes_it(self):
+        cache, opened, registry = _cache(size=2)
+        for statement in ("A", "B", "A", "C"):
+            cache.checkout(statement).close()
+        
+        first_a, b, c = opened
+        assert b.closed
+        assert not first_a.closed and not c.closed
+        assert len(cache) == 2
+        assert registry.counter('db_statement_cache_evictions_total', '').value() == 1
+    
+    def test_release_drains_unread_rows(self):
+        cache, opened, _ = _cache()
+        cursor = cache.checkout("SELECT id FROM t")
+        cursor.execute("SELECT id FROM t")
+        assert cursor.fetchone() == (1,)
+        
+        cursor.close()
+        
+        assert opened[0].pending == []
+        assert not opened[0].closed
+    
+    def test_nested_checkout_uses_uncached_cursor(self):
+        cache, opened, _ = _cache()
+        outer = cache.checkout("SELECT 1")
+        inner = cache.checkout("SELECT 1")
+        inner.close()
+        outer.close()
+        
+        assert opened[1].closed
+        assert not opened[0].closed
+        assert len(cache) == 1
+    
+    def test_clear_closes_idle_and_borrowed_cursors(self):
+        cache, opened, _ = _cache()
+        cache.checkout("A").close()
+        borrowed = cache.checkout("B")
+        
+        cache.clear()
+        borrowed.close()
+        
+        assert all(cursor.closed for cursor in opened)
+        assert len(cache) == 0
+
+
+class TestDatabaseConnectionStatementCache:
+    """Tests des curseurs préparés de DatabaseConnection"""
+    
+    def _connection(self, size=64):
+        conn = DatabaseConnection(ping_idle_seconds=60, clock=lambda: 0.0, statement_cache_size=size)
+        conn._connection = Mock()
+        conn._connection.cursor.side_effect = lambda **kwargs: FakePreparedCursor()
+        conn._last_used = 0.0
+        return conn
+    
+    def test_statement_cursor_is_prepared_once_per_connection(self):
+        conn = self._connection()
+        
+        for _ in range(2):
+            cursor = conn.get_cursor("SELECT 1")
+            cursor.execute("SELECT 1")
+            cursor.close()
+        
+        conn._connection.cursor.assert_called_once_with(prepared=True)
+    
+    def test_disabled_cache_returns_plain_cursor(self):
+        conn = self._connection(size=0)
+        
+        conn.get_cursor("SELECT 1")
+        
+        conn._connection.cursor.assert_called_once_with()
+    
+    def test_recycling_connection_closes_prepared_statements(self):
+        conn = self._connection()
+        cursor = conn.get_cursor("SELECT 1")
+        cursor.execute("SELECT 1")
+        cursor.close()
+        prepared = cursor._cursor
+        
+        conn.disconnect()
+        
+        assert prepared.closed
+        assert len(conn._statements) == 0
+    
+    def test_lost_connection_forgets_prepared_statements(self):
+        conn = self._connection()
+        conn.get_cursor("SELECT 1").close()
+        
+        conn.handle_error(mysql.connector.Error("gone away", errno=2006))
+        
+        assert len(conn._statements) == 0
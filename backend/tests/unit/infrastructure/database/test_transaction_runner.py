@@ -0,0 +1,141 @@
+"""
+Tests unitaires pour la reprise des transactions en conflit de verrous.
+"""
+import mysql.connector
+import pytest
+
+from domain.exceptions.database_exception import DatabaseException
+from infrastructure.database.transaction_runner import TransactionRunner
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from tests.unit.infrastructure.database.test_unit_of_work import _pool
+
+
+DEADLOCK = mysql.connector.errors.DatabaseError(msg="Deadlock found when trying to get lock", errno=1213)
+LOCK_WAIT_TIMEOUT = mysql.connector.errors.DatabaseError(msg="Lock wait timeout exceeded", errno=1205)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class Work:
+    """Travail qui échoue sur les premières tentatives, en écrivant avant"""
+    
+    def __init__(self, manager, failures, error=DEADLOCK, swallow=False):
+        self._manager = manager
+        self._failures = list(failures)
+        self._error = error
+        self._swallow = swallow
+        self.connections = []
+    
+    def __call__(self):
+        connection = self._manager.connection()
+        connection.get_cursor()
+        self.connections.append(self._manager.current.connection)
+        if self._failures and self._failures.pop(0):
+            error = DatabaseException("Échec de l'insertion", original_error=self._error)
+            connection.handle_error(self._error)
+            if self._swallow:
+                return 'erreur rattrapée'
+            raise error
+        return 'ok'
+
+
+@pytest.fixture
+def context():
+    registry = MetricsRegistry()
+    manager = UnitOfWorkManager(_pool(), registry)
+    clock = FakeClock()
+    runner = TransactionRunner(
+        manager, max_retries=3, base_delay_seconds=0.01, max_delay_seconds=0.05, budget_seconds=1.0,
+        clock=clock, sleep=clock.sleep, jitter=lambda: 1.0, registry=registry
+    )
+    return runner, manager, clock, registry
+
+
+class TestTransactionRunner:
+    """Tests pour le rejeu de l'unité de travail"""
+    
+    def test_success_commits_once(self, context):
+        runner, manager, _, registry = context
+        work = Work(manager, [])
+        
+        assert runner.run(work) == 'ok'
+        
+        assert work.connections[0].commits == 1
+        assert registry.counter('db_transaction_retries_total', '').value() == 0
+    
+    def test_deadlock_replays_whole_unit(self, context):
+        runner, manager, _, registry = context
+        work = Work(manager, [True, True])
+        
+        assert runner.run(work) == 'ok'
+        
+        assert len(work.connections) == 3
+        assert sum(connection.rollbacks for connection in set(work.connections)) == 2
+        assert sum(connection.commits for connection in set(work.connections)) == 1
+        assert registry.counter('db_transaction_retries_total', '').value() == 2
+        assert registry.counter('db_transaction_conflicts_total', '').value(error='deadlock') == 2
+        assert manager.current is None
+    
+    def test_conflict_swallowed_by_work_is_still_replayed(self, context):
+        runner, manager, _, _ = context
+        work = Work(manager, [True], error=LOCK_WAIT_TIMEOUT, swallow=True)
+        
+        assert runner.run(work) == 'ok'
+        
+        assert len(work.connections) == 2
+    
+    def test_backoff_grows_exponentially_up_to_ceiling(self, context):
+        runner, manager, clock, registry = context
+        
+        runner.run(Work(manager, [True, True, True]))
+        
+        assert clock.now == pytest.approx(0.01 + 0.02 + 0.04)
+        assert registry.counter('db_transaction_retry_wait_seconds_total', '').value() == pytest.approx(0.07)
+    
+    def test_retries_exhausted_raises_last_error(self, context):
+        runner, manager, _, registry = context
+        work = Work(manager, [True] * 10)
+        
+        with pytest.raises(DatabaseException):
+            runner.run(work)
+        
+        assert len(work.connections) == 4
+        assert registry.counter('db_transaction_retries_exhausted_total', '').value() == 1
+        assert manager.current is None
+    
+    def test_time_budget_bounds_retries(self, context):
+        _, manager, clock, registry = context
+        runner = TransactionRunner(
+            manager, max_retries=10, base_delay_seconds=0.1, max_delay_seconds=1.0, budget_seconds=0.25,
+            clock=clock, sleep=clock.sleep, jitter=lambda: 1.0, registry=registry
+        )
+        work = Work(manager, [True] * 10)
+        
+        with pytest.raises(DatabaseException):
+            runner.run(work)
+        
+        # Première attente 0,1; la seconde (0,2) mènerait à 0,3, au-delà du budget
+        assert len(work.connections) == 2
+        assert clock.now == pytest.approx(0.1)
+    
+    def test_other_errors_are_not_replayed(self, context):
+        runner, manager, _, registry = context
+        
+        def work():
+            manager.connection().get_cursor()
+            raise ValueError("invalide")
+        
+        with pytest.raises(ValueError):
+            runner.run(work)
+        
+        assert registry.counter('db_transaction_conflicts_total', '').value(error='deadlock') == 0
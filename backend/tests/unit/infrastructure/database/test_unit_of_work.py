@@ -0,0 +1,229 @@
+"""
+Tests pour le pool de connexions et l'unité de travail.
+"""
+import threading
+
+import mysql.connector
+import pytest
+from unittest.mock import Mock
+from mysql.connector.cursor import MySQLCursor
+
+from domain.exceptions.database_exception import DatabaseException
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.database.unit_of_work import UnitOfWork, UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+
+
+class FakeConnection:
+    """DatabaseConnection sans serveur: compte les commits et rollbacks"""
+    
+    def __init__(self, config=None):
+        self.connected = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_commit = False
+    
+    def connect(self):
+        self.connected = True
+    
+    def disconnect(self):
+        self.connected = False
+    
+    def is_connected(self):
+        return self.connected
+    
+    def get_cursor(self, statement=None):
+        cursor = Mock(spec=MySQLCursor)
+        cursor.lastrowid = 1
+        cursor.rowcount = 1
+        return cursor
+    
+    def commit(self):
+        if self.fail_commit:
+            raise DatabaseException("Échec du commit")
+        self.commits += 1
+    
+    def rollback(self):
+        self.rollbacks += 1
+    
+    def handle_error(self, error):
+        pass
+    
+    def recover_read(self, error, discard_statements=False):
+        return False
+
+
+class RowRepository(BaseMySQLRepository):
+    def _get_table_name(self):
+        return 'rows'
+    
+    def _map_to_entity(self, data):
+        return data
+    
+    def add(self, value):
+        return self._execute_insert("INSERT INTO rows (value) VALUES (%s)", (value,))
+
+
+def _pool(size=2, timeout=0.05):
+    return ConnectionPool(size=size, acquire_timeout_seconds=timeout, connection_factory=FakeConnection, registry=MetricsRegistry())
+
+
+class TestConnectionPool:
+    """Tests pour le prêt et la restitution des connexions"""
+    
+    def test_reuses_released_connection(self):
+        pool = _pool()
+        first = pool.acquire()
+        pool.release(first)
+        
+        assert pool.acquire() is first
+        assert pool.in_use == 1
+    
+    def test_acquire_times_out_when_exhausted(self):
+        pool = _pool(size=1)
+        pool.acquire()
+        
+        with pytest.raises(DatabaseException):
+            pool.acquire()
+    
+    def test_waiter_gets_released_connection(self):
+        pool = _pool(size=1, timeout=2)
+        held = pool.acquire()
+        received = []
+        waiter = threading.Thread(target=lambda: received.append(pool.acquire()))
+        waiter.start()
+        
+        pool.release(held)
+        waiter.join(2)
+        
+        assert received == [held]
+    
+    def test_discarded_connection_frees_a_slot(self):
+        pool = _pool(size=1)
+        broken = pool.acquire()
+        pool.release(broken, discard=True)
+        
+        replacement = pool.acquire()
+        
+        assert replacement is not broken
+        assert not broken.connected
+
+
+class TestUnitOfWork:
+    """Tests pour la transaction unique par unité de travail"""
+    
+    @pytest.fixture
+    def pool(self):
+        return _pool()
+    
+    @pytest.fixture
+    def manager(self, pool):
+        return UnitOfWorkManager(pool, MetricsRegistry())
+    
+    def test_repositories_share_one_connection_and_commit_once(self, manager, pool):
+        users, sessions = RowRepository(manager.connection()), RowRepository(manager.connection())
+        
+        with manager.scope() as unit:
+            users.add('alice')
+            sessions.add('jeton')
+            connection = unit.connection
+        
+        assert connection.commits == 1
+        assert pool.in_use == 0
+    
+    def test_exception_rolls_back(self, manager):
+        repository = RowRepository(manager.connection())
+        
+        with pytest.raises(ValueError):
+            with manager.scope() as unit:
+                repository.add('alice')
+                connection = unit.connection
+                raise ValueError("échec métier")
+        
+        assert (connection.commits, connection.rollbacks) == (0, 1)
+    
+    def test_caught_sql_error_still_rolls_back(self, manager):
+        repository = RowRepository(manager.connection())
+        
+        with manager.scope() as unit:
+            connection = unit.connection
+            connection.get_cursor = Mock(side_effect=mysql.connector.Error("duplicate"))
+            with pytest.raises(DatabaseException):
+                repository.add('alice')
+        
+        assert (connection.commits, connection.rollbacks) == (0, 1)
+    
+    def test_no_sql_no_connection(self, manager, pool):
+        with manager.scope() as unit:
+            pass
+        
+        assert not unit.has_connection
+        assert pool.in_use == 0
+    
+    def test_failed_commit_rolls_back_and_raises(self, pool):
+        unit = UnitOfWork(pool, MetricsRegistry())
+        unit.connection.fail_commit = True
+        connection = unit.connection
+        
+        with pytest.raises(DatabaseException):
+            unit.commit()
+        
+        assert connection.rollbacks == 1
+        assert pool.in_use == 0
+    
+    def test_after_commit_runs_once_committed(self, manager):
+        events = []
+        
+        with manager.scope() as unit:
+            RowRepository(manager.connection()).add('alice')
+            connection = unit.connection
+            manager.after_commit(lambda: events.append(connection.commits))
+            assert events == []
+        
+        assert events == [1]
+    
+    def test_after_commit_dropped_on_rollback(self, manager):
+        events = []
+        
+        with pytest.raises(ValueError):
+            with manager.scope():
+                manager.after_commit(lambda: events.append('publié'))
+                raise ValueError("échec métier")
+        with manager.scope() as unit:
+            unit.mark_rollback_only()
+            manager.after_commit(lambda: events.append('publié'))
+        
+        assert events == []
+    
+    def test_after_commit_outside_unit_runs_immediately(self, manager):
+        events = []
+        
+        manager.after_commit(lambda: events.append('publié'))
+        
+        assert events == ['publié']
+    
+    def test_failing_after_commit_does_not_fail_commit(self, manager):
+        events = []
+        
+        with manager.scope():
+            manager.after_commit(Mock(side_effect=RuntimeError("broker indisponible")))
+            manager.after_commit(lambda: events.append('publié'))
+        
+        assert events == ['publié']
+    
+    def test_scope_joins_current_unit_on_request(self, manager):
+        with manager.scope() as unit:
+            with pytest.raises(DatabaseException):
+                with manager.scope():
+                    pass
+            with manager.scope(join_current=True) as joined:
+                RowRepository(manager.connection()).add('alice')
+            assert joined is unit and manager.current is unit
+            connection = unit.connection
+        
+        assert connection.commits == 1
+    
+    def test_repository_outside_unit_raises(self, manager):
+        with pytest.raises(DatabaseException):
+            RowRepository(manager.connection()).add('alice')
@@ -0,0 +1,138 @@
+"""
+Tests unitaires pour ImageResizer et ResizedImageCache.
+"""
+import os
+import threading
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from infrastructure.imaging.image_resizer import ImageResizer, ResizeRequest
+from infrastructure.imaging.resized_image_cache import ResizedImageCache
+from infrastructure.imaging.thumbnail_generator import ThumbnailGenerator
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+HASHED_NAME = 'ab/' + 'ab' * 32 + '.jpg'
+
+
+class _SlowGenerator:
+    """Générateur factice: écrit quelques octets quand on le libère"""
+    
+    is_available = True
+    
+    def __init__(self):
+        self.release = threading.Event()
+        self.renders = 0
+    
+    def render(self, relative_path, box, output_format, target_path):
+        self.renders += 1
+        future = Future()
+        
+        def work():
+            self.release.wait(timeout=5)
+            with open(target_path, 'wb') as target:
+                target.write(b'x' * box[0])
+            future.set_result(target_path)
+        
+        threading.Thread(target=work).start()
+        return future
+
+
+class TestResizeRequest:
+    """Tests pour la validation des paramètres"""
+    
+    def test_sizes_are_rounded_up_to_step(self):
+        """Vérifie que des tailles voisines partagent la même entrée de cache"""
+        assert ResizeRequest.parse(300, None, 'JPG') == ResizeRequest(304, None, 'jpeg')
+        assert ResizeRequest.parse(301, None, None) == ResizeRequest(304, None, 'jpeg')
+    
+    @pytest.mark.parametrize('width,height,fmt', [(None, None, 'jpeg'), (0, None, 'jpeg'), (4000, None, 'jpeg'), (100, None, 'gif')])
+    def test_invalid_parameters_are_rejected(self, width, height, fmt):
+        """Vérifie le refus des paramètres hors limites"""
+        with pytest.raises(ValueError):
+            ResizeRequest.parse(width, height, fmt)
+
+
+class TestResizedImageCache:
+    """Tests pour le cache LRU disque"""
+    
+    def _put(self, cache, key, size):
+        temp_path = cache.new_temp_path(key)
+        with open(temp_path, 'wb') as temp:
+            temp.write(b'x' * size)
+        return cache.put(key, temp_path)
+    
+    def test_least_recently_used_entry_is_evicted(self, tmp_path):
+        """Vérifie l'éviction du fichier le moins récemment lu"""
+        cache = ResizedImageCache(str(tmp_path), max_bytes=250)
+        self._put(cache, 'aa-1', 100)
+        self._put(cache, 'bb-2', 100)
+        cache.get('aa-1')
+        
+        self._put(cache, 'cc-3', 100)
+        
+        assert cache.get('bb-2') is None
+        assert cache.get('aa-1') is not None
+        assert cache.evictions == 1
+        assert cache.total_bytes == 200
+    
+    def test_index_is_rebuilt_from_disk(self, tmp_path):
+        """Vérifie qu'un nouveau processus retrouve les fichiers existants"""
+        self._put(ResizedImageCache(str(tmp_path)), 'aa-1', 100)
+        
+        reopened = ResizedImageCache(str(tmp_path))
+        
+        assert len(reopened) == 1
+        assert reopened.total_bytes == 100
+
+
+class TestImageResizer:
+    """Tests pour la classe ImageResizer"""
+    
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+    
+    def test_concurrent_first_requests_render_once(self, tmp_path, registry):
+        """Vérifie la coalescence des premières requêtes et les métriques"""
+        generator = _SlowGenerator()
+        resizer = ImageResizer(
+            str(tmp_path), generator, ResizedImageCache(str(tmp_path / 'cache')), registry=registry
+        )
+        request = ResizeRequest.parse(320, None, 'jpeg')
+        key = resizer.cache_key(HASHED_NAME, request)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(resizer.resized_path, HASHED_NAME, request) for _ in range(3)]
+            while generator.renders == 0 or resizer._single_flight._calls[key].waiters < 2:
+                pass
+            generator.release.set()
+            paths = {future.result(timeout=5) for future in futures}
+        resizer.resized_path(HASHED_NAME, request)
+        
+        assert generator.renders == 1
+        assert len(paths) == 1
+        assert os.path.getsize(paths.pop()) == 320
+        requests = registry.counter('media_resize_requests_total', '')
+        assert requests.value(result='hit') == 1
+        assert requests.value(result='miss') == 1
+        assert requests.value(result='coalesced') == 2
+        assert resizer.hit_ratio() == 0.25
+    
+    def test_real_render_never_upscales(self, tmp_path, registry):
+        """Vérifie un rendu Pillow réel dans le pool"""
+        image_module = pytest.importorskip('PIL.Image')
+        os.makedirs(tmp_path / 'ab')
+        image_module.new('RGB', (400, 200), (0, 128, 255)).save(tmp_path / HASHED_NAME, 'JPEG')
+        generator = ThumbnailGenerator(str(tmp_path), executor_factory=lambda: ThreadPoolExecutor(max_workers=1))
+        resizer = ImageResizer(
+            str(tmp_path), generator, ResizedImageCache(str(tmp_path / 'cache')), registry=registry
+        )
+        
+        small = resizer.resized_path(HASHED_NAME, ResizeRequest.parse(100, None, 'webp'))
+        large = resizer.resized_path(HASHED_NAME, ResizeRequest.parse(1000, 1000, 'png'))
+        generator.shutdown()
+        
+        with image_module.open(small) as rendered:
+            assert (rendered.format, rendered.size) == ('WEBP', (112, 56))
+        with image_module.open(large) as rendered:
+            assert (rendered.format, rendered.size) == ('PNG', (400, 200))
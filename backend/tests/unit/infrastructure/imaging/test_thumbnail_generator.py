@@ -0,0 +1,56 @@
+"""
+Tests unitaires pour ThumbnailGenerator.
+"""
+import os
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from infrastructure.imaging.thumbnail_generator import ThumbnailGenerator
+
+Image = pytest.importorskip('PIL.Image')
+
+
+class TestThumbnailGenerator:
+    """Tests pour la classe ThumbnailGenerator"""
+    
+    @pytest.fixture
+    def generator(self, tmp_path):
+        generator = ThumbnailGenerator(
+            str(tmp_path),
+            variants={'thumbnail': (32, 32), 'medium': (64, 64)},
+            executor_factory=lambda: ThreadPoolExecutor(max_workers=1)
+        )
+        yield generator
+        generator.shutdown()
+    
+    def test_submit_produces_bounded_variants(self, generator, tmp_path):
+        """Vérifie les variantes produites et l'appel du callback"""
+        Image.new('RGBA', (200, 100), (255, 0, 0, 128)).save(tmp_path / 'photo.png')
+        done = threading.Event()
+        produced = {}
+        
+        def on_done(variants):
+            produced.update(variants)
+            done.set()
+        
+        generator.submit('photo.png', on_done).result(timeout=10)
+        
+        assert done.wait(timeout=10)
+        assert produced == {'thumbnail': 'photo_thumbnail.jpg', 'medium': 'photo_medium.jpg'}
+        with Image.open(tmp_path / 'photo_thumbnail.jpg') as thumbnail:
+            assert thumbnail.size == (32, 16)
+        with Image.open(tmp_path / 'photo_medium.jpg') as medium:
+            assert medium.size == (64, 32)
+    
+    def test_corrupt_picture_does_not_call_callback(self, generator, tmp_path):
+        """Vérifie qu'une photo illisible est journalisée sans callback"""
+        (tmp_path / 'broken.jpg').write_bytes(b'\xff\xd8\xff' + b'\x00' * 10)
+        calls = []
+        
+        future = generator.submit('broken.jpg', calls.append)
+        with pytest.raises(Exception):
+            future.result(timeout=10)
+        
+        assert calls == []
+        assert not os.path.exists(tmp_path / 'broken_thumbnail.jpg')
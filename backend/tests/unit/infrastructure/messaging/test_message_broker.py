@@ -0,0 +1,87 @@
+"""
+Tests unitaires pour MessageBroker.
+"""
+import pytest
+
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+from infrastructure.messaging.message_broker import MessageBroker
+
+
+class TestMessageBroker:
+    """Tests pour le pub/sub en processus"""
+    
+    def test_publish_reaches_only_the_recipient(self):
+        """Vérifie qu'un événement n'est livré qu'aux flux du destinataire"""
+        broker = MessageBroker()
+        alice = broker.subscribe('alice')
+        bob = broker.subscribe('bob')
+        
+        delivered = broker.publish('alice', 'message', {'content': 'Bonjour'}, event_id=1)
+        
+        assert delivered == 1
+        event = alice.get(timeout=0.1)
+        assert event.event == 'message'
+        assert event.event_id == 1
+        assert bob.get(timeout=0.01) is None
+    
+    def test_publish_reaches_every_stream_of_the_user(self):
+        """Vérifie que chaque onglet ouvert reçoit l'événement"""
+        broker = MessageBroker()
+        first = broker.subscribe('alice')
+        second = broker.subscribe('alice')
+        
+        assert broker.publish('alice', 'unread', {'unread_count': 2}) == 2
+        assert first.get(timeout=0.1).data == {'unread_count': 2}
+        assert second.get(timeout=0.1).data == {'unread_count': 2}
+    
+    def test_get_returns_none_on_timeout(self):
+        """Vérifie que l'attente expire (moment d'envoyer un heartbeat)"""
+        subscription = MessageBroker().subscribe('alice')
+        
+        assert subscription.get(timeout=0.01) is None
+    
+    def test_connection_cap_raises_overloaded(self):
+        """Vérifie que le plafond de connexions par worker est respecté"""
+        broker = MessageBroker(max_connections=1)
+        broker.subscribe('alice')
+        
+        with pytest.raises(ServiceOverloadedException) as exc_info:
+            broker.subscribe('bob')
+        
+        assert exc_info.value.retry_after == 5
+    
+    def test_close_releases_a_slot(self):
+        """Vérifie que fermer un flux libère sa place"""
+        broker = MessageBroker(max_connections=1)
+        
+        with broker.subscribe('alice'):
+            assert broker.connection_count == 1
+        
+        assert broker.connection_count == 0
+        broker.subscribe('bob')
+    
+    def test_close_is_idempotent(self):
+        """Vérifie qu'une double fermeture ne fausse pas le compteur"""
+        broker = MessageBroker()
+        subscription = broker.subscribe('alice')
+        broker.subscribe('alice')
+        
+        subscription.close()
+        subscription.close()
+        
+        assert broker.connection_count == 1
+    
+    def test_full_queue_marks_overflow_without_blocking(self):
+        """Vérifie qu'un client lent ne bloque pas l'expéditeur"""
+        broker = MessageBroker(queue_size=1)
+        subscription = broker.subscribe('alice')
+        
+        assert broker.publish('alice', 'message', {}, event_id=1) == 1
+        assert broker.publish('alice', 'message', {}, event_id=2) == 0
+        
+        assert subscription.overflowed is True
+    
+    def test_invalid_max_connections(self):
+        """Vérifie qu'un plafond nul est refusé"""
+        with pytest.raises(ValueError):
+            MessageBroker(max_connections=0)
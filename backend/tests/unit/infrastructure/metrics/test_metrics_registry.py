@@ -0,0 +1,43 @@
+"""
+Tests unitaires pour MetricsRegistry.
+"""
+import os
+import pytest
+
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests pour la classe MetricsRegistry"""
+    
+    def test_counter_is_shared_by_name(self):
+        """Vérifie que deux déclarations du même nom retournent le même compteur"""
+        registry = MetricsRegistry()
+        
+        registry.counter('requests_total', 'Requêtes').inc(result='hit')
+        registry.counter('requests_total', 'Requêtes').inc(2, result='hit')
+        
+        assert registry.counter('requests_total', 'Requêtes').value(result='hit') == 3
+    
+    def test_render_uses_prometheus_text_format(self):
+        """Vérifie HELP, TYPE, labels et jauge calculée"""
+        registry = MetricsRegistry()
+        registry.counter('requests_total', 'Requêtes').inc(result='miss')
+        registry.gauge('ratio', 'Ratio', callback=lambda: 0.5)
+        
+        text = registry.render()
+        
+        pid = os.getpid()
+        assert '# TYPE requests_total counter' in text
+        assert f'requests_total{{result="miss",pid="{pid}"}} 1' in text
+        assert f'ratio{{pid="{pid}"}} 0.5' in text
+    
+    def test_counter_cannot_decrease_or_change_type(self):
+        """Vérifie les erreurs de déclaration et d'usage"""
+        registry = MetricsRegistry()
+        counter = registry.counter('events_total', 'Événements')
+        
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+        with pytest.raises(ValueError):
+            registry.gauge('events_total', 'Événements')
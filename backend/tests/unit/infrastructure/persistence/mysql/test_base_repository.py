@@ -57,7 +57,8 @@ class TestBaseMySQLRepository:
         
         result = repository._execute_query("SELECT * FROM users WHERE id = %s", (1,))
         
-        mock_connection.get_cursor.assert_called_once()
+        # Curseur fermé par l'appelant: jamais un curseur préparé du cache
+        mock_connection.get_cursor.assert_called_once_with()
         mock_cursor.execute.assert_called_once_with("SELECT * FROM users WHERE id = %s", (1,))
         assert result == mock_cursor
     
@@ -217,3 +218,100 @@ class TestBaseMySQLRepository:
         
         with pytest.raises(TypeError):
             IncompleteRepository(Mock())
+
+
+class TestBaseMySQLRepositoryInsert:
+    """Tests pour _execute_insert"""
+    
+    @pytest.fixture
+    def mock_connection(self):
+        return Mock(spec=DatabaseConnection)
+    
+    @pytest.fixture
+    def repository(self, mock_connection):
+        return ConcreteRepository(mock_connection)
+    
+    def test_execute_insert_returns_lastrowid(self, repository, mock_connection):
+        """Vérifie que _execute_insert valide la transaction et retourne l'ID généré"""
+        cursor = Mock(spec=MySQLCursor)
+        cursor.lastrowid = 42
+        mock_connection.get_cursor.return_value = cursor
+        
+        result = repository._execute_insert("INSERT INTO t (name) VALUES (%s)", ("a",))
+        
+        assert result == 42
+        mock_connection.commit.assert_called_once()
+        cursor.close.assert_called_once()
+    
+    def test_execute_insert_rollback_on_error(self, repository, mock_connection):
+        """Vérifie que _execute_insert annule la transaction en cas d'erreur"""
+        cursor = Mock(spec=MySQLCursor)
+        cursor.execute.side_effect = mysql.connector.Error("Duplicate entry")
+        mock_connection.get_cursor.return_value = cursor
+        
+        with pytest.raises(DatabaseException) as exc_info:
+            repository._execute_insert("INSERT INTO t (name) VALUES (%s)", ("a",))
+        
+        mock_connection.rollback.assert_called_once()
+        assert "Échec de l'insertion" in str(exc_info.value)
+
+
+class TestBaseMySQLRepositoryReconnect:
+    """Tests pour la relecture après coupure de connexion"""
+    
+    @pytest.fixture
+    def mock_connection(self):
+        return Mock(spec=DatabaseConnection)
+    
+    @pytest.fixture
+    def repository(self, mock_connection):
+        return ConcreteRepository(mock_connection)
+    
+    @pytest.fixture
+    def cursor(self):
+        cursor = Mock(spec=MySQLCursor)
+        cursor.description = [["id"]]
+        cursor.fetchall.return_value = [(1,)]
+        return cursor
+    
+    def test_read_is_replayed_once_after_lost_connection(self, repository, mock_connection, cursor):
+        """Vérifie qu'une lecture coupée (2013) est rejouée sur la connexion rouverte"""
+        lost = Mock(spec=MySQLCursor)
+        lost.execute.side_effect = mysql.connector.Error("Lost connection", errno=2013)
+        mock_connection.get_cursor.side_effect = [lost, cursor]
+        mock_connection.recover_read.return_value = True
+        
+        assert repository._fetch_all("SELECT id FROM t") == [{'id': 1}]
+        assert mock_connection.get_cursor.call_count == 2
+    
+    def test_read_not_replayed_when_recovery_refused(self, repository, mock_connection):
+        """Vérifie que l'erreur remonte si la transaction ne peut pas être rejouée"""
+        lost = Mock(spec=MySQLCursor)
+        lost.execute.side_effect = mysql.connector.Error("Lost connection", errno=2013)
+        mock_connection.get_cursor.return_value = lost
+        mock_connection.recover_read.return_value = False
+        
+        with pytest.raises(DatabaseException):
+            repository._fetch_one("SELECT id FROM t")
+        assert mock_connection.get_cursor.call_count == 1
+    
+    def test_ordinary_error_is_not_replayed(self, repository, mock_connection):
+        """Vérifie qu'une erreur SQL ordinaire n'entraîne pas de reconnexion"""
+        failing = Mock(spec=MySQLCursor)
+        failing.execute.side_effect = mysql.connector.Error("Syntax error", errno=1064)
+        mock_connection.get_cursor.return_value = failing
+        
+        with pytest.raises(DatabaseException):
+            repository._fetch_all("SELEC id FROM t")
+        mock_connection.recover_read.assert_not_called()
+    
+    def test_lost_connection_during_write_is_reported(self, repository, mock_connection):
+        """Vérifie qu'une écriture coupée signale la connexion perdue sans rejouer"""
+        lost = Mock(spec=MySQLCursor)
+        lost.execute.side_effect = mysql.connector.Error("Gone away", errno=2006)
+        mock_connection.get_cursor.return_value = lost
+        
+        with pytest.raises(DatabaseException):
+            repository._execute_insert("INSERT INTO t (name) VALUES (%s)", ("a",))
+        mock_connection.handle_error.assert_called_once()
+        assert mock_connection.get_cursor.call_count == 1
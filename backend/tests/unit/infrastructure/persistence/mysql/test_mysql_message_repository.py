@@ -0,0 +1,171 @@
+"""
+Tests pour MySQLMessageRepository.
+"""
+import pytest
+from unittest.mock import Mock
+import mysql.connector
+from mysql.connector.cursor import MySQLCursor
+
+from domain.exceptions.database_exception import DatabaseException
+from domain.message.conversation import Conversation
+from domain.message.message import Message
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.connection_pool import ConnectionPool
+from infrastructure.database.unit_of_work import UnitOfWorkManager
+from infrastructure.metrics.metrics_registry import MetricsRegistry
+from infrastructure.persistence.mysql.mysql_message_repository import MySQLMessageRepository
+from tests.unit.infrastructure.database.test_unit_of_work import FakeConnection
+
+
+class TestMySQLMessageRepository:
+    """Tests pour la mise à jour dénormalisée des conversations"""
+    
+    @pytest.fixture
+    def mock_connection(self):
+        return Mock(spec=DatabaseConnection)
+    
+    @pytest.fixture
+    def mock_cursor(self, mock_connection):
+        cursor = Mock(spec=MySQLCursor)
+        cursor.rowcount = 3
+        cursor.fetchone.return_value = (7, 42)
+        cursor.nextset.return_value = None
+        mock_connection.get_cursor.return_value = cursor
+        return cursor
+    
+    @pytest.fixture
+    def repository(self, mock_connection):
+        return MySQLMessageRepository(mock_connection)
+    
+    def test_save_is_a_single_call(self, repository, mock_connection, mock_cursor):
+        """Vérifie que l'envoi tient en un seul CALL, validé par l'appelant"""
+        message = Message(conversation_id=7, sender_id='12', content='Bonjour')
+        
+        saved = repository.save(message)
+        
+        assert saved.message_id == 42
+        mock_cursor.execute.assert_called_once()
+        query, params = mock_cursor.execute.call_args.args
+        assert query.startswith("CALL SendMessage(")
+        assert params == (7, None, None, None, '12', 'Bonjour', 140)
+        # La procédure ne valide plus: commit() (ou l'unité de travail) s'en charge
+        mock_connection.commit.assert_called_once()
+    
+    def test_save_with_conversation_upserts_in_same_call(self, repository, mock_cursor):
+        """Vérifie que le premier message crée la conversation dans le même CALL"""
+        conversation = Conversation(listing_id='3', buyer_id='12', seller_id='4')
+        
+        saved = repository.save_with_conversation(conversation, '12', 'Toujours dispo?')
+        
+        assert (saved.conversation_id, saved.message_id) == (7, 42)
+        params = mock_cursor.execute.call_args.args[1]
+        assert params == (None, '3', '12', '4', '12', 'Toujours dispo?', 140)
+    
+    def test_save_with_conversation_validates_before_database(self, repository, mock_cursor):
+        """Vérifie qu'un message vide n'atteint pas la base"""
+        with pytest.raises(ValueError):
+            repository.save_with_conversation(Conversation('3', '12', '4'), '12', '   ')
+        
+        mock_cursor.execute.assert_not_called()
+    
+    def test_save_wraps_database_error(self, repository, mock_connection, mock_cursor):
+        """Vérifie qu'une erreur de la procédure devient une DatabaseException"""
+        mock_cursor.execute.side_effect = mysql.connector.Error("Deadlock")
+        
+        with pytest.raises(DatabaseException):
+            repository.save(Message(conversation_id=7, sender_id='12', content='Bonjour'))
+        
+        mock_connection.rollback.assert_called_once()
+        mock_cursor.close.assert_called_once()
+    
+    def test_save_rolls_back_when_no_ids_returned(self, repository, mock_connection, mock_cursor):
+        """Vérifie qu'un CALL sans ligne de résultat n'est pas validé"""
+        mock_cursor.fetchone.return_value = None
+        
+        with pytest.raises(DatabaseException):
+            repository.save(Message(conversation_id=7, sender_id='12', content='Bonjour'))
+        
+        mock_connection.rollback.assert_called_once()
+        mock_connection.commit.assert_not_called()
+        mock_cursor.close.assert_called_once()
+    
+    def test_mark_conversation_read_resets_counter(self, repository, mock_connection, mock_cursor):
+        """Vérifie que les messages et le compteur sont mis à jour ensemble"""
+        marked = repository.mark_conversation_read(7, '12')
+        
+        assert marked == 3
+        messages_call, counter_call = mock_cursor.execute.call_args_list
+        assert messages_call.args[1] == (7, '12')
+        assert counter_call.args[1] == ('12', '12', 7)
+        mock_connection.commit.assert_called_once()
+    
+    def test_count_unread_sums_counters(self, repository, mock_connection, mock_cursor):
+        """Vérifie que le compteur global se lit sur les conversations"""
+        mock_cursor.description = [('unread',)]
+        mock_cursor.fetchone.return_value = (5,)
+        
+        assert repository.count_unread_for_user('12') == 5
+        
+        query = mock_cursor.execute.call_args.args[0]
+        assert 'FROM messages' not in query
+    
+    def test_latest_page_is_read_backwards_then_reversed(self, repository, mock_cursor):
+        """Vérifie la page la plus récente: parcours descendant, résultat chronologique"""
+        mock_cursor.description = [
+            ('message_id',), ('conversation_id',), ('sender_id',), ('content',), ('is_read',), ('created_at',)
+        ]
+        mock_cursor.fetchall.return_value = [
+            (9, 7, 12, 'neuf', 0, None),
+            (8, 7, 12, 'huit', 0, None)
+        ]
+        
+        page = repository.find_by_conversation(7, 2)
+        
+        query, params = mock_cursor.execute.call_args.args
+        assert 'ORDER BY m.message_id DESC' in query
+        assert 'OFFSET' not in query
+        assert params == (7, 2)
+        assert [message.message_id for message in page] == [8, 9]
+    
+    def test_before_and_after_cursors_use_keyset_predicates(self, repository, mock_cursor):
+        """Vérifie les prédicats de curseur sur message_id"""
+        mock_cursor.description = [('message_id',)]
+        mock_cursor.fetchall.return_value = []
+        
+        repository.find_by_conversation(7, 20, before_message_id=100)
+        before_query, before_params = mock_cursor.execute.call_args.args
+        repository.find_by_conversation(7, 20, after_message_id=100)
+        after_query, after_params = mock_cursor.execute.call_args.args
+        
+        assert 'm.message_id < %s' in before_query and before_params == (7, 100, 20)
+        assert 'm.message_id > %s' in after_query and 'ASC' in after_query
+        assert after_params == (7, 100, 20)
+
+
+class SendMessageConnection(FakeConnection):
+    """Connexion sans serveur dont le CALL SendMessage retourne (7, 42)"""
+    
+    def get_cursor(self, statement=None):
+        cursor = super().get_cursor(statement)
+        cursor.fetchone.return_value = (7, 42)
+        cursor.nextset.return_value = None
+        return cursor
+
+
+class TestSendMessageInUnitOfWork:
+    """Tests pour l'envoi d'un message dans la transaction de l'unité de travail"""
+    
+    def test_send_marks_unit_dirty_and_commits_once(self):
+        pool = ConnectionPool(size=1, connection_factory=SendMessageConnection, registry=MetricsRegistry())
+        manager = UnitOfWorkManager(pool, MetricsRegistry())
+        repository = MySQLMessageRepository(manager.connection())
+        
+        with manager.scope() as unit:
+            repository.save(Message(conversation_id=7, sender_id='12', content='Bonjour'))
+            connection = unit.connection
+            
+            # Validé avec le reste de la requête, pas par la procédure
+            assert unit.dirty is True
+            assert connection.commits == 0
+        
+        assert connection.commits == 1
@@ -0,0 +1,136 @@
+"""
+Tests pour le mappage compilé ligne → entité (RowMapper).
+"""
+import pytest
+from unittest.mock import Mock
+from mysql.connector.cursor import MySQLCursor
+
+from domain.exceptions.database_exception import DatabaseException
+from domain.message.message import Message
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.persistence.mysql.base_repository import BaseMySQLRepository
+from infrastructure.persistence.mysql.row_mapper import RowMapper
+
+
+MESSAGE_MAPPER = RowMapper(
+    Message,
+    'message_id', 'conversation_id', ('sender_id', str), 'content', ('is_read', bool), 'created_at'
+)
+
+DESCRIPTION = [('message_id',), ('conversation_id',), ('sender_id',), ('content',), ('is_read',), ('created_at',)]
+
+
+class MessageReader(BaseMySQLRepository):
+    """Repository de test lisant des messages par RowMapper"""
+    
+    def find_all(self):
+        return self._fetch_all_as(MESSAGE_MAPPER, "SELECT message_id FROM messages")
+    
+    def find_one(self):
+        return self._fetch_one_as(MESSAGE_MAPPER, "SELECT message_id FROM messages LIMIT 1")
+    
+    def _get_table_name(self) -> str:
+        return "messages"
+    
+    def _map_to_entity(self, data):
+        return MESSAGE_MAPPER.from_dict(data)
+
+
+class TestRowMapper:
+    """Tests pour RowMapper"""
+    
+    def test_maps_tuple_with_conversions(self):
+        """Vérifie que les valeurs vont au constructeur, converties"""
+        message = MESSAGE_MAPPER.compiled(DESCRIPTION)((9, 7, 12, 'Bonjour', 0, None))
+        
+        assert message.message_id == 9
+        assert message.sender_id == '12'
+        assert message.is_read is False
+        assert message.content == 'Bonjour'
+    
+    def test_follows_result_column_order_and_ignores_extra_columns(self):
+        """Vérifie que l'ordre du résultat est libre et les colonnes en trop ignorées"""
+        description = [('content',), ('extra',), ('is_read',), ('created_at',),
+                       ('sender_id',), ('conversation_id',), ('message_id',)]
+        
+        message = MESSAGE_MAPPER.compiled(description)(('Salut', 'x', 1, None, 3, 7, 9))
+        
+        assert (message.message_id, message.conversation_id, message.sender_id) == (9, 7, '3')
+        assert message.is_read is True
+    
+    def test_compiled_mapper_is_cached_per_description(self):
+        """Vérifie qu'une forme de résultat n'est compilée qu'une fois"""
+        mapper = RowMapper(dict, 'a', 'b')
+        
+        assert mapper.compiled([('a',), ('b',)]) is mapper.compiled([['a'], ['b']])
+        assert mapper.compiled([('b',), ('a',)]) is not mapper.compiled([('a',), ('b',)])
+    
+    def test_missing_column_raises_database_exception(self):
+        """Vérifie qu'une colonne déclarée absente du résultat est signalée"""
+        with pytest.raises(DatabaseException) as exc_info:
+            MESSAGE_MAPPER.compiled([('message_id',)])
+        
+        assert 'sender_id' in str(exc_info.value)
+    
+    def test_from_dict_uses_same_conversions(self):
+        """Vérifie le mappage d'une ligne déjà en dictionnaire"""
+        message = MESSAGE_MAPPER.from_dict({
+            'message_id': 1, 'conversation_id': 2, 'sender_id': 3,
+            'content': 'Allô', 'is_read': 1, 'created_at': None
+        })
+        
+        assert message.sender_id == '3' and message.is_read is True
+    
+    def test_rejects_invalid_column_names(self):
+        """Vérifie que les colonnes doivent être des identifiants uniques"""
+        with pytest.raises(ValueError):
+            RowMapper(dict, 'm.message_id')
+        with pytest.raises(ValueError):
+            RowMapper(dict, 'a', ('a', str))
+
+
+class TestBaseMySQLRepositoryMappedReads:
+    """Tests pour _fetch_one_as et _fetch_all_as"""
+    
+    @pytest.fixture
+    def mock_connection(self):
+        return Mock(spec=DatabaseConnection)
+    
+    @pytest.fixture
+    def cursor(self, mock_connection):
+        cursor = Mock(spec=MySQLCursor)
+        cursor.description = DESCRIPTION
+        mock_connection.get_cursor.return_value = cursor
+        return cursor
+    
+    def test_fetch_all_as_builds_entities(self, mock_connection, cursor):
+        """Vérifie que les lignes deviennent des entités sans dictionnaire"""
+        cursor.fetchall.return_value = [(1, 7, 12, 'un', 0, None), (2, 7, 13, 'deux', 1, None)]
+        
+        messages = MessageReader(mock_connection).find_all()
+        
+        assert [message.message_id for message in messages] == [1, 2]
+        assert [message.sender_id for message in messages] == ['12', '13']
+        cursor.close.assert_called_once()
+    
+    def test_fetch_all_as_empty_result_skips_compilation(self, mock_connection, cursor):
+        """Vérifie qu'un résultat vide ne dépend pas de la description"""
+        cursor.description = [('message_id',)]
+        cursor.fetchall.return_value = []
+        
+        assert MessageReader(mock_connection).find_all() == []
+    
+    def test_fetch_one_as_returns_none_when_not_found(self, mock_connection, cursor):
+        """Vérifie que _fetch_one_as retourne None sans ligne"""
+        cursor.fetchone.return_value = None
+        
+        assert MessageReader(mock_connection).find_one() is None
+        cursor.close.assert_called_once()
+    
+    def test_fetch_one_as_builds_entity(self, mock_connection, cursor):
+        """Vérifie que _fetch_one_as construit l'entité"""
+        cursor.fetchone.return_value = (5, 7, 12, 'cinq', 1, None)
+        
+        message = MessageReader(mock_connection).find_one()
+        
+        assert message.message_id == 5 and message.is_read is True
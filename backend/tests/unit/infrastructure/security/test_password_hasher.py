@@ -0,0 +1,126 @@
+"""
+Tests unitaires pour PasswordHasher.
+"""
+import threading
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock
+
+import bcrypt
+
+from infrastructure.security.password_hasher import PasswordHasher
+from domain.exceptions.service_overloaded_exception import ServiceOverloadedException
+
+
+class TestPasswordHasher:
+    """Tests pour la classe PasswordHasher"""
+    
+    @pytest.fixture
+    def hasher(self):
+        # Coût minimal et pool de threads: tests rapides
+        hasher = PasswordHasher(rounds=4, max_workers=2, executor_factory=lambda: ThreadPoolExecutor(2))
+        yield hasher
+        hasher.shutdown()
+    
+    def test_rejects_invalid_rounds(self):
+        """Vérifie qu'un coût hors bornes est refusé"""
+        with pytest.raises(ValueError):
+            PasswordHasher(rounds=3)
+    
+    def test_hash_then_verify(self, hasher):
+        """Vérifie qu'une empreinte créée est vérifiable"""
+        hashed = hasher.hash_password('motdepasse123')
+        
+        assert hashed.startswith('$2b$04$')
+        assert hasher.verify_password('motdepasse123', hashed) is True
+        assert hasher.verify_password('mauvais', hashed) is False
+    
+    def test_verify_malformed_hash_returns_false(self, hasher):
+        """Vérifie qu'une empreinte corrompue ne lève pas d'exception"""
+        assert hasher.verify_password('motdepasse123', 'pas-une-empreinte') is False
+    
+    def test_needs_rehash_when_cost_differs(self, hasher):
+        """Vérifie la détection d'un changement de coût"""
+        old_hash = bcrypt.hashpw(b'motdepasse123', bcrypt.gensalt(5)).decode()
+        
+        assert hasher.needs_rehash(old_hash) is True
+        assert hasher.needs_rehash(hasher.hash_password('motdepasse123')) is False
+    
+    def test_verify_and_update_returns_new_hash_when_cost_changed(self, hasher):
+        """Vérifie le recalcul transparent de l'empreinte"""
+        old_hash = bcrypt.hashpw(b'motdepasse123', bcrypt.gensalt(5)).decode()
+        
+        is_valid, new_hash = hasher.verify_and_update('motdepasse123', old_hash)
+        
+        assert is_valid is True
+        assert new_hash.startswith('$2b$04$')
+        assert hasher.verify_password('motdepasse123', new_hash) is True
+    
+    def test_verify_and_update_without_rehash(self, hasher):
+        """Vérifie qu'aucune empreinte n'est recalculée si le coût est courant"""
+        hashed = hasher.hash_password('motdepasse123')
+        
+        assert hasher.verify_and_update('motdepasse123', hashed) == (True, None)
+        assert hasher.verify_and_update('mauvais', hashed) == (False, None)
+    
+    def test_overflow_fails_fast(self):
+        """Vérifie qu'une file pleine lève immédiatement ServiceOverloadedException"""
+        pending = Future()
+        executor = Mock()
+        executor.submit.return_value = pending
+        hasher = PasswordHasher(rounds=4, max_pending=1, executor_factory=lambda: executor)
+        
+        first_call = threading.Thread(target=hasher.hash_password, args=('motdepasse123',))
+        first_call.start()
+        while executor.submit.call_count == 0:
+            pass  # Attendre que la première opération occupe la file
+        
+        with pytest.raises(ServiceOverloadedException) as exc_info:
+            hasher.hash_password('motdepasse123')
+        
+        assert exc_info.value.retry_after == 1
+        assert hasher.rejected_count == 1
+        
+        pending.set_result(b'$2b$04$termine')
+        first_call.join(timeout=2)
+        
+        # La place est libérée une fois l'opération terminée
+        executor.submit.return_value = Future()
+        executor.submit.return_value.set_result(b'$2b$04$ok')
+        assert hasher.hash_password('motdepasse123') == '$2b$04$ok'
+    
+    def test_broken_pool_is_replaced(self):
+        """Vérifie qu'un pool brisé est recréé et l'opération réessayée"""
+        broken = Mock()
+        broken.submit.side_effect = BrokenProcessPool("processus tué")
+        executors = [broken, ThreadPoolExecutor(1), ThreadPoolExecutor(1)]
+        hasher = PasswordHasher(rounds=4, executor_factory=lambda: executors.pop(0))
+        
+        hashed = hasher.hash_password('motdepasse123')
+        
+        assert hasher.verify_password('motdepasse123', hashed) is True
+        broken.shutdown.assert_called_once_with(wait=False)
+        assert len(executors) == 1
+        hasher.shutdown()
+    
+    def test_verify_dummy_costs_a_verification(self, hasher):
+        """Vérifie que la vérification factice fait un vrai calcul bcrypt"""
+        hasher.verify_dummy('motdepasse123')
+        
+        assert bcrypt.checkpw(b'compte-inexistant', hasher._dummy_hash)
+    
+    def test_calibrate_respects_bounds(self):
+        """Vérifie que la calibration reste dans les bornes demandées"""
+        rounds = PasswordHasher.calibrate(target_ms=0.001, min_rounds=4, max_rounds=6)
+        
+        assert rounds == 4
+    
+    def test_process_pool(self):
+        """Vérifie le fonctionnement avec le vrai pool de processus"""
+        hasher = PasswordHasher(rounds=4, max_workers=1)
+        try:
+            hashed = hasher.hash_password('motdepasse123')
+            assert hasher.verify_password('motdepasse123', hashed) is True
+        finally:
+            hasher.shutdown()
@@ -0,0 +1,65 @@
+"""
+Tests unitaires pour BlobGarbageCollector.
+"""
+import os
+import time
+import pytest
+
+from domain.listing.listing_picture import ListingPicture
+from infrastructure.persistence.in_memory.in_memory_listing_picture_repository import InMemoryListingPictureRepository
+from infrastructure.storage.blob_garbage_collector import BlobGarbageCollector
+from infrastructure.storage.upload_store import LocalUploadStore
+
+JPEG_HEADER = b'\xff\xd8\xff\xe0'
+
+
+class TestBlobGarbageCollector:
+    """Tests pour la classe BlobGarbageCollector"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LocalUploadStore(str(tmp_path))
+    
+    @pytest.fixture
+    def repository(self):
+        return InMemoryListingPictureRepository()
+    
+    def _store_picture(self, store, content: bytes, age_seconds: float = 0) -> str:
+        upload = store.new_batch().stream_factory(None, 'image/jpeg', 'photo.jpg')
+        upload.write(JPEG_HEADER + content)
+        relative_path = store.commit(upload, 'photo.jpg')
+        if age_seconds:
+            past = time.time() - age_seconds
+            os.utime(store.path_for(relative_path), (past, past))
+        return relative_path
+    
+    def test_collect_deletes_only_old_unreferenced_blobs(self, store, repository):
+        """Vérifie les trois cas: référencé, orphelin ancien, orphelin récent"""
+        referenced = self._store_picture(store, b'referenced', age_seconds=7200)
+        orphan = self._store_picture(store, b'orphan', age_seconds=7200)
+        recent = self._store_picture(store, b'recent')
+        repository.save(ListingPicture('listing-1', '/uploads/' + referenced, is_cover=True))
+        collector = BlobGarbageCollector(store, repository, grace_seconds=3600, batch_size=1)
+        
+        assert collector.collect() == 1
+        
+        remaining = {path for path, _ in store.iter_blobs()}
+        assert remaining == {referenced, recent}
+        assert orphan not in remaining
+    
+    def test_reupload_refreshes_blob_before_collection(self, store, repository):
+        """Vérifie qu'un fichier réutilisé par un upload identique est épargné"""
+        self._store_picture(store, b'shared', age_seconds=7200)
+        self._store_picture(store, b'shared')
+        collector = BlobGarbageCollector(store, repository, grace_seconds=3600)
+        
+        assert collector.collect() == 0
+    
+    def test_reference_counts_shared_paths(self, repository):
+        """Vérifie le compteur de références par file_path"""
+        repository.save(ListingPicture('listing-1', '/uploads/aa/x.jpg', is_cover=True))
+        repository.save(ListingPicture('listing-2', '/uploads/aa/x.jpg', is_cover=True))
+        
+        counts = repository.count_references(['/uploads/aa/x.jpg', '/uploads/bb/y.jpg'])
+        
+        assert counts == {'/uploads/aa/x.jpg': 2}
@@ -0,0 +1,93 @@
+"""
+Tests unitaires pour LocalUploadStore.
+"""
+import hashlib
+import os
+import time
+import pytest
+
+from domain.listing.exceptions.invalid_picture_exception import InvalidPictureException
+from domain.listing.exceptions.picture_too_large_exception import PictureTooLargeException
+from infrastructure.storage.upload_store import LocalUploadStore
+
+JPEG_BYTES = b'\xff\xd8\xff\xe0' + b'\x00' * 60
+
+
+class TestLocalUploadStore:
+    """Tests pour la classe LocalUploadStore"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LocalUploadStore(str(tmp_path), max_file_size=100)
+    
+    def _receive(self, store, content: bytes, chunk_size: int = 16):
+        """Simule le parseur multipart: écriture par morceaux"""
+        batch = store.new_batch()
+        upload = batch.stream_factory(None, 'image/jpeg', 'photo.jpg')
+        for start in range(0, len(content), chunk_size):
+            upload.write(content[start:start + chunk_size])
+        return batch, upload
+    
+    def test_commit_stores_file_under_content_hash(self, store):
+        """Vérifie que le fichier est rangé sous son empreinte, sans temporaire restant"""
+        _, upload = self._receive(store, JPEG_BYTES)
+        
+        relative_path = store.commit(upload, 'Photo.JPEG')
+        
+        digest = hashlib.sha256(JPEG_BYTES).hexdigest()
+        assert relative_path == f"{digest[:2]}/{digest}.jpg"
+        with open(store.path_for(relative_path), 'rb') as stored:
+            assert stored.read() == JPEG_BYTES
+        assert os.listdir(store.root_dir) == [digest[:2]]
+    
+    def test_identical_uploads_are_stored_once(self, store):
+        """Vérifie la déduplication: même contenu, même fichier"""
+        _, first = self._receive(store, JPEG_BYTES)
+        _, second = self._receive(store, JPEG_BYTES)
+        
+        first_path = store.commit(first, 'a.jpg')
+        second_path = store.commit(second, 'b.jpg')
+        
+        assert first_path == second_path
+        assert [path for path, _ in store.iter_blobs()] == [first_path]
+        assert not os.path.exists(second.name)
+    
+    def test_delete_blob_removes_variants_and_spares_recent_files(self, store):
+        """Vérifie la suppression d'un original avec ses variantes"""
+        _, upload = self._receive(store, JPEG_BYTES)
+        relative_path = store.commit(upload, 'a.jpg')
+        variant_path = store.path_for(relative_path.replace('.jpg', '_thumbnail.jpg'))
+        open(variant_path, 'wb').close()
+        
+        assert not store.delete_blob(relative_path, older_than=time.time() - 60)
+        assert store.delete_blob(relative_path)
+        assert not os.path.exists(variant_path)
+    
+    def test_write_stops_as_soon_as_limit_is_exceeded(self, store):
+        """Vérifie que l'envoi est interrompu au premier morceau de trop"""
+        with pytest.raises(PictureTooLargeException):
+            self._receive(store, JPEG_BYTES * 2)
+    
+    def test_discard_removes_partial_files(self, store):
+        """Vérifie qu'un envoi échoué ne laisse rien sur disque"""
+        batch = store.new_batch()
+        upload = batch.stream_factory(None, 'image/jpeg', 'photo.jpg')
+        with pytest.raises(PictureTooLargeException):
+            upload.write(JPEG_BYTES * 2)
+        
+        batch.discard()
+        
+        assert os.listdir(store.root_dir) == []
+    
+    def test_commit_rejects_content_that_is_not_an_image(self, store):
+        """Vérifie la détection du format par signature, pas par extension"""
+        _, upload = self._receive(store, b'<?php echo 1; ?>')
+        
+        with pytest.raises(InvalidPictureException):
+            store.commit(upload, 'photo.jpg')
+        assert os.listdir(store.root_dir) == []
+    
+    def test_path_for_rejects_traversal(self, store):
+        """Vérifie qu'un chemin ne peut pas sortir du dossier d'uploads"""
+        with pytest.raises(ValueError):
+            store.path_for('../secret.txt')
@@ -54,7 +54,7 @@ class TestDatabaseConnection:
             
             assert conn._config == mock_config_instance
             assert conn._connection is None
-            assert conn._cursor is None
+            assert len(conn._cursors) == 0
 
     def test_init_with_custom_config(self, mock_config):
         """Vérifie que l'initialisation accepte une config personnalisée"""
@@ -62,7 +62,7 @@ class TestDatabaseConnection:
         
         assert conn._config == mock_config
         assert conn._connection is None
-        assert conn._cursor is None
+        assert len(conn._cursors) == 0
 
     @patch('infrastructure.database.connection.mysql.connector.connect')
     def test_connect_success(self, mock_connect, mock_config, mock_mysql_connection):
@@ -101,13 +101,13 @@ class TestDatabaseConnection:
         conn = DatabaseConnection(mock_config)
         conn._connection = mock_mysql_connection
         mock_cursor = Mock()
-        conn._cursor = mock_cursor
+        conn._cursors.add(mock_cursor)
         
         conn.disconnect()
         
         mock_cursor.close.assert_called_once()
         mock_mysql_connection.close.assert_called_once()
-        assert conn._cursor is None
+        assert len(conn._cursors) == 0
         assert conn._connection is None
 
     def test_disconnect_safe_when_not_connected(self, mock_config):
@@ -118,19 +118,20 @@ class TestDatabaseConnection:
         conn.disconnect()
         
         assert conn._connection is None
-        assert conn._cursor is None
+        assert len(conn._cursors) == 0
 
     def test_disconnect_ignores_cursor_close_errors(self, mock_config, mock_mysql_connection):
         """Vérifie que disconnect() ignore les erreurs de fermeture du curseur"""
         conn = DatabaseConnection(mock_config)
         conn._connection = mock_mysql_connection
-        conn._cursor = Mock()
-        conn._cursor.close.side_effect = Exception("Cursor close failed")
+        mock_cursor = Mock()
+        mock_cursor.close.side_effect = Exception("Cursor close failed")
+        conn._cursors.add(mock_cursor)
         
         # Ne doit pas lever d'exception
         conn.disconnect()
         
-        assert conn._cursor is None
+        assert len(conn._cursors) == 0
         assert conn._connection is None
 
     def test_disconnect_ignores_connection_close_errors(self, mock_config, mock_mysql_connection):